@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Repository-root pytest configuration.
+
+Command-line options must be registered by a conftest that pytest loads
+before parsing arguments, which for a plain ``pytest`` (or ``make test``)
+run is only this file.  The benchmark harness options live here for that
+reason; the harness itself is in ``pytest/benchmark/conftest.py``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the apply-pipeline benchmarks (skipped otherwise).",
+    )
+    group.addoption(
+        "--benchmark-sizes",
+        default="small,medium",
+        help="Comma-separated synthetic repository sizes to benchmark.",
+    )
+    group.addoption(
+        "--benchmark-repeat",
+        type=int,
+        default=3,
+        help="Timed repetitions per benchmark case (minimum is reported).",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Write benchmark results to this JSON file.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        default=None,
+        help="Compare against a previous --benchmark-json file.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "benchmark: apply-pipeline timing run (needs --benchmark)"
+    )
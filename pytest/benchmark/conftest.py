@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Opt-in benchmark harness for the ishfiles apply pipeline.
+
+Tests marked ``@pytest.mark.benchmark`` are skipped unless
+``--benchmark`` is given.  Run them in-process (``-n0``) so xdist
+workers do not compete for the CPU::
+
+    pytest pytest/benchmark -n0 --benchmark --benchmark-json=bench.json
+
+Options (registered in the repository-root ``conftest.py`` so they are
+accepted by any invocation, not only ones that name ``pytest/benchmark``):
+
+``--benchmark``
+    Run the benchmark-marked tests.
+``--benchmark-sizes``
+    Comma-separated repository sizes to run (default: ``small,medium``;
+    see ``SIZES`` in ``test_apply_pipeline.py``).
+``--benchmark-repeat``
+    Timed repetitions per case (default 3); the minimum is reported.
+``--benchmark-json``
+    Write all timings to this file.
+``--benchmark-compare``
+    A previous ``--benchmark-json`` file; the terminal summary shows the
+    ratio of each phase against it.
+
+The JSON document has the form ``{"meta": {...}, "results": [...]}``,
+where each result is ``{"case", "mode", "phase", "seconds", "runs",
+"spec"}`` and ``meta`` records the git revision, Python version and
+platform so runs from different revisions can be compared.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    if config.getoption("benchmark", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmark; pass --benchmark to run")
+    for item in items:
+        # Not ``item.keywords``: that also holds the ``benchmark`` package
+        # name, which would skip the always-on smoke test too.
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
+
+
+class BenchmarkRecorder:
+    """Collects per-phase timings for the session."""
+
+    def __init__(self, sizes: List[str], repeat: int) -> None:
+        self.sizes = sizes
+        self.repeat = max(1, repeat)
+        self.results: List[dict] = []
+
+    def add(
+        self, case: str, mode: str, runs: Dict[str, List[float]], spec: dict
+    ) -> None:
+        """Record the best of *runs* (phase -> seconds per repetition)."""
+        for phase, seconds in runs.items():
+            self.results.append(
+                {
+                    "case": case,
+                    "mode": mode,
+                    "phase": phase,
+                    "seconds": min(seconds),
+                    "runs": seconds,
+                    "spec": spec,
+                }
+            )
+
+
+_RECORDER_KEY = pytest.StashKey[BenchmarkRecorder]()
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(_REPO_ROOT), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+@pytest.fixture(scope="session")
+def bench(request: pytest.FixtureRequest) -> BenchmarkRecorder:
+    config = request.config
+    recorder = BenchmarkRecorder(
+        sizes=[
+            s.strip()
+            for s in config.getoption("benchmark_sizes", default="").split(",")
+            if s.strip()
+        ],
+        repeat=config.getoption("benchmark_repeat", default=3),
+    )
+    config.stash[_RECORDER_KEY] = recorder
+    return recorder
+
+
+def _key(result: dict) -> Tuple[str, str, str]:
+    return result["case"], result["mode"], result["phase"]
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    recorder = session.config.stash.get(_RECORDER_KEY, None)
+    path = session.config.getoption("benchmark_json", default=None)
+    if recorder is None or not recorder.results or not path:
+        return
+    worker = getattr(session.config, "workerinput", {}).get("workerid")
+    out = Path(path)
+    if worker:
+        out = out.with_name(f"{out.stem}.{worker}{out.suffix}")
+    doc = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": recorder.results,
+    }
+    out.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    recorder = config.stash.get(_RECORDER_KEY, None)
+    if recorder is None or not recorder.results:
+        return
+    baseline: Dict[Tuple[str, str, str], float] = {}
+    compare = config.getoption("benchmark_compare", default=None)
+    if compare:
+        try:
+            previous = json.loads(Path(compare).read_text(encoding="utf-8"))
+            baseline = {_key(r): r["seconds"] for r in previous.get("results", [])}
+        except (OSError, ValueError) as exc:
+            terminalreporter.write_line(f"cannot read {compare}: {exc}")
+
+    terminalreporter.section("apply pipeline benchmark")
+    for result in recorder.results:
+        line = (
+            f"{result['case']:<8} {result['mode']:<8} {result['phase']:<12} "
+            f"{result['seconds'] * 1000:10.1f} ms"
+        )
+        before = baseline.get(_key(result))
+        if before:
+            line += f"  x{result['seconds'] / before:.2f} vs baseline"
+        terminalreporter.write_line(line)
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Synthetic dotfile repositories for the apply-pipeline benchmarks.
+
+:func:`generate_repo` writes a deterministic (seeded) ishfiles source tree
+whose shape is controlled by a :class:`RepoSpec`: number of files, how
+many lines carry ``@ish`` directives or ``${__ish_*}`` references, how
+many files have an ``__ISH__`` metadata block, how many ``mergejson_``
+files exist, and how many patterns the ``.dotfileignore`` holds.
+
+Generated directives only reference the ``bench_flag`` context variable
+(see :data:`CONTEXT`), so preprocessing never prompts.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+#: Context variables the generated files expect in ``cfg.context``.
+CONTEXT = {"bench_flag": "on"}
+
+
+@dataclass(frozen=True)
+class RepoSpec:
+    """Shape of a synthetic dotfile repository.
+
+    Attributes:
+        files:             Number of regular (non-mergejson) dotfiles.
+        lines_per_file:    Body lines per file.
+        directive_density: Fraction of body lines that are ``@ish``
+                           conditionals or variable references.
+        metadata_ratio:    Fraction of files with an ``__ISH__`` block.
+        mergejson_files:   Number of ``mergejson_`` JSON patch files.
+        ignore_patterns:   Number of patterns in ``.dotfileignore``.
+        dirs:              Number of directories files are spread over.
+        seed:              Random seed (the same spec always yields the
+                           same tree).
+    """
+
+    files: int = 200
+    lines_per_file: int = 40
+    directive_density: float = 0.1
+    metadata_ratio: float = 0.2
+    mergejson_files: int = 5
+    ignore_patterns: int = 20
+    dirs: int = 20
+    seed: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the spec as a JSON-serialisable dict."""
+        return asdict(self)
+
+
+def _body(rng: random.Random, spec: RepoSpec, index: int) -> str:
+    lines = []
+    for n in range(spec.lines_per_file):
+        if rng.random() >= spec.directive_density:
+            lines.append(f"setting_{index}_{n} = value {rng.randrange(10**6)}\n")
+        elif rng.random() < 0.5:
+            lines.append(f"flag_{n} = ${{__ish_bench_flag}}\n")
+        else:
+            lines.append("#@ish if ish.bench_flag == 'on'\n")
+            lines.append(f"enabled_{n} = yes\n")
+            lines.append("#@ish else\n")
+            lines.append(f"enabled_{n} = no\n")
+            lines.append("#@ish fi\n")
+    return "".join(lines)
+
+
+def _metadata(index: int) -> str:
+    return f'# __ISH__\n# [vars]\n# bench_file = "{index}"\n# __ISH__\n'
+
+
+def generate_repo(root: Path, spec: RepoSpec) -> Path:
+    """Write a synthetic ishfiles source tree for *spec* under *root*.
+
+    About one in twenty files is named so that an ignore pattern matches
+    it, so the ignore rules are exercised and not just parsed.
+
+    Returns:
+        *root*.
+    """
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+
+    patterns = []
+    for i in range(spec.ignore_patterns):
+        patterns.append(f"ignored_{i}.txt" if i % 2 else f"*.skip{i}")
+    (root / ".dotfileignore").write_text("\n".join(patterns) + "\n")
+
+    for i in range(spec.files):
+        subdir = root / "dot_config" / f"tool{i % max(spec.dirs, 1)}"
+        subdir.mkdir(parents=True, exist_ok=True)
+        if patterns and i % 20 == 19:
+            pattern = patterns[i % len(patterns)]
+            name = pattern.replace("*", f"file{i}")
+        else:
+            name = f"file{i}.conf"
+        text = _body(rng, spec, i)
+        if rng.random() < spec.metadata_ratio:
+            text = _metadata(i) + text
+        (subdir / name).write_text(text)
+
+    for i in range(spec.mergejson_files):
+        subdir = root / "dot_config" / f"json{i}"
+        subdir.mkdir(parents=True, exist_ok=True)
+        patch = {
+            "editor": {"fontSize": 10 + i, "rulers": [80, 100]},
+            "bench": {f"key{k}": k for k in range(20)},
+        }
+        (subdir / "mergejson_settings.json").write_text(json.dumps(patch, indent=2))
+
+    return root
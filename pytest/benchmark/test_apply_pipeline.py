@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Phase timings for :class:`DotfileApplier` on synthetic repositories.
+
+Each case generates a repository from :data:`SIZES`, then times
+discover / scan / prepare / get_changes / apply against a fresh
+temporary ``$HOME`` with the :class:`CommandRunner` in dry-run and real
+modes.  See ``conftest.py`` for how to run and compare results.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.command_runner import CommandRunner  # noqa: E402
+from pyishlib.dotfile_applier import DotfileApplier  # noqa: E402
+from pyishlib.ish_config import IshConfig  # noqa: E402
+
+from .synth import CONTEXT, RepoSpec, generate_repo  # noqa: E402
+
+SIZES: Dict[str, RepoSpec] = {
+    "small": RepoSpec(files=200),
+    "medium": RepoSpec(files=2000, mergejson_files=20, ignore_patterns=100),
+    "large": RepoSpec(
+        files=10000,
+        lines_per_file=80,
+        directive_density=0.2,
+        metadata_ratio=0.5,
+        mergejson_files=100,
+        ignore_patterns=500,
+        dirs=200,
+    ),
+}
+
+MODES = {"dry-run": True, "real": False}
+
+
+def run_pipeline(source: Path, home: Path, dry_run: bool) -> Dict[str, float]:
+    """Run every applier phase once; return seconds per phase."""
+    cfg = IshConfig(
+        dry_run=dry_run,
+        log_level=logging.WARNING,
+        defaults={"source": str(source), "target": str(home)},
+    )
+    for key, value in CONTEXT.items():
+        cfg.context.set(key, value)
+    runner = CommandRunner(cfg=cfg)
+    applier = DotfileApplier(source, home, cfg=cfg, runner=runner)
+
+    timings: Dict[str, float] = {}
+
+    def timed(phase, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[phase] = time.perf_counter() - start
+        return result
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        dotfiles = timed("discover", applier.discover)
+        dotfiles, _ = timed("scan", applier.scan, dotfiles)
+        dotfiles = timed("prepare", applier.prepare, dotfiles)
+        changes = timed("get_changes", applier.get_changes, dotfiles)
+        timed("apply", applier.apply_changes, changes)
+    return timings
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", list(MODES))
+@pytest.mark.parametrize("size", list(SIZES))
+def test_apply_pipeline(size: str, mode: str, tmp_path: Path, bench) -> None:
+    if size not in bench.sizes:
+        pytest.skip(f"size {size!r} not selected (--benchmark-sizes)")
+    spec = SIZES[size]
+    source = generate_repo(tmp_path / "source", spec)
+
+    runs: Dict[str, List[float]] = {}
+    for rep in range(bench.repeat):
+        home = tmp_path / f"home{rep}"
+        home.mkdir()
+        for phase, seconds in run_pipeline(source, home, MODES[mode]).items():
+            runs.setdefault(phase, []).append(seconds)
+    bench.add(size, mode, runs, spec.as_dict())
+
+
+def test_synthetic_repo_applies(tmp_path: Path) -> None:
+    """Smoke test (always runs): the generator's output applies cleanly."""
+    spec = RepoSpec(files=40, mergejson_files=2, ignore_patterns=4, dirs=4)
+    source = generate_repo(tmp_path / "source", spec)
+    home = tmp_path / "home"
+    home.mkdir()
+    timings = run_pipeline(source, home, dry_run=False)
+    assert set(timings) == {"discover", "scan", "prepare", "get_changes", "apply"}
+
+    conf = sorted(home.glob(".config/tool*/file*.conf"))
+    assert 0 < len(conf) < spec.files  # some files are ignored
+    text = conf[0].read_text()
+    assert "__ish" not in text and "@ish" not in text
+    assert len(list(home.glob(".config/json*/settings.json"))) == 2
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for the opt-in skip logic of the ``pytest/benchmark`` harness.
+
+The benchmark package is run in a child pytest process: a broken skip
+hook would also skip any check placed inside that package.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run_benchmark_suite(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "pytest/benchmark",
+            "-q",
+            "-rs",
+            "-o",
+            "addopts=",
+            "-p",
+            "no:cacheprovider",
+            *args,
+        ],
+        cwd=str(_REPO_ROOT),
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestBenchmarkSkip(unittest.TestCase):
+    def test_smoke_test_runs_without_benchmark_option(self):
+        result = _run_benchmark_suite("-k", "synthetic_repo_applies")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "1 passed" in result.stdout
+        assert "skipped" not in result.stdout
+
+    def test_marked_tests_skipped_without_benchmark_option(self):
+        result = _run_benchmark_suite("-k", "apply_pipeline and small")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "pass --benchmark to run" in result.stdout
+        assert "passed" not in result.stdout
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ import os
 import sys
 import unittest
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,7 +17,9 @@ sys.path.insert(
 
 from pyishlib.cli_command import (  # noqa: E402
     CliCommand,
+    LazyCommand,
     _compose_argv,
+    lazy_callable,
 )
 
 # Skipped on Windows for parity with the rest of the ishproject test
@@ -110,6 +112,60 @@ class TestEntryPopulatesCfg(unittest.TestCase):
         self.assertIsNone(cmd.cfg)
 
 
+# ---------------------------------------------------------------------------
+# LazyCommand — declared up front, imported on dispatch
+# ---------------------------------------------------------------------------
+
+
+def _add_dummy_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--flag", action="store_true")
+
+
+class TestLazyCommand(unittest.TestCase):
+    def setUp(self) -> None:
+        _DummyCommand.last_cfg = None
+        _DummyCommand.ran = 0
+
+    def _parse(self, entry: LazyCommand, argv):
+        parser = argparse.ArgumentParser()
+        common = MagicMock()
+        entry.register(parser.add_subparsers(dest="cmd"), common)
+        return parser.parse_args(argv), common
+
+    def test_register_uses_declaration(self) -> None:
+        entry = LazyCommand(
+            "dummy",
+            "no.such.module:Nothing",
+            help="dummy command",
+            arguments=_add_dummy_arguments,
+        )
+        args, common = self._parse(entry, ["dummy", "--flag"])
+        self.assertTrue(args.flag)
+        common.assert_called_once()
+
+    def test_common_flags_optional(self) -> None:
+        entry = LazyCommand("dummy", "x:y", help="h", common_flags=False)
+        _, common = self._parse(entry, ["dummy"])
+        common.assert_not_called()
+
+    def test_dispatch_imports_target(self) -> None:
+        entry = LazyCommand("dummy", f"{__name__}:_DummyCommand", help="h")
+        args, _ = self._parse(entry, ["dummy"])
+        ctx = SimpleNamespace()
+        self.assertEqual(args.func(ctx), 42)
+        self.assertIs(_DummyCommand.last_cfg, ctx)
+        self.assertIs(entry.load(), _DummyCommand)
+
+    def test_load_rejects_non_command_target(self) -> None:
+        entry = LazyCommand("dummy", "os.path:join", help="h")
+        with self.assertRaises(TypeError):
+            entry.load()
+
+    def test_lazy_callable_forwards(self) -> None:
+        call = lazy_callable("os.path:join")
+        self.assertEqual(call("a", "b"), os.path.join("a", "b"))
+
+
 # ---------------------------------------------------------------------------
 # passthrough() — target gate + forwarding
 # ---------------------------------------------------------------------------
@@ -230,5 +286,34 @@ class TestPassthroughMethod(unittest.TestCase):
         _PassThroughCommand.TARGET_MAIN.assert_not_called()
 
 
+class TestPassthroughCaptured(unittest.TestCase):
+    def setUp(self) -> None:
+        _PassThroughCommand.TARGET_MAIN.reset_mock()
+
+    def test_runs_target_module_in_child(self) -> None:
+        class _Cmd(_PassThroughCommand):
+            TARGET_MODULE = "some.cli"
+
+        cmd = _Cmd()
+        cmd.cfg = _ExplicitAwareCfg(set())
+        with patch("pyishlib.cli_command.subprocess.run") as mock_run:
+            cmd.passthrough_captured("apply", ("a",), global_args=["--source", "/x"])
+        args, kwargs = mock_run.call_args
+        self.assertEqual(
+            args[0],
+            [sys.executable, "-m", "some.cli", "--source", "/x", "apply", "a"],
+        )
+        self.assertTrue(kwargs["capture_output"])
+        pythonpath = kwargs["env"]["PYTHONPATH"].split(os.pathsep)
+        self.assertTrue(os.path.isdir(os.path.join(pythonpath[0], "pyishlib")))
+        _PassThroughCommand.TARGET_MAIN.assert_not_called()
+
+    def test_raises_without_target_module(self) -> None:
+        cmd = _PassThroughCommand()
+        cmd.cfg = _ExplicitAwareCfg(set())
+        with self.assertRaises(TypeError):
+            cmd.passthrough_captured("apply", ())
+
+
 if __name__ == "__main__":
     unittest.main()
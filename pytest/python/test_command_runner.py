@@ -76,6 +76,12 @@ class TestCommandRunnerRun:
         assert result.stdout == b""
         assert result.stderr == b""
 
+    def test_run_read_only_runs_in_dry_run(self, capsys):
+        runner = CommandRunner(cfg=IshConfig(dry_run=True))
+        result = runner.run(["false"], read_only=True, check=False)
+        assert result.returncode != 0
+        assert capsys.readouterr().out == ""
+
     def test_run_quiet_suppresses_output(self):
         runner = CommandRunner()
         result = runner.run(["echo", "hello"], quiet=True)
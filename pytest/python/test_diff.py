@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for the in-process batch renderer in pyishlib.diff."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+from pyishlib.diff import DiffEntry, print_diffs, render_diffs
+
+
+def _render(*entries, color=False) -> str:
+    return "".join(render_diffs(entries, color=color))
+
+
+def _git_diff(old: str, new: str, cwd: str, color: bool = False) -> str:
+    return subprocess.run(
+        [
+            "git",
+            "--no-pager",
+            "diff",
+            "--no-index",
+            f"--color={'always' if color else 'never'}",
+            "--",
+            old,
+            new,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    ).stdout
+
+
+class TestRenderDiffs:
+    def test_modified_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            old = Path(d) / "old"
+            new = Path(d) / "new"
+            old.write_text("a\nb\nc\n")
+            new.write_text("a\nB\nc\n")
+            out = _render(DiffEntry(old, new))
+        prefix = Path(d).as_posix().lstrip("/")
+        assert out.startswith(f"diff --git a/{prefix}/old b/{prefix}/new\n")
+        assert f"--- a/{prefix}/old\n+++ b/{prefix}/new\n" in out
+        assert out.endswith("@@ -1,3 +1,3 @@\n a\n-b\n+B\n c\n")
+
+    def test_new_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            new = Path(d) / "new"
+            new.write_text("x\n")
+            out = _render(DiffEntry(None, new))
+        assert "new file mode 100644\nindex 0000000..587be6b\n" in out
+        assert "--- /dev/null\n" in out
+        assert out.endswith("@@ -0,0 +1 @@\n+x\n")
+
+    def test_missing_trailing_newline_marker(self):
+        with tempfile.TemporaryDirectory() as d:
+            old = Path(d) / "old"
+            new = Path(d) / "new"
+            old.write_text("a\n")
+            new.write_text("a")
+            out = _render(DiffEntry(old, new))
+        assert out.endswith("-a\n+a\n\\ No newline at end of file\n")
+
+    def test_old_text_override(self):
+        with tempfile.TemporaryDirectory() as d:
+            old = Path(d) / "old"
+            new = Path(d) / "new"
+            old.write_text("ignored\n")
+            new.write_text("b\n")
+            out = _render(DiffEntry(old, new, old_text="a\n"))
+        assert out.endswith("-a\n+b\n")
+
+    def test_splits_on_newline_only(self):
+        with tempfile.TemporaryDirectory() as d:
+            old = Path(d) / "old"
+            new = Path(d) / "new"
+            old.write_bytes(b"a\nb\x0cc\rx\nd\n")
+            new.write_bytes(b"a\nb\x0cc\rx\nD\n")
+            out = _render(DiffEntry(old, new))
+        assert "No newline" not in out
+        assert out.endswith("@@ -1,3 +1,3 @@\n a\n b\x0cc\rx\n-d\n+D\n")
+
+    def test_binary_files(self):
+        with tempfile.TemporaryDirectory() as d:
+            old = Path(d) / "old"
+            new = Path(d) / "new"
+            old.write_bytes(b"\xff\x00")
+            new.write_bytes(b"\xfe\x00")
+            out = _render(DiffEntry(old, new))
+        assert out == f"--- {old}\n+++ {new}\n<binary files differ>\n\n"
+
+    def test_binary_new_file_uses_label(self):
+        with tempfile.TemporaryDirectory() as d:
+            new = Path(d) / "staged"
+            new.write_bytes(b"\xff\x00")
+            out = _render(DiffEntry(None, new, new_label="/home/u/.bin"))
+        assert out == "--- /dev/null\n+++ /home/u/.bin\n<binary files differ>\n\n"
+
+    def test_print_diffs_writes_all_entries(self, capsys):
+        with tempfile.TemporaryDirectory() as d:
+            files = []
+            for name in ("one", "two"):
+                p = Path(d) / name
+                p.write_text(f"{name}\n")
+                files.append(p)
+            print_diffs([DiffEntry(None, p) for p in files], color=False)
+        out = capsys.readouterr().out
+        assert out.count("diff --git") == 2
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+class TestMatchesGit:
+    @pytest.mark.parametrize("color", [False, True])
+    def test_same_output_as_git(self, color):
+        old = "int main\n" + "".join(f"{i}\n" for i in range(12))
+        new = old.replace("10\n", "ten\n") + "tail"
+        with tempfile.TemporaryDirectory() as d:
+            (Path(d) / "old").write_text(old)
+            (Path(d) / "new").write_text(new)
+            (Path(d) / "new").chmod(0o755)
+            expected = _git_diff("old", "new", d, color=color)
+            cwd = os.getcwd()
+            os.chdir(d)
+            try:
+                out = _render(DiffEntry(Path("old"), Path("new")), color=color)
+            finally:
+                os.chdir(cwd)
+        assert out == expected
+
+    def test_form_feed_same_as_git(self):
+        with tempfile.TemporaryDirectory() as d:
+            (Path(d) / "old").write_bytes(b"a\nb\x0cc\nd\n")
+            (Path(d) / "new").write_bytes(b"a\nb\x0cc\nD\n")
+            expected = _git_diff("old", "new", d)
+            cwd = os.getcwd()
+            os.chdir(d)
+            try:
+                out = _render(DiffEntry(Path("old"), Path("new")))
+            finally:
+                os.chdir(cwd)
+        assert "@@ -1,3 +1,3 @@" in expected
+        assert out == expected
+
+    def test_empty_new_file_same_as_git(self):
+        with tempfile.TemporaryDirectory() as d:
+            (Path(d) / "new").write_text("")
+            expected = _git_diff(os.devnull, "new", d)
+            cwd = os.getcwd()
+            os.chdir(d)
+            try:
+                out = _render(DiffEntry(None, Path("new")))
+            finally:
+                os.chdir(cwd)
+        assert "+++" not in expected
+        assert out == expected
+
+    def test_new_file_same_as_git(self):
+        with tempfile.TemporaryDirectory() as d:
+            (Path(d) / "new").write_text("x\ny\n")
+            expected = _git_diff(os.devnull, "new", d)
+            cwd = os.getcwd()
+            os.chdir(d)
+            try:
+                out = _render(DiffEntry(None, Path("new")))
+            finally:
+                os.chdir(cwd)
+        assert out == expected
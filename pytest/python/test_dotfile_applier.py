@@ -597,7 +597,10 @@ class TestPrepare:
 
     def test_prepare_preserves_translated_path(self):
         with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
-            _make_file(Path(src) / "dot_config" / "nvim" / "init.vim", "set nu\n")
+            _make_file(
+                Path(src) / "dot_config" / "nvim" / "init.vim",
+                "#@ish set mode=nu\nset ${__ish_mode}\n",
+            )
 
             applier = DotfileApplier(source_dir=Path(src), target_dir=Path(tgt))
             dotfiles = applier.discover()
@@ -45,5 +45,22 @@ class TestDotfileContextPromptChoice(unittest.TestCase):
         assert ctx.get("machineType") == "min"
 
 
+class TestDotfileContextPrompted(unittest.TestCase):
+    def test_stored_values_do_not_set_flag(self):
+        ctx = DotfileContext({"work": "yes", "name": "me"})
+        ctx.prompt_bool("work", "Work?")
+        ctx.prompt("name", "Name?")
+        assert not ctx.prompted
+
+    def test_prompting_sets_flag_until_reset(self):
+        ctx = DotfileContext()
+        with patch("sys.stdin.isatty", return_value=False):
+            ctx.prompt_bool("work", "Work?")
+        assert ctx.prompted
+        ctx.reset_prompted()
+        assert not ctx.prompted
+        assert "prompted" not in ctx.as_dict()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for pyishlib.dotfile_index."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.dotfile import ChangeType
+from pyishlib.dotfile_applier import DotfileApplier
+from pyishlib.dotfile_index import DotfileIndex, hash_bytes
+
+_OLD_NS = 1_000_000_000 * 1_000_000_000  # 2001-09-09, well outside the racy window
+
+
+def _make_file(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+    return path
+
+
+def _prepared(src: Path, tgt: Path, index: DotfileIndex):
+    applier = DotfileApplier(source_dir=src, target_dir=tgt, index=index)
+    return applier, applier.prepare(applier.discover())
+
+
+class TestHashBytes(unittest.TestCase):
+    def test_returns_hex_string(self):
+        assert len(hash_bytes(b"hello")) == 64
+
+    def test_different_content_different_hash(self):
+        assert hash_bytes(b"a") != hash_bytes(b"b")
+
+
+class TestDotfileIndex(unittest.TestCase):
+    def test_prepare_sets_staged_digest(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            index = DotfileIndex(Path(tgt) / "index.json")
+            _, dotfiles = _prepared(Path(src), Path(tgt), index)
+            assert dotfiles[0].staged_digest == hash_bytes(b"same\n")
+
+    def test_unchanged_file_is_recorded_and_saved(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            _make_file(Path(tgt) / ".bashrc", "same\n")
+            path = Path(tgt) / "index.json"
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            assert applier.get_changes(dotfiles) == []
+
+            data = json.loads(path.read_text())
+            entry = data[str(Path(tgt) / ".bashrc")]
+            assert entry["staged"] == hash_bytes(b"same\n")
+
+    def test_second_run_skips_content_compare(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            _make_file(Path(tgt) / ".bashrc", "same\n")
+            path = Path(tgt) / "index.json"
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            applier.get_changes(dotfiles)
+
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            with patch("pyishlib.dotfile.filecmp.cmp") as cmp:
+                assert applier.get_changes(dotfiles) == []
+            cmp.assert_not_called()
+
+    def test_modified_target_invalidates_entry(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            _make_file(Path(tgt) / ".bashrc", "same\n")
+            path = Path(tgt) / "index.json"
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            applier.get_changes(dotfiles)
+
+            _make_file(Path(tgt) / ".bashrc", "edited\n")
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            changes = applier.get_changes(dotfiles)
+            assert len(changes) == 1
+            assert changes[0].get_change_type() == ChangeType.MODIFIED
+            assert json.loads(path.read_text()) == {}
+
+    def test_changed_staged_output_invalidates_entry(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            _make_file(Path(tgt) / ".bashrc", "same\n")
+            path = Path(tgt) / "index.json"
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            applier.get_changes(dotfiles)
+
+            _make_file(Path(src) / "dot_bashrc", "other\n")
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            assert len(applier.get_changes(dotfiles)) == 1
+
+    def test_recent_target_is_not_recorded(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            target = _make_file(Path(tgt) / ".bashrc", "same\n")
+            now = time.time_ns()
+            os.utime(target, ns=(now, now))
+            index = DotfileIndex(Path(tgt) / "index.json")
+            applier, dotfiles = _prepared(Path(src), Path(tgt), index)
+            applier.get_changes(dotfiles)
+            assert not index.is_unchanged(dotfiles[0])
+
+    def test_dry_run_does_not_save(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "same\n")
+            _make_file(Path(tgt) / ".bashrc", "same\n")
+            path = Path(tgt) / "index.json"
+            applier, dotfiles = _prepared(Path(src), Path(tgt), DotfileIndex(path))
+            applier.cfg.dry_run = True
+            applier.get_changes(dotfiles)
+            assert not path.exists()
+
+    def test_corrupt_file_starts_empty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.json"
+            path.write_text("not json")
+            index = DotfileIndex(path)
+            index.save()
+            assert path.read_text() == "not json"
+
+    def test_from_cfg_uses_target(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = SimpleNamespace(
+                get_opt=lambda name, default=None: {
+                    "target": tmp,
+                    "dotfile_index_filename": "idx.json",
+                }.get(name, default)
+            )
+            index = DotfileIndex.from_cfg(cfg)
+            assert index.path == (
+                Path(tmp).resolve() / ".config" / "ishfiles" / "idx.json"
+            )
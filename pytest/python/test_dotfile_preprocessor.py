@@ -8,6 +8,7 @@ import os
 import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -19,6 +20,8 @@ from pyishlib.dotfile import DotFile
 from pyishlib.dotfile_context import DotfileContext
 from pyishlib.dotfile_preprocessor import DotFilePreprocessor
 from pyishlib.file_preprocessor import (
+    FilePreprocessor,
+    ParsedSource,
     _RE_DIRECTIVE,
     _RE_VAR_REF,
     _parse_set_directive,
@@ -865,5 +868,80 @@ export BROWSER=safari
             assert "export BROWSER=safari" not in staged_content
 
 
+# ---------------------------------------------------------------------------
+# ParsedSource
+# ---------------------------------------------------------------------------
+
+
+class TestParsedSource:
+    def test_flags_detected(self):
+        with tempfile.TemporaryDirectory() as d:
+            f = _make_file(Path(d) / "a", "#@ish set x=1\necho ${__ish_x}\n")
+            parsed = ParsedSource.load(f)
+            assert parsed.has_directives
+            assert parsed.has_variable_refs
+
+    def test_plain_file_has_no_flags(self):
+        with tempfile.TemporaryDirectory() as d:
+            parsed = ParsedSource.load(_make_file(Path(d) / "a", "plain\n"))
+            assert not parsed.has_directives
+            assert not parsed.has_variable_refs
+            assert parsed.metadata is None
+
+    def test_binary_defers_decode_error(self):
+        with tempfile.TemporaryDirectory() as d:
+            f = Path(d) / "bin"
+            f.write_bytes(b"\x00\xff\xfe")
+            parsed = ParsedSource.load(f)
+            assert parsed.text is None
+            with pytest.raises(UnicodeDecodeError):
+                parsed.require_text()
+
+    @pytest.mark.skipif(not HAS_TOML, reason="TOML support not available")
+    def test_sidecar_metadata(self):
+        with tempfile.TemporaryDirectory() as d:
+            f = _make_file(Path(d) / "a", "plain\n")
+            _make_file(Path(d) / "a.ish", '[script]\nname = "side"\n')
+            assert ParsedSource.load(f).metadata == {"script": {"name": "side"}}
+
+    @pytest.mark.skipif(not HAS_TOML, reason="TOML support not available")
+    def test_invalid_metadata_deferred(self):
+        with tempfile.TemporaryDirectory() as d:
+            f = _make_file(Path(d) / "a", "plain\n")
+            _make_file(Path(d) / "a.ish", "not = [valid\n")
+            parsed = ParsedSource.load(f)
+            assert parsed.metadata is None
+            with pytest.raises(ValueError):
+                parsed.require_metadata()
+            with pytest.raises(ValueError):
+                FilePreprocessor().preprocess_source(parsed)
+
+    def test_preprocess_source_matches_preprocess_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            f = _make_file(
+                Path(d) / "a",
+                "#@ish set who=you\nhi ${__ish_who}\n${__ish_missing}\n",
+            )
+            expected, _ = FilePreprocessor().preprocess_file(f)
+            text, _ = FilePreprocessor().preprocess_source(ParsedSource.load(f))
+            assert text == expected == "hi you\n${__ish_missing}\n"
+
+    def test_scan_and_prepare_read_source_once(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "echo ${__ish_x}\n")
+            cfg = IshConfig()
+            cfg.context.set("x", "1")
+            applier = DotfileApplier(
+                source_dir=Path(src), target_dir=Path(tgt), cfg=cfg
+            )
+            dotfiles, _ = applier.scan(applier.discover())
+            with patch.object(
+                ParsedSource, "load", side_effect=AssertionError("re-read")
+            ):
+                dotfiles = applier.prepare(dotfiles)
+            assert dotfiles[0].staged.read_text() == "echo 1\n"
+            assert dotfiles[0].parsed is None
+
+
 if __name__ == "__main__":
     pytest.main()
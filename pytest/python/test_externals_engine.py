@@ -5,21 +5,28 @@
 from __future__ import annotations
 
 import os
+import subprocess
 import sys
 import tempfile
 import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
 )
 
+from pyishlib import package_state
+from pyishlib.ishfiles import externals as externals_mod
 from pyishlib.ishfiles.externals import (
     ExternalsEngine,
+    check_updates,
+    copy_tree_incremental,
     copy_tree_nondestructive,
+    fetch_many,
+    _is_selected,
     _parse_remote_tags,
     _pick_latest_tag,
     _tag_tuple,
@@ -561,5 +568,206 @@ class TestCheckUpdateMocked(unittest.TestCase):
             assert candidate is None
 
 
+# ---------------------------------------------------------------------------
+# copy_tree_incremental
+# ---------------------------------------------------------------------------
+
+
+class _CountingSha:
+    def __init__(self):
+        self.paths = []
+        self._real = externals_mod._sha256
+
+    def __call__(self, path):
+        self.paths.append(Path(path).name)
+        return self._real(path)
+
+
+@patch.object(package_state, "RACY_WINDOW_NS", 0)
+class TestCopyTreeIncremental(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.src, self.dst = root / "src", root / "dst"
+        (self.src / "sub").mkdir(parents=True)
+        (self.src / "a").write_text("a\n")
+        (self.src / "sub" / "b").write_text("b\n")
+        self.tree = {"a": ("100644", "1" * 40), "sub/b": ("100644", "2" * 40)}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _copy(self, previous=None, **kw):
+        return copy_tree_incremental(
+            self.src, self.dst, _make_runner(), self.tree, previous, **kw
+        )
+
+    def test_unchanged_tree_is_not_read(self):
+        result, manifest = self._copy()
+        assert result.copied == 2
+        counter = _CountingSha()
+        with patch.object(externals_mod, "_sha256", counter):
+            result, again = self._copy(manifest)
+        assert (result.copied, result.skipped) == (0, 2)
+        assert counter.paths == []
+        assert again == manifest
+
+    def test_changed_blob_is_the_only_copy(self):
+        _, manifest = self._copy()
+        (self.src / "sub" / "b").write_text("b2\n")
+        self.tree["sub/b"] = ("100644", "3" * 40)
+        counter = _CountingSha()
+        with patch.object(externals_mod, "_sha256", counter):
+            result, _ = self._copy(manifest)
+        assert (result.copied, result.skipped) == (1, 1)
+        assert set(counter.paths) <= {"b"}
+        assert (self.dst / "sub" / "b").read_text() == "b2\n"
+
+    def test_destination_edit_is_detected(self):
+        _, manifest = self._copy()
+        (self.dst / "a").write_text("local edit\n")
+        result, _ = self._copy(manifest)
+        assert (result.copied, result.skipped) == (1, 1)
+        assert (self.dst / "a").read_text() == "a\n"
+
+    def test_filters_match_walk(self):
+        self.tree.update(
+            {
+                ".git/config": ("100644", "4" * 40),
+                "x.pyc": ("100644", "5" * 40),
+                "mod": ("160000", "6" * 40),
+            }
+        )
+        _, manifest = self._copy(exclude=["sub"])
+        assert sorted(manifest) == ["a"]
+        assert _is_selected("sub/b", ["sub/*"], None)
+        assert not _is_selected("a", ["sub/*"], None)
+
+    def test_dry_run_records_nothing(self):
+        result, manifest = copy_tree_incremental(
+            self.src, self.dst, _make_runner(dry_run=True), self.tree
+        )
+        assert result.copied == 2
+        assert manifest == {}
+        assert not (self.dst / "a").exists()
+
+    def test_recent_files_are_not_recorded(self):
+        with patch.object(package_state, "RACY_WINDOW_NS", 10**18):
+            _, manifest = self._copy()
+        assert manifest == {}
+
+
+class TestExternalsStateManifest(unittest.TestCase):
+    def test_manifest_survives_set_and_checks_key(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state = ExternalsState(Path(tmp) / "state.json")
+            state.set_manifest(".fzf", "k1", {"a": ["100644", "1", 2, 3, 4]})
+            state.set(".fzf", "v1", "0" * 40, "url")
+            state.save()
+            reloaded = ExternalsState(Path(tmp) / "state.json")
+            assert reloaded.get_manifest(".fzf", "k1") == {
+                "a": ["100644", "1", 2, 3, 4]
+            }
+            assert reloaded.get_manifest(".fzf", "k2") is None
+            assert reloaded.get(".fzf")["revision"] == "v1"
+
+
+# ---------------------------------------------------------------------------
+# fetch_many / check_updates against local bare repositories (file://)
+# ---------------------------------------------------------------------------
+
+
+def _make_bare_repo(root: Path, name: str, tags: list) -> str:
+    """Create ``root/<name>.git`` with one commit per tag; return its file:// URL."""
+    work = root / f"{name}-work"
+    work.mkdir()
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=work, check=True)
+    for tag in tags:
+        (work / "README").write_text(f"{name} {tag}\n")
+        subprocess.run(["git", "add", "README"], cwd=work, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", tag], cwd=work, check=True)
+        subprocess.run(["git", "tag", tag], cwd=work, check=True)
+    bare = root / f"{name}.git"
+    subprocess.run(["git", "clone", "-q", "--bare", str(work), str(bare)], check=True)
+    return bare.as_uri()
+
+
+class TestFetchManyLocalRepos(unittest.TestCase):
+    def _setup(self, tmp: Path, count: int):
+        src, tgt, remotes = tmp / "src", tmp / "tgt", tmp / "remotes"
+        for d in (src, tgt, remotes):
+            d.mkdir()
+        specs = [
+            _make_spec(
+                path=f".ext{i}",
+                url=_make_bare_repo(remotes, f"ext{i}", ["v1.0.0", "v1.1.0"]),
+                revision="v1.0.0",
+            )
+            for i in range(count)
+        ]
+        state = ExternalsState(tgt / "state.json")
+        engine = ExternalsEngine(_make_cfg(str(src), str(tgt)), _make_runner(), state)
+        return engine, specs, state, tgt
+
+    def test_fetches_all_in_order(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, specs, state, tgt = self._setup(Path(tmp), 5)
+            outcomes = fetch_many(engine, specs, jobs=3)
+
+            assert [o.item.path for o in outcomes] == [s.path for s in specs]
+            assert all(o.ok for o in outcomes), [o.error for o in outcomes]
+            for outcome in outcomes:
+                assert len(outcome.value.commit_sha) == 40
+
+            # All records survived the concurrent writes to the state file.
+            reloaded = ExternalsState(tgt / "state.json")
+            for spec in specs:
+                assert reloaded.get(spec.path)["revision"] == "v1.0.0"
+
+            for spec in specs:
+                result = engine.apply(spec, tgt)
+                assert result.copied == 1
+                text = (tgt / spec.path / "README").read_text()
+                assert text == f"{spec.path[1:]} v1.0.0\n"
+
+    def test_failure_is_captured_per_spec(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, specs, _, _ = self._setup(Path(tmp), 2)
+            specs.insert(
+                1,
+                _make_spec(
+                    path=".missing",
+                    url=(Path(tmp) / "nope.git").as_uri(),
+                    revision="v1.0.0",
+                ),
+            )
+            outcomes = fetch_many(engine, specs, jobs=4)
+            assert [o.ok for o in outcomes] == [True, False, True]
+
+    @patch.object(package_state, "RACY_WINDOW_NS", 0)
+    def test_apply_uses_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, specs, state, tgt = self._setup(Path(tmp), 1)
+            spec = specs[0]
+            engine.fetch(spec)
+            assert engine.apply(spec, tgt).copied == 1
+            counter = _CountingSha()
+            with patch.object(externals_mod, "_sha256", counter):
+                result = engine.apply(spec, tgt)
+            assert (result.copied, result.skipped) == (0, 1)
+            assert counter.paths == []
+
+            spec.revision = "v1.1.0"
+            engine.fetch(spec)
+            assert engine.apply(spec, tgt).copied == 1
+            assert (tgt / spec.path / "README").read_text() == "ext0 v1.1.0\n"
+
+    def test_check_updates_reports_newer_tags(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine, specs, _, _ = self._setup(Path(tmp), 3)
+            outcomes = check_updates(engine, specs, jobs=2)
+            assert [o.value.latest_tag for o in outcomes] == ["v1.1.0"] * 3
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,7 +15,7 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
 )
 
-from pyishlib.git_repo import GitRepo, NotAGitRepoError  # noqa: E402
+from pyishlib.git_repo import GitRepo, NotAGitRepoError, git_session  # noqa: E402
 
 # Every test here exercises real ``git`` subprocesses against a
 # ``tempfile.TemporaryDirectory``. On the Windows CI runner that
@@ -553,6 +553,111 @@ class TestRemoteOps(unittest.TestCase):
         self.assertTrue(self.repo.branch_exists("ish/track", local_only=True))
 
 
+# ---------------------------------------------------------------------------
+# git_session: the same queries answered from snapshots
+# ---------------------------------------------------------------------------
+
+
+class _InSession:
+    """Mixin running a test case's queries inside a :func:`git_session`."""
+
+    def setUp(self) -> None:
+        super().setUp()  # type: ignore[misc]
+        session = git_session()
+        session.__enter__()
+        self.addCleanup(session.__exit__, None, None, None)  # type: ignore
+
+
+class TestBranchExistsInSession(_InSession, TestBranchExists):
+    pass
+
+
+class TestRemotesWithBranchInSession(_InSession, TestRemotesWithBranch):
+    pass
+
+
+class TestRemoteOpsInSession(_InSession, TestRemoteOps):
+    pass
+
+
+class TestGitSession(GitRepoTestCase):
+    def _count_git_calls(self):
+        from unittest.mock import patch
+
+        import pyishlib.git_repo as git_repo_mod
+
+        return patch.object(
+            git_repo_mod.subprocess, "run", wraps=git_repo_mod.subprocess.run
+        )
+
+    def test_ref_queries_share_one_snapshot(self) -> None:
+        _git("branch", "feature/x", cwd=self.root)
+        with git_session():
+            with self._count_git_calls() as run:
+                repo = GitRepo.discover(self.root)
+                again = GitRepo.discover(self.root, require_root=True)
+                self.assertTrue(repo.branch_exists("feature/x", local_only=True))
+                self.assertFalse(again.branch_exists("nope"))
+                self.assertEqual(repo.current_branch(), "main")
+                self.assertEqual(repo.remotes_with_branch("main"), [])
+            # One rev-parse for discovery, one for-each-ref for the refs.
+            self.assertEqual(run.call_count, 2)
+
+    def test_mutation_invalidates_snapshot(self) -> None:
+        with git_session():
+            repo = GitRepo.discover(self.root)
+            repo.add_worktree(self.root / "wt", branch=None, detach=True)
+            self.assertFalse(repo.branch_exists("ish/wt", local_only=True))
+            _git("switch", "-c", "ish/wt", cwd=self.root / "wt")
+            # Raw git calls need an explicit invalidation...
+            self.assertFalse(repo.branch_exists("ish/wt", local_only=True))
+            repo.checkout_orphan("ish/orphan", work_dir=self.root / "wt")
+            # ...GitRepo mutators invalidate on their own.
+            self.assertTrue(repo.branch_exists("ish/wt", local_only=True))
+
+    def test_explicit_invalidate(self) -> None:
+        with git_session() as session:
+            repo = GitRepo.discover(self.root)
+            self.assertFalse(repo.branch_exists("later"))
+            _git("branch", "later", cwd=self.root)
+            session.invalidate()
+            self.assertTrue(repo.branch_exists("later"))
+
+    def test_current_branch_detached_and_unborn(self) -> None:
+        _git("switch", "--detach", cwd=self.root)
+        with git_session():
+            self.assertIsNone(GitRepo.discover(self.root).current_branch())
+        _git("switch", "--orphan", "fresh", cwd=self.root)
+        with git_session():
+            self.assertEqual(GitRepo.discover(self.root).current_branch(), "fresh")
+
+    def test_nested_sessions_share_caches(self) -> None:
+        with git_session() as outer:
+            with git_session() as inner:
+                self.assertIs(inner, outer)
+            repo = GitRepo.discover(self.root)
+            with self._count_git_calls() as run:
+                GitRepo.discover(self.root)
+            self.assertEqual(run.call_count, 0)
+            self.assertTrue(repo.branch_exists("main"))
+
+    def test_submodule_discovery_reads_dotgit(self) -> None:
+        child_tmp = _make_tempdir()
+        self.addCleanup(child_tmp.cleanup)
+        child = Path(child_tmp.name).resolve()
+        _make_repo(child)
+        TestIterSubmoduleRepos._add_submodule(self, child, "sub")  # type: ignore
+
+        repo = GitRepo.discover(self.root)
+        expected = [(r.work_tree, r.git_dir) for r in repo.iter_submodule_repos()]
+        with git_session():
+            with self._count_git_calls() as run:
+                got = [(r.work_tree, r.git_dir) for r in repo.iter_submodule_repos()]
+            # Only the `git submodule foreach` enumeration itself.
+            self.assertEqual(run.call_count, 1)
+        self.assertEqual(got, expected)
+
+
 class TestListTrackedFiles(GitRepoTestCase):
     def test_lists_tracked_files_relative_to_worktree(self) -> None:
         (self.root / "a.txt").write_text("a")
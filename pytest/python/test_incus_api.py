@@ -0,0 +1,368 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+
+"""Tests for the Incus REST API backend (pyishlib.container.incus_api).
+
+Runs :class:`IncusApiClient` / :class:`IncusApiContainer` against a small
+in-process HTTP-over-unix-socket stand-in for the Incus daemon.
+"""
+
+import json
+import os
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.container import (  # noqa: E402
+    IncusApiBackend,
+    IncusApiClient,
+    IncusApiContainer,
+    IncusApiError,
+    IncusContainer,
+    get_backend,
+)
+
+
+class _FakeIncus:
+    """In-memory daemon state shared by the request handler."""
+
+    def __init__(self):
+        self.instances = {}
+        self.operations = {}
+        self.files = {}
+        self.logs = {}
+        self.requests = []
+
+    def operation(self, metadata=None, error=None):
+        op_id = uuid.uuid4().hex
+        self.operations[op_id] = {
+            "polls_left": 1,
+            "metadata": metadata,
+            "error": error,
+        }
+        return f"/1.0/operations/{op_id}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def fake(self):
+        return self.server.fake
+
+    def _send(self, status, doc=None, raw=None, headers=None):
+        body = raw if raw is not None else json.dumps(doc).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _sync(self, metadata=None):
+        self._send(200, {"type": "sync", "status_code": 200, "metadata": metadata})
+
+    def _async(self, metadata=None, error=None):
+        op = self.fake.operation(metadata, error)
+        self._send(202, {"type": "async", "status_code": 100, "operation": op})
+
+    def _error(self, code, message):
+        self._send(code, {"type": "error", "error_code": code, "error": message})
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+        query = parse_qs(url.query)
+        body = self._body()
+        self.fake.requests.append((method, url.path))
+
+        if parts == ["1.0"]:
+            return self._sync({"auth": "trusted"})
+        if parts[:2] == ["1.0", "operations"] and parts[-1] == "wait":
+            op = self.fake.operations[parts[2]]
+            if op["polls_left"]:
+                op["polls_left"] -= 1
+                return self._sync({"status_code": 103, "status": "Running"})
+            if op["error"]:
+                return self._sync({"status_code": 400, "err": op["error"]})
+            return self._sync({"status_code": 200, "metadata": op["metadata"]})
+        if parts == ["1.0", "instances"]:
+            if method == "GET":
+                return self._sync(list(self.fake.instances.values()))
+            req = json.loads(body)
+            source = req["source"]
+            if source["type"] == "copy":
+                inst = json.loads(json.dumps(self.fake.instances[source["source"]]))
+                inst.update(name=req["name"], status="Stopped")
+            else:
+                inst = {
+                    "name": req["name"],
+                    "status": "Stopped",
+                    "config": dict(req.get("config") or {}),
+                    "devices": {},
+                    "profiles": ["default"],
+                }
+            self.fake.instances[req["name"]] = inst
+            return self._async()
+
+        name = parts[2]
+        inst = self.fake.instances.get(name)
+        if inst is None:
+            return self._error(404, "Instance not found")
+        rest = parts[3:]
+        if not rest:
+            if method == "GET":
+                return self._sync(inst)
+            if method == "PUT":
+                inst.update(json.loads(body))
+                return self._async()
+            if method == "DELETE":
+                if inst["status"] == "Running":
+                    return self._async(error="Instance is running")
+                del self.fake.instances[name]
+                return self._async()
+        if rest == ["state"]:
+            action = json.loads(body)["action"]
+            inst["status"] = "Running" if action == "start" else "Stopped"
+            return self._async()
+        if rest == ["exec"]:
+            req = json.loads(body)
+            cmd = req["command"]
+            out = " ".join(cmd[1:]) + "\n" if cmd[0] == "echo" else ""
+            if cmd[0] == "env":
+                out = "".join(f"{k}={v}\n" for k, v in req["environment"].items())
+            err = "boom\n" if cmd[0] == "false" else ""
+            urls = {}
+            for fd, data in (("1", out), ("2", err)):
+                url = f"/1.0/instances/{name}/logs/exec-output/{uuid.uuid4().hex}"
+                self.fake.logs[url] = data.encode()
+                urls[fd] = url
+            rc = 1 if cmd[0] == "false" else 0
+            return self._async({"return": rc, "output": urls})
+        if rest[:2] == ["logs", "exec-output"]:
+            if method == "DELETE":
+                self.fake.logs.pop(url.path, None)
+                return self._sync()
+            return self._send(200, raw=self.fake.logs[url.path])
+        if rest == ["files"]:
+            key = (name, query["path"][0])
+            if method == "POST":
+                self.fake.files[key] = (body, dict(self.headers))
+                return self._sync()
+            if key not in self.fake.files:
+                return self._error(404, "not found")
+            data, _ = self.fake.files[key]
+            return self._send(
+                200, raw=data, headers={"X-Incus-type": "file", "X-Incus-mode": "0640"}
+            )
+        return self._error(404, "not found")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def daemon():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "unix.socket")
+        server = _Server(path, _Handler)
+        server.fake = _FakeIncus()
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.05,), daemon=True
+        )
+        thread.start()
+        try:
+            yield server.fake, Path(path)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.fixture
+def backend(daemon):
+    return IncusApiBackend(daemon[1])
+
+
+class TestIncusApiClient:
+    def test_sync_request_returns_metadata(self, daemon):
+        client = IncusApiClient(daemon[1])
+        assert client.request("GET", "/1.0") == {"auth": "trusted"}
+
+    def test_error_response_raises_with_status(self, daemon):
+        client = IncusApiClient(daemon[1])
+        with pytest.raises(IncusApiError) as exc:
+            client.request("GET", "/1.0/instances/missing")
+        assert exc.value.status_code == 404
+
+    def test_async_operation_is_polled(self, daemon):
+        fake, path = daemon
+        client = IncusApiClient(path)
+        body = {"name": "c1", "source": {"type": "image", "alias": "deb"}}
+        client.request("POST", "/1.0/instances", body)
+        waits = [p for m, p in fake.requests if p.endswith("/wait")]
+        assert len(waits) == 2
+        assert "c1" in fake.instances
+
+    def test_connection_is_reused(self, daemon):
+        client = IncusApiClient(daemon[1])
+        client.request("GET", "/1.0")
+        conn = client._local.conn
+        client.request("GET", "/1.0")
+        assert client._local.conn is conn
+
+    def test_missing_socket_raises(self, tmp_path):
+        client = IncusApiClient(tmp_path / "nope.socket")
+        assert not client.available()
+        with pytest.raises(IncusApiError):
+            client.request("GET", "/1.0")
+
+
+class TestIncusApiContainer:
+    def test_lifecycle(self, backend):
+        c = backend.container("c1")
+        assert isinstance(c, IncusApiContainer)
+        assert not c.exists()
+        c.create("debian", **{"security.nesting": "true"})
+        assert c.exists() and not c.is_running()
+        assert c.get_metadata("security.nesting") == "true"
+        c.start()
+        assert c.is_running()
+        assert c.delete(force=True)
+        assert not c.exists()
+
+    def test_start_failure_raises_called_process_error(self, backend):
+        with pytest.raises(subprocess.CalledProcessError):
+            backend.container("ghost").start()
+
+    def test_stop_and_delete_report_failure(self, backend):
+        c = backend.container("ghost")
+        assert c.stop() is False
+        assert c.delete() is False
+
+    def test_copy_to(self, backend, daemon):
+        c = backend.container("c1")
+        c.create("debian")
+        copy = c.copy_to("c2")
+        assert isinstance(copy, IncusApiContainer)
+        assert copy.exists()
+
+    def test_remote_image_falls_back_to_cli(self, backend):
+        with patch.object(IncusContainer, "create") as cli_create:
+            backend.container("c1").create("images:debian/12")
+        cli_create.assert_called_once_with("images:debian/12")
+
+    def test_devices_and_metadata(self, backend):
+        c = backend.container("c1")
+        c.create("debian")
+        c.add_mount("home", Path("/src"), "/dst", readonly=True)
+        assert c.list_devices() == ["home"]
+        with pytest.raises(subprocess.CalledProcessError):
+            c.add_device("home", "disk", source="/x", path="/y")
+        c.remove_device("home")
+        assert c.list_devices_strict() == []
+        c.set_metadata("user.isholate", "1")
+        assert c.get_metadata("user.isholate") == "1"
+        assert c.get_metadata("user.missing") is None
+
+    def test_list_devices_strict_raises_for_missing(self, backend):
+        c = backend.container("ghost")
+        assert c.list_devices() == []
+        with pytest.raises(RuntimeError):
+            c.list_devices_strict()
+
+    def test_exec_captures_output_and_cleans_logs(self, backend, daemon):
+        fake, _ = daemon
+        c = backend.container("c1")
+        c.create("debian")
+        r = c.exec(["echo", "hi"], capture_output=True, text=True)
+        assert (r.returncode, r.stdout, r.stderr) == (0, "hi\n", "")
+        assert fake.logs == {}
+
+    def test_exec_passes_environment(self, backend):
+        c = backend.container("c1")
+        c.create("debian")
+        r = c.exec(["env"], env={"A": "1"}, capture_output=True)
+        assert r.stdout == b"A=1\n"
+
+    def test_exec_check_raises(self, backend):
+        c = backend.container("c1")
+        c.create("debian")
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            c.exec(["false"], capture_output=True, text=True, check=True)
+        assert exc.value.stderr == "boom\n"
+
+    def test_exec_without_capture_uses_cli(self, backend):
+        c = backend.container("c1")
+        with patch.object(IncusContainer, "exec") as cli_exec:
+            c.exec(["bash"], stdin=subprocess.DEVNULL)
+        cli_exec.assert_called_once()
+
+    def test_push_and_pull_file(self, backend, daemon, tmp_path):
+        fake, _ = daemon
+        c = backend.container("c1")
+        c.create("debian")
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"payload")
+        assert c.push_file(src, "/etc/x y", uid=0, gid=0, mode=0o600)
+        _, headers = fake.files[("c1", "/etc/x y")]
+        assert headers["X-Incus-mode"] == "0600"
+        dest = tmp_path / "out" / "dest.txt"
+        assert c.pull_file("/etc/x y", dest)
+        assert dest.read_bytes() == b"payload"
+        assert not c.pull_file("/missing", tmp_path / "m")
+
+
+class TestIncusApiBackend:
+    def test_check_available(self, backend):
+        assert backend.check_available() is None
+
+    def test_list_containers(self, backend):
+        backend.container("c1").create("debian")
+        assert [c["name"] for c in backend.list_containers()] == ["c1"]
+
+    def test_falls_back_to_cli_without_socket(self, tmp_path):
+        backend = IncusApiBackend(tmp_path / "nope.socket")
+        c = backend.container("c1")
+        assert type(c) is IncusContainer
+        with patch(
+            "pyishlib.container.incus_api.check_incus_available",
+            return_value="guidance",
+        ):
+            assert backend.check_available() == "guidance"
+
+    def test_get_backend_env_selects_api(self, monkeypatch):
+        monkeypatch.setenv("ISHLIB_CONTAINER_BACKEND", "incus-api")
+        assert isinstance(get_backend(), IncusApiBackend)
@@ -8,6 +8,7 @@ import sys
 import os
 import subprocess
 import logging
+import threading
 from pathlib import Path
 from unittest.mock import patch
 import pytest
@@ -18,8 +19,10 @@ sys.path.insert(
 from pyishlib.installer import Installer
 from pyishlib.installer_apt import (
     InstallerApt,
+    _parse_dpkg_status_lines,
     _parse_reverse_provides,
     _showpkg_has_versions_or_providers,
+    _split_showpkg_sections,
 )
 from pyishlib.installer_brew import InstallerBrew
 from pyishlib.installer_cargo import InstallerCargo
@@ -290,6 +293,101 @@ class TestInstallerApt:
         assert not any("${Version}" in c[2] for c in calls if len(c) > 2)
 
 
+class TestInstallerAptPrefetch:
+    _SHOWPKG = (
+        b"Package: virtual-pkg\nVersions: \n\n"
+        b"Reverse Depends: \n\nDependencies\n\nProvides: \n\n"
+        b"Reverse Provides:\nreal-pkg 1.0\n\n"
+        b"Package: fresh\nVersions: \n1.2-1 (/var/lib/apt/lists/...)\n\n"
+        b"Reverse Provides: \n\n"
+    )
+
+    def _make(self):
+        runner = make_runner({"apt": "/usr/bin/apt"})
+        apt = InstallerApt(runner)
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            if cmd[0] == "dpkg-query" and "git" in cmd:
+                out = b"git\tinstall ok installed\t1:2.40.1-1\n"
+                return subprocess.CompletedProcess(cmd, 1, out, b"")
+            if cmd[0] == "dpkg-query" and "real-pkg" in cmd:
+                out = b"real-pkg\tinstall ok installed\t1.0\n"
+                return subprocess.CompletedProcess(cmd, 0, out, b"")
+            if cmd[0] == "apt-cache":
+                return subprocess.CompletedProcess(cmd, 0, self._SHOWPKG, b"")
+            return subprocess.CompletedProcess(cmd, 1, b"", b"")
+
+        runner.run = mock_run
+        return apt, calls
+
+    def test_prefetch_uses_three_queries(self):
+        apt, calls = self._make()
+        pkgs = [
+            {"name": "git", "apt": "git", "min_version": "2.30"},
+            {"name": "virtual-pkg", "apt": "virtual-pkg"},
+            {"name": "fresh", "apt": "fresh"},
+        ]
+        apt.prefetch(pkgs)
+        assert [c[0] for c in calls] == ["dpkg-query", "apt-cache", "dpkg-query"]
+        assert calls[0][3:] == ["fresh", "git", "virtual-pkg"]
+        assert calls[1][3:] == ["fresh", "virtual-pkg"]
+        assert calls[2][3:] == ["real-pkg"]
+
+        calls.clear()
+        assert apt.is_pkg_installed(pkgs[0]) is True
+        assert apt.is_pkg_installed(pkgs[1]) is True
+        assert apt.is_pkg_installed(pkgs[2]) is False
+        assert apt.is_pkg_available(pkgs[2]) is True
+        assert calls == []
+
+    def test_prefetch_skips_known_names(self):
+        apt, calls = self._make()
+        apt.prefetch([{"name": "git", "apt": "git"}])
+        calls.clear()
+        apt.prefetch([{"name": "git", "apt": "git"}])
+        assert calls == []
+
+    def test_prefetch_ignores_arch_qualified_names(self):
+        apt, calls = self._make()
+        apt.prefetch([{"name": "lib32", "apt": "libc6:i386"}])
+        assert calls == []
+
+    def test_install_clears_cache(self):
+        apt, calls = self._make()
+        apt.prefetch([{"name": "fresh", "apt": "fresh"}])
+        apt.install_pkgs([{"name": "fresh", "apt": "fresh"}])
+        calls.clear()
+        apt.is_pkg_installed({"name": "fresh", "apt": "fresh"})
+        assert calls and calls[0][0] == "dpkg-query"
+
+    def test_installer_get_missing_pkgs_prefetches(self):
+        installer = make_installer(which_returns={"apt": "/usr/bin/apt"})
+        apt = installer.get_backend("apt")
+        pkgs = [{"name": "a", "apt": "a"}, {"name": "b", "apt": "b"}]
+        with patch.object(apt, "prefetch") as mock_prefetch:
+            installer.get_missing_pkgs(pkgs)
+        mock_prefetch.assert_called_once_with(pkgs)
+
+
+class TestAptBulkParsers:
+    def test_parse_dpkg_status_lines(self):
+        output = (
+            "git\tinstall ok installed\t1:2.40.1-1\n"
+            "vim\tdeinstall ok config-files\t2:9.0\n"
+            "garbage line\n"
+        )
+        assert _parse_dpkg_status_lines(output) == {"git": "1:2.40.1-1"}
+
+    def test_split_showpkg_sections(self):
+        output = "Package: a\nVersions: \n1.0\n\nPackage: b\nVersions: \n\n"
+        sections = _split_showpkg_sections(output)
+        assert set(sections) == {"a", "b"}
+        assert _showpkg_has_versions_or_providers(sections["a"]) is True
+        assert _showpkg_has_versions_or_providers(sections["b"]) is False
+
+
 class TestInstallerDnf:
     def test_is_pkg_available_true(self):
         runner = make_runner({"dnf": "/usr/bin/dnf"})
@@ -371,6 +469,106 @@ class TestInstallerDnf:
             assert dnf.is_pkg_installed(pkg) is True
 
 
+class TestBulkAvailability:
+    def _make(self, cls, tool, output):
+        runner = make_runner({tool: f"/usr/bin/{tool}"})
+        backend = cls(runner)
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, output, b"")
+
+        runner.run = mock_run
+        return backend, calls
+
+    def test_dnf_repoquery_resolves_all_names_at_once(self):
+        dnf, calls = self._make(
+            InstallerDnf, "dnf", b"tldr noarch\nripgrep x86_64\nripgrep i686\n"
+        )
+        pkgs = [
+            {"name": "tldr", "dnf": "tldr"},
+            {"name": "rg", "dnf": "ripgrep.x86_64"},
+            {"name": "nope", "dnf": "nope"},
+            {"name": "glob", "dnf": "python3-*"},
+        ]
+        dnf.prefetch_available(pkgs)
+        assert len(calls) == 1
+        assert calls[0][:2] == ["dnf", "repoquery"]
+        assert calls[0][-3:] == ["nope", "ripgrep.x86_64", "tldr"]
+        calls.clear()
+        assert [dnf.is_pkg_available(p) for p in pkgs[:3]] == [True, True, False]
+        assert calls == []
+        dnf.is_pkg_available(pkgs[3])
+        assert calls == [["dnf", "info", "--quiet", "python3-*"]]
+
+    def test_dnf_failed_repoquery_falls_back(self):
+        runner = make_runner({"dnf": "/usr/bin/dnf"})
+        dnf = InstallerDnf(runner)
+        with patch.object(
+            runner,
+            "run",
+            return_value=subprocess.CompletedProcess([], 1, b"", b"boom"),
+        ) as mock_run:
+            dnf.prefetch_available([{"name": "tldr", "dnf": "tldr"}])
+            dnf.is_pkg_available({"name": "tldr", "dnf": "tldr"})
+        assert mock_run.call_args.args[0][:2] == ["dnf", "info"]
+
+    def test_dnf_repoquery_runs_in_dry_run(self):
+        runner = make_runner({"dnf": "/usr/bin/dnf"})
+        assert runner.dry_run
+        dnf = InstallerDnf(runner)
+        with patch(
+            "pyishlib.command_runner.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, b"tldr noarch\n", b""),
+        ) as mock_run:
+            dnf.prefetch_available([{"name": "tldr", "dnf": "tldr"}])
+        assert mock_run.call_args.args[0][:2] == ["dnf", "repoquery"]
+        assert dnf.is_pkg_available({"name": "tldr", "dnf": "tldr"})
+
+    def test_apt_showpkg_runs_in_dry_run(self):
+        runner = make_runner({"apt": "/usr/bin/apt"})
+        apt = InstallerApt(runner)
+        output = b"Package: tldr\nVersions: \n1.0 (/var/lib/apt/lists/x)\n\n"
+        with patch(
+            "pyishlib.command_runner.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, output, b""),
+        ) as mock_run:
+            apt.prefetch_available([{"name": "tldr", "apt": "tldr"}])
+        assert mock_run.call_args.args[0][:3] == [
+            "apt-cache",
+            "--no-generate",
+            "showpkg",
+        ]
+        assert apt.is_pkg_available({"name": "tldr", "apt": "tldr"})
+
+    def test_apt_showpkg_resolves_all_names_at_once(self):
+        apt, calls = self._make(
+            InstallerApt,
+            "apt",
+            b"Package: tldr\nVersions: \n1.0 (/var/lib/apt/lists/x)\n\n",
+        )
+        pkgs = [{"name": "tldr", "apt": "tldr"}, {"name": "nope", "apt": "nope"}]
+        apt.prefetch_available(pkgs)
+        assert calls == [["apt-cache", "--no-generate", "showpkg", "nope", "tldr"]]
+        calls.clear()
+        assert [apt.is_pkg_available(p) for p in pkgs] == [True, False]
+        assert calls == []
+
+    def test_installer_plan_prefetches_missing_only(self):
+        installer = make_installer(which_returns={"dnf": "/usr/bin/dnf"})
+        dnf = installer.get_backend("dnf")
+        pkgs = [{"name": "a", "dnf": "a"}, {"name": "b", "dnf": "b"}]
+        with (
+            patch.object(
+                dnf, "is_pkg_installed", side_effect=lambda p: p["dnf"] == "a"
+            ),
+            patch.object(dnf, "prefetch_available") as prefetch,
+        ):
+            installer.plan(pkgs)
+        prefetch.assert_called_once_with([pkgs[1]])
+
+
 class TestParseReverseProvides:
     def test_single_provider(self):
         output = "Package: virt\nVersions: \n\nReverse Provides:\nreal-pkg 1.0\n\n"
@@ -529,6 +727,74 @@ class TestInstallerCargo:
             assert result is True
 
 
+class TestInstalledSnapshot:
+    _PIP_LIST = b'[{"name": "Black", "version": "24.1"}, {"name": "ruamel.yaml"}]'
+    _CARGO_LIST = (
+        b"cargo-update v13.4.0:\n    cargo-install-update\n"
+        b"ripgrep v14.1.0 (https://github.com/BurntSushi/ripgrep):\n    rg\n"
+    )
+
+    def _make(self, cls, tool, output, returncode=0):
+        runner = make_runner({tool: f"/usr/bin/{tool}"})
+        backend = cls(runner)
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, returncode, output, b"")
+
+        runner.run = mock_run
+        return backend, calls
+
+    def test_pip_lists_once(self):
+        pip, calls = self._make(InstallerPip, "pip3", self._PIP_LIST)
+        pkgs = [{"name": f"p{i}", "pip": f"missing-{i}"} for i in range(40)]
+        assert not any(pip.is_pkg_installed(p) for p in pkgs)
+        assert calls == [["pip3", "list", "--format=json"]]
+
+    def test_pip_names_are_normalised(self):
+        pip, _ = self._make(InstallerPip, "pip3", self._PIP_LIST)
+        assert pip.is_pkg_installed({"name": "black", "pip": "black[jupyter]>=24"})
+        assert pip.is_pkg_installed({"name": "ruamel", "pip": "ruamel_yaml"})
+        assert not pip.is_pkg_installed({"name": "bla", "pip": "bla"})
+
+    def test_cargo_matches_crates_not_binaries(self):
+        cargo, calls = self._make(InstallerCargo, "cargo", self._CARGO_LIST)
+        assert cargo.is_pkg_installed({"name": "rg", "cargo": "ripgrep"})
+        assert cargo.is_pkg_installed({"name": "cu", "cargo": "cargo-update"})
+        assert not cargo.is_pkg_installed({"name": "rg", "cargo": "rg"})
+        assert not cargo.is_pkg_installed({"name": "cargo", "cargo": "cargo"})
+        assert calls == [["cargo", "install", "--list"]]
+
+    def test_brew_matches_tap_qualified_names(self):
+        brew, _ = self._make(InstallerBrew, "brew", b"git\nripgrep\n")
+        assert brew.is_pkg_installed({"name": "rg", "brew": "ripgrep"})
+        assert brew.is_pkg_installed({"name": "rg", "brew": "me/tools/ripgrep"})
+        assert not brew.is_pkg_installed({"name": "gi", "brew": "gi"})
+
+    def test_failed_listing_counts_as_not_installed(self):
+        brew, calls = self._make(InstallerBrew, "brew", b"git\n", returncode=1)
+        assert not brew.is_pkg_installed({"name": "git", "brew": "git"})
+        assert not brew.is_pkg_installed({"name": "git", "brew": "git"})
+        assert len(calls) == 1
+
+    def test_install_clears_snapshot(self):
+        brew, calls = self._make(InstallerBrew, "brew", b"git\n")
+        brew.is_pkg_installed({"name": "git", "brew": "git"})
+        brew.install_pkgs([{"name": "jq", "brew": "jq"}])
+        brew.is_pkg_installed({"name": "jq", "brew": "jq"})
+        assert [c[:2] for c in calls] == [
+            ["brew", "list"],
+            ["brew", "install"],
+            ["brew", "list"],
+        ]
+
+    def test_backends_without_listing_have_no_snapshot(self):
+        apt, calls = self._make(InstallerApt, "apt", b"")
+        assert apt.installed_snapshot() is None
+        assert calls == []
+
+
 class TestInstallerWinget:
     def test_available_true(self):
         winget = InstallerWinget(make_runner({"winget": "C:\\winget.exe"}))
@@ -803,6 +1069,112 @@ class TestInstallerOrchestration:
         with patch.object(apt_backend, "is_pkg_available", return_value=False):
             assert installer.pkg_is_available(pkg) is False
 
+    def test_plan_records_backend_availability_and_version(self):
+        installer = make_installer(
+            which_returns={"apt": "/usr/bin/apt", "git": "/usr/bin/git"}
+        )
+        pkgs = [
+            {"name": "git", "cmd": "git", "min_version": "2.50"},
+            {"name": "tldr", "apt": "tldr", "optional": True},
+            {"name": "nope", "cargo": "nope"},
+        ]
+        apt = installer.get_backend("apt")
+        with (
+            patch(
+                "pyishlib.installer.probe_version", return_value="git version 2.40.1"
+            ),
+            patch.object(apt, "is_pkg_installed", return_value=False),
+            patch.object(apt, "is_pkg_available", return_value=True),
+        ):
+            plan = installer.plan(pkgs)
+        git, tldr, nope = plan.entries
+        assert (git.installed, git.reason, git.version) == (False, "too-old", "2.40.1")
+        assert (tldr.reason, tldr.backend, tldr.available) == ("missing", "apt", True)
+        assert (nope.reason, nope.backend) == ("no-checker", None)
+        assert nope.available is False
+        assert plan.as_dict()["packages"][1]["optional"] is True
+
+    def test_install_from_plan_does_not_probe_again(self):
+        installer = make_installer(which_returns={"apt": "/usr/bin/apt"})
+        pkgs = [{"name": "a", "apt": "a"}, {"name": "b", "apt": "b"}]
+        apt = installer.get_backend("apt")
+        with (
+            patch.object(apt, "is_pkg_installed", return_value=False) as probe,
+            patch.object(apt, "is_pkg_available", return_value=True),
+            patch.object(apt, "install_pkgs", return_value=True) as install,
+        ):
+            plan = installer.plan(pkgs)
+            assert probe.call_count == 2
+            installer.install_pkgs([e.pkg for e in plan.missing], plan=plan)
+        assert probe.call_count == 2
+        install.assert_called_once_with(pkgs)
+
+
+class TestInstallerConcurrentProbes:
+    def _make(self, jobs, which_returns=None):
+        runner = make_runner(which_returns or {"apt": "/usr/bin/apt"})
+        return Installer(cfg=IshConfig(dry_run=True), runner=runner, jobs=jobs)
+
+    def test_packages_are_probed_concurrently_in_order(self):
+        installer = self._make(jobs=4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def is_installed(pkg):
+            barrier.wait()  # only passes if all four probes overlap
+            return pkg["apt"] in ("b", "d")
+
+        pkgs = [{"name": n, "apt": n} for n in "abcd"]
+        with patch.object(
+            installer.get_backend("apt"), "is_pkg_installed", side_effect=is_installed
+        ):
+            missing = installer.get_missing_pkgs(pkgs)
+        assert [p["name"] for p in missing] == ["a", "c"]
+
+    def test_single_job_probes_serially(self):
+        installer = self._make(jobs=1)
+        threads = set()
+
+        def is_installed(pkg):
+            threads.add(threading.get_ident())
+            return False
+
+        with patch.object(
+            installer.get_backend("apt"), "is_pkg_installed", side_effect=is_installed
+        ):
+            installer.get_missing_pkgs([{"name": n, "apt": n} for n in "abc"])
+        assert threads == {threading.get_ident()}
+
+    def test_first_backend_hit_stops_the_probe(self):
+        installer = self._make(
+            jobs=4, which_returns={"apt": "/usr/bin/apt", "cargo": "/usr/bin/cargo"}
+        )
+        with (
+            patch.object(
+                installer.get_backend("apt"), "is_pkg_installed", return_value=True
+            ),
+            patch.object(installer.get_backend("cargo"), "is_pkg_installed") as cargo,
+        ):
+            status = installer.pkg_status({"name": "rg", "apt": "rg", "cargo": "rg"})
+        assert (status.installed, status.backend) == (True, "apt")
+        cargo.assert_not_called()
+
+    def test_probe_errors_are_reraised_in_order(self):
+        installer = self._make(jobs=4)
+
+        def is_installed(pkg):
+            raise RuntimeError(pkg["apt"])
+
+        pkgs = [{"name": n, "apt": n} for n in "abcd"]
+        with patch.object(
+            installer.get_backend("apt"), "is_pkg_installed", side_effect=is_installed
+        ):
+            with pytest.raises(RuntimeError, match="^a$"):
+                installer.plan(pkgs)
+
+    def test_jobs_default_from_config(self):
+        cfg = IshConfig(dry_run=True, defaults={"probe_jobs": 7})
+        assert Installer(cfg=cfg, runner=make_runner()).jobs == 7
+
 
 class TestInstallerPipWindowsSupport:
     def test_has_pip_fallback_to_pip(self):
@@ -4,11 +4,14 @@
 #
 # Tests for the ishfiles tool (config, ignore, CLI)
 
+import fnmatch
+import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -248,6 +251,23 @@ class TestDotfileIgnore:
             assert di.is_ignored("foo.pyc", Path("deep/nested/foo.pyc"))
             assert not di.is_ignored("foo.py", Path("deep/nested/foo.py"))
 
+    def test_compiled_matcher_agrees_with_fnmatch(self):
+        pats = ["*.log", "temp_*", "exact", "[ab]?c", "a[", "sub/*.tmp", "**/x"]
+        names = ["x.log", "temp_1", "exact", "abc", "bzc", "a[", "exactly", "log"]
+        paths = ["sub/y.tmp", "sub/deep/y.tmp", "a/b/x", "x"]
+        with tempfile.TemporaryDirectory() as d:
+            di = DotfileIgnore(Path(d), extra_patterns=pats)
+            for name in names:
+                for rel in [None] + [Path(p) for p in paths]:
+                    expected = any(
+                        fnmatch.fnmatch(rel.as_posix(), p)
+                        if "/" in p
+                        else fnmatch.fnmatch(name, p)
+                        for p in di.patterns
+                        if rel is not None or "/" not in p
+                    )
+                    assert di.is_ignored(name, rel) is expected, (name, rel)
+
     def test_name_pattern_still_works_without_rel_path(self):
         with tempfile.TemporaryDirectory() as d:
             _make_file(Path(d) / ".ishignore", "*.log\n")
@@ -314,6 +334,14 @@ class TestCli:
             ret = cli_main(["--source", src, "--target", tgt, "diff"])
         assert ret == 1
 
+    def test_diff_binary_new_file_shows_target(self, capsys):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            (Path(src) / "dot_bin").write_bytes(b"\xff\x00")
+            ret = cli_main(["--source", src, "--target", tgt, "diff"])
+            target = Path(tgt) / ".bin"
+        assert ret == 1
+        assert f"+++ {target}\n" in capsys.readouterr().out
+
     def test_diff_no_changes(self):
         with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
             _make_file(Path(src) / "dot_bashrc", "same\n")
@@ -343,6 +371,36 @@ class TestCli:
             assert ret == 0
             assert (Path(tgt) / ".bashrc").read_text() == "content\n"
 
+    def test_apply_timings_prints_phases_and_writes_trace(self, capsys):
+        import json
+
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(Path(src) / "dot_bashrc", "content\n")
+            ret = cli_main(
+                [
+                    "--source",
+                    src,
+                    "--target",
+                    tgt,
+                    "apply",
+                    "--yes",
+                    "--dotfiles-only",
+                    "--skip-launchers",
+                    "--timings",
+                ]
+            )
+            out = capsys.readouterr().out
+            traces = list((Path(tgt) / ".local/state/ishfiles/logs").glob("*.json"))
+            assert len(traces) == 1
+            events = json.loads(traces[0].read_text())["traceEvents"]
+        assert ret == 0
+        for name in ("discover", "scan", "prepare", "changes", "write", "total"):
+            assert any(line.startswith(name) for line in out.splitlines()), name
+        assert {e["name"] for e in events if e["cat"] == "phase"} >= {
+            "discover",
+            "write",
+        }
+
     def test_apply_user_declines(self):
         with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
             _make_file(Path(src) / "dot_bashrc", "content\n")
@@ -446,6 +504,30 @@ class TestCli:
                 ret = cli_main(["--source", src, "--target", tgt, "apply", "--dry-run"])
             assert ret == 1
 
+    def test_parser_does_not_import_commands(self):
+        """Building the parser (``--help``, completion) imports no command
+        implementation; dispatching a subcommand imports only its own."""
+        src_dir = Path(__file__).resolve().parents[2] / "src"
+        code = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(src_dir)!r})\n"
+            "from pyishlib.ishfiles.cli import build_parser, main\n"
+            "build_parser()\n"
+            "loaded = lambda: sorted(m for m in sys.modules\n"
+            "    if m.startswith('pyishlib.ishfiles.commands.')\n"
+            "    and not m.endswith('.registry'))\n"
+            "print(loaded())\n"
+            "main(['pd'])\n"
+            "print(loaded())\n"
+            "print('pyishlib.installer' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+        assert out[0] == "[]"
+        assert out[-2] == "['pyishlib.ishfiles.commands.pd']"
+        assert out[-1] == "False"
+
 
 # ---------------------------------------------------------------------------
 # reverse translation
@@ -563,6 +645,59 @@ class TestDotfileFinder:
             assert df.target == Path(tgt) / ".bashrc"
             assert df.source == Path(src) / "dot_bashrc"
 
+    @staticmethod
+    def _make_tree(src: Path) -> None:
+        for i in range(6):
+            for j in range(4):
+                _make_file(src / "dot_config" / f"tool{i}" / f"sub{j}" / "conf")
+            _make_file(src / "dot_config" / f"tool{i}" / "init.vim")
+            _make_file(src / f"dot_file{i}")
+        _make_file(src / "dot_config" / "tool1" / "skip.bak")
+        _make_file(src / "dot_vim" / "pack" / "p" / "start" / "x.vim")
+        os.symlink(src / "dot_vim", src / "dot_vimlink")
+
+    def test_parallel_scan_matches_serial(self):
+        from pyishlib.dotfile_finder import DotfileFinder
+        from pyishlib.ish_config import IshConfig
+
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            self._make_tree(Path(src))
+            results = []
+            for jobs in (1, 4):
+                cfg = IshConfig(
+                    defaults={"source": src, "target": tgt, "discover_jobs": jobs}
+                )
+                ignore = DotfileIgnore(Path(src), extra_patterns=["*.bak"])
+                found = DotfileFinder(cfg).discover(dotfile_ignore=ignore)
+                results.append([(df.source, df.rel_path) for df in found])
+            assert results[0] == results[1]
+            rels = [str(rel) for _, rel in results[0]]
+            assert len(rels) == 6 * 6 + 2
+            assert "dot_vimlink/pack/p/start/x.vim" in rels
+            assert not any(r.endswith(".bak") for r in rels)
+
+    def test_parallel_scan_propagates_errors(self):
+        from pyishlib.dotfile_finder import DotfileFinder
+        from pyishlib.ish_config import IshConfig
+
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            self._make_tree(Path(src))
+            cfg = IshConfig(defaults={"source": src, "target": tgt, "discover_jobs": 4})
+            finder = DotfileFinder(cfg)
+            real = finder._scan_dir
+            raised_in = []
+
+            def failing(current, *args):
+                if current.name == "tool3":
+                    raised_in.append(threading.current_thread())
+                    raise PermissionError(current)
+                return real(current, *args)
+
+            with patch.object(finder, "_scan_dir", side_effect=failing):
+                with pytest.raises(PermissionError):
+                    finder.discover()
+            assert raised_in and raised_in[0] is not threading.main_thread()
+
 
 # ---------------------------------------------------------------------------
 # git subcommand
@@ -1954,6 +2089,34 @@ class TestInstallCommand:
         captured = capsys.readouterr()
         assert "nonexistent-test-pkg" in captured.out
 
+    def test_install_plan_json(self, capsys):
+        """--plan --json prints the probed plan and installs nothing."""
+        from pyishlib.installer import Installer
+
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            config_dir = Path(src) / "ishconfig"
+            config_dir.mkdir()
+            (config_dir / "packages.json").write_text(
+                '{"plan-pkg": {"apt": "plan-pkg", "cmd": "nonexistent_plan_12345"}, '
+                '"sh": {"apt": "dash", "cmd": "sh"}}'
+            )
+
+            with (
+                patch.object(Installer, "pkg_is_available", return_value=True),
+                patch.object(Installer, "install_pkgs") as mock_install,
+            ):
+                ret = cli_main(
+                    ["--source", src, "--target", tgt, "install", "--plan", "--json"]
+                )
+
+        assert ret == 0
+        mock_install.assert_not_called()
+        plan = {p["name"]: p for p in json.loads(capsys.readouterr().out)["packages"]}
+        assert plan["sh"]["installed"] is True
+        assert plan["sh"]["reason"] == "found-cmd"
+        assert plan["plan-pkg"]["installed"] is False
+        assert plan["plan-pkg"]["available"] is True
+
     def test_install_dry_run_toml(self, capsys):
         """Dry-run works with TOML package config."""
         from pyishlib.installer import Installer
@@ -2961,6 +3124,13 @@ class TestRepoConfLayer:
         assert not hasattr(cfg.repo_conf, "source")
 
 
+def _missing(pkg):
+    """``Installer.pkg_status`` stand-in reporting every package as missing."""
+    from pyishlib.installer import PackageStatus
+
+    return PackageStatus(dict(pkg), False, "missing")
+
+
 class TestRunInstallAvailabilityFiltering:
     """Tests for the availability pre-filter in run_install."""
 
@@ -2994,9 +3164,7 @@ class TestRunInstallAvailabilityFiltering:
         }
 
         with (
-            patch.object(
-                Installer, "get_missing_pkgs", return_value=[unavailable_optional]
-            ),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=False),
             patch.object(Installer, "install_pkgs") as mock_install,
         ):
@@ -3017,7 +3185,7 @@ class TestRunInstallAvailabilityFiltering:
         opt_b = {"name": "tldr", "apt": "tldr", "optional": True}
 
         with (
-            patch.object(Installer, "get_missing_pkgs", return_value=[opt_a, opt_b]),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=True),
             patch.object(Installer, "install_pkgs", return_value=True) as mock_install,
         ):
@@ -3043,9 +3211,7 @@ class TestRunInstallAvailabilityFiltering:
             return pkg["name"] == "tldr"
 
         with (
-            patch.object(
-                Installer, "get_missing_pkgs", return_value=[available, unavailable]
-            ),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", side_effect=fake_is_available),
             patch.object(Installer, "install_pkgs", return_value=True),
         ):
@@ -3067,9 +3233,7 @@ class TestRunInstallAvailabilityFiltering:
         unavailable_required = {"name": "glow", "apt": "glow"}
 
         with (
-            patch.object(
-                Installer, "get_missing_pkgs", return_value=[unavailable_required]
-            ),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=False),
             patch.object(Installer, "install_pkgs") as mock_install,
             patch(
@@ -3093,9 +3257,7 @@ class TestRunInstallAvailabilityFiltering:
         unavailable_required = {"name": "glow", "apt": "glow"}
 
         with (
-            patch.object(
-                Installer, "get_missing_pkgs", return_value=[unavailable_required]
-            ),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=False),
             patch.object(Installer, "install_pkgs") as mock_install,
             patch(
@@ -3124,9 +3286,7 @@ class TestRunInstallAvailabilityFiltering:
         unavailable_required = {"name": "glow", "apt": "glow"}
 
         with (
-            patch.object(
-                Installer, "get_missing_pkgs", return_value=[unavailable_required]
-            ),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=False),
             patch.object(Installer, "install_pkgs") as mock_install,
             patch("pyishlib.ishfiles.installer_helper.prompt_bool") as mock_prompt,
@@ -3148,7 +3308,7 @@ class TestRunInstallAvailabilityFiltering:
         required = {"name": "git", "apt": "git"}
 
         with (
-            patch.object(Installer, "get_missing_pkgs", return_value=[required]),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=True),
             patch.object(
                 Installer,
@@ -3175,7 +3335,7 @@ class TestRunInstallAvailabilityFiltering:
         required = {"name": "git", "apt": "git"}
 
         with (
-            patch.object(Installer, "get_missing_pkgs", return_value=[required]),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=True),
             patch.object(
                 Installer,
@@ -3207,7 +3367,7 @@ class TestRunInstallAvailabilityFiltering:
         required = {"name": "git", "apt": "git"}
 
         with (
-            patch.object(Installer, "get_missing_pkgs", return_value=[required]),
+            patch.object(Installer, "pkg_status", side_effect=_missing),
             patch.object(Installer, "pkg_is_available", return_value=True),
             patch.object(
                 Installer,
@@ -520,6 +520,60 @@ class TestPurgeContainers:
         rc, _ = self._run_purge("nobody", [])
         assert rc == 0
 
+    def test_many_containers_listed_once_and_deleted_concurrently(self):
+        import json
+        import threading
+
+        username = "alice"
+        existing = [{"name": f"isholate-alice-{i:06d}"} for i in range(40)]
+        lock = threading.Lock()
+        calls = []
+        active = [0, 0]  # current, peak
+
+        def fake_run(cmd, **kwargs):
+            with lock:
+                calls.append(list(cmd))
+                if cmd[:2] == ["incus", "delete"]:
+                    active[0] += 1
+                    active[1] = max(active)
+            if cmd[:3] == ["incus", "list", "--format=json"]:
+                return SimpleNamespace(returncode=0, stdout=json.dumps(existing))
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            return SimpleNamespace(returncode=0)
+
+        with patch("pyishlib.container.incus._run", side_effect=fake_run):
+            rc = purge_containers(username, quiet=True, jobs=4)
+        assert rc == 0
+        assert [c[:2] for c in calls].count(["incus", "list"]) == 1
+        deleted = [c[2] for c in calls if c[:2] == ["incus", "delete"]]
+        assert sorted(deleted) == [e["name"] for e in existing]
+        assert 1 < active[1] <= 4
+
+    def test_failures_are_reported_together(self, caplog):
+        import json
+
+        username = "alice"
+        existing = [{"name": f"isholate-alice-{i:06d}"} for i in range(3)]
+
+        def fake_run(cmd, **kwargs):
+            if cmd[:3] == ["incus", "list", "--format=json"]:
+                return SimpleNamespace(returncode=0, stdout=json.dumps(existing))
+            if cmd[2] == "isholate-alice-000001":
+                raise OSError("daemon went away")
+            return SimpleNamespace(returncode=1 if cmd[2].endswith("2") else 0)
+
+        with patch("pyishlib.container.incus._run", side_effect=fake_run):
+            with caplog.at_level(logging.ERROR):
+                rc = purge_containers(username, quiet=True, jobs=3)
+        assert rc == 1
+        assert (
+            "failed to delete 2 of 3 containers: "
+            "isholate-alice-000001, isholate-alice-000002"
+        ) in caplog.text
+        assert "daemon went away" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # _find_isholate_containers
@@ -2692,7 +2746,7 @@ class TestParser:
             ) as mock_stop:
                 cli_main(["stop"])
                 _, kwargs = mock_stop.call_args
-                assert kwargs == {"names": None, "include_bases": False}
+                assert kwargs == {"names": None, "include_bases": False, "jobs": None}
 
     def test_stop_dispatch_with_names(self):
         with patch(
@@ -2704,7 +2758,11 @@ class TestParser:
             ) as mock_stop:
                 cli_main(["stop", "a", "b"])
                 _, kwargs = mock_stop.call_args
-                assert kwargs == {"names": ["a", "b"], "include_bases": False}
+                assert kwargs == {
+                    "names": ["a", "b"],
+                    "include_bases": False,
+                    "jobs": None,
+                }
 
     def test_stop_dispatch_all(self):
         with patch(
@@ -2716,7 +2774,29 @@ class TestParser:
             ) as mock_stop:
                 cli_main(["stop", "--all"])
                 _, kwargs = mock_stop.call_args
-                assert kwargs == {"names": None, "include_bases": True}
+                assert kwargs == {"names": None, "include_bases": True, "jobs": None}
+
+    def test_stop_and_purge_pass_jobs(self):
+        with (
+            patch(
+                "pyishlib.isholate.commands.stop.get_host_user_info",
+                return_value=_fake_user_info(),
+            ),
+            patch(
+                "pyishlib.isholate.commands.purge.get_host_user_info",
+                return_value=_fake_user_info(),
+            ),
+        ):
+            with patch(
+                "pyishlib.isholate.commands.stop.stop_containers", return_value=0
+            ) as mock_stop:
+                cli_main(["stop", "-j", "8"])
+                assert mock_stop.call_args[1]["jobs"] == 8
+            with patch(
+                "pyishlib.isholate.commands.purge.purge_containers", return_value=0
+            ) as mock_purge:
+                cli_main(["purge", "--jobs", "2"])
+                assert mock_purge.call_args[1]["jobs"] == 2
 
     def test_list_does_not_call_launch_and_exec(self):
         with patch(
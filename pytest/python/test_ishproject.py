@@ -6,6 +6,7 @@ import os
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -555,16 +556,8 @@ class TestAddUpdate(_ChdirTestCase):
         mock_main.assert_not_called()
 
 
-class TestRecurseSubmodules(_ChdirTestCase):
-    """``--recurse-submodules`` recursion across commit/push/pull/apply.
-
-    Builds a parent repo with one initialised submodule that has the
-    ishproject branch and worktree present. Asserts the per-command
-    passthrough is called once per repo (parent + submodule) when the
-    flag is set, and only on the parent when it is not. ishfiles is
-    fully mocked so no real git push/pull/commit happens — the test
-    only checks the ishproject layer's iteration logic.
-    """
+class _SubmoduleProject(_ChdirTestCase):
+    """Parent repo with one ready submodule (ishproject branch + worktree)."""
 
     def setUp(self) -> None:
         super().setUp()
@@ -595,6 +588,18 @@ class TestRecurseSubmodules(_ChdirTestCase):
             for call in mock_main.call_args_list
         ]
 
+
+class TestRecurseSubmodules(_SubmoduleProject):
+    """``--recurse-submodules`` recursion across commit/push/pull/apply.
+
+    Builds a parent repo with one initialised submodule that has the
+    ishproject branch and worktree present. Asserts the per-command
+    passthrough is called once per repo (parent + submodule) when the
+    flag is set, and only on the parent when it is not. ishfiles is
+    fully mocked so no real git push/pull/commit happens — the test
+    only checks the ishproject layer's iteration logic.
+    """
+
     def test_commit_recurse_runs_per_repo(self) -> None:
         sources = self._run_and_collect_sources(
             "pyishlib.ishproject.commands.commit.ishfiles_main",
@@ -655,6 +660,75 @@ class TestRecurseSubmodules(_ChdirTestCase):
         self.assertNotIn("/child/.ishlib/", sources[0])
 
 
+class TestSubmoduleJobs(_SubmoduleProject):
+    """``-j N`` runs the submodule passthroughs in child processes."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.child2_bare = _make_submodule_source(self.workspace, "child2")
+        _add_submodule(self.root, self.child2_bare, "child2")
+        sub = self.root / "child2"
+        (sub / ".ishlib" / "ishproject").mkdir(parents=True)
+        _git("branch", DEFAULT_BRANCH, cwd=sub)
+
+    def test_output_is_printed_in_order_and_failures_summarised(self) -> None:
+        from io import StringIO
+
+        def fake_captured(self, subcommand, remainder, *, global_args=()):
+            source = Path(global_args[global_args.index("--source") + 1])
+            name = source.parent.parent.name
+            if name == "child":
+                time.sleep(0.2)  # finishes last, still printed first
+            return subprocess.CompletedProcess(
+                [], 1 if name == "child2" else 0, f"{subcommand} {name}\n", ""
+            )
+
+        buf = StringIO()
+        with (
+            patch(
+                "pyishlib.ishproject.commands.pull.ishfiles_main", return_value=0
+            ) as mock_main,
+            patch(
+                "pyishlib.ishproject.commands.pull.PullCommand.passthrough_captured",
+                fake_captured,
+            ),
+            patch("sys.stdout", buf),
+            self.assertLogs("pyishlib.ishproject.fanout", level="ERROR") as cm,
+        ):
+            rc = cli_main(["pull", "--recurse-submodules", "-j", "2"])
+        self.assertEqual(rc, 1)
+        mock_main.assert_called_once()  # parent stays in-process
+        self.assertEqual(buf.getvalue(), "pull child\npull child2\n")
+        self.assertIn("failed in 1 of 2 submodules", "\n".join(cm.output))
+        self.assertIn(str(self.root / "child2"), "\n".join(cm.output))
+
+    def test_serial_by_default(self) -> None:
+        with patch(
+            "pyishlib.ishproject.commands.push.PushCommand.passthrough_captured"
+        ) as mock_captured:
+            sources = self._run_and_collect_sources(
+                "pyishlib.ishproject.commands.push.ishfiles_main",
+                ["push", "--recurse-submodules"],
+            )
+        self.assertEqual(len(sources), 3)
+        mock_captured.assert_not_called()
+
+    def test_status_runs_real_children(self) -> None:
+        src = Path(__file__).resolve().parents[2] / "src"
+        result = subprocess.run(
+            [sys.executable, "-m", "pyishlib.ishproject", "status", "-j", "2"],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+            env=dict(os.environ, PYTHONPATH=str(src)),
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        headers = [
+            line for line in result.stdout.splitlines() if line.startswith("===")
+        ]
+        self.assertEqual(headers, ["=== . ===", "=== child ===", "=== child2 ==="])
+
+
 class TestAddEndToEnd(_ChdirTestCase):
     """End-to-end: add stays hidden in main but is staged in the ishproject worktree.
 
@@ -1734,6 +1808,92 @@ class TestCleanRebase(_ChdirTestCase):
         self.assertIn("--verbose", captured[0])
 
 
+class TestCleanRebaseRewriteEngines(_ChdirTestCase):
+    """The fast-export pipeline matches the per-commit rewrite exactly."""
+
+    MANAGED = {"foo.txt", "sub dir/bär.txt"}
+
+    def _commit(self, files: dict, msg: str, author: str, date: str) -> None:
+        for rel, content in files.items():
+            path = self.root / rel
+            if content is None:
+                _git("rm", "-q", rel, cwd=self.root)
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            _git("add", rel, cwd=self.root)
+        env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME=author,
+            GIT_AUTHOR_EMAIL=f"{author}@example.com",
+            GIT_AUTHOR_DATE=date,
+            GIT_COMMITTER_DATE=date,
+        )
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "commit.gpgsign=false",
+                "commit",
+                "-q",
+                "--allow-empty",
+                "--cleanup=verbatim",
+                "-F",
+                "-",
+            ],
+            cwd=self.root,
+            input=msg,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+    def test_bulk_rewrite_matches_per_commit(self) -> None:
+        from pyishlib.command_runner import CommandRunner
+        from pyishlib.ish_config import IshConfig
+        from pyishlib.ishproject.commands import clean_rebase as cr
+
+        _init_repo(self.root)
+        self._commit(
+            {"foo.txt": "a\n", "keep.txt": "k\n"},
+            "base\n",
+            "ann",
+            "2024-01-01T00:00:00+02:00",
+        )
+        base = _git("rev-parse", "HEAD", cwd=self.root).stdout.strip()
+        self._commit(
+            {"foo.txt": "b\n", "sub dir/bär.txt": "x\n", "new.txt": "n\n"},
+            "subject\n\nbody\n",
+            "bob",
+            "2024-02-01T10:00:00-05:00",
+        )
+        self._commit(
+            {"sub dir/bär.txt": None, "new.txt": "n2\n"},
+            "no trailing newline",
+            "cat",
+            "2024-03-01T10:00:00+00:00",
+        )
+        self._commit(
+            {"foo.txt": "c\n"}, "only managed\n", "dan", "2024-04-01T10:00:00+00:00"
+        )
+        head = _git("rev-parse", "HEAD", cwd=self.root).stdout.strip()
+
+        bulk = cr._rewrite_range(self.root, base, head, set(self.MANAGED))
+
+        runner = CommandRunner(cfg=IshConfig(dry_run=False))
+        serial = base
+        for sha in cr._rev_list_reverse(self.root, base, head):
+            serial = cr._rewrite_commit(
+                self.root, sha, serial, set(self.MANAGED), runner
+            )
+
+        self.assertEqual(bulk, serial)
+        files = _git("ls-tree", "-r", "--name-only", bulk, cwd=self.root).stdout
+        self.assertEqual(files.split(), ["keep.txt", "new.txt"])
+        refs = _git("for-each-ref", "refs/ishproject/", cwd=self.root).stdout
+        self.assertEqual(refs, "")
+
+
 class TestConfigLoad(unittest.TestCase):
     """Cover load / prompt / save of ~/.config/ishlib/ishproject.toml."""
 
@@ -13,7 +13,7 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
 )
 from pyishlib.dotfile_applier import DotfileApplier
-from pyishlib.ishfiles.commands.diff import _show_diff
+from pyishlib.ishfiles.commands.diff import _show_diff, _show_diffs
 
 
 def _make_file(path: Path, content: str) -> Path:
@@ -91,3 +91,26 @@ class TestShowDiffMergejson:
             _show_diff(changes[0])
             captured = capsys.readouterr()
             assert captured.out != ""
+
+    def test_show_diffs_batch_uses_canonical_target(self, capsys):
+        """The batch renderer diffs against the canonicalised target."""
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as tgt:
+            _make_file(
+                Path(src) / "mergejson_settings.json",
+                '{"a": 2}\n',
+            )
+            target = _make_file(
+                Path(tgt) / "settings.json",
+                '{"a":   1}',
+            )
+
+            applier = DotfileApplier(source_dir=Path(src), target_dir=Path(tgt))
+            dotfiles = applier.prepare(applier.discover())
+            changes = applier.get_changes(dotfiles)
+            assert len(changes) == 1
+
+            _show_diffs(changes)
+            out = capsys.readouterr().out
+            assert f"--- a/{target.as_posix().lstrip('/')}" in out
+            assert '-  "a": 1' in out
+            assert '+  "a": 2' in out
@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for pyishlib.package_state and its use by Installer.have_pkg."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.command_runner import CommandRunner
+from pyishlib.installer import Installer
+from pyishlib.installer_apt import InstallerApt
+from pyishlib.installer_cargo import InstallerCargo
+from pyishlib.ish_config import IshConfig
+from pyishlib.package_state import (
+    RACY_WINDOW_NS,
+    PackageStateCache,
+    host_filename,
+    is_racy,
+    stat_fingerprint,
+)
+
+_OLD_NS = 1_000_000_000 * 1_000_000_000  # 2001-09-09, well outside the racy window
+
+
+def _db(path: Path, content: str = "db\n", ns: int = _OLD_NS) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    os.utime(path, ns=(ns, ns))
+    return path
+
+
+class TestStatFingerprint(unittest.TestCase):
+    def test_missing_paths_give_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            assert stat_fingerprint([Path(tmp) / "nope"]) is None
+
+    def test_changes_with_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = _db(Path(tmp) / "status")
+            before = stat_fingerprint([db, Path(tmp) / "nope"])
+            assert len(before) == 1
+            _db(db, ns=_OLD_NS + 1)
+            assert stat_fingerprint([db]) != before
+
+
+class TestIsRacy(unittest.TestCase):
+    def test_window_boundary(self):
+        now = _OLD_NS + RACY_WINDOW_NS
+        assert is_racy(now - RACY_WINDOW_NS + 1, now)
+        assert not is_racy(now - RACY_WINDOW_NS, now)
+
+    def test_defaults_to_current_time(self):
+        assert not is_racy(_OLD_NS)
+
+
+class TestPackageStateCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.fp = stat_fingerprint([_db(self.tmp / "status")])
+        self.key = PackageStateCache.key("apt", {"name": "git", "apt": "git"})
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_record_and_query(self):
+        cache = PackageStateCache(self.tmp / "state.json")
+        assert not cache.is_installed("apt", self.fp, self.key)
+        cache.record("apt", self.fp, self.key)
+        assert cache.is_installed("apt", self.fp, self.key)
+        assert not cache.is_installed("dnf", self.fp, self.key)
+        assert not cache.is_installed("apt", None, self.key)
+
+    def test_key_includes_min_version(self):
+        pkg = {"name": "git", "apt": "git"}
+        assert PackageStateCache.key("apt", pkg) != PackageStateCache.key(
+            "apt", dict(pkg, min_version="2.40")
+        )
+
+    def test_new_fingerprint_discards_entries(self):
+        cache = PackageStateCache(self.tmp / "state.json")
+        cache.record("apt", self.fp, self.key)
+        other = [[*self.fp[0][:1], _OLD_NS + 5, 3, 1]]
+        assert not cache.is_installed("apt", other, self.key)
+        cache.record("apt", other, "x")
+        assert not cache.is_installed("apt", self.fp, self.key)
+
+    def test_racy_fingerprint_not_recorded(self):
+        cache = PackageStateCache(self.tmp / "state.json")
+        fresh = stat_fingerprint([self.tmp / "state.json"] + [self.tmp])
+        cache.record("apt", fresh, self.key)
+        assert not cache.is_installed("apt", fresh, self.key)
+
+    def test_save_and_reload(self):
+        path = self.tmp / "sub" / "state.json"
+        cache = PackageStateCache(path)
+        cache.record("apt", self.fp, self.key)
+        cache.save()
+        assert PackageStateCache(path).is_installed("apt", self.fp, self.key)
+
+    def test_availability_record_and_reload(self):
+        path = self.tmp / "state.json"
+        cache = PackageStateCache(path)
+        assert cache.availability("apt", self.fp, "git") is None
+        cache.record_availability("apt", self.fp, "git", True)
+        cache.record_availability("apt", self.fp, "nope", False)
+        cache.record("apt", self.fp, self.key)
+        cache.save()
+        again = PackageStateCache(path)
+        assert again.availability("apt", self.fp, "git") is True
+        assert again.availability("apt", self.fp, "nope") is False
+        assert again.availability("apt", None, "git") is None
+        assert again.is_installed("apt", self.fp, self.key)
+
+    def test_availability_is_keyed_on_index_fingerprint(self):
+        cache = PackageStateCache(self.tmp / "state.json")
+        cache.record_availability("apt", self.fp, "git", True)
+        other = [[*self.fp[0][:1], _OLD_NS + 5, 3, 1]]
+        assert cache.availability("apt", other, "git") is None
+        fresh = stat_fingerprint([self.tmp])
+        cache.record_availability("apt", fresh, "git", True)
+        assert cache.availability("apt", fresh, "git") is None
+
+    def test_corrupt_file_starts_empty(self):
+        path = self.tmp / "state.json"
+        path.write_text("{not json")
+        cache = PackageStateCache(path)
+        assert not cache.is_installed("apt", self.fp, self.key)
+
+    def test_from_cfg_uses_target(self):
+        cfg = IshConfig(defaults={"target": str(self.tmp)})
+        with patch("socket.gethostname", return_value="box"):
+            cache = PackageStateCache.from_cfg(cfg)
+        assert cache.path == (
+            self.tmp.resolve() / ".config" / "ishfiles" / "package-state.box.json"
+        )
+
+    def test_host_filename_is_per_host(self):
+        with patch("socket.gethostname", return_value="a.example/x"):
+            assert host_filename("state.json") == "state.a.example_x.json"
+        with patch("socket.gethostname", return_value="other"):
+            assert host_filename("state.json") == "state.other.json"
+
+
+class TestBackendFingerprints(unittest.TestCase):
+    def test_apt_uses_dpkg_status(self):
+        apt = InstallerApt(CommandRunner(cfg=IshConfig(dry_run=True)))
+        assert apt._db_paths() == [Path("/var/lib/dpkg/status")]
+
+    def test_cargo_honours_cargo_home(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _db(Path(tmp) / ".crates.toml")
+            cargo = InstallerCargo(CommandRunner(cfg=IshConfig(dry_run=True)))
+            with patch.dict(os.environ, {"CARGO_HOME": tmp}):
+                fp = cargo.namespace.db_fingerprint()
+            assert [e[0] for e in fp] == [str(Path(tmp) / ".crates.toml")]
+
+
+class TestInstallerUsesState(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.db = _db(self.tmp / "status")
+        self.calls = []
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _installer(self, dry_run=False):
+        cfg = IshConfig(dry_run=dry_run, log_level=logging.DEBUG)
+        runner = CommandRunner(cfg=cfg)
+
+        def mock_run(cmd, **kwargs):
+            self.calls.append(cmd)
+            out = b"git\tinstall ok installed\t1:2.40.1-1\n"
+            if cmd[:2] == ["dpkg-query", "-W"] and "--showformat=${Status}\n" in cmd:
+                out = b"install ok installed\n"
+            return subprocess.CompletedProcess(cmd, 0, out, b"")
+
+        runner.which = lambda cmd: "/usr/bin/apt" if cmd == "apt" else None
+        runner.run = mock_run
+        state = PackageStateCache(self.tmp / "state.json")
+        installer = Installer(cfg=cfg, runner=runner, state=state)
+        apt = installer.get_backend("apt")
+        apt._db_paths = lambda: [self.db]
+        return installer
+
+    def test_second_run_needs_no_subprocesses(self):
+        pkgs = [{"name": "git", "apt": "git"}]
+        assert self._installer().get_missing_pkgs(pkgs) == []
+        assert self.calls
+        self.calls.clear()
+        assert self._installer().get_missing_pkgs(pkgs) == []
+        assert self.calls == []
+
+    def test_database_change_invalidates(self):
+        pkgs = [{"name": "git", "apt": "git"}]
+        self._installer().get_missing_pkgs(pkgs)
+        _db(self.db, content="changed\n")
+        self.calls.clear()
+        self._installer().get_missing_pkgs(pkgs)
+        assert self.calls
+
+    def test_dry_run_does_not_save(self):
+        self._installer(dry_run=True).get_missing_pkgs([{"name": "git", "apt": "git"}])
+        assert not (self.tmp / "state.json").exists()
+
+    def test_second_plan_reuses_availability(self):
+        index = _db(self.tmp / "lists" / "Packages")
+        pkgs = [{"name": "new", "apt": "new"}]
+
+        def installer():
+            inst = self._installer()
+            inst.get_backend("apt")._index_paths = lambda: [index]
+            return inst
+
+        with (
+            patch.object(InstallerApt, "is_pkg_installed", return_value=False),
+            patch.object(InstallerApt, "is_pkg_available", return_value=True) as avail,
+        ):
+            assert installer().plan(pkgs).entries[0].available is True
+            assert installer().plan(pkgs).entries[0].available is True
+            assert avail.call_count == 1
+            _db(index, content="updated\n")
+            installer().plan(pkgs)
+            assert avail.call_count == 2
+
+    def test_saved_file_is_json(self):
+        self._installer().get_missing_pkgs([{"name": "git", "apt": "git"}])
+        data = json.loads((self.tmp / "state.json").read_text())
+        assert data["apt"]["installed"] == [json.dumps(["git", None])]
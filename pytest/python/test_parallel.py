@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for pyishlib.parallel."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.parallel import map_bounded, resolve_jobs
+
+
+class TestMapBounded(unittest.TestCase):
+    def test_preserves_input_order(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        outcomes = map_bounded(slow_square, range(5), jobs=5)
+        assert [o.item for o in outcomes] == [0, 1, 2, 3, 4]
+        assert [o.value for o in outcomes] == [0, 1, 4, 9, 16]
+
+    def test_captures_exceptions(self):
+        def fail_on_two(n):
+            if n == 2:
+                raise RuntimeError("boom")
+            return n
+
+        outcomes = map_bounded(fail_on_two, [1, 2, 3], jobs=2)
+        assert [o.ok for o in outcomes] == [True, False, True]
+        assert str(outcomes[1].error) == "boom"
+        assert outcomes[1].value is None
+
+    def test_result_returns_value_or_reraises(self):
+        def fail_on_two(n):
+            if n == 2:
+                raise RuntimeError("boom")
+            return n
+
+        ok, failed = map_bounded(fail_on_two, [1, 2], jobs=1)
+        assert ok.result() == 1
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            failed.result()
+
+    def test_respects_job_limit(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def track(_):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        map_bounded(track, range(8), jobs=3)
+        assert 1 < peak[0] <= 3
+
+    def test_serial_runs_in_calling_thread(self):
+        caller = threading.get_ident()
+        outcomes = map_bounded(lambda _: threading.get_ident(), range(3), jobs=1)
+        assert {o.value for o in outcomes} == {caller}
+
+
+class TestResolveJobs(unittest.TestCase):
+    def test_none_uses_default(self):
+        assert resolve_jobs(None, default=7) == 7
+
+    def test_parses_strings(self):
+        assert resolve_jobs("3") == 3
+
+    def test_clamps_to_one(self):
+        assert resolve_jobs(0) == 1
+        assert resolve_jobs("bogus") == 1
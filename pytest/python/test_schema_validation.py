@@ -159,6 +159,13 @@ class TestValidateMetadata:
         }
         assert validate_metadata(metadata) is None
 
+    def test_valid_after_before(self):
+        assert validate_metadata({"after": "10_a", "before": ["30_c"]}) is None
+
+    def test_invalid_after_type(self):
+        assert validate_metadata({"after": 5}) is not None
+        assert validate_metadata({"before": [True]}) is not None
+
     def test_invalid_only_on_type(self):
         err = validate_metadata({"only_on": "linux"})
         assert err is not None
@@ -270,3 +277,60 @@ class TestInstallerConfigSharedValidation:
 
 if __name__ == "__main__":
     pytest.main()
+
+
+# ---------------------------------------------------------------------------
+# Validator registry and known-valid cache
+# ---------------------------------------------------------------------------
+
+
+class TestValidatorRegistry:
+    def test_validator_is_reused(self):
+        from pyishlib.schema_validation import get_validator
+
+        assert get_validator("packages") is get_validator("packages")
+        assert get_validator("packages") is not get_validator("metadata")
+
+    def test_validator_is_per_thread(self):
+        import threading
+
+        from pyishlib.schema_validation import get_validator
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(get_validator("metadata")))
+        t.start()
+        t.join()
+        assert other[0] is not get_validator("metadata")
+
+    def test_known_valid_block_is_not_revalidated(self):
+        from unittest.mock import patch
+
+        import pyishlib.schema_validation as sv
+
+        pkgs = {"registry-cache-pkg": {"apt": "registry-cache-pkg"}}
+        assert validate_packages(pkgs) is None
+        with patch.object(sv, "get_validator") as mock_get:
+            assert validate_packages(pkgs) is None
+        mock_get.assert_not_called()
+
+    def test_invalid_block_is_not_cached(self):
+        pkgs = {"registry-bad-pkg": {"min_version": 123}}
+        first = validate_packages(pkgs)
+        assert first is not None
+        assert validate_packages(pkgs) == first
+
+    def test_json_schema_reloaded_after_edit(self):
+        from pyishlib.schema_validation import get_json_validator, load_json_schema
+
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "schema.json"
+            p.write_text('{"type": "object"}')
+            first = load_json_schema(p)
+            assert load_json_schema(p) is first
+            validator = get_json_validator(p)
+            assert get_json_validator(p) is validator
+            assert validator.is_valid({})
+            p.write_text('{"type": "array"}')
+            os.utime(p, ns=(1, 1))
+            assert load_json_schema(p) == {"type": "array"}
+            assert not get_json_validator(p).is_valid({})
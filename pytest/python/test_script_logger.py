@@ -321,6 +321,26 @@ class TestScriptLoggerWindowsSink(unittest.TestCase):
             assert "test error" in content
 
 
+class TestScriptLoggerChannels(unittest.TestCase):
+    """Per-script channels attribute messages to their own script."""
+
+    def test_messages_attributed_per_channel(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = _make_cfg(tmp)
+            with ScriptLogger(cfg) as slog:
+                slog.set_current_script("other.sh")
+                for name, level in (("a.sh", "warning"), ("b.sh", "error")):
+                    sink_path = Path(slog.open_channel(name)["ISHLIB_LOG_OUT"])
+                    with open(sink_path, "ab") as f:
+                        f.write(f"{level}\tfrom {name}\n".encode("utf-8"))
+                for name in ("a.sh", "b.sh"):
+                    slog.close_channel(name)
+                issues = dict(slog.script_issues())
+            assert issues["a.sh"]["warning"] == 1
+            assert issues["b.sh"]["error"] == 1
+            assert "other.sh" not in issues
+
+
 @unittest.skipIf(
     sys.platform != "win32",
     "PowerShell sink tests are Windows-only",
@@ -9,12 +9,16 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
 )
 
+from pyishlib.file_preprocessor import ParsedSource
 from pyishlib.ishfiles.script_runner import (
+    _script_dependencies,
+    _topological_order,
     find_scripts,
     scan_scripts,
     run_scanned_scripts,
@@ -187,6 +191,27 @@ class TestRunWhenGating(unittest.TestCase):
 
             assert any("skip/unchanged" in msg for msg in cm.output)
 
+    def test_scanned_sources_are_reused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            _write_toml_script(scripts_dir, "once.sh", 'run_when = "once"')
+            cfg = _make_cfg(tmp, verbose=True)
+            state = self._make_state(tmp)
+            state.record("once.sh", "anything")
+            sources = {}
+            kept, _ = scan_scripts(cfg, sources=sources)
+            assert list(sources) == kept
+
+            with (
+                patch.object(
+                    ParsedSource, "load", side_effect=AssertionError("re-read")
+                ),
+                self.assertLogs("pyishlib", level="INFO") as cm,
+            ):
+                run_scanned_scripts(cfg, kept, script_state=state, sources=sources)
+
+            assert any("skip/once" in msg for msg in cm.output)
+
 
 class TestScanScriptsTagFilter(unittest.TestCase):
     """scan_scripts respects tags from __ISH__ metadata."""
@@ -255,5 +280,136 @@ class TestScriptsDirContext(unittest.TestCase):
             assert "${__ish_scripts_dir}" not in preprocessed
 
 
+class TestScriptDependencies(unittest.TestCase):
+    """after/before metadata builds the script dependency graph."""
+
+    def _paths(self, *names):
+        return [Path("/s") / n for n in names]
+
+    def test_undeclared_scripts_keep_lexical_chain(self):
+        a, b, c = self._paths("10_a.sh", "20_b.sh", "30_c.sh")
+        deps = _script_dependencies([a, b, c], {})
+        assert deps == {a: set(), b: {a}, c: {a, b}}
+        assert _topological_order([a, b, c], deps) == [a, b, c]
+
+    def test_declared_script_only_waits_for_its_edges(self):
+        a, b, c = self._paths("10_a.sh", "20_b.sh", "30_c.sh")
+        deps = _script_dependencies([a, b, c], {c: {"after": ["10_a"]}})
+        assert deps[c] == {a}
+
+    def test_before_adds_reverse_edge(self):
+        a, b = self._paths("10_a.sh", "20_b.sh")
+        deps = _script_dependencies([a, b], {b: {"before": ["10_a.sh"]}})
+        assert deps == {a: {b}, b: set()}
+        assert _topological_order([a, b], deps) == [b, a]
+
+    def test_unknown_names_are_ignored(self):
+        a, b = self._paths("10_a.sh", "20_b.sh")
+        with self.assertLogs("pyishlib", level="WARNING") as logs:
+            deps = _script_dependencies([a, b], {b: {"after": ["missing.sh"]}})
+        assert deps[b] == set()
+        assert "missing.sh" in logs.output[0]
+
+    def test_unscheduled_names_are_dropped_silently(self):
+        a, b, c = self._paths("10_a.sh", "20_b.sh", "30_c.sh")
+        with patch("pyishlib.ishfiles.script_runner.log.warning") as warn:
+            deps = _script_dependencies(
+                [a, c], {a: {"before": ["20_b"]}, c: {"after": ["20_b.sh"]}}, [a, b, c]
+            )
+        warn.assert_not_called()
+        assert deps == {a: set(), c: set()}
+
+    def test_invalid_values_fall_back_to_lexical_chain(self):
+        a, b = self._paths("10_a.sh", "20_b.sh")
+        for bad in (5, True, [1]):
+            with self.assertLogs("pyishlib", level="ERROR"):
+                deps = _script_dependencies([a, b], {b: {"after": bad}})
+            assert deps == {a: set(), b: {a}}
+
+    def test_cycle_returns_none(self):
+        a, b = self._paths("10_a.sh", "20_b.sh")
+        meta = {a: {"after": ["20_b.sh"]}, b: {"after": ["10_a.sh"]}}
+        with self.assertLogs("pyishlib", level="ERROR"):
+            assert _script_dependencies([a, b], meta) is None
+
+
+class TestParallelScripts(unittest.TestCase):
+    """Scripts with after/before metadata are scheduled concurrently."""
+
+    def _cfg(self, tmp, jobs=4):
+        cfg = _make_cfg(tmp)
+        cfg.dry_run = False
+        cfg.set_constant("scripts_jobs", jobs)
+        return cfg
+
+    def test_independent_scripts_overlap(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            # Each script waits for the other's marker, so they can only
+            # both succeed when running at the same time.
+            for me, other in (("a", "b"), ("b", "a")):
+                _write_toml_script(
+                    scripts_dir,
+                    f"{me}.sh",
+                    "after = []",
+                    f"touch {tmp}/{me}\n"
+                    f"for i in $(seq 50); do [ -e {tmp}/{other} ] && exit 0; "
+                    "sleep 0.1; done\nexit 1\n",
+                )
+            kept = find_scripts(self._cfg(tmp), Path(tmp))
+            assert run_scanned_scripts(self._cfg(tmp), kept) == 0
+
+    def test_after_is_respected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            _write_toml_script(
+                scripts_dir, "10_slow.sh", "after = []", f"sleep 0.3\ntouch {tmp}/x\n"
+            )
+            _write_toml_script(
+                scripts_dir, "20_fast.sh", 'after = ["10_slow"]', f"test -e {tmp}/x\n"
+            )
+            kept = find_scripts(self._cfg(tmp), Path(tmp))
+            assert run_scanned_scripts(self._cfg(tmp), kept) == 0
+
+    def test_failure_stops_dependents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            _write_toml_script(scripts_dir, "10_bad.sh", "after = []", "exit 1\n")
+            _write_toml_script(
+                scripts_dir, "20_next.sh", 'after = ["10_bad"]', f"touch {tmp}/ran\n"
+            )
+            kept = find_scripts(self._cfg(tmp), Path(tmp))
+            with self.assertLogs("pyishlib", level="ERROR"):
+                assert run_scanned_scripts(self._cfg(tmp), kept) == 1
+            assert not (Path(tmp) / "ran").exists()
+
+    def test_after_filtered_script_runs_without_warning(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            _write_toml_script(scripts_dir, "10_other.sh", "after = []", "exit 1\n")
+            _write_toml_script(
+                scripts_dir, "20_me.sh", 'after = ["10_other"]', f"touch {tmp}/ran\n"
+            )
+            kept = find_scripts(self._cfg(tmp), Path(tmp))[1:]
+            with patch("pyishlib.ishfiles.script_runner.log.warning") as warn:
+                assert run_scanned_scripts(self._cfg(tmp), kept) == 0
+            warn.assert_not_called()
+            assert (Path(tmp) / "ran").exists()
+
+    def test_cycle_fails_without_running(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts_dir = Path(tmp) / "ishscripts"
+            _write_toml_script(
+                scripts_dir, "a.sh", 'after = ["b"]', f"touch {tmp}/ran\n"
+            )
+            _write_toml_script(
+                scripts_dir, "b.sh", 'after = ["a"]', f"touch {tmp}/ran\n"
+            )
+            kept = find_scripts(self._cfg(tmp), Path(tmp))
+            with self.assertLogs("pyishlib", level="ERROR"):
+                assert run_scanned_scripts(self._cfg(tmp), kept) == 1
+            assert not (Path(tmp) / "ran").exists()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for pyishlib.staging_store and in-place staging in DotfileApplier."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.dotfile_applier import DotfileApplier
+from pyishlib.dotfile_preprocessor import DotFilePreprocessor
+from pyishlib.ish_config import IshConfig
+from pyishlib.staging_store import StagingStore, environment_signature
+
+
+def _make_file(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+class _Base(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.src = root / "src"
+        self.tgt = root / "tgt"
+        self.src.mkdir()
+        self.tgt.mkdir()
+        self.store_dir = root / "store"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _prepare(self, dry_run=False, **context):
+        cfg = IshConfig(dry_run=dry_run)
+        for key, value in context.items():
+            cfg.context.set(key, value)
+        # Keep the applier alive: it owns the temporary staging directory.
+        self.applier = DotfileApplier(
+            source_dir=self.src,
+            target_dir=self.tgt,
+            cfg=cfg,
+            store=StagingStore(self.store_dir),
+        )
+        dotfiles = self.applier.prepare(self.applier.discover())
+        return {str(df.translated): df for df in dotfiles}
+
+
+class TestInPlaceStaging(_Base):
+    def test_plain_file_is_staged_in_place(self):
+        src = _make_file(self.src / "dot_bashrc", "plain\n")
+        df = self._prepare()[".bashrc"]
+        assert df.staged == src
+        assert not self.store_dir.exists()
+
+    def test_binary_file_is_staged_in_place(self):
+        src = self.src / "dot_bin"
+        src.write_bytes(b"\xff\xfe\x00")
+        df = self._prepare()[".bin"]
+        assert df.staged == src
+
+    def test_metadata_block_is_staged_separately(self):
+        src = _make_file(
+            self.src / "dot_rc", '# __ISH__\n# [vars]\n# a = "1"\n# __ISH__\nbody\n'
+        )
+        df = self._prepare()[".rc"]
+        assert df.staged != src
+        assert df.staged.read_text() == "body\n"
+
+    def test_crlf_source_is_not_staged_in_place(self):
+        src = self.src / "dot_crlf"
+        src.write_bytes(b"a\r\nb\r\n")
+        df = self._prepare()[".crlf"]
+        assert df.staged != src
+
+    def test_plain_file_is_not_read_again(self):
+        src = _make_file(self.src / "dot_bashrc", "plain\n")
+        applier = DotfileApplier(source_dir=self.src, target_dir=self.tgt)
+        dotfiles, _ = applier.scan(applier.discover())
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            (df,) = applier.prepare(dotfiles)
+        assert df.staged == src
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX file modes")
+    def test_in_place_target_takes_source_mode_and_mtime(self):
+        src = _make_file(self.src / "dot_bashrc", "plain\n")
+        src.chmod(0o640)
+        os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+        dotfiles = list(self._prepare().values())
+        changes = self.applier.get_changes(dotfiles)
+        assert self.applier.apply_changes(changes) == 1
+        st = (self.tgt / ".bashrc").stat()
+        assert st.st_mode & 0o777 == 0o640
+        assert st.st_mtime_ns == 1_000_000_000
+
+
+class TestStagingStore(_Base):
+    def setUp(self):
+        super().setUp()
+        _make_file(self.src / "dot_a", "#@ish set editor=vim\nA=${__ish_editor}\n")
+        _make_file(self.src / "dot_b", "B=${__ish_editor} ${__ish_host}\n")
+
+    def test_second_run_reuses_store(self):
+        first = self._prepare(host="h1")
+        assert first[".b"].staged.read_text() == "B=vim h1\n"
+        assert first[".a"].staged.is_relative_to(self.store_dir)
+        with patch.object(DotFilePreprocessor, "preprocess") as mock_pre:
+            second = self._prepare(host="h1")
+        mock_pre.assert_not_called()
+        assert second[".a"].staged == first[".a"].staged
+        assert second[".b"].staged.read_text() == "B=vim h1\n"
+        assert second[".b"].staged_digest == first[".b"].staged_digest
+
+    def test_context_change_misses(self):
+        self._prepare(host="h1")
+        again = self._prepare(host="h2")
+        assert again[".b"].staged.read_text() == "B=vim h2\n"
+
+    def test_prompt_files_are_not_stored(self):
+        _make_file(self.src / "dot_p", "#@ish prompt name Your name?\n${__ish_name}\n")
+        df = self._prepare(name="me")[".p"]
+        assert not df.staged.is_relative_to(self.store_dir)
+
+    def test_expression_prompt_files_are_not_stored(self):
+        _make_file(
+            self.src / "dot_w",
+            '#@ish if ish.prompt_bool("work", "Work?") == "true"\nwork\n'
+            "#@ish else\nhome\n#@ish fi\n",
+        )
+        answers = iter([True, False])
+        with patch(
+            "pyishlib.dotfile_context._io_prompt_bool",
+            side_effect=lambda *a, **k: next(answers),
+        ) as mock_prompt:
+            first = self._prepare(host="h1")[".w"]
+            assert first.staged.read_text() == "work\n"
+            second = self._prepare(host="h1")[".w"]
+        assert mock_prompt.call_count == 2
+        assert not second.staged.is_relative_to(self.store_dir)
+        assert second.staged.read_text() == "home\n"
+
+    def test_dry_run_does_not_write(self):
+        df = self._prepare(dry_run=True, host="h1")[".b"]
+        assert df.staged.read_text() == "B=vim h1\n"
+        assert not self.store_dir.exists()
+
+    def test_corrupt_entry_is_ignored(self):
+        first = self._prepare(host="h1")
+        first[".b"].staged.with_suffix(".json").write_text("{")
+        assert self._prepare(host="h1")[".b"].staged.read_text() == "B=vim h1\n"
+
+    def test_prune_removes_stale_entries(self):
+        staged = self._prepare(host="h1")[".b"].staged
+        old = time.time() - 60 * 24 * 3600
+        os.utime(staged, (old, old))
+        (self.store_dir / ".last-prune").unlink()
+        store = StagingStore(self.store_dir)
+        assert store.prune() == 1
+        assert not staged.exists()
+        assert not staged.with_suffix(".json").exists()
+        assert store.prune() == 0  # rate-limited by the prune stamp
+
+    def test_environment_signature_covers_env_checks(self):
+        sig = environment_signature()
+        assert "detect_os" in sig and "is_linux" in sig
+
+    def test_from_cfg_uses_target(self):
+        cfg = IshConfig(defaults={"target": str(self.tgt)})
+        assert StagingStore.from_cfg(cfg).root == (
+            self.tgt.resolve() / ".config" / "ishfiles" / "staging"
+        )
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Tests for pyishlib.timings and the subprocess spans in CommandRunner."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib import timings
+from pyishlib.command_runner import CommandRunner
+from pyishlib.ish_config import IshConfig
+from pyishlib.parallel import map_bounded
+from pyishlib.timings import PHASE, SUBPROCESS, Tracer, phase, span, tracing
+
+
+class TestTracer(unittest.TestCase):
+    def test_spans_are_attributed_to_the_current_phase(self):
+        tracer = Tracer()
+        with tracing(tracer):
+            with phase("fetch"):
+                with span("a"):
+                    pass
+            with span("outside"):
+                pass
+        by_name = {s.name: s for s in tracer.spans}
+        assert by_name["fetch"].cat == PHASE
+        assert by_name["a"].phase == "fetch"
+        assert by_name["outside"].phase is None
+
+    def test_worker_thread_spans_join_the_phase(self):
+        tracer = Tracer()
+
+        def work(i):
+            with span(f"w{i}", SUBPROCESS):
+                return threading.get_ident()
+
+        with tracing(tracer), phase("externals"):
+            map_bounded(work, range(4), 4)
+        subs = [s for s in tracer.spans if s.cat == SUBPROCESS]
+        assert len(subs) == 4
+        assert {s.phase for s in subs} == {"externals"}
+        rows = tracer.summary()
+        assert [(r[0], r[2]) for r in rows] == [("externals", 4)]
+
+    def test_off_without_active_tracer(self):
+        assert timings._active is None
+        assert span("x") is phase("y")  # the shared no-op
+        tracer = Tracer()
+        with tracing(tracer):
+            pass
+        with span("after"):
+            pass
+        assert tracer.spans == []
+
+    def test_dry_run_read_only_is_recorded(self):
+        tracer = Tracer()
+        runner = CommandRunner(cfg=IshConfig(dry_run=True))
+        with tracing(tracer):
+            runner.run([sys.executable, "-c", "pass"], read_only=True)
+        assert [s.cat for s in tracer.spans] == [SUBPROCESS]
+
+    def test_chrome_trace_format(self):
+        tracer = Tracer()
+        with tracing(tracer), phase("p"):
+            with span("git fetch", SUBPROCESS, argv=["git", "fetch"]):
+                pass
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "logs" / "trace.json"
+            tracer.write_chrome_trace(path)
+            doc = json.loads(path.read_text())
+        events = doc["traceEvents"]
+        assert [e["name"] for e in events] == ["p", "git fetch"]
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+        assert events[1]["args"] == {"argv": ["git", "fetch"], "phase": "p"}
+
+    def test_format_summary_has_total(self):
+        tracer = Tracer()
+        with tracing(tracer):
+            with phase("one"):
+                pass
+            with phase("two"):
+                pass
+        lines = tracer.format_summary().splitlines()
+        assert [line.split()[0] for line in lines] == ["phase", "one", "two", "total"]
+
+
+class TestCommandRunnerSpans(unittest.TestCase):
+    def test_subprocess_recorded(self):
+        tracer = Tracer()
+        runner = CommandRunner(cfg=IshConfig())
+        with tracing(tracer), phase("install"):
+            runner.run([sys.executable, "-c", "pass"])
+        subs = [s for s in tracer.spans if s.cat == SUBPROCESS]
+        assert len(subs) == 1
+        assert subs[0].phase == "install"
+        assert subs[0].args["argv"][0] == sys.executable
+
+    def test_dry_run_records_nothing(self):
+        tracer = Tracer()
+        runner = CommandRunner(cfg=IshConfig(dry_run=True))
+        with tracing(tracer):
+            runner.run(["false"])
+        assert tracer.spans == []
+
+
+if __name__ == "__main__":
+    unittest.main()
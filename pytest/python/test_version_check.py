@@ -1,16 +1,30 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2024-2026 Hans Liljestrand <hans@liljestrand.dev>
 
+import os
 import subprocess
+import sys
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock
 
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src"))
+)
+
+from pyishlib.command_runner import CommandRunner
+from pyishlib.installer import Installer
+from pyishlib.ish_config import IshConfig
 from pyishlib.version_check import (
+    VersionProbeCache,
     meets_min_version,
     parse_version,
     probe_version,
 )
 
+_OLD_NS = 1_000_000_000 * 1_000_000_000  # well outside the racy window
+
 
 class TestParseVersion(unittest.TestCase):
     def test_simple(self):
@@ -153,5 +167,130 @@ class TestProbeVersion(unittest.TestCase):
         self.assertIn("1.2.3", out)
 
 
+class TestVersionProbeCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.tool = self._binary("tool", b"\x7fELF v1")
+        self.cache_path = self.tmp / "state" / "version-cache.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _binary(self, name, content, ns=_OLD_NS):
+        path = self.tmp / "bin" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        path.chmod(0o755)
+        if ns is not None:
+            os.utime(path, ns=(ns, ns))
+        return path
+
+    def _runner(self, stdout=b"tool 1.2.3\n", dry_run=False):
+        runner = MagicMock()
+        runner.dry_run = dry_run
+        runner.which.side_effect = lambda cmd: str(self.tmp / "bin" / cmd)
+        runner.run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=stdout, stderr=b""
+        )
+        return runner
+
+    def test_unchanged_binary_is_probed_once_across_runs(self):
+        runner = self._runner()
+        cache = VersionProbeCache(self.cache_path)
+        self.assertIn("1.2.3", cache.probe(runner, "tool --version"))
+        self.assertIn("1.2.3", cache.probe(runner, "tool --version"))
+        cache.save()
+        again = VersionProbeCache(self.cache_path)
+        self.assertIn("1.2.3", again.probe(runner, "tool --version"))
+        runner.run.assert_called_once()
+
+    def test_changed_binary_is_probed_again(self):
+        runner = self._runner()
+        cache = VersionProbeCache(self.cache_path)
+        cache.probe(runner, "tool --version")
+        self._binary("tool", b"\x7fELF v2 (longer)")
+        runner.run.return_value.stdout = b"tool 2.0.0\n"
+        self.assertIn("2.0.0", cache.probe(runner, "tool --version"))
+        self.assertEqual(runner.run.call_count, 2)
+
+    def test_uncacheable_binaries_are_always_probed(self):
+        self._binary("script", b"#!/bin/sh\necho 1.0\n")
+        os.link(self.tool, self.tmp / "bin" / "proxy")
+        (self.tmp / "bin" / "shim").symlink_to(self.tool)
+        runner = self._runner()
+        cache = VersionProbeCache(self.cache_path)
+        for cmd in ("script --version", "proxy --version", "shim --version"):
+            cache.probe(runner, cmd)
+            cache.probe(runner, cmd)
+        self.assertEqual(runner.run.call_count, 6)
+
+    def test_commands_naming_code_are_always_probed(self):
+        runner = self._runner()
+        cache = VersionProbeCache(self.cache_path)
+        for cmd in (
+            "tool -m black --version",
+            "tool -mblack --version",
+            "tool -e 'console.log(1)'",
+            "tool --eval=1",
+            "tool version",
+        ):
+            cache.probe(runner, cmd)
+            cache.probe(runner, cmd)
+        self.assertEqual(runner.run.call_count, 10)
+
+    def test_plain_flags_are_cached(self):
+        runner = self._runner()
+        cache = VersionProbeCache(self.cache_path)
+        for cmd in ("tool -V", "tool --version --short"):
+            cache.probe(runner, cmd)
+            cache.probe(runner, cmd)
+        self.assertEqual(runner.run.call_count, 2)
+
+    def test_fresh_binary_and_dry_run_are_not_recorded(self):
+        self._binary("fresh", b"\x7fELF", ns=None)
+        cache = VersionProbeCache(self.cache_path)
+        cache.probe(self._runner(), "fresh --version")
+        cache.probe(self._runner(dry_run=True), "tool --version")
+        cache.save()
+        self.assertFalse(self.cache_path.exists())
+
+    def test_failed_probe_is_not_recorded(self):
+        runner = self._runner(stdout=b"")
+        runner.run.return_value.returncode = 1
+        cache = VersionProbeCache(self.cache_path)
+        self.assertIsNone(cache.probe(runner, "tool --version"))
+        self.assertIsNone(cache.probe(runner, "tool --version"))
+        self.assertEqual(runner.run.call_count, 2)
+
+    def test_corrupt_file_starts_empty(self):
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text("[1]")
+        runner = self._runner()
+        VersionProbeCache(self.cache_path).probe(runner, "tool --version")
+        runner.run.assert_called_once()
+
+    def test_from_cfg_uses_target(self):
+        cfg = IshConfig(defaults={"target": str(self.tmp)})
+        self.assertEqual(
+            VersionProbeCache.from_cfg(cfg).path,
+            self.tmp.resolve() / ".config" / "ishfiles" / "version-cache.json",
+        )
+
+    def test_installer_uses_cache(self):
+        cfg = IshConfig()
+        runner = CommandRunner(cfg=cfg)
+        fake = self._runner()
+        runner.which = fake.which
+        runner.run = fake.run
+        pkg = {"name": "tool", "cmd": "tool", "min_version": "1.0"}
+        for _ in range(2):
+            installer = Installer(
+                cfg=cfg, runner=runner, versions=VersionProbeCache(self.cache_path)
+            )
+            self.assertEqual(installer.get_missing_pkgs([pkg]), [])
+        fake.run.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
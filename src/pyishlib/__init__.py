@@ -5,5 +5,14 @@
 
 from .command_runner import CommandRunner as CommandRunner
 from .dotfile import DotFile as DotFile
-from .dotfile_applier import DotfileApplier as DotfileApplier
 from .ish_config import IshConfig as IshConfig
+
+
+def __getattr__(name: str):
+    # DotfileApplier pulls in the whole preprocessing stack; import it on
+    # first access so CLI startup does not pay for it.
+    if name == "DotfileApplier":
+        from .dotfile_applier import DotfileApplier
+
+        return DotfileApplier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
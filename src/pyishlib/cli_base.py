@@ -7,11 +7,11 @@ from __future__ import annotations
 import argparse
 import sys
 from abc import ABC
-from typing import Any, List, Optional, Sequence, Type
+from typing import Any, List, Optional, Sequence, Type, Union
 
 from .ish_logging import log_level_from_args, setup_logging
 
-from .cli_command import CliCommand
+from .cli_command import CliCommand, LazyCommand
 
 
 def _mark_explicit(ns: argparse.Namespace, dest: str) -> None:
@@ -131,8 +131,10 @@ class BaseCLI(ABC):
     Class attributes:
         PROG: Program name shown in ``--help`` (e.g. ``"ishfiles"``).
         DESCRIPTION: Top-level description text.
-        COMMANDS: Ordered list of :class:`CliCommand` subclasses to
-            register as subparsers.
+        COMMANDS: Ordered list of :class:`CliCommand` subclasses, or
+            :class:`LazyCommand` entries for subcommands whose
+            implementation is imported only when dispatched, to register
+            as subparsers.
         SUBPARSER_DEST: ``dest`` for ``add_subparsers`` (default
             ``"command"``).  Must match the attribute name used by
             :meth:`main` to detect a missing subcommand.
@@ -145,7 +147,7 @@ class BaseCLI(ABC):
 
     PROG: str = ""
     DESCRIPTION: str = ""
-    COMMANDS: Sequence[Type[CliCommand]] = ()
+    COMMANDS: Sequence[Union[Type[CliCommand], LazyCommand]] = ()
     SUBPARSER_DEST: str = "command"
     SUBPARSER_METAVAR: Optional[str] = None
     SUBPARSER_REQUIRED: bool = False
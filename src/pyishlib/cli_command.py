@@ -7,14 +7,31 @@ Also owns the passthrough machinery (``CliCommand.passthrough`` and
 ``ishproject`` whose subcommands delegate to ``ishfiles``.  The argv
 composition helpers (:func:`_compose_argv` and :func:`_split_for_target`)
 are module-level so they are unit-testable without instantiating a
-subclass.
+subclass.  ``CliCommand.passthrough_captured`` runs the same argv in a
+child process with its output captured, for callers that fan out over
+several repositories at once.
+
+:class:`LazyCommand` registers a subcommand from a declaration (name,
+help, argument builder) and imports the implementing
+:class:`CliCommand` subclass only when that subcommand is dispatched,
+so building the parser -- for ``--help``, shell completion or running
+a cheap subcommand -- does not import every command's dependencies.
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib
+import os
+import subprocess
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+
+# Parent of the pyishlib package directory, put on PYTHONPATH for child
+# processes so they import the same pyishlib as this process.
+_PYISHLIB_PARENT = Path(__file__).resolve().parent.parent
 
 
 class CliCommand(ABC):
@@ -32,6 +49,10 @@ class CliCommand(ABC):
     To forward to another ishlib CLI, set :attr:`TARGET_MAIN` and
     :attr:`TARGET_BUILD_PARSER` on the subclass and call
     :meth:`passthrough` from ``run``.
+
+    A subclass registered through a :class:`LazyCommand` entry takes its
+    name, help and arguments from that entry and only implements
+    :meth:`run`.
     """
 
     NAME: str = ""
@@ -44,6 +65,8 @@ class CliCommand(ABC):
     # become callable.
     TARGET_MAIN: Optional[Callable[[List[str]], int]] = None
     TARGET_BUILD_PARSER: Optional[Callable[[], argparse.ArgumentParser]] = None
+    # ``python -m`` module of the target CLI, for :meth:`passthrough_captured`.
+    TARGET_MODULE: Optional[str] = None
 
     def __init__(self) -> None:
         self.cfg: Any = None
@@ -177,6 +200,130 @@ class CliCommand(ABC):
         assert self.TARGET_MAIN is not None  # for type-checkers
         return self.TARGET_MAIN(argv)
 
+    def passthrough_captured(
+        self,
+        subcommand: str,
+        remainder: Iterable[str],
+        *,
+        global_args: Iterable[str] = (),
+    ) -> "subprocess.CompletedProcess[str]":
+        """Run the target CLI in a child process and capture its output.
+
+        Same argv as :meth:`passthrough`, but safe to call from several
+        threads at once: each run gets its own process, so its output
+        and logging setup do not mix with the others.  The child's stdin
+        is ``/dev/null``.  Requires :attr:`TARGET_MODULE`.
+        """
+        argv = self.compose_passthrough_argv(
+            subcommand, remainder, global_args=global_args
+        )
+        if self.TARGET_MODULE is None:
+            raise TypeError(
+                f"{type(self).__name__}.passthrough_captured() requires "
+                "TARGET_MODULE to be set on the class."
+            )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(_PYISHLIB_PARENT), env.get("PYTHONPATH")) if p
+        )
+        return subprocess.run(
+            [sys.executable, "-m", self.TARGET_MODULE, *argv],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+
+
+class LazyCommand:
+    """A subcommand declaration whose implementation is imported on dispatch.
+
+    Holds everything argparse needs to build the subparser, so the full
+    parser (``--help``, shell completion, passthrough argv splitting) can
+    be built without importing the implementing module.  Entries go in
+    :attr:`BaseCLI.COMMANDS <pyishlib.cli_base.BaseCLI.COMMANDS>` next to
+    (or instead of) :class:`CliCommand` subclasses.
+
+    Args:
+        name:          Subcommand name.
+        target:        The :class:`CliCommand` subclass implementing it, as
+                       ``"package.module:ClassName"``.
+        help:          One-line help shown in the subcommand list.
+        description:   Longer ``--help`` text (default: *help*).
+        arguments:     Callable adding subcommand-specific flags to the
+                       subparser.  Must not import *target*.
+        common_flags:  Attach the CLI's common flags (``-v``/``-n``/…).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        target: str,
+        help: str,
+        description: Optional[str] = None,
+        arguments: Optional[Callable[[argparse.ArgumentParser], None]] = None,
+        common_flags: bool = True,
+    ) -> None:
+        self.name = name
+        self.target = target
+        self.help = help
+        self.description = description
+        self.arguments = arguments
+        self.common_flags = common_flags
+
+    def register(
+        self,
+        subparsers: argparse._SubParsersAction,
+        add_common_flags: Callable[[argparse.ArgumentParser], None],
+    ) -> argparse.ArgumentParser:
+        """Create the subparser like :meth:`CliCommand.register`."""
+        parser = subparsers.add_parser(
+            self.name,
+            help=self.help,
+            description=self.description or self.help,
+        )
+        if self.common_flags:
+            add_common_flags(parser)
+        if self.arguments is not None:
+            self.arguments(parser)
+        parser.set_defaults(func=self._entry)
+        return parser
+
+    def load(self) -> Type[CliCommand]:
+        """Import and return the implementing :class:`CliCommand` subclass.
+
+        Raises:
+            TypeError: If *target* does not name a :class:`CliCommand`
+                       subclass.
+        """
+        command = import_target(self.target)
+        if not (isinstance(command, type) and issubclass(command, CliCommand)):
+            raise TypeError(f"{self.target} is not a CliCommand subclass")
+        return command
+
+    def _entry(self, ctx: Any) -> int:
+        return self.load()._entry(ctx)
+
+
+def import_target(target: str) -> Any:
+    """Import ``"package.module:attr"`` and return the attribute."""
+    module, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def lazy_callable(target: str) -> Callable[..., Any]:
+    """Return a function that imports *target* when called and forwards to it.
+
+    For dispatch targets below a subcommand (``set_defaults(func=...)`` on
+    nested subparsers) that live in the implementing module.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return import_target(target)(*args, **kwargs)
+
+    return call
+
 
 # ----------------------------------------------------------------------
 # Passthrough argv composition (module-level helpers)
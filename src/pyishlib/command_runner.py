@@ -13,6 +13,7 @@ from .ish_config import IshConfig
 from .ish_comp import die
 from .userio import prompt_yes_no_always
 from .environment import is_windows
+from .timings import SUBPROCESS, span
 
 log = logging.getLogger(__name__)
 
@@ -81,6 +82,7 @@ class CommandRunner:
         quiet: bool = False,
         sudo: bool = False,
         force_sudo: Optional[bool] = False,
+        read_only: bool = False,
         **kwargs,
     ) -> subprocess.CompletedProcess:
         """Run command.
@@ -89,6 +91,10 @@ class CommandRunner:
         runs through :meth:`_check_sudo` for user confirmation (unless
         *force_sudo* is True or ``always_sudo`` is set).  Raises
         ``OSError`` on Windows when *sudo* is True.
+
+        A *read_only* command has no side effects, so it also runs (and
+        is not echoed) in dry-run mode, where callers need its real
+        output rather than a synthetic success.
         """
 
         command = [str(c) for c in command]
@@ -108,7 +114,8 @@ class CommandRunner:
         if "check" not in kwargs:
             kwargs["check"] = True
 
-        self._print_cmd(command)
+        if not (read_only and self.dry_run):
+            self._print_cmd(command)
 
         if quiet:
             if "stdout" not in kwargs:
@@ -116,26 +123,18 @@ class CommandRunner:
             if "stderr" not in kwargs:
                 kwargs["stderr"] = subprocess.DEVNULL
 
-        if self.dry_run:
+        if self.dry_run and not read_only:
             return subprocess.CompletedProcess(
                 args=command, returncode=0, stdout=b"", stderr=b""
             )
 
-        old_path: Optional[Path] = None
-        if work_dir is not None:
-            try:
-                old_path = Path(os.getcwd())
-            except OSError:
-                pass  # CWD already invalid; skip restoring after work_dir execution
-
-        try:
-            if work_dir is not None:
-                os.chdir(work_dir)
-            result = subprocess.run(command, **kwargs)
-        finally:
-            if old_path is not None:
-                os.chdir(old_path)
-        return result
+        # Pass work_dir as the child's cwd rather than chdir-ing the whole
+        # process, so concurrent runs from worker threads cannot race.
+        if work_dir is not None and "cwd" not in kwargs:
+            kwargs["cwd"] = str(work_dir)
+
+        with span(" ".join(command[:2]), SUBPROCESS, argv=command):
+            return subprocess.run(command, **kwargs)
 
     def git(
         self, command: Iterable[str], work_dir: Optional[Path] = None, **kwargs
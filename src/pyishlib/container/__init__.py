@@ -8,6 +8,8 @@ Provides:
 - :class:`Container` — per-container handle ABC.
 - :class:`ContainerBackend` — daemon-level backend ABC.
 - :class:`IncusContainer` / :class:`IncusBackend` — Incus implementations.
+- :class:`IncusApiContainer` / :class:`IncusApiBackend` — Incus over its
+  REST API (unix socket), falling back to the CLI where needed.
 - :func:`get_backend` — single seam for selecting a backend.
 
 This package owns every backend-specific code path (today: Incus only).
@@ -15,6 +17,7 @@ Tool-specific layers (such as ``pyishlib.isholate``) must build on top
 of these classes rather than reach for a backend's CLI directly.
 """
 
+import os
 from typing import Optional
 
 from .backend import ContainerBackend
@@ -26,10 +29,15 @@ from .incus import (
     ensure_managed_network,
     list_incus_containers,
 )
+from .incus_api import IncusApiBackend, IncusApiClient, IncusApiContainer, IncusApiError
 
 __all__ = [
     "Container",
     "ContainerBackend",
+    "IncusApiBackend",
+    "IncusApiClient",
+    "IncusApiContainer",
+    "IncusApiError",
     "IncusBackend",
     "IncusContainer",
     "check_incus_available",
@@ -41,19 +49,25 @@ __all__ = [
 
 _BACKENDS = {
     "incus": IncusBackend,
+    "incus-api": IncusApiBackend,
 }
 
+#: Environment variable selecting the default backend (see :func:`get_backend`).
+BACKEND_ENV = "ISHLIB_CONTAINER_BACKEND"
+
 
 def get_backend(name: Optional[str] = None) -> ContainerBackend:
     """Return the requested :class:`ContainerBackend`.
 
-    With ``name=None`` (the default) returns an :class:`IncusBackend`.
+    With ``name=None`` (the default) the backend named by
+    ``$ISHLIB_CONTAINER_BACKEND`` is used, else an :class:`IncusBackend`.
+    Set it to ``incus-api`` to talk to the Incus daemon over its REST API.
     Future backends register themselves in the lookup table above.
 
     Raises:
         ValueError: when *name* is not a known backend.
     """
-    key = (name or "incus").lower()
+    key = (name or os.environ.get(BACKEND_ENV) or "incus").lower()
     try:
         cls = _BACKENDS[key]
     except KeyError as exc:
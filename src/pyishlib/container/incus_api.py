@@ -0,0 +1,606 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+
+"""Incus REST API backend over the daemon's local unix socket.
+
+:class:`IncusApiBackend` / :class:`IncusApiContainer` implement the same
+contract as :class:`~pyishlib.container.incus.IncusBackend` but talk to
+the Incus daemon directly (``/1.0/...`` over HTTP on its unix socket)
+instead of spawning the ``incus`` binary for every call.  Provisioning
+an isholate container issues dozens of small requests; on the API path
+each is a round-trip on a kept-alive connection rather than a Go process
+start-up.
+
+Asynchronous requests return an *operation*; :class:`IncusApiClient`
+polls it with the ``/wait`` endpoint until it completes.  ``exec`` uses
+the websocket-free mode (``record-output``) and fetches the recorded
+stdout/stderr afterwards, so it is only used when the caller captures
+output and provides no stdin.
+
+The CLI implementation remains the fallback: interactive/streaming
+exec, recursive file pulls, remote-image creation and diagnostics are
+delegated to :class:`~pyishlib.container.incus.IncusContainer`, and the
+backend hands out plain CLI containers when the socket is not usable.
+Like the CLI backend, failures of "checked" operations surface as
+:class:`subprocess.CalledProcessError` so callers need not care which
+transport is in use.
+
+The socket path is taken from ``$INCUS_SOCKET``, then
+``$INCUS_DIR/unix.socket``, then the distribution defaults.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import os
+import socket
+import stat
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from .container import Container
+from .incus import IncusBackend, IncusContainer, check_incus_available
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_SOCKETS = ("/var/lib/incus/unix.socket", "/run/incus/unix.socket")
+
+# Errors meaning a kept-alive connection was closed by the daemon.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+#: Seconds the daemon holds each ``/wait`` poll before returning.
+_WAIT_CHUNK = 20
+
+# Instance keys accepted by ``PUT /1.0/instances/<name>``.
+_WRITABLE_KEYS = (
+    "architecture",
+    "config",
+    "description",
+    "devices",
+    "ephemeral",
+    "profiles",
+    "stateful",
+)
+
+
+def default_socket_path() -> Path:
+    """Return the Incus unix socket path for the current environment."""
+    env = os.environ.get("INCUS_SOCKET")
+    if env:
+        return Path(env)
+    incus_dir = os.environ.get("INCUS_DIR")
+    if incus_dir:
+        return Path(incus_dir) / "unix.socket"
+    for candidate in _DEFAULT_SOCKETS:
+        if os.path.exists(candidate):
+            return Path(candidate)
+    return Path(_DEFAULT_SOCKETS[0])
+
+
+class IncusApiError(RuntimeError):
+    """A request to the Incus API failed.
+
+    Attributes:
+        status_code: HTTP (or Incus error) status code, or None for
+                     transport-level failures.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """:class:`http.client.HTTPConnection` bound to a unix socket."""
+
+    def __init__(self, socket_path: Path, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self._socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class IncusApiClient:
+    """Minimal JSON client for the Incus REST API.
+
+    Keeps one persistent connection per thread, so a client may be shared
+    by concurrent callers.
+
+    Args:
+        socket_path: Daemon socket (default: :func:`default_socket_path`).
+        timeout:     Socket timeout in seconds for a single request.
+    """
+
+    def __init__(
+        self, socket_path: Optional[Path] = None, timeout: float = 60.0
+    ) -> None:
+        self.socket_path = (
+            Path(socket_path) if socket_path is not None else default_socket_path()
+        )
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def available(self) -> bool:
+        """True if the socket exists and is accessible to this user."""
+        try:
+            st = os.stat(self.socket_path)
+        except OSError:
+            return False
+        return stat.S_ISSOCK(st.st_mode) and os.access(
+            self.socket_path, os.R_OK | os.W_OK
+        )
+
+    def close(self) -> None:
+        """Close the calling thread's connection, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def raw(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request and return *(status, headers, body)*.
+
+        Header names in the result are lower-cased.  A request on a
+        kept-alive connection that the daemon has since closed is retried
+        once on a fresh connection.
+
+        Raises:
+            IncusApiError: on transport failures.
+        """
+        for attempt in range(2):
+            conn = getattr(self._local, "conn", None)
+            reused = conn is not None
+            if conn is None:
+                conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+                self._local.conn = conn
+            try:
+                conn.request(method, path, body=body, headers=dict(headers or {}))
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self.close()
+                if reused and isinstance(exc, _STALE_ERRORS) and attempt == 0:
+                    continue
+                raise IncusApiError(f"{method} {path}: {exc}") from exc
+            if resp.getheader("connection", "").lower() == "close":
+                self.close()
+            result_headers = {k.lower(): v for k, v in resp.getheaders()}
+            return resp.status, result_headers, data
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def request(self, method: str, path: str, body: Any = None) -> Any:
+        """Send a JSON request and return the response ``metadata``.
+
+        Asynchronous responses are waited for via :meth:`wait`, in which
+        case the finished operation's ``metadata`` is returned instead.
+
+        Raises:
+            IncusApiError: on transport failures, error responses, or a
+                failed operation.
+        """
+        payload = None
+        headers: Dict[str, str] = {}
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        status, _, data = self.raw(method, path, payload, headers)
+        try:
+            doc = json.loads(data or b"{}")
+        except ValueError as exc:
+            raise IncusApiError(
+                f"{method} {path}: invalid JSON response", status
+            ) from exc
+        if doc.get("type") == "error" or status >= 400:
+            code = doc.get("error_code") or status
+            raise IncusApiError(
+                f"{method} {path}: {doc.get('error') or f'HTTP {status}'}", code
+            )
+        if doc.get("type") == "async":
+            operation = doc.get("operation") or ""
+            return self.wait(operation).get("metadata")
+        return doc.get("metadata")
+
+    def wait(self, operation: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Poll *operation* until it finishes and return its final state.
+
+        Args:
+            operation: Operation URL (e.g. ``"/1.0/operations/<uuid>"``).
+            timeout:   Overall limit in seconds; None waits indefinitely.
+
+        Raises:
+            IncusApiError: if the operation fails or *timeout* expires.
+        """
+        waited = 0.0
+        while True:
+            chunk = _WAIT_CHUNK
+            if timeout is not None:
+                chunk = max(1, min(chunk, int(timeout - waited)))
+            op = self.request("GET", f"{operation}/wait?timeout={chunk}") or {}
+            code = int(op.get("status_code") or 0)
+            if code == 200:
+                return op
+            if code >= 400:
+                raise IncusApiError(
+                    f"operation {operation}: {op.get('err') or op.get('status')}",
+                    code,
+                )
+            waited += chunk
+            if timeout is not None and waited >= timeout:
+                raise IncusApiError(f"operation {operation}: timed out")
+
+
+def _checked(step: str, func: Callable[[], Any]) -> Any:
+    """Run *func*; turn :class:`IncusApiError` into ``CalledProcessError``.
+
+    Mirrors :func:`pyishlib.container.incus._run_checked` so callers see
+    the same exception type from both transports.
+    """
+    try:
+        return func()
+    except IncusApiError as exc:
+        log.error("%s failed: %s", step, exc)
+        raise subprocess.CalledProcessError(1, step, stderr=str(exc)) from exc
+
+
+# ---------------------------------------------------------------------------
+# IncusApiContainer
+# ---------------------------------------------------------------------------
+
+
+class IncusApiContainer(IncusContainer):
+    """:class:`Container` implementation backed by :class:`IncusApiClient`.
+
+    Subclasses :class:`IncusContainer` so that operations the API path
+    does not cover fall back to the CLI via ``super()``.
+    """
+
+    def __init__(self, name: str, client: IncusApiClient) -> None:
+        super().__init__(name)
+        self._client = client
+
+    @property
+    def _url(self) -> str:
+        return f"/1.0/instances/{quote(self.name, safe='')}"
+
+    def _get(self) -> Optional[Dict[str, Any]]:
+        try:
+            return self._client.request("GET", self._url)
+        except IncusApiError as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+
+    def _update(self, mutate: Callable[[Dict[str, Any]], None]) -> None:
+        """Read-modify-write the instance's writable configuration."""
+        inst = self._get()
+        if inst is None:
+            raise IncusApiError(f"instance '{self.name}' not found", 404)
+        body = {key: inst.get(key) for key in _WRITABLE_KEYS if key in inst}
+        body.setdefault("config", {})
+        body.setdefault("devices", {})
+        mutate(body)
+        self._client.request("PUT", self._url, body)
+
+    # ------------------------------------------------------------------
+    # Lifecycle primitives
+    # ------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        try:
+            return self._get() is not None
+        except IncusApiError:
+            return False
+
+    def is_running(self) -> bool:
+        try:
+            inst = self._get()
+        except IncusApiError:
+            return False
+        return str((inst or {}).get("status", "")).lower() == "running"
+
+    def create(self, image: str, **config: str) -> None:
+        remote, _, alias = image.rpartition(":")
+        if remote and remote != "local":
+            # Remote image servers are configured client-side; let the
+            # CLI resolve them.
+            super().create(image, **config)
+            return
+        body = {
+            "name": self.name,
+            "source": {"type": "image", "alias": alias},
+            "config": dict(config),
+        }
+        _checked(
+            f"create '{self.name}'",
+            lambda: self._client.request("POST", "/1.0/instances", body),
+        )
+
+    def _set_state(self, action: str, force: bool = False) -> None:
+        body = {"action": action, "force": force, "timeout": -1}
+        self._client.request("PUT", f"{self._url}/state", body)
+
+    def start(self) -> None:
+        _checked(f"start '{self.name}'", lambda: self._set_state("start"))
+
+    def stop(self, *, force: bool = True) -> bool:
+        try:
+            self._set_state("stop", force=force)
+        except IncusApiError as exc:
+            log.debug("stop %s failed: %s", self.name, exc)
+            return False
+        return True
+
+    def delete(self, *, force: bool = True) -> bool:
+        if force and self.is_running() and not self.stop(force=True):
+            return False
+        try:
+            self._client.request("DELETE", self._url)
+        except IncusApiError as exc:
+            log.debug("delete %s failed: %s", self.name, exc)
+            return False
+        return True
+
+    def copy_to(self, dest_name: str) -> "IncusApiContainer":
+        body = {"name": dest_name, "source": {"type": "copy", "source": self.name}}
+        _checked(
+            f"copy '{self.name}' to '{dest_name}'",
+            lambda: self._client.request("POST", "/1.0/instances", body),
+        )
+        return IncusApiContainer(dest_name, self._client)
+
+    # ------------------------------------------------------------------
+    # Exec / file I/O
+    # ------------------------------------------------------------------
+
+    def exec(
+        self,
+        cmd: Sequence[str],
+        *,
+        env: Optional[Mapping[str, str]] = None,
+        cwd: Optional[str] = None,
+        user: Optional[int] = None,
+        check: bool = False,
+        capture_output: bool = False,
+        text: bool = False,
+        stdin: Any = None,
+    ) -> subprocess.CompletedProcess:
+        if stdin is not None or not capture_output:
+            # Live output and stdin need the websocket protocol; the CLI
+            # implements it.
+            return super().exec(
+                cmd,
+                env=env,
+                cwd=cwd,
+                user=user,
+                check=check,
+                capture_output=capture_output,
+                text=text,
+                stdin=stdin,
+            )
+
+        argv = list(cmd)
+        body: Dict[str, Any] = {
+            "command": argv,
+            "environment": dict(env or {}),
+            "interactive": False,
+            "record-output": True,
+            "wait-for-websocket": False,
+        }
+        if cwd is not None:
+            body["cwd"] = cwd
+        if user is not None:
+            body["user"] = user
+
+        try:
+            meta = self._client.request("POST", f"{self._url}/exec", body) or {}
+            returncode = int(meta.get("return", 1))
+            outputs = meta.get("output") or {}
+            out = self._fetch_output(outputs.get("1"))
+            err = self._fetch_output(outputs.get("2"))
+        except IncusApiError as exc:
+            returncode, out, err = 1, b"", str(exc).encode("utf-8")
+
+        stdout: Any = out.decode("utf-8", errors="replace") if text else out
+        stderr: Any = err.decode("utf-8", errors="replace") if text else err
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, argv, stdout, stderr)
+        return subprocess.CompletedProcess(argv, returncode, stdout, stderr)
+
+    def _fetch_output(self, url: Optional[str]) -> bytes:
+        """Download and then delete one recorded exec output log."""
+        if not url:
+            return b""
+        status, _, data = self._client.raw("GET", url)
+        try:
+            self._client.raw("DELETE", url)
+        except IncusApiError:
+            pass
+        return data if status == 200 else b""
+
+    def _file_url(self, container_path: str) -> str:
+        return f"{self._url}/files?path={quote(container_path, safe='/')}"
+
+    def pull_file(
+        self,
+        container_path: str,
+        host_dest: Path,
+        *,
+        recursive: bool = False,
+    ) -> bool:
+        if recursive:
+            return super().pull_file(container_path, host_dest, recursive=True)
+        try:
+            status, headers, data = self._client.raw(
+                "GET", self._file_url(container_path)
+            )
+        except IncusApiError:
+            return False
+        if status != 200 or headers.get("x-incus-type", "file") != "file":
+            return False
+        try:
+            host_dest.parent.mkdir(parents=True, exist_ok=True)
+            host_dest.write_bytes(data)
+            if "x-incus-mode" in headers:
+                os.chmod(host_dest, int(headers["x-incus-mode"], 8))
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def push_file(
+        self,
+        host_src: Path,
+        container_path: str,
+        *,
+        uid: Optional[int] = None,
+        gid: Optional[int] = None,
+        mode: Optional[int] = None,
+    ) -> bool:
+        try:
+            st = os.stat(host_src)
+            data = Path(host_src).read_bytes()
+        except OSError:
+            return False
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "X-Incus-type": "file",
+            "X-Incus-write": "overwrite",
+            "X-Incus-uid": str(st.st_uid if uid is None else uid),
+            "X-Incus-gid": str(st.st_gid if gid is None else gid),
+            "X-Incus-mode": format(
+                stat.S_IMODE(st.st_mode) if mode is None else mode, "04o"
+            ),
+        }
+        try:
+            status, _, _ = self._client.raw(
+                "POST", self._file_url(container_path), data, headers
+            )
+        except IncusApiError:
+            return False
+        return status == 200
+
+    # ------------------------------------------------------------------
+    # Device primitives
+    # ------------------------------------------------------------------
+
+    def add_device(self, device_name: str, device_type: str, **options: str) -> None:
+        def mutate(body: Dict[str, Any]) -> None:
+            if device_name in body["devices"]:
+                raise IncusApiError(f"device '{device_name}' already exists")
+            body["devices"][device_name] = {"type": device_type, **options}
+
+        _checked(
+            f"add device '{device_name}' on '{self.name}'",
+            lambda: self._update(mutate),
+        )
+
+    def remove_device(self, device_name: str) -> None:
+        try:
+            self._update(lambda body: body["devices"].pop(device_name, None))
+        except IncusApiError as exc:
+            log.debug("remove device %s on %s: %s", device_name, self.name, exc)
+
+    def list_devices(self) -> List[str]:
+        try:
+            return self.list_devices_strict()
+        except RuntimeError:
+            return []
+
+    def list_devices_strict(self) -> List[str]:
+        try:
+            inst = self._get()
+        except IncusApiError as exc:
+            raise RuntimeError(
+                f"failed to list devices on '{self.name}': {exc}"
+            ) from exc
+        if inst is None:
+            raise RuntimeError(
+                f"failed to list devices on '{self.name}': instance not found"
+            )
+        return sorted(inst.get("devices") or {})
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def get_metadata(self, key: str) -> Optional[str]:
+        try:
+            inst = self._get()
+        except IncusApiError:
+            return None
+        value = ((inst or {}).get("config") or {}).get(key)
+        return value or None
+
+    def set_metadata(self, key: str, value: str) -> None:
+        def mutate(body: Dict[str, Any]) -> None:
+            body["config"][key] = value
+
+        _checked(f"set {key} on '{self.name}'", lambda: self._update(mutate))
+
+
+# ---------------------------------------------------------------------------
+# IncusApiBackend
+# ---------------------------------------------------------------------------
+
+
+class IncusApiBackend(IncusBackend):
+    """Incus backend that talks to the daemon's REST API.
+
+    Falls back to the CLI-based :class:`IncusBackend` behaviour whenever
+    the unix socket is missing or not accessible to the current user.
+
+    Args:
+        socket_path: Daemon socket (default: :func:`default_socket_path`).
+    """
+
+    name = "incus-api"
+
+    def __init__(self, socket_path: Optional[Path] = None) -> None:
+        self.client = IncusApiClient(socket_path)
+
+    def check_available(self) -> Optional[str]:
+        if not self.client.available():
+            return check_incus_available()
+        try:
+            info = self.client.request("GET", "/1.0") or {}
+        except IncusApiError:
+            return check_incus_available()
+        if info.get("auth") != "trusted":
+            return check_incus_available()
+        return None
+
+    def container(self, name: str) -> Container:
+        if not self.client.available():
+            return IncusContainer(name)
+        return IncusApiContainer(name, self.client)
+
+    def list_containers(self) -> List[dict]:
+        if not self.client.available():
+            return super().list_containers()
+        instances = _checked(
+            "list instances",
+            lambda: self.client.request("GET", "/1.0/instances?recursion=1"),
+        )
+        return instances or []
@@ -6,6 +6,15 @@ Provides :func:`print_diff` which uses ``git diff --no-index`` for
 coloured, familiar output and falls back to Python's :mod:`difflib`
 when git is not available.
 
+For whole change sets, :func:`print_diffs` renders every file in-process
+(no subprocess per file) in the same format ``git diff --no-index``
+produces: ``diff --git`` / ``index`` / mode headers, ``@@`` hunk headers
+with git's default function-name context, ``\ No newline at end of
+file`` markers, and git's default colours.  Hunks are computed with
+:mod:`difflib`, so in ambiguous cases they may be split differently from
+git's own algorithm; :func:`print_diff` remains available when git's
+exact output is wanted.
+
 .. note::
 
    The git backend uses file paths as diff headers; the *old_label* and
@@ -15,12 +24,16 @@ when git is not available.
 from __future__ import annotations
 
 import difflib
+import hashlib
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
 
 log = logging.getLogger(__name__)
 
@@ -79,6 +92,218 @@ def print_binary_diff(old_label: str, new_label: str) -> None:
     print()
 
 
+# ---------------------------------------------------------------------------
+# Batch renderer
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class DiffEntry:
+    """One file pair for :func:`print_diffs`.
+
+    Attributes:
+        old:      The "before" file, or ``None`` for a new file.
+        new:      The "after" file.
+        old_text: Content to use for *old* instead of reading it (e.g. a
+                  canonicalised form); *old* is then only used as the
+                  header path.
+        new_label: Name shown for *new* in binary-file notices (default:
+                  its path), e.g. the target a staged file will land on.
+    """
+
+    old: Optional[Path]
+    new: Path
+    old_text: Optional[str] = None
+    new_label: Optional[str] = None
+
+
+# git's default diff colours (color.diff.{meta,frag,old,new}).
+_RESET = "\x1b[m"
+_META = "\x1b[1m"
+_FRAG = "\x1b[36m"
+_OLD = "\x1b[31m"
+_NEW = "\x1b[32m"
+
+_NO_NEWLINE = "\\ No newline at end of file"
+_CONTEXT_LINES = 3
+# xdiff's default function-name buffer size.
+_FUNCNAME_MAX = 80
+
+
+def print_diffs(entries: Iterable[DiffEntry], color: Optional[bool] = None) -> None:
+    """Print unified diffs for a whole change set in one pass.
+
+    Args:
+        entries: File pairs to diff, printed in order.
+        color:   Force colour on or off.  Defaults to colour when stdout
+                 is a terminal, like the git backend.
+    """
+    if color is None:
+        color = sys.stdout.isatty()
+    for chunk in render_diffs(entries, color=color):
+        sys.stdout.write(chunk)
+
+
+def render_diffs(entries: Iterable[DiffEntry], color: bool = False) -> Iterator[str]:
+    """Yield the rendered diff of each entry (see :func:`print_diffs`).
+
+    Binary files are rendered like :func:`print_binary_diff`.
+    """
+    for entry in entries:
+        old_data = b"" if entry.old is None else _read_old(entry)
+        new_data = entry.new.read_bytes()
+        try:
+            old_text = old_data.decode("utf-8")
+            new_text = new_data.decode("utf-8")
+        except UnicodeDecodeError:
+            old_label = os.devnull if entry.old is None else str(entry.old)
+            new_label = entry.new_label or str(entry.new)
+            yield f"--- {old_label}\n+++ {new_label}\n<binary files differ>\n\n"
+            continue
+        yield _render_text_diff(entry, old_data, new_data, old_text, new_text, color)
+
+
+def _read_old(entry: DiffEntry) -> bytes:
+    if entry.old_text is not None:
+        return entry.old_text.encode("utf-8")
+    assert entry.old is not None
+    return entry.old.read_bytes()
+
+
+def _render_text_diff(
+    entry: DiffEntry,
+    old_data: bytes,
+    new_data: bytes,
+    old_text: str,
+    new_text: str,
+    color: bool,
+) -> str:
+    out: List[str] = []
+
+    def meta(line: str) -> None:
+        out.append(f"{_META}{line}{_RESET}\n" if color else f"{line}\n")
+
+    new_path = _git_path(entry.new)
+    old_path = new_path if entry.old is None else _git_path(entry.old)
+    new_mode = _git_mode(entry.new)
+    meta(f"diff --git a/{old_path} b/{new_path}")
+
+    if entry.old is None:
+        meta(f"new file mode {new_mode}")
+        meta(f"index 0000000..{_blob_id(new_data)}")
+    else:
+        old_mode = _git_mode(entry.old)
+        if old_mode != new_mode:
+            meta(f"old mode {old_mode}")
+            meta(f"new mode {new_mode}")
+        if old_data == new_data:
+            return "".join(out)
+        index = f"index {_blob_id(old_data)}..{_blob_id(new_data)}"
+        meta(index if old_mode != new_mode else f"{index} {old_mode}")
+
+    a = _split_lines(old_text)
+    b = _split_lines(new_text)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    groups = list(matcher.get_grouped_opcodes(_CONTEXT_LINES))
+    if not groups:
+        # Like git, an empty new file gets no ---/+++ header.
+        return "".join(out)
+    meta("--- /dev/null" if entry.old is None else f"--- a/{old_path}")
+    meta(f"+++ b/{new_path}")
+
+    for group in groups:
+        first, last = group[0], group[-1]
+        header = "@@ -{} +{} @@".format(
+            _format_range(first[1], last[2]), _format_range(first[3], last[4])
+        )
+        func = _funcname(a, first[1])
+        if color:
+            header = f"{_FRAG}{header}{_RESET}"
+            if func:
+                header += f" {_RESET}{func}{_RESET}"
+        elif func:
+            header += f" {func}"
+        out.append(header + "\n")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                _emit_lines(out, a[i1:i2], " ", "", color)
+                continue
+            if tag in ("replace", "delete"):
+                _emit_lines(out, a[i1:i2], "-", _OLD, color)
+            if tag in ("replace", "insert"):
+                _emit_lines(out, b[j1:j2], "+", _NEW, color)
+    return "".join(out)
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split *text* into lines the way git does: on ``\n`` only.
+
+    :meth:`str.splitlines` also breaks on ``\r``, form feeds and other
+    Unicode separators, which would shift hunk ranges away from git's.
+    """
+    lines = re.split(r"(?<=\n)", text)
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _emit_lines(
+    out: List[str], lines: Sequence[str], sign: str, code: str, color: bool
+) -> None:
+    for line in lines:
+        text = line[:-1] if line.endswith("\n") else line
+        if not color:
+            out.append(f"{sign}{text}\n")
+        elif sign == "+":
+            out.append(f"{code}{sign}{_RESET}{code}{text}{_RESET}\n")
+        else:
+            out.append(f"{code}{sign}{text}{_RESET}\n")
+        if not line.endswith("\n"):
+            out.append(f"{_NO_NEWLINE}{_RESET}\n" if color else f"{_NO_NEWLINE}\n")
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range the way git (and difflib) do."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _funcname(lines: Sequence[str], start: int) -> str:
+    """Return git's default function-name context for a hunk at *start*.
+
+    Mirrors xdiff's default: the nearest preceding line that begins with a
+    letter, ``_`` or ``$``, truncated to 80 characters.
+    """
+    for line in reversed(lines[:start]):
+        if line[:1].isalpha() or line[:1] in ("_", "$"):
+            return line[:_FUNCNAME_MAX].rstrip()
+    return ""
+
+
+def _git_path(path: Path) -> str:
+    """Path as git prints it in ``--no-index`` headers."""
+    return path.as_posix().lstrip("/")
+
+
+def _git_mode(path: Path) -> str:
+    try:
+        executable = os.stat(path).st_mode & 0o100
+    except OSError:
+        executable = 0
+    return "100755" if executable else "100644"
+
+
+def _blob_id(data: bytes) -> str:
+    """Abbreviated git blob id of *data*."""
+    header = f"blob {len(data)}\0".encode("ascii")
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()[:7]
+
+
 # ---------------------------------------------------------------------------
 # git diff backend
 # ---------------------------------------------------------------------------
@@ -15,11 +15,15 @@ import filecmp
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .environment import is_windows
 from .json_merge import semantic_equal
 
+if TYPE_CHECKING:
+    from .dotfile_index import DotfileIndex
+    from .file_preprocessor import ParsedSource
+
 DOT_PREFIX = "dot_"
 EXECUTABLE_PREFIX = "executable_"
 MERGEJSON_PREFIX = "mergejson_"
@@ -138,8 +142,10 @@ class DotFile:
         self._target_dir: Path = target_dir
         self._translated: Path = translate_path(rel_path)
         self._staged: Optional[Path] = None
+        self._staged_digest: Optional[str] = None
         self._metadata: Optional[Dict[str, Any]] = None
         self._scanned: bool = False
+        self._parsed: Optional["ParsedSource"] = None
 
     @property
     def source(self) -> Path:
@@ -170,6 +176,15 @@ class DotFile:
     def staged(self, path: Optional[Path]) -> None:
         self._staged = path
 
+    @property
+    def staged_digest(self) -> Optional[str]:
+        """SHA-256 of the staged output, set during the prepare step."""
+        return self._staged_digest
+
+    @staged_digest.setter
+    def staged_digest(self, digest: Optional[str]) -> None:
+        self._staged_digest = digest
+
     @property
     def metadata(self) -> Optional[Dict[str, Any]]:
         """Extracted __ISH__ metadata, populated during preprocessing."""
@@ -185,6 +200,15 @@ class DotFile:
         """True if metadata has been read (even if no metadata was found)."""
         return self._scanned
 
+    @property
+    def parsed(self) -> Optional["ParsedSource"]:
+        """The source as read during scanning, reused by the prepare step."""
+        return self._parsed
+
+    @parsed.setter
+    def parsed(self, value: Optional["ParsedSource"]) -> None:
+        self._parsed = value
+
     @property
     def executable(self) -> bool:
         """True if the source filename carries the ``executable_`` prefix.
@@ -207,9 +231,18 @@ class DotFile:
         """The file to compare / copy: staged copy if available, else source."""
         return self._staged if self._staged is not None else self._source
 
-    def get_change_type(self) -> Optional[ChangeType]:
+    def get_change_type(
+        self, index: Optional["DotfileIndex"] = None
+    ) -> Optional[ChangeType]:
         """Compare the effective source against the target.
 
+        Args:
+            index: Optional :class:`~pyishlib.dotfile_index.DotfileIndex`.
+                When given and its record for this file is still valid,
+                the content comparison is skipped; a fresh "unchanged"
+                result is recorded into it, and any other result drops
+                the stale record.
+
         Returns:
             :attr:`ChangeType.NEW` if the target does not exist,
             :attr:`ChangeType.MODIFIED` if content differs or if the
@@ -220,6 +253,18 @@ class DotFile:
         both sides as JSON and comparing semantically, so key ordering
         inside objects does not count as a change.
         """
+        if index is not None:
+            if index.is_unchanged(self):
+                return None
+            change = self._compare()
+            if change is None:
+                index.record(self)
+            else:
+                index.forget(self)
+            return change
+        return self._compare()
+
+    def _compare(self) -> Optional[ChangeType]:
         if not self.target.exists():
             return ChangeType.NEW
         if not self.target.is_file():
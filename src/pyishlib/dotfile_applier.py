@@ -8,8 +8,9 @@ prefixes.  The pipeline has three stages:
 
 1. **Discover** -- scan a source directory (or accept an explicit file list)
    and build a list of :class:`DotFile` objects.
-2. **Prepare** -- copy discovered files into a temporary staging directory
-   where future preprocessing can be applied.
+2. **Prepare** -- preprocess discovered files into staged copies.  Files
+   that preprocessing leaves unchanged are staged in place, and outputs
+   can be reused across runs from a persistent :class:`StagingStore`.
 3. **Apply** -- compare the staged files against the target, prompt the
    user, and copy changed files into place.
 """
@@ -27,10 +28,13 @@ from .command_runner import CommandRunner
 from .dotfile import ChangeType, DotFile
 from .dotfile_finder import DotfileFinder
 from .dotfile_ignore import DotfileIgnore
-from .ish_metadata import collect_metadata_packages, read_metadata
+from .dotfile_index import DotfileIndex, hash_bytes
+from .file_preprocessor import ParsedSource, has_prompt_directives
+from .ish_metadata import collect_metadata_packages
 from .dotfile_preprocessor import DotFilePreprocessor
 from .ish_config import IshConfig
 from .json_merge import canonical_json, deep_merge_json
+from .staging_store import StagingStore, environment_signature
 from .userio import prompt_yes_no_always
 from .environment import is_windows, should_skip_for_os_from_metadata
 
@@ -46,8 +50,9 @@ class DotfileApplier:
 
     1. :meth:`discover` -- find dotfiles in *source_dir* or from an
        explicit list (delegated to :class:`DotfileFinder`).
-    2. :meth:`prepare` -- stage files into a temporary directory with
-       preprocessing (metadata extraction, variable substitution, etc.).
+    2. :meth:`prepare` -- preprocess files (metadata extraction, variable
+       substitution, etc.); unchanged files are staged in place, others
+       in a temporary directory or the :class:`StagingStore`.
     3. :meth:`apply` -- compare staged files with *target_dir*, prompt
        the user, and install changed files.
 
@@ -64,6 +69,12 @@ class DotfileApplier:
                    to skip during discovery.
         finder: Optional pre-built :class:`DotfileFinder`.  When given,
                 *source_dir* and *target_dir* are read from it.
+        index: Optional :class:`DotfileIndex` used by :meth:`get_changes`
+               to skip content comparisons for files whose inputs have
+               not changed since the last run.
+        store: Optional :class:`StagingStore` used by :meth:`prepare` to
+               reuse preprocessed output from earlier runs.  It is only
+               read from in dry-run mode.
     """
 
     def __init__(
@@ -74,6 +85,8 @@ class DotfileApplier:
         runner: Optional[CommandRunner] = None,
         dotfile_ignore: Optional[DotfileIgnore] = None,
         finder: Optional[DotfileFinder] = None,
+        index: Optional[DotfileIndex] = None,
+        store: Optional[StagingStore] = None,
     ) -> None:
         if runner is not None:
             self.cfg: IshConfig = cfg if cfg is not None else runner.cfg
@@ -95,6 +108,10 @@ class DotfileApplier:
             self._dotfile_ignore = dotfile_ignore
         else:
             self._dotfile_ignore = DotfileIgnore(self._finder.source_dir)
+        self._index = index
+        self._store = store
+        if store is not None and self.runner.dry_run:
+            store.writable = False
         self._staging_dir: Optional[tempfile.TemporaryDirectory] = None
 
     @property
@@ -136,7 +153,9 @@ class DotfileApplier:
     ) -> Tuple[List[DotFile], List[Dict[str, Any]]]:
         """Read metadata from discovered dotfiles and collect embedded packages.
 
-        For each dotfile, reads ``__ISH__`` metadata and applies OS filtering.
+        For each dotfile, reads the source once (see :class:`ParsedSource`),
+        keeping it on :attr:`~DotFile.parsed` for :meth:`prepare`, and
+        applies OS filtering to its ``__ISH__`` metadata.
         Files that are excluded by OS rules are silently dropped.  For kept
         files, any ``[packages]`` section in the metadata is extracted and
         converted to the installer package-dict format.
@@ -157,15 +176,14 @@ class DotfileApplier:
         packages: List[Dict[str, Any]] = []
 
         for dotfile in dotfiles:
-            try:
-                meta = read_metadata(dotfile.source)
-            except (ValueError, ImportError):
-                meta = None
+            parsed = ParsedSource.load(dotfile.source)
+            meta = parsed.metadata
             if should_skip_for_os_from_metadata(meta):
                 log.debug("Skipping %s (OS rules in metadata)", dotfile.source)
                 continue
 
             dotfile.metadata = meta
+            dotfile.parsed = parsed
             packages.extend(collect_metadata_packages(meta, source=str(dotfile.source)))
             kept.append(dotfile)
 
@@ -176,12 +194,15 @@ class DotfileApplier:
     def prepare(self, dotfiles: List[DotFile]) -> List[DotFile]:
         """Stage discovered dotfiles for installation.
 
-        Copies each file into a temporary staging directory, preserving
-        the translated relative path.  Each text file is preprocessed:
-        ``__ISH__`` metadata is extracted and stored, metadata blocks and
-        ``@ish`` directive lines are stripped, and ``${__ish_<name>}``
-        variable references are substituted.  Binary files that cannot
-        be decoded as UTF-8 are copied verbatim.
+        Each text file is preprocessed: ``__ISH__`` metadata is extracted
+        and stored, metadata blocks and ``@ish`` directive lines are
+        stripped, and ``${__ish_<name>}`` variable references are
+        substituted.  Files that come out byte-for-byte unchanged, and
+        binary files that cannot be decoded as UTF-8, are staged in
+        place (:attr:`DotFile.staged` is the source itself).  Other
+        output is written to a temporary staging directory, preserving
+        the translated relative path, or taken from / added to the
+        applier's :class:`StagingStore` when it has one.
 
         If :meth:`scan` has already been called, dotfiles will have their
         metadata pre-populated and OS filtering already applied.  Otherwise,
@@ -194,12 +215,13 @@ class DotfileApplier:
             The list of staged dotfiles (excluding OS-skipped ones),
             with each :attr:`DotFile.staged` set.
         """
-        self._staging_dir = tempfile.TemporaryDirectory()
-        staging_root = Path(self._staging_dir.name)
+        self._staging_dir = None
         preprocessor = DotFilePreprocessor(variables=self.cfg.context.as_dict())
+        environment: Optional[Dict[str, Any]] = None
 
         kept: List[DotFile] = []
         for dotfile in dotfiles:
+            parsed = dotfile.parsed
             if dotfile.scanned:
                 # scan() already read metadata and applied OS filtering.
                 # Use the stored metadata, falling back to an empty dict
@@ -208,35 +230,129 @@ class DotfileApplier:
                     dotfile.metadata if dotfile.metadata is not None else {}
                 )
             else:
-                try:
-                    meta = read_metadata(dotfile.source)
-                except (ValueError, ImportError):
-                    meta = None
+                parsed = ParsedSource.load(dotfile.source)
+                meta = parsed.metadata
                 if should_skip_for_os_from_metadata(meta):
                     log.debug("Skipping %s (OS rules in metadata)", dotfile.source)
                     continue
 
-            staged_path = staging_root / dotfile.translated
-            staged_path.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                processed = preprocessor.preprocess(dotfile, metadata=meta)
-                staged_path.write_text(processed, encoding="utf-8")
-            except UnicodeDecodeError:
-                log.debug("Binary file, copying verbatim: %s", dotfile.source)
-                shutil.copy2(dotfile.source, staged_path)
-
-            if dotfile.mergejson and not self._merge_json_stage(dotfile, staged_path):
-                # Source did not parse as JSON; drop the file so the rest of
-                # the pipeline is unaffected.
+            if parsed is None:
+                parsed = ParsedSource.load(dotfile.source)
+            staged: Optional[Tuple[Path, str]]
+            if (
+                self._store is not None
+                and not dotfile.mergejson
+                and parsed.text is not None
+                and (parsed.has_directives or parsed.has_variable_refs)
+                and not has_prompt_directives(parsed.text)
+            ):
+                if environment is None:
+                    environment = environment_signature()
+                staged = self._stage_from_store(
+                    dotfile, parsed, meta, preprocessor, environment
+                )
+            else:
+                staged = self._stage(dotfile, parsed, meta, preprocessor)
+            if staged is None:
                 continue
 
-            dotfile.staged = staged_path
-            log.debug("Staged %s -> %s", dotfile.source, staged_path)
+            dotfile.staged, dotfile.staged_digest = staged
+            dotfile.parsed = None
+            log.debug("Staged %s -> %s", dotfile.source, dotfile.staged)
             kept.append(dotfile)
 
+        if self._store is not None:
+            self._store.prune()
         return kept
 
+    def _stage(
+        self,
+        dotfile: DotFile,
+        parsed: ParsedSource,
+        meta: Optional[Dict[str, Any]],
+        preprocessor: DotFilePreprocessor,
+    ) -> Optional[Tuple[Path, str]]:
+        """Preprocess *dotfile*; return its staged path and digest.
+
+        Returns None when a ``mergejson_`` source is not valid JSON.
+        """
+        processed: Optional[str] = None
+        try:
+            processed = preprocessor.preprocess(dotfile, metadata=meta, parsed=parsed)
+        except UnicodeDecodeError:
+            log.debug("Binary file: %s", dotfile.source)
+
+        if not dotfile.mergejson:
+            source_bytes = parsed.raw
+            if source_bytes is None:
+                source_bytes = dotfile.source.read_bytes()
+            if processed is None or processed.encode("utf-8") == source_bytes:
+                return dotfile.source, hash_bytes(source_bytes)
+
+        staged_path = self._staging_path(dotfile)
+        if processed is None:
+            shutil.copy2(dotfile.source, staged_path)
+        else:
+            staged_path.write_text(processed, encoding="utf-8")
+        if not dotfile.mergejson:
+            assert processed is not None
+            return staged_path, hash_bytes(processed.encode("utf-8"))
+        if not self._merge_json_stage(dotfile, staged_path):
+            # Source did not parse as JSON; drop the file so the rest
+            # of the pipeline is unaffected.
+            return None
+        return staged_path, hash_bytes(staged_path.read_bytes())
+
+    def _stage_from_store(
+        self,
+        dotfile: DotFile,
+        parsed: ParsedSource,
+        meta: Optional[Dict[str, Any]],
+        preprocessor: DotFilePreprocessor,
+        environment: Dict[str, Any],
+    ) -> Tuple[Path, str]:
+        """Stage *dotfile* through the :class:`StagingStore`.
+
+        On a hit, the variables the file adds to the preprocessing
+        context are replayed so later files see the same context as on
+        a full run.  Output that asked the user anything (e.g. an
+        ``ish.prompt_bool(...)`` call inside an ``@ish if`` expression)
+        is never stored, since a hit would replay the old answer
+        instead of prompting.
+        """
+        assert self._store is not None and parsed.text is not None
+        context = preprocessor.context
+        before = context.as_dict()
+        key = StagingStore.key(parsed.text, meta, before, environment)
+        hit = self._store.get(key)
+        if hit is not None:
+            hit_path, hit_digest, delta = hit
+            context.update(delta)
+            if meta is not None:
+                dotfile.metadata = meta
+            return hit_path, hit_digest
+
+        context.reset_prompted()
+        processed = preprocessor.preprocess(dotfile, metadata=meta, parsed=parsed)
+        digest = hash_bytes(processed.encode("utf-8"))
+        stored: Optional[Path] = None
+        if not context.prompted:
+            delta = {k: v for k, v in context.as_dict().items() if before.get(k) != v}
+            stored = self._store.put(key, processed, digest, delta)
+        if stored is not None:
+            return stored, digest
+        path = self._staging_path(dotfile)
+        path.write_text(processed, encoding="utf-8")
+        return path, digest
+
+    def _staging_path(self, dotfile: DotFile) -> Path:
+        """Return a fresh path for *dotfile* in the temporary staging directory."""
+        if self._staging_dir is None:
+            self._staging_dir = tempfile.TemporaryDirectory()
+        path = Path(self._staging_dir.name) / dotfile.translated
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
     # -- Stage 2b: mergejson post-step --------------------------------------
 
     def _merge_json_stage(self, dotfile: DotFile, staged_path: Path) -> bool:
@@ -289,6 +405,12 @@ class DotfileApplier:
     def get_changes(self, dotfiles: List[DotFile]) -> List[DotFile]:
         """Filter dotfiles to only those that would change the target.
 
+        When the applier has a :class:`DotfileIndex`, it is consulted
+        (and refreshed) so that files whose source, staged output, and
+        target are all unchanged since the last run are resolved from
+        ``stat`` alone.  The index is saved afterwards unless in dry-run
+        mode.
+
         Args:
             dotfiles: Files from :meth:`prepare` (or :meth:`discover`).
 
@@ -297,11 +419,13 @@ class DotfileApplier:
         """
         changed: List[DotFile] = []
         for dotfile in dotfiles:
-            change = dotfile.get_change_type()
+            change = dotfile.get_change_type(index=self._index)
             if change is not None:
                 changed.append(dotfile)
             else:
                 log.debug("Unchanged: %s", dotfile.target)
+        if self._index is not None and not self.runner.dry_run:
+            self._index.save()
         return changed
 
     def is_target_up_to_date(self, dotfile: DotFile) -> bool:
@@ -348,7 +472,9 @@ class DotfileApplier:
         """Copy changed files into the target directory.
 
         Files whose source name carries the ``executable_`` prefix are made
-        executable (``chmod +x``) after copying.
+        executable (``chmod +x``) after copying.  Targets take the mode and
+        mtime of :attr:`DotFile.effective_source`, so a file staged in place
+        keeps its source permissions, as binary files always have.
 
         Args:
             changes: Dotfiles from :meth:`get_changes`.
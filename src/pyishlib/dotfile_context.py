@@ -50,12 +50,14 @@ class DotfileContext:
     """
 
     _vars: Dict[str, str]
+    _prompted: bool
 
     def __init__(self, variables: Optional[Dict[str, str]] = None) -> None:
         # Use object.__setattr__ to avoid triggering our custom __setattr__
         # before _vars exists.
         object.__setattr__(self, "_vars", dict(variables) if variables else {})
         object.__setattr__(self, "env", EnvironmentNamespace())
+        object.__setattr__(self, "_prompted", False)
 
     # -- dict-style access ---------------------------------------------------
 
@@ -103,6 +105,21 @@ class DotfileContext:
             if key not in self._vars:
                 self._vars[key] = str(val)
 
+    # -- interactive prompts -------------------------------------------------
+
+    @property
+    def prompted(self) -> bool:
+        """True if a ``prompt*`` call asked the user since :meth:`reset_prompted`.
+
+        Lets callers tell output that depends on an interactive answer
+        (which must not be cached) from output derived from variables.
+        """
+        return self._prompted
+
+    def reset_prompted(self) -> None:
+        """Clear the :attr:`prompted` flag."""
+        self._prompted = False
+
     def prompt(self, key: str, message: str, default: str = "") -> str:
         """Return the stored value for *key*, or prompt the user interactively.
 
@@ -115,6 +132,7 @@ class DotfileContext:
         existing = self._vars.get(key)
         if existing:
             return existing
+        self._prompted = True
         value = _io_prompt_string(message, default, name=key)
         self._vars[key] = value
         return value
@@ -139,6 +157,7 @@ class DotfileContext:
                 key,
                 existing,
             )
+        self._prompted = True
         result = _io_prompt_bool(message, default, name=key)
         value = "true" if result else "false"
         self._vars[key] = value
@@ -172,6 +191,7 @@ class DotfileContext:
                 existing,
                 values,
             )
+        self._prompted = True
         value = _io_prompt_choice(message, values, default, name=key)
         self._vars[key] = value
         return value
@@ -30,15 +30,34 @@ Recognised OS names: ``linux``, ``macos``, ``windows`` (plus common
 aliases like ``mac``, ``darwin``, ``win``).
 
 Lines before the first section header are unconditional (always active).
+
+Matching
+--------
+
+All effective patterns are compiled once, at construction time, into a
+:class:`_PatternSet` per match target (bare name vs. relative path):
+wildcard-free patterns go into a set for O(1) lookup and the remaining
+globs are joined into a single alternation regex.  The result is
+identical to testing each pattern with :func:`fnmatch.fnmatch` in turn.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 
 from .environment import normalise_os, detect_os_tags
 
@@ -64,6 +83,9 @@ DOTFILEIGNORE: str = ".dotfileignore"
 #: Regex matching section headers: [only_on.linux], [ignore_on.windows], etc.
 _RE_SECTION = re.compile(r"^\[\s*(only_on|ignore_on)\.(\w+)\s*\]$")
 
+#: Characters that make an fnmatch pattern a glob rather than a literal.
+_GLOB_CHARS = frozenset("*?[")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -135,6 +157,41 @@ def load_ignore_file(
     return global_patterns, only_on, ignore_on
 
 
+class _PatternSet:
+    """A set of fnmatch patterns compiled for single-pass matching.
+
+    Equivalent to ``any(fnmatch.fnmatch(value, p) for p in patterns)``,
+    including :func:`os.path.normcase` folding on case-insensitive
+    platforms.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        literals: List[str] = []
+        globs: List[str] = []
+        for pat in patterns:
+            pat = os.path.normcase(pat)
+            if _GLOB_CHARS.isdisjoint(pat):
+                literals.append(pat)
+            else:
+                globs.append(pat)
+        self._literals: FrozenSet[str] = frozenset(literals)
+        self._regex: Optional[Pattern[str]] = None
+        if globs:
+            self._regex = re.compile(
+                "|".join(fnmatch.translate(pat) for pat in dict.fromkeys(globs))
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self._literals) or self._regex is not None
+
+    def match(self, value: str) -> bool:
+        """Return *True* if *value* matches any pattern in the set."""
+        value = os.path.normcase(value)
+        if value in self._literals:
+            return True
+        return self._regex is not None and self._regex.match(value) is not None
+
+
 # ---------------------------------------------------------------------------
 # DotfileIgnore
 # ---------------------------------------------------------------------------
@@ -194,6 +251,10 @@ class DotfileIgnore:
             if os_name in self._os_tags:
                 self._os_patterns.extend(pats)
 
+        effective = self._patterns + self._os_patterns
+        self._name_matcher = _PatternSet(p for p in effective if "/" not in p)
+        self._path_matcher = _PatternSet(p for p in effective if "/" in p)
+
     @property
     def patterns(self) -> List[str]:
         """A copy of all effective ignore patterns (unconditional + OS)."""
@@ -223,18 +284,8 @@ class DotfileIgnore:
         string using :func:`fnmatch.fnmatch`.  Patterns without ``/`` are
         matched against *name* only (the existing behaviour).
         """
-        return any(self._matches(name, rel_path, pat) for pat in self._patterns) or any(
-            self._matches(name, rel_path, pat) for pat in self._os_patterns
-        )
-
-    def _matches(self, name: str, rel_path: Optional[Path], pat: str) -> bool:
-        """Return *True* if the entry matches *pat*.
-
-        Routes to path-based or name-based matching depending on whether *pat*
-        contains a ``/``.
-        """
-        if "/" in pat:
-            if rel_path is None:
-                return False
-            return fnmatch.fnmatch(rel_path.as_posix(), pat)
-        return fnmatch.fnmatch(name, pat)
+        if self._name_matcher.match(name):
+            return True
+        if rel_path is None or not self._path_matcher:
+            return False
+        return self._path_matcher.match(rel_path.as_posix())
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Persistent stat/content index for dotfile change detection.
+
+Records, for each managed dotfile that was last found to be in sync with
+its target, the inputs of that comparison:
+
+- ``source`` -- ``[mtime_ns, size, inode]`` of the file in the repo.
+- ``staged`` -- SHA-256 of the preprocessed (staged) output.
+- ``target`` -- ``[mtime_ns, ctime_ns, size, inode, mode]`` of the target.
+
+When none of these have changed since the previous run, the target is
+known to still match and :meth:`DotFile.get_change_type` can skip the
+full-content ``filecmp`` comparison.  The index lives in
+``<target>/.config/ishfiles/dotfile-index.json``.
+
+Entries are only recorded when the target's mtime is older than
+:data:`~pyishlib.package_state.RACY_WINDOW_NS`, so a target rewritten within the same
+filesystem timestamp tick as the recording is never trusted (the same
+"racy clean" guard git uses for its index).
+
+Public API
+----------
+- :class:`DotfileIndex` -- load / save / query per-dotfile records.
+- :func:`hash_bytes`    -- produce the sha256 digest for staged output.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .package_state import is_racy
+
+if TYPE_CHECKING:
+    from .dotfile import DotFile
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_FILENAME = "dotfile-index.json"
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest of *data*.
+
+    Args:
+        data: Staged output bytes.
+
+    Returns:
+        64-character lowercase hex string.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _source_key(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def _target_key(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino, st.st_mode]
+
+
+class DotfileIndex:
+    """Persistent stat/content index consulted by change detection.
+
+    Args:
+        state_path: Path to the JSON index file.  Parent directories are
+                    created on first :meth:`save`.
+    """
+
+    def __init__(self, state_path: Path) -> None:
+        self._path = state_path
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # -- factory ---------------------------------------------------------------
+
+    @classmethod
+    def from_cfg(cls, cfg) -> "DotfileIndex":
+        """Create a :class:`DotfileIndex` rooted at *cfg*'s target home.
+
+        Args:
+            cfg: :class:`~pyishlib.ish_config.IshConfig` providing ``target``
+                 and (optionally) ``dotfile_index_filename``.
+        """
+        target = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+        filename = cfg.get_opt("dotfile_index_filename") or _DEFAULT_FILENAME
+        return cls(target / ".config" / "ishfiles" / filename)
+
+    # -- public interface ------------------------------------------------------
+
+    def is_unchanged(self, dotfile: "DotFile") -> bool:
+        """True if *dotfile*'s target is known to match its staged output.
+
+        Requires a recorded entry whose source stat, staged digest, and
+        target stat all equal the current values.  Dotfiles without a
+        :attr:`~DotFile.staged_digest` are never considered unchanged.
+
+        Args:
+            dotfile: A prepared :class:`~pyishlib.dotfile.DotFile`.
+        """
+        digest = dotfile.staged_digest
+        if digest is None:
+            return False
+        record = self._data.get(self._key(dotfile))
+        if record is None or record.get("staged") != digest:
+            return False
+        if record.get("source") != _source_key(dotfile.source):
+            return False
+        return record.get("target") == _target_key(dotfile.target)
+
+    def record(self, dotfile: "DotFile") -> None:
+        """Remember that *dotfile*'s target currently matches its staged output.
+
+        Call only after a full comparison found no change.  Targets too
+        recent to trust (:func:`~pyishlib.package_state.is_racy`) are
+        skipped and any previous entry is dropped instead.
+
+        Args:
+            dotfile: A prepared :class:`~pyishlib.dotfile.DotFile`.
+        """
+        digest = dotfile.staged_digest
+        source = _source_key(dotfile.source)
+        target = _target_key(dotfile.target)
+        if digest is None or source is None or target is None:
+            self.forget(dotfile)
+            return
+        if is_racy(target[0]):
+            self.forget(dotfile)
+            return
+        entry = {"source": source, "staged": digest, "target": target}
+        key = self._key(dotfile)
+        if self._data.get(key) != entry:
+            self._data[key] = entry
+            self._dirty = True
+
+    def forget(self, dotfile: "DotFile") -> None:
+        """Drop any recorded entry for *dotfile*.
+
+        Args:
+            dotfile: The :class:`~pyishlib.dotfile.DotFile` to forget.
+        """
+        if self._data.pop(self._key(dotfile), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the index to :attr:`path` (atomic replace) if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".json.tmp")
+            tmp.write_text(
+                json.dumps(self._data, indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
+            tmp.replace(self._path)
+            self._dirty = False
+        except OSError as exc:
+            log.warning("Could not save dotfile index to %s: %s", self._path, exc)
+
+    @property
+    def path(self) -> Path:
+        """Path to the backing JSON file."""
+        return self._path
+
+    # -- internals -------------------------------------------------------------
+
+    @staticmethod
+    def _key(dotfile: "DotFile") -> str:
+        return str(dotfile.target)
+
+    def _load(self) -> None:
+        if not self._path.is_file():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            if not isinstance(raw, dict):
+                raise ValueError("Top-level JSON value is not an object")
+            self._data = {k: v for k, v in raw.items() if isinstance(v, dict)}
+        except (OSError, json.JSONDecodeError, ValueError) as exc:
+            log.warning(
+                "Could not load dotfile index from %s: %s — starting empty",
+                self._path,
+                exc,
+            )
@@ -58,7 +58,7 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 from .dotfile import DotFile
-from .file_preprocessor import FilePreprocessor
+from .file_preprocessor import FilePreprocessor, ParsedSource
 
 # ---------------------------------------------------------------------------
 # DotFilePreprocessor
@@ -86,7 +86,12 @@ class DotFilePreprocessor(FilePreprocessor):
 
     # -- public API ----------------------------------------------------------
 
-    def preprocess(self, dotfile: DotFile, metadata: Optional[dict] = None) -> str:
+    def preprocess(
+        self,
+        dotfile: DotFile,
+        metadata: Optional[dict] = None,
+        parsed: Optional[ParsedSource] = None,
+    ) -> str:
         """Preprocess a single dotfile source.
 
         The processing pipeline:
@@ -102,6 +107,8 @@ class DotFilePreprocessor(FilePreprocessor):
             metadata: Optional pre-extracted metadata dictionary.  When
                 provided, the file is still read for content but metadata
                 extraction is skipped (avoiding a redundant file read).
+            parsed: Optional :class:`ParsedSource` for *dotfile.source*.
+                When provided, the file is not read again at all.
 
         Returns:
             The processed file content as a string.
@@ -111,7 +118,18 @@ class DotFilePreprocessor(FilePreprocessor):
                 caller should fall back to a raw copy).
         """
         meta: Optional[Any] = None
-        if metadata is not None:
+        if parsed is not None and metadata is not None:
+            text, _ = self._preprocess_text_with_meta(
+                parsed.require_text(),
+                metadata,
+                source=parsed.path,
+                directives=parsed.has_directives,
+                variables=parsed.has_variable_refs,
+            )
+            meta = metadata
+        elif parsed is not None:
+            text, meta = self.preprocess_source(parsed)
+        elif metadata is not None:
             text = dotfile.source.read_text(encoding="utf-8")
             text = self.preprocess_text(text, meta=metadata)
             meta = metadata
@@ -26,7 +26,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Optional
 
 from .command_runner import CommandRunner
-from .file_preprocessor import FilePreprocessor
+from .file_preprocessor import FilePreprocessor, ParsedSource
 
 if TYPE_CHECKING:
     from .ishfiles.script_logger import ScriptLogger
@@ -50,6 +50,8 @@ class DotfileScript:
                        processing.  If *None*, a new one is created.
         runner: A :class:`CommandRunner` for execution.  If *None*, a
                 new one is created.
+        parsed: Optional :class:`ParsedSource` for *path* (e.g. from
+                script scanning) so preprocessing does not re-read it.
     """
 
     def __init__(
@@ -57,8 +59,10 @@ class DotfileScript:
         path: Path,
         preprocessor: Optional[FilePreprocessor] = None,
         runner: Optional[CommandRunner] = None,
+        parsed: Optional[ParsedSource] = None,
     ) -> None:
         self._path = Path(path)
+        self._parsed = parsed
         self._preprocessor = preprocessor or FilePreprocessor()
         self._runner = runner or CommandRunner()
         self._metadata: Optional[dict] = None
@@ -74,6 +78,11 @@ class DotfileScript:
         """Metadata extracted during preprocessing, if any."""
         return self._metadata
 
+    @property
+    def preprocessed_text(self) -> Optional[str]:
+        """Text cached by :meth:`preprocess`, or None if it has not run."""
+        return self._preprocessed_text
+
     def preprocess(self) -> str:
         """Preprocess the script and return the processed text.
 
@@ -87,10 +96,12 @@ class DotfileScript:
         if self._preprocessed_text is not None:
             return self._preprocessed_text
 
-        if not self._path.is_file():
+        if self._parsed is not None:
+            text, meta = self._preprocessor.preprocess_source(self._parsed)
+        elif not self._path.is_file():
             raise FileNotFoundError(f"Script not found: {self._path}")
-
-        text, meta = self._preprocessor.preprocess_file(self._path)
+        else:
+            text, meta = self._preprocessor.preprocess_file(self._path)
         self._metadata = meta
         self._preprocessed_text = text
         return text
@@ -152,7 +163,7 @@ class DotfileScript:
             if env:
                 script_env.update(env)
             if script_logger is not None:
-                script_env.update(script_logger.env())
+                script_env.update(script_logger.open_channel(self._path.name))
 
             log.info("Executing script: %s", self._path.name)
 
@@ -175,6 +186,8 @@ class DotfileScript:
             )
             raise
         finally:
+            if script_logger is not None:
+                script_logger.close_channel(self._path.name)
             tmp_path.unlink(missing_ok=True)
 
     def _run_captured(
@@ -46,20 +46,36 @@ Variables are resolved in order of precedence (highest first):
 1. ``#@ish set`` directives in the file itself
 2. Variables passed programmatically (e.g. from CLI or config)
 3. The ``[vars]`` section of embedded ``__ISH__`` metadata
+
+Parsed sources
+--------------
+
+:class:`ParsedSource` is the result of reading a file **once**: its text,
+its ``__ISH__`` metadata (embedded and sidecar), and whether it contains
+any directives or variable references.  Scanning, OS/tag filtering,
+``run_when`` gating, and preprocessing can all share one instance instead
+of each re-reading the file, and the preprocessor skips the directive and
+substitution passes for files that have nothing to process.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .dotfile_context import DotfileContext
-from .ish_metadata import read_metadata, remove_metadata_blocks
+from .ish_metadata import parse_metadata, remove_metadata_blocks
 
 log = logging.getLogger(__name__)
 
+#: Version of the preprocessing semantics.  Bump whenever a change makes
+#: the same source and context produce different output, so that
+#: persisted outputs (see :mod:`pyishlib.staging_store`) are not reused.
+PREPROCESSOR_VERSION = 1
+
 # ---------------------------------------------------------------------------
 # Patterns
 # ---------------------------------------------------------------------------
@@ -112,6 +128,102 @@ def has_prompt_directives(text: str) -> bool:
     return bool(_RE_PROMPT_DIRECTIVE.search(text))
 
 
+# ---------------------------------------------------------------------------
+# ParsedSource
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ParsedSource:
+    """A source file read once, with its metadata and directive flags.
+
+    Create instances with :meth:`load`.  Metadata parse errors and UTF-8
+    decode errors are captured rather than raised so that callers which
+    tolerate them (scanning, filtering) can still use the object; callers
+    that need strict behaviour use :meth:`require_text` and
+    :meth:`require_metadata`.
+
+    Attributes:
+        path:              The file that was read.
+        text:              File content, or None if not valid UTF-8.
+        metadata:          Parsed ``__ISH__`` metadata, or None.
+        metadata_error:    ``ValueError`` / ``ImportError`` raised while
+                           parsing the metadata, if any.
+        decode_error:      ``UnicodeDecodeError`` raised while reading,
+                           if any.
+        has_directives:    True if *text* contains ``@ish`` directive lines.
+        has_variable_refs: True if *text* contains ``${__ish_*}`` references.
+        raw:               The bytes read from disk, before decoding and
+                           newline translation (None if not from :meth:`load`).
+    """
+
+    path: Path
+    text: Optional[str]
+    metadata: Optional[Dict[str, Any]] = None
+    metadata_error: Optional[Exception] = None
+    decode_error: Optional[UnicodeDecodeError] = None
+    has_directives: bool = False
+    has_variable_refs: bool = False
+    raw: Optional[bytes] = None
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ParsedSource":
+        """Read *path* (and its ``.ish`` sidecar) and parse it.
+
+        Raises:
+            OSError: If the file (or its sidecar) cannot be read.
+        """
+        path = Path(path)
+        raw = path.read_bytes()
+        text: Optional[str] = None
+        decode_error: Optional[UnicodeDecodeError] = None
+        try:
+            # Same universal-newline translation as Path.read_text().
+            text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError as exc:
+            decode_error = exc
+
+        metadata: Optional[Dict[str, Any]] = None
+        metadata_error: Optional[Exception] = None
+        try:
+            metadata = parse_metadata(path, text)
+        except (ValueError, ImportError) as exc:
+            metadata_error = exc
+
+        return cls(
+            path=path,
+            text=text,
+            metadata=metadata,
+            metadata_error=metadata_error,
+            decode_error=decode_error,
+            has_directives=text is not None and has_directives(text),
+            has_variable_refs=text is not None and has_variable_refs(text),
+            raw=raw,
+        )
+
+    def require_text(self) -> str:
+        """Return :attr:`text`, re-raising the decode error for binary files.
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8.
+        """
+        if self.text is None:
+            assert self.decode_error is not None
+            raise self.decode_error
+        return self.text
+
+    def require_metadata(self) -> Optional[Dict[str, Any]]:
+        """Return :attr:`metadata`, re-raising any parse error.
+
+        Raises:
+            ValueError: If the metadata is not valid TOML.
+            ImportError: If TOML support is not available.
+        """
+        if self.metadata_error is not None:
+            raise self.metadata_error
+        return self.metadata
+
+
 # ---------------------------------------------------------------------------
 # Helpers (kept module-level for testability)
 # ---------------------------------------------------------------------------
@@ -249,9 +361,34 @@ class FilePreprocessor:
         Raises:
             UnicodeDecodeError: If the file cannot be read as UTF-8.
         """
-        text = path.read_text(encoding="utf-8")
-        meta = read_metadata(path)
-        return self._preprocess_text_with_meta(text, meta, source=path)
+        return self.preprocess_source(ParsedSource.load(path))
+
+    def preprocess_source(self, parsed: ParsedSource) -> Tuple[str, Optional[dict]]:
+        """Preprocess an already-read :class:`ParsedSource`.
+
+        Same pipeline and errors as :meth:`preprocess_file`, without
+        touching the filesystem.  The directive and substitution passes
+        are skipped when *parsed* has no directives or variable references.
+
+        Args:
+            parsed: Result of :meth:`ParsedSource.load`.
+
+        Returns:
+            A tuple of (processed_text, metadata_dict_or_None).
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8.
+            ValueError: If the embedded metadata is not valid TOML.
+        """
+        text = parsed.require_text()
+        meta = parsed.require_metadata()
+        return self._preprocess_text_with_meta(
+            text,
+            meta,
+            source=parsed.path,
+            directives=parsed.has_directives,
+            variables=parsed.has_variable_refs,
+        )
 
     def preprocess_text(self, text: str, meta: Optional[dict] = None) -> str:
         """Preprocess text content directly.
@@ -271,8 +408,15 @@ class FilePreprocessor:
         text: str,
         meta: Optional[dict],
         source: Optional[Path] = None,
+        directives: bool = True,
+        variables: bool = True,
     ) -> Tuple[str, Optional[dict]]:
-        """Core preprocessing pipeline shared by all entry points."""
+        """Core preprocessing pipeline shared by all entry points.
+
+        *directives* / *variables* may be set to False when the caller
+        already knows the text has no directive lines / variable
+        references, skipping those passes.
+        """
         # 1. Seed context from metadata [vars] (as defaults only)
         if meta and "vars" in meta:
             self._context.update_defaults(meta["vars"])
@@ -281,10 +425,12 @@ class FilePreprocessor:
         text = remove_metadata_blocks(text)
 
         # 3. Process directive lines and conditionals
-        text = self._process_directives(text, source=source)
+        if directives:
+            text = self._process_directives(text, source=source)
 
         # 4. Substitute variables
-        text = _substitute_variables(text, self._context.as_dict())
+        if variables:
+            text = _substitute_variables(text, self._context.as_dict())
 
         return text, meta
 
@@ -8,15 +8,26 @@ git directory lives under the parent repo's ``.git/modules/<name>/``
 (and for a linked worktree under ``.git/worktrees/<name>/``). ``git
 rev-parse --git-dir`` resolves the right path in both cases, and
 :class:`GitRepo` owns that resolution.
+
+Read-only queries normally spawn one git process each.  Inside a
+:func:`git_session` block they are answered from shared caches instead:
+discovery results are remembered per path, ref queries
+(:meth:`GitRepo.branch_exists`, :meth:`GitRepo.remotes_with_branch`,
+:meth:`GitRepo.current_branch`) read one ``git for-each-ref`` snapshot
+per repo, and remote queries one ``git remote -v`` listing.  Mutating
+:class:`GitRepo` methods drop the ref and remote caches, so later
+queries see their effect.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Iterable, Iterator, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .command_runner import CommandRunner
 
@@ -38,10 +49,113 @@ def _clean_git_env() -> dict:
     return env
 
 
+def _read_dotgit(work_tree: Path) -> Optional[Path]:
+    """Resolve the git directory named by ``<work_tree>/.git``.
+
+    Handles both a ``.git`` directory and a ``gitdir: <path>`` file (how
+    submodules and linked worktrees point at their git directory).
+    Returns ``None`` when neither yields an existing directory.
+    """
+    dotgit = work_tree / ".git"
+    if dotgit.is_dir():
+        return dotgit.resolve()
+    try:
+        text = dotgit.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    git_dir = Path(text[len("gitdir:") :].strip())
+    if not git_dir.is_absolute():
+        git_dir = work_tree / git_dir
+    return git_dir.resolve() if git_dir.is_dir() else None
+
+
 class NotAGitRepoError(RuntimeError):
     """Raised when a path is not inside a git working tree."""
 
 
+# ---------------------------------------------------------------------------
+# Query session
+# ---------------------------------------------------------------------------
+
+
+class _RefSnapshot:
+    """Refs of one repo plus the branch its HEAD points at."""
+
+    def __init__(self, refs: List[str], head: Optional[str]) -> None:
+        self.refs = refs
+        self.ref_set = frozenset(refs)
+        self.head = head
+
+
+class GitSession:
+    """Caches shared by every :class:`GitRepo` while a session is active.
+
+    Created by :func:`git_session`; not meant to be instantiated
+    directly.  Safe to use from several threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._discovered: Dict[Path, Tuple[Path, Path]] = {}
+        self._refs: Dict[Path, _RefSnapshot] = {}
+        self._remotes: Dict[Path, Dict[str, Optional[str]]] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached refs and remotes (after a mutation).
+
+        Call this after changing a repository by means other than
+        :class:`GitRepo` methods (e.g. a raw ``git`` subprocess).
+        Discovery results are kept: mutations do not move work trees.
+        """
+        with self._lock:
+            self._refs.clear()
+            self._remotes.clear()
+
+    def close(self) -> None:
+        """Drop every cache, including discovery results."""
+        self.invalidate()
+        with self._lock:
+            self._discovered.clear()
+
+    # -- cache access (used by GitRepo) ----------------------------------------
+
+    def _get(self, table: dict, key: Path, load):
+        with self._lock:
+            if key in table:
+                return table[key]
+        value = load()
+        with self._lock:
+            return table.setdefault(key, value)
+
+
+_session: Optional[GitSession] = None
+_session_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def git_session() -> Iterator[GitSession]:
+    """Answer read-only :class:`GitRepo` queries from shared caches.
+
+    For read-heavy spans such as reporting status across many
+    submodules.  Nested blocks share the outermost session; the caches
+    are dropped when it exits.
+    """
+    global _session
+    with _session_lock:
+        outer = _session
+        session = GitSession() if outer is None else outer
+        _session = session
+    try:
+        yield session
+    finally:
+        if outer is None:
+            with _session_lock:
+                _session = None
+            session.close()
+
+
 class GitRepo:
     """Lightweight git working-tree wrapper.
 
@@ -87,6 +201,24 @@ class GitRepo:
                 ``require_root`` is true but *path* is not the root.
         """
         path = Path(path).resolve()
+        session = _session
+        if session is not None:
+            toplevel, git_dir = session._get(
+                session._discovered, path, lambda: cls._rev_parse_dirs(path)
+            )
+        else:
+            toplevel, git_dir = cls._rev_parse_dirs(path)
+
+        if require_root and toplevel.resolve() != path:
+            raise NotAGitRepoError(
+                f"{path} is not the root of the git repository ({toplevel})"
+            )
+
+        return cls(toplevel, git_dir)
+
+    @staticmethod
+    def _rev_parse_dirs(path: Path) -> Tuple[Path, Path]:
+        """Return ``(toplevel, git_dir)`` for *path* via ``git rev-parse``."""
         try:
             result = subprocess.run(
                 ["git", "-C", str(path), "rev-parse", "--show-toplevel", "--git-dir"],
@@ -108,13 +240,7 @@ class GitRepo:
         if not git_dir.is_absolute():
             # ``--git-dir`` is relative to *path* when given via -C.
             git_dir = (path / git_dir).resolve()
-
-        if require_root and toplevel.resolve() != path:
-            raise NotAGitRepoError(
-                f"{path} is not the root of the git repository ({toplevel})"
-            )
-
-        return cls(toplevel, git_dir)
+        return toplevel, git_dir
 
     # ---- ref queries -------------------------------------------------------
 
@@ -140,6 +266,60 @@ class GitRepo:
             env=_clean_git_env(),
         )
 
+    def _ref_snapshot(self) -> Optional[_RefSnapshot]:
+        """Return the session's ref snapshot for this repo (None outside one)."""
+        session = _session
+        if session is None:
+            return None
+        return session._get(session._refs, self.work_tree, self._load_refs)
+
+    def _load_refs(self) -> _RefSnapshot:
+        result = self._run_ref_query(
+            ["for-each-ref", "--format=%(HEAD)%(refname)"],
+            capture_output=True,
+            text=True,
+        )
+        refs: List[str] = []
+        head: Optional[str] = None
+        for line in result.stdout.splitlines() if result.returncode == 0 else ():
+            if len(line) < 2:
+                continue
+            refs.append(line[1:])
+            if line.startswith("*refs/heads/"):
+                head = line[len("*refs/heads/") :]
+        if head is None:
+            # Detached HEAD, or a branch with no commits yet (which
+            # for-each-ref does not list): ask symbolic-ref once.
+            head = self._query_current_branch()
+        return _RefSnapshot(refs, head)
+
+    def _load_remotes(self) -> Dict[str, Optional[str]]:
+        result = self._run_ref_query(
+            ["remote", "-v"],
+            capture_output=True,
+            text=True,
+        )
+        remotes: Dict[str, Optional[str]] = {}
+        if result.returncode != 0:
+            return remotes
+        for line in result.stdout.splitlines():
+            name, _, rest = line.partition("\t")
+            if not name.strip():
+                continue
+            remotes.setdefault(name, None)
+            if rest.endswith(" (fetch)") and remotes[name] is None:
+                remotes[name] = rest[: -len(" (fetch)")] or None
+        return remotes
+
+    def _session_remotes(self, session: GitSession) -> Dict[str, Optional[str]]:
+        return session._get(session._remotes, self.work_tree, self._load_remotes)
+
+    def _invalidate(self) -> None:
+        """Drop session caches after a mutating call."""
+        session = _session
+        if session is not None:
+            session.invalidate()
+
     def branch_exists(self, branch: str, *, local_only: bool = False) -> bool:
         """True if *branch* exists locally or (when allowed) on any remote.
 
@@ -150,6 +330,11 @@ class GitRepo:
         <path> <branch>`` should pass ``local_only=True``: a remote
         ref alone is not a local branch name.
         """
+        snapshot = self._ref_snapshot()
+        if snapshot is not None:
+            if f"refs/heads/{branch}" in snapshot.ref_set:
+                return True
+            return not local_only and bool(self.remotes_with_branch(branch))
         local = self._run_ref_query(
             ["show-ref", "--verify", "--quiet", f"refs/heads/{branch}"]
         )
@@ -167,15 +352,20 @@ class GitRepo:
         enumerates them. Returns an empty list when no remote carries
         the branch or when there are no remotes at all.
         """
-        result = self._run_ref_query(
-            ["for-each-ref", "--format=%(refname)", "refs/remotes"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0 or not result.stdout:
-            return []
+        snapshot = self._ref_snapshot()
+        if snapshot is not None:
+            lines = snapshot.refs
+        else:
+            result = self._run_ref_query(
+                ["for-each-ref", "--format=%(refname)", "refs/remotes"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0 or not result.stdout:
+                return []
+            lines = result.stdout.splitlines()
         carriers = []
-        for line in result.stdout.splitlines():
+        for line in lines:
             line = line.strip()
             if not line.startswith("refs/remotes/"):
                 continue
@@ -194,6 +384,12 @@ class GitRepo:
         has no symbolic branch, so the method returns ``None`` instead
         of raising.
         """
+        snapshot = self._ref_snapshot()
+        if snapshot is not None:
+            return snapshot.head
+        return self._query_current_branch()
+
+    def _query_current_branch(self) -> Optional[str]:
         result = self._run_ref_query(
             ["symbolic-ref", "--quiet", "--short", "HEAD"],
             capture_output=True,
@@ -212,6 +408,9 @@ class GitRepo:
         Runs ``git remote`` via the read-only probe path so dry-run
         callers still see the real remote list.
         """
+        session = _session
+        if session is not None:
+            return list(self._session_remotes(session))
         result = self._run_ref_query(
             ["remote"],
             capture_output=True,
@@ -227,6 +426,9 @@ class GitRepo:
 
     def remote_url(self, name: str) -> Optional[str]:
         """Return the fetch URL of *name*, or ``None`` if the remote does not exist."""
+        session = _session
+        if session is not None:
+            return self._session_remotes(session).get(name)
         result = self._run_ref_query(
             ["remote", "get-url", name],
             capture_output=True,
@@ -241,7 +443,10 @@ class GitRepo:
 
         Honours ``self.runner.dry_run``.
         """
-        self.runner.git(["remote", "add", name, url], work_dir=self.work_tree)
+        try:
+            self.runner.git(["remote", "add", name, url], work_dir=self.work_tree)
+        finally:
+            self._invalidate()
 
     def fetch(self, remote: str, *, refspec: Optional[str] = None) -> None:
         """Run ``git fetch --quiet <remote> [<refspec>]``.
@@ -253,7 +458,10 @@ class GitRepo:
         cmd = ["fetch", "--quiet", remote]
         if refspec is not None:
             cmd.append(refspec)
-        self.runner.git(cmd, work_dir=self.work_tree)
+        try:
+            self.runner.git(cmd, work_dir=self.work_tree)
+        finally:
+            self._invalidate()
 
     def create_tracking_branch(self, branch: str, remote: str) -> None:
         """Create local *branch* tracking ``<remote>/<branch>``.
@@ -262,10 +470,13 @@ class GitRepo:
         Explicit ``--track`` survives ``branch.autoSetupMerge=never``.
         Honours ``self.runner.dry_run``.
         """
-        self.runner.git(
-            ["branch", "--track", branch, f"{remote}/{branch}"],
-            work_dir=self.work_tree,
-        )
+        try:
+            self.runner.git(
+                ["branch", "--track", branch, f"{remote}/{branch}"],
+                work_dir=self.work_tree,
+            )
+        finally:
+            self._invalidate()
 
     def list_tracked_files(self) -> list:
         """Return work-tree-relative paths of tracked files.
@@ -325,8 +536,20 @@ class GitRepo:
         checkout left behind after the submodule was deinitialised) are
         silently skipped so callers can iterate without try/except
         boilerplate.
+
+        Inside a :func:`git_session` the submodule's git directory is
+        read from its ``.git`` file instead of running ``git rev-parse``.
         """
+        session = _session
         for sub_path in self.list_submodules(recursive=recursive):
+            if session is not None:
+                git_dir = _read_dotgit(sub_path)
+                if git_dir is not None:
+                    session._get(
+                        session._discovered,
+                        sub_path.resolve(),
+                        lambda: (sub_path.resolve(), git_dir),
+                    )
             try:
                 yield GitRepo.discover(sub_path, require_root=True)
             except NotAGitRepoError:
@@ -431,11 +654,14 @@ class GitRepo:
         (e.g. "nothing to commit"); callers are responsible for checking
         ``returncode``.
         """
-        return self.runner.git(
-            ["commit", "-a", "-m", message],
-            work_dir=self.work_tree,
-            check=False,
-        )
+        try:
+            return self.runner.git(
+                ["commit", "-a", "-m", message],
+                work_dir=self.work_tree,
+                check=False,
+            )
+        finally:
+            self._invalidate()
 
     def push(self, *extra_args: str) -> "subprocess.CompletedProcess":
         """Run ``git push [extra_args]`` in the working tree.
@@ -444,11 +670,14 @@ class GitRepo:
         Returns the ``CompletedProcess`` without raising on non-zero exit;
         callers are responsible for checking ``returncode``.
         """
-        return self.runner.git(
-            ["push", *extra_args],
-            work_dir=self.work_tree,
-            check=False,
-        )
+        try:
+            return self.runner.git(
+                ["push", *extra_args],
+                work_dir=self.work_tree,
+                check=False,
+            )
+        finally:
+            self._invalidate()
 
     def pull_rebase(self) -> "subprocess.CompletedProcess":
         """Run ``git pull --rebase`` in the working tree.
@@ -457,11 +686,14 @@ class GitRepo:
         Returns the ``CompletedProcess`` without raising on non-zero exit;
         callers are responsible for checking ``returncode``.
         """
-        return self.runner.git(
-            ["pull", "--rebase"],
-            work_dir=self.work_tree,
-            check=False,
-        )
+        try:
+            return self.runner.git(
+                ["pull", "--rebase"],
+                work_dir=self.work_tree,
+                check=False,
+            )
+        finally:
+            self._invalidate()
 
     # ---- worktree / branch ops --------------------------------------------
 
@@ -479,30 +711,39 @@ class GitRepo:
         cmd.append(str(path))
         if branch is not None:
             cmd.append(branch)
-        self.runner.git(cmd, work_dir=self.work_tree)
+        try:
+            self.runner.git(cmd, work_dir=self.work_tree)
+        finally:
+            self._invalidate()
 
     def checkout_orphan(self, branch: str, *, work_dir: Path) -> None:
         """Run ``git switch --orphan <branch>`` inside *work_dir*."""
-        self.runner.git(
-            ["switch", "--orphan", branch],
-            work_dir=work_dir,
-        )
+        try:
+            self.runner.git(
+                ["switch", "--orphan", branch],
+                work_dir=work_dir,
+            )
+        finally:
+            self._invalidate()
 
     def empty_commit(self, message: str, *, work_dir: Path) -> None:
         """Run ``git commit --allow-empty -m <message>`` inside *work_dir*."""
-        self.runner.git(
-            [
-                "-c",
-                "commit.gpgsign=false",
-                "-c",
-                "tag.gpgsign=false",
-                "commit",
-                "--allow-empty",
-                "-m",
-                message,
-            ],
-            work_dir=work_dir,
-        )
+        try:
+            self.runner.git(
+                [
+                    "-c",
+                    "commit.gpgsign=false",
+                    "-c",
+                    "tag.gpgsign=false",
+                    "commit",
+                    "--allow-empty",
+                    "-m",
+                    message,
+                ],
+                work_dir=work_dir,
+            )
+        finally:
+            self._invalidate()
 
     def create_orphan_worktree(
         self,
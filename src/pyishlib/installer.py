@@ -3,7 +3,9 @@
 """Helper library for package installing tasks"""
 
 import logging
-from typing import Any, Optional, Iterable, Mapping
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Iterable, Mapping
 
 from .ish_config import IshConfig
 from .command_runner import CommandRunner
@@ -14,11 +16,94 @@ from .installer_custom import InstallerCustom
 from .installer_pip import InstallerPip
 from .installer_brew import InstallerBrew
 from .installer_winget import InstallerWinget
-from .version_check import meets_min_version, probe_version
+from .package_state import PackageStateCache
+from .parallel import map_bounded, resolve_jobs
+from .timings import span
+from .version_check import (
+    VersionProbeCache,
+    meets_min_version,
+    parse_version,
+    probe_version,
+)
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class PackageStatus:
+    """Probed state of one package, as recorded in an :class:`InstallPlan`.
+
+    Attributes:
+        pkg:       The package dict.
+        installed: True if the package needs no installing.
+        reason:    Why: ``"found-cmd"``, ``"version-ok"``, ``"installed"``
+                   (reported by *backend*), ``"missing"``, ``"too-old"``,
+                   ``"version-unknown"`` or ``"no-checker"``.
+        backend:   Backend that reported the package installed, or, for
+                   missing packages, the backend chosen to install it.
+        available: Whether a backend reports the package as installable
+                   (only probed for missing packages).
+        version:   Installed version, when a ``min_version`` probe ran.
+    """
+
+    pkg: Dict[str, Any]
+    installed: bool
+    reason: str
+    backend: Optional[str] = None
+    available: Optional[bool] = None
+    version: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """The package name."""
+        return self.pkg["name"]
+
+    @property
+    def optional(self) -> bool:
+        """True if the package is marked ``optional``."""
+        return bool(self.pkg.get("optional"))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the status as a JSON-serialisable dict."""
+        return {
+            "name": self.name,
+            "installed": self.installed,
+            "reason": self.reason,
+            "backend": self.backend,
+            "available": self.available,
+            "version": self.version,
+            "min_version": self.pkg.get("min_version"),
+            "optional": self.optional,
+        }
+
+
+@dataclass
+class InstallPlan:
+    """Result of :meth:`Installer.plan`: one :class:`PackageStatus` per package.
+
+    The plan is probed once; pass it to :meth:`Installer.install_pkgs` to
+    install from it without probing again.
+    """
+
+    entries: List[PackageStatus] = field(default_factory=list)
+
+    @property
+    def missing(self) -> List[PackageStatus]:
+        """Entries for packages that need installing."""
+        return [e for e in self.entries if not e.installed]
+
+    def entry(self, name: str) -> Optional[PackageStatus]:
+        """Return the entry for package *name*, or None."""
+        for e in self.entries:
+            if e.name == name:
+                return e
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the plan as a JSON-serialisable dict."""
+        return {"packages": [e.as_dict() for e in self.entries]}
+
+
 class Installer:
     """Installer class for installing packages.
 
@@ -27,15 +112,40 @@ class Installer:
              to locate the dotfiles directory (for custom install scripts),
              and ``cfg.context`` provides preprocessing variables.
         runner: Optional :class:`CommandRunner`.
+        state:  Optional :class:`PackageStateCache`.  When given,
+                :meth:`have_pkg` answers from it for backends whose
+                package database is unchanged since the package was last
+                found installed, and records new positive results.
+        versions: Optional :class:`~pyishlib.version_check.VersionProbeCache`
+                answering ``min_version`` probes of unchanged binaries.
+                Saved with *state* (never in dry-run mode).
+        jobs:   Number of packages probed concurrently by :meth:`plan` and
+                :meth:`get_missing_pkgs`.
+                Defaults to the ``probe_jobs`` option, else
+                :data:`~pyishlib.parallel.DEFAULT_JOBS`; 1 probes serially.
     """
 
     def __init__(
         self,
         cfg: Optional[IshConfig] = None,
         runner: Optional[CommandRunner] = None,
+        state: Optional[PackageStateCache] = None,
+        jobs: Optional[int] = None,
+        versions: Optional[VersionProbeCache] = None,
     ) -> None:
         self.cfg: IshConfig = cfg if cfg is not None else IshConfig()
         self._backends: dict = {}
+        self._state: Optional[PackageStateCache] = state
+        self._versions: Optional[VersionProbeCache] = versions
+        self.jobs: int = resolve_jobs(
+            jobs if jobs is not None else self.cfg.get_opt("probe_jobs")
+        )
+        # Guards _fingerprints and _state against concurrent probes.
+        self._lock = threading.Lock()
+        # Backend name -> database fingerprint, taken once per install round.
+        self._fingerprints: dict = {}
+        # Backend name -> repo index fingerprint, likewise.
+        self._index_fingerprints: dict = {}
         self.runner: CommandRunner = (
             runner if runner is not None else CommandRunner(cfg=self.cfg)
         )
@@ -52,8 +162,12 @@ class Installer:
 
         The backend must have an INSTALLER_NAME class attribute and a
         namespace property exposing can_install, install, is_installed,
-        and update methods.  Registering a backend with a name that
-        already exists replaces the previous one.
+        is_pkg_available and update methods.  The bulk-probe hooks
+        (prefetch, prefetch_available) and cache fingerprints
+        (db_fingerprint, index_fingerprint) are optional; a backend
+        without them is probed one package at a time and never cached.
+        Registering a backend with a name that already exists replaces the
+        previous one.
         """
         name = backend.INSTALLER_NAME
         self._backends[name] = backend
@@ -84,30 +198,68 @@ class Installer:
         log.debug("No installer found for %s", pkg["name"])
         return None
 
-    def install_pkgs(self, pkgs: Iterable[Mapping]) -> bool:
-        """Install all packages."""
+    def prefetch(self, pkgs: Iterable[Mapping]) -> None:
+        """Let every available backend bulk-probe *pkgs* up front.
+
+        Backends without a ``prefetch`` hook are skipped; the per-package
+        checks in :meth:`have_pkg` and :meth:`pkg_is_available` then fall
+        back to their usual one-query-per-package behaviour.
+        """
+        pkgs = list(pkgs)
+        for i in self._backends:
+            ns = self.installer(i)
+            prefetch = getattr(ns, "prefetch", None)
+            if prefetch is None or not ns.can_install():
+                continue
+            prefetch([p for p in pkgs if ns.can_install(p)])
+
+    def install_pkgs(
+        self, pkgs: Iterable[Mapping], plan: Optional[InstallPlan] = None
+    ) -> bool:
+        """Install all packages.
 
-        # Get the packages that are missing
-        missing_packages: Iterable[Mapping] = self.get_missing_pkgs(pkgs)
+        Without *plan*, *pkgs* are probed first and only the missing ones
+        are installed.  With a *plan* from :meth:`plan`, *pkgs* are taken
+        to be missing and each goes to the backend the plan chose for it.
+        """
+        if plan is None:
+            missing_packages: Iterable[Mapping] = self.get_missing_pkgs(pkgs)
+        else:
+            missing_packages = pkgs
 
         # Then sort them by installer
         to_install: Mapping[str, list] = {i: [] for i in self._backends}
         for pkg in missing_packages:
-            installer: Optional[str] = self.get_installer(pkg)
+            entry = plan.entry(pkg["name"]) if plan is not None else None
+            installer: Optional[str] = (
+                entry.backend if entry is not None else self.get_installer(pkg)
+            )
             if installer is not None:
                 to_install[installer].append(pkg)
                 continue
             log.error("No installer found for %s", pkg["name"])
 
         # Finally, install the packages
-        for i, i_pkgs in to_install.items():
-            if len(i_pkgs) == 0:
-                continue
-            self.installer(i).install(i_pkgs)
+        try:
+            for i, i_pkgs in to_install.items():
+                if len(i_pkgs) == 0:
+                    continue
+                self.installer(i).install(i_pkgs)
+        finally:
+            self._fingerprints.clear()
+            self._index_fingerprints.clear()
         return True
 
     def have_pkg(self, package: Mapping) -> bool:
         """Check if a package is installed."""
+        return self.pkg_status(package).installed
+
+    def pkg_status(self, package: Mapping) -> PackageStatus:
+        """Probe whether *package* is installed, and why (see :meth:`have_pkg`).
+
+        Only the install state is probed; ``available`` is left unset.
+        """
+        pkg = dict(package)
         found_checker = False
         cmd = package.get("cmd")
         min_version = package.get("min_version")
@@ -120,67 +272,240 @@ class Installer:
                 # so consulting them here would mask a too-old installation.
                 if not on_path:
                     log.debug("Did not find %s with which", cmd)
-                    return False
+                    return PackageStatus(pkg, False, "missing")
                 probe_cmd = package.get("command_version", f"{cmd} --version")
-                output = probe_version(self.runner, probe_cmd)
+                if self._versions is not None:
+                    output = self._versions.probe(self.runner, probe_cmd)
+                else:
+                    output = probe_version(self.runner, probe_cmd)
                 if output is None:
                     log.debug(
                         "Version probe for %s failed; treating as not installed",
                         package["name"],
                     )
-                    return False
+                    return PackageStatus(pkg, False, "version-unknown")
+                parsed = parse_version(output)
+                version = ".".join(map(str, parsed)) if parsed else None
                 if meets_min_version(output, min_version):
                     log.debug(
                         "Package %s meets min_version %s",
                         package["name"],
                         min_version,
                     )
-                    return True
+                    return PackageStatus(pkg, True, "version-ok", version=version)
                 log.debug(
                     "Package %s below min_version %s; will reinstall",
                     package["name"],
                     min_version,
                 )
-                return False
+                return PackageStatus(pkg, False, "too-old", version=version)
             if on_path:
                 log.debug(
                     "Package %s installed, found command %s",
                     package["name"],
                     cmd,
                 )
-                return True
+                return PackageStatus(pkg, True, "found-cmd")
             log.debug("Did not find %s with which", cmd)
 
+        # Backends are asked in order and the first hit wins.  This stays
+        # serial: packages are already probed concurrently by _probe(), and
+        # most packages are found by their first backend.
         for i in self._backends:
             ns = self.installer(i)
             if ns.can_install(package):
                 found_checker = True
-                if ns.is_installed(package):
+                if self._backend_has_pkg(i, ns, package):
                     log.debug("Package %s installed with %s", package["name"], i)
-                    return True
+                    return PackageStatus(pkg, True, "installed", backend=i)
                 log.debug("Package %s not installed with %s", package["name"], i)
 
         if not found_checker:
             log.error("Cannot check if %s is installed", package["name"])
+            return PackageStatus(pkg, False, "no-checker")
+        return PackageStatus(pkg, False, "missing")
+
+    def _fingerprint(self, name: str, ns: Any) -> Optional[list]:
+        """Return backend *name*'s database fingerprint (memoised)."""
+        with self._lock:
+            if name not in self._fingerprints:
+                db_fingerprint = getattr(ns, "db_fingerprint", None)
+                self._fingerprints[name] = db_fingerprint() if db_fingerprint else None
+            return self._fingerprints[name]
+
+    def _known_installed(self, package: Mapping) -> bool:
+        """True if the state cache already vouches for *package*."""
+        if self._state is None:
+            return False
+        for i in self._backends:
+            ns = self.installer(i)
+            if ns.can_install(package) and self._state.is_installed(
+                i, self._fingerprint(i, ns), PackageStateCache.key(i, package)
+            ):
+                return True
         return False
 
+    def _backend_has_pkg(self, name: str, ns: Any, package: Mapping) -> bool:
+        """Ask backend *name* about *package*, via the state cache if any."""
+        if self._state is None:
+            return ns.is_installed(package)
+        fingerprint = self._fingerprint(name, ns)
+        key = PackageStateCache.key(name, package)
+        if self._state.is_installed(name, fingerprint, key):
+            log.debug("Package %s installed with %s (cached)", package["name"], name)
+            return True
+        if not ns.is_installed(package):
+            return False
+        with self._lock:
+            self._state.record(name, fingerprint, key)
+        return True
+
     def pkg_is_available(self, package: Mapping) -> bool:
         """Return True if any backend that can handle *package* also reports it
         as available in its repo/index.
 
         Uses :attr:`Namespace.is_pkg_available` on each backend.  Falls back
         to True for backends that don't override it (non-apt/dnf backends).
+        With a state cache, answers recorded under the backend's current
+        repo index fingerprint are reused, and new answers are recorded.
         """
         for i in self._backends:
             ns = self.installer(i)
-            if ns.can_install(package) and ns.is_pkg_available(package):
+            if ns.can_install(package) and self._backend_offers_pkg(i, ns, package):
                 return True
         return False
 
+    def prefetch_available(self, pkgs: Iterable[Mapping]) -> None:
+        """Let every available backend bulk-resolve availability of *pkgs*.
+
+        Packages whose availability the state cache already knows for a
+        backend are not passed to that backend's ``prefetch_available``.
+        """
+        pkgs = list(pkgs)
+        for i in self._backends:
+            ns = self.installer(i)
+            prefetch = getattr(ns, "prefetch_available", None)
+            if prefetch is None or not ns.can_install():
+                continue
+            todo = [
+                p
+                for p in pkgs
+                if ns.can_install(p) and self._cached_availability(i, ns, p) is None
+            ]
+            if todo:
+                prefetch(todo)
+
+    def _index_fingerprint(self, name: str, ns: Any) -> Optional[list]:
+        """Return backend *name*'s repo index fingerprint (memoised)."""
+        with self._lock:
+            if name not in self._index_fingerprints:
+                index_fingerprint = getattr(ns, "index_fingerprint", None)
+                self._index_fingerprints[name] = (
+                    index_fingerprint() if index_fingerprint else None
+                )
+            return self._index_fingerprints[name]
+
+    def _cached_availability(
+        self, name: str, ns: Any, package: Mapping
+    ) -> Optional[bool]:
+        """Availability of *package* via backend *name* per the state cache."""
+        if self._state is None:
+            return None
+        return self._state.availability(
+            name, self._index_fingerprint(name, ns), package[name]
+        )
+
+    def _backend_offers_pkg(self, name: str, ns: Any, package: Mapping) -> bool:
+        """Ask backend *name* whether *package* is available, via the state cache."""
+        cached = self._cached_availability(name, ns, package)
+        if cached is not None:
+            log.debug(
+                "Package %s available with %s: %s (cached)",
+                package["name"],
+                name,
+                cached,
+            )
+            return cached
+        available = bool(ns.is_pkg_available(package))
+        if self._state is not None:
+            with self._lock:
+                self._state.record_availability(
+                    name, self._index_fingerprints.get(name), package[name], available
+                )
+        return available
+
     def install_pkg(self, pkg: dict) -> bool:
         """Install a package"""
         return self.install_pkgs([pkg])
 
     def get_missing_pkgs(self, pkgs: Iterable[Mapping]) -> Iterable[Mapping]:
-        """Check if a list of commands are available."""
-        return [p for p in pkgs if not self.have_pkg(p)]
+        """Check if a list of commands are available.
+
+        Probes *pkgs* like :meth:`plan` (without the availability checks)
+        and returns the packages that are not installed.
+        """
+        return [e.pkg for e in self._probe(pkgs)]
+
+    def plan(self, pkgs: Iterable[Mapping]) -> InstallPlan:
+        """Probe *pkgs* once and return the resulting :class:`InstallPlan`.
+
+        Every package gets a :meth:`pkg_status`; missing packages are also
+        checked with :meth:`pkg_is_available` and assigned the backend
+        :meth:`get_installer` would pick.  Availability is resolved in bulk
+        first (:meth:`prefetch_available`).  Both rounds of probes run
+        :attr:`jobs` at a time.
+        """
+        entries = self._probe(pkgs, keep_installed=True)
+        missing = [e for e in entries if not e.installed]
+        with span("prefetch-available", "probe"):
+            self.prefetch_available([e.pkg for e in missing])
+
+        def available(entry: PackageStatus) -> bool:
+            with span(entry.name, "available"):
+                return self.pkg_is_available(entry.pkg)
+
+        for e, outcome in zip(missing, map_bounded(available, missing, self.jobs)):
+            e.available = outcome.result()
+            e.backend = self.get_installer(e.pkg)
+        self._save_state()
+        return InstallPlan(entries)
+
+    def _save_state(self) -> None:
+        """Save the state and version caches, unless in dry-run mode."""
+        if self.runner.dry_run:
+            return
+        if self._state is not None:
+            self._state.save()
+        if self._versions is not None:
+            self._versions.save()
+
+    def _probe(
+        self, pkgs: Iterable[Mapping], keep_installed: bool = False
+    ) -> List[PackageStatus]:
+        """Return the :meth:`pkg_status` of *pkgs* (only missing ones by default).
+
+        Backends are given a chance to :meth:`prefetch` the whole list
+        first so that their per-package checks are answered in bulk.
+        Packages the state cache already knows to be installed are left
+        out of the prefetch, and the cache is saved afterwards unless in
+        dry-run mode.
+
+        The per-package checks then run :attr:`jobs` at a time; results
+        keep the order of *pkgs*, and the first error (in that order) is
+        re-raised once all checks have finished.
+        """
+        pkgs = list(pkgs)
+        with span("prefetch", "probe"):
+            self.prefetch([p for p in pkgs if not self._known_installed(p)])
+
+        def probe(p: Mapping) -> PackageStatus:
+            with span(p["name"], "probe"):
+                return self.pkg_status(p)
+
+        statuses = []
+        for outcome in map_bounded(probe, pkgs, self.jobs):
+            status = outcome.result()
+            if keep_installed or not status.installed:
+                statuses.append(status)
+        self._save_state()
+        return statuses
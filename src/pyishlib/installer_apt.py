@@ -4,19 +4,34 @@
 
 import logging
 import subprocess
-from typing import Any, Optional, Sequence
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
 
+from .command_runner import CommandRunner
 from .installer_base import InstallerBase
 from .version_check import meets_min_version
 
 log = logging.getLogger(__name__)
 
+_DPKG_STATUS = Path("/var/lib/dpkg/status")
+
+# ``apt update`` renames fresh index files into the lists directory (and
+# regenerates the binary cache), so both change whenever the index does.
+_APT_INDEX = (Path("/var/lib/apt/lists"), Path("/var/cache/apt/pkgcache.bin"))
+
 
 class InstallerApt(InstallerBase):
     """Helper class for managing apt packages"""
 
     INSTALLER_NAME: str = "apt"
 
+    def __init__(self, runner: CommandRunner) -> None:
+        super().__init__(runner)
+        # Populated by prefetch(): dpkg name -> installed version (None when
+        # not installed), and apt name -> its ``apt-cache showpkg`` section.
+        self._dpkg_cache: Dict[str, Optional[str]] = {}
+        self._showpkg_cache: Dict[str, str] = {}
+
     def _tool_cmd(self) -> str:
         return "apt"
 
@@ -29,6 +44,121 @@ class InstallerApt(InstallerBase):
     def _needs_sudo_for_install(self) -> bool:
         return True
 
+    def _db_paths(self) -> Sequence[Path]:
+        return [_DPKG_STATUS]
+
+    def _index_paths(self) -> Sequence[Path]:
+        return _APT_INDEX
+
+    def prefetch(self, pkgs: Sequence[dict]) -> None:
+        """Bulk-probe install state and availability for *pkgs*.
+
+        Runs at most three queries regardless of the number of packages:
+        one ``dpkg-query -W`` for status and version of every requested
+        name, one ``apt-cache showpkg`` over the names that are not
+        installed (for availability and virtual-package providers), and
+        one more ``dpkg-query`` over those providers.  Later calls to
+        :meth:`is_pkg_installed` and :meth:`is_pkg_available` are then
+        answered from the cached results.  Architecture-qualified names
+        (``foo:i386``) are left to the per-package queries.
+        """
+        if not self.can_install():
+            return
+        names = sorted(
+            {p["apt"] for p in pkgs if self.can_install(p) and ":" not in p["apt"]}
+            - set(self._dpkg_cache)
+        )
+        if not names:
+            return
+        self._bulk_dpkg_query(names)
+        missing = [
+            n
+            for n in names
+            if self._dpkg_cache.get(n) is None and n not in self._showpkg_cache
+        ]
+        if not missing:
+            return
+        self._bulk_showpkg(missing)
+        providers = {
+            provider
+            for n in missing
+            for provider in _parse_reverse_provides(self._showpkg_cache.get(n, ""))
+            if ":" not in provider
+        } - set(self._dpkg_cache)
+        if providers:
+            self._bulk_dpkg_query(sorted(providers))
+
+    def prefetch_available(self, pkgs: Sequence[dict]) -> None:
+        """Resolve availability for *pkgs* with one ``apt-cache showpkg``.
+
+        Names already covered by :meth:`prefetch` are skipped, as are
+        architecture-qualified names.
+        """
+        if not self.can_install():
+            return
+        names = sorted(
+            {p["apt"] for p in pkgs if self.can_install(p) and ":" not in p["apt"]}
+            - set(self._showpkg_cache)
+        )
+        if names:
+            self._bulk_showpkg(names)
+
+    def _bulk_dpkg_query(self, names: Sequence[str]) -> None:
+        """Fill :attr:`_dpkg_cache` for *names* from one ``dpkg-query``."""
+        try:
+            result = self.runner.run(
+                [
+                    "dpkg-query",
+                    "-W",
+                    "--showformat=${Package}\t${Status}\t${Version}\n",
+                    *names,
+                ],
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except Exception:
+            return
+        # dpkg-query exits 1 when any name is unknown, but still reports
+        # the ones it knows about, so the exit status is not consulted.
+        installed = _parse_dpkg_status_lines(
+            result.stdout.decode("utf-8", errors="replace")
+        )
+        for name in names:
+            self._dpkg_cache[name] = installed.get(name)
+
+    def _bulk_showpkg(self, names: Sequence[str]) -> None:
+        """Fill :attr:`_showpkg_cache` for *names* from one ``apt-cache showpkg``."""
+        try:
+            result = self.runner.run(
+                ["apt-cache", "--no-generate", "showpkg", *names],
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                read_only=True,
+            )
+        except Exception:
+            return
+        if result.returncode != 0:
+            return
+        sections = _split_showpkg_sections(
+            result.stdout.decode("utf-8", errors="replace")
+        )
+        for name in names:
+            self._showpkg_cache[name] = sections.get(name, "")
+
+    def _clear_probe_cache(self) -> None:
+        """Forget prefetched state (called after anything is installed)."""
+        self._dpkg_cache.clear()
+        self._showpkg_cache.clear()
+
+    def install_pkgs(self, pkgs: Sequence[dict]) -> bool:
+        """Install *pkgs* and invalidate the prefetched probe state."""
+        try:
+            return super().install_pkgs(pkgs)
+        finally:
+            self._clear_probe_cache()
+
     def is_pkg_installed(self, pkg: dict) -> bool:
         """Check if an apt package is installed.
 
@@ -95,6 +225,9 @@ class InstallerApt(InstallerBase):
         if pkg is None or not self.can_install() or not self.can_install(pkg):
             return False
 
+        cached = self._showpkg_cache.get(pkg["apt"])
+        if cached is not None:
+            return _showpkg_has_versions_or_providers(cached)
         try:
             result = self.runner.run(
                 ["apt-cache", "--no-generate", "showpkg", pkg["apt"]],
@@ -112,6 +245,8 @@ class InstallerApt(InstallerBase):
 
     def _dpkg_is_installed(self, pkg_name: str) -> bool:
         """Return True if dpkg reports *pkg_name* as installed."""
+        if pkg_name in self._dpkg_cache:
+            return self._dpkg_cache[pkg_name] is not None
         try:
             result = self.runner.run(
                 ["dpkg-query", "-W", "--showformat=${Status}\n", pkg_name],
@@ -132,6 +267,8 @@ class InstallerApt(InstallerBase):
         the returned string matches the upstream version that
         ``min_version`` is most likely declared against.
         """
+        if self._dpkg_cache.get(pkg_name) is not None:
+            return _strip_epoch(self._dpkg_cache[pkg_name])
         try:
             result = self.runner.run(
                 ["dpkg-query", "-W", "--showformat=${Version}", pkg_name],
@@ -143,15 +280,13 @@ class InstallerApt(InstallerBase):
             return None
         if result.returncode != 0:
             return None
-        ver = result.stdout.decode("utf-8", errors="replace").strip()
-        if not ver:
-            return None
-        if ":" in ver:
-            ver = ver.split(":", 1)[1]
-        return ver
+        return _strip_epoch(result.stdout.decode("utf-8", errors="replace"))
 
     def _apt_reverse_provides(self, pkg_name: str) -> list:
         """Return package names that ``Provides: <pkg_name>`` in the apt index."""
+        cached = self._showpkg_cache.get(pkg_name)
+        if cached is not None:
+            return _parse_reverse_provides(cached)
         try:
             result = self.runner.run(
                 ["apt-cache", "--no-generate", "showpkg", pkg_name],
@@ -172,8 +307,11 @@ class InstallerApt(InstallerBase):
         self._require_available()
 
         log.info("Updating apt packages")
-        self._run_cmd(["apt", "update"], sudo=True, action="updating")
-        self._run_cmd(["apt", "upgrade", "-y"], sudo=True, action="updating")
+        try:
+            self._run_cmd(["apt", "update"], sudo=True, action="updating")
+            self._run_cmd(["apt", "upgrade", "-y"], sudo=True, action="updating")
+        finally:
+            self._clear_probe_cache()
         return True
 
 
@@ -182,6 +320,57 @@ class InstallerApt(InstallerBase):
 # ---------------------------------------------------------------------------
 
 
+def _strip_epoch(version: Optional[str]) -> Optional[str]:
+    """Strip a Debian epoch (``2:``) from *version*; empty becomes None."""
+    ver = (version or "").strip()
+    if not ver:
+        return None
+    if ":" in ver:
+        ver = ver.split(":", 1)[1]
+    return ver
+
+
+def _parse_dpkg_status_lines(output: str) -> Dict[str, str]:
+    """Parse ``${Package}\\t${Status}\\t${Version}`` lines from ``dpkg-query``.
+
+    Returns a mapping of package name to raw installed version for every
+    package whose status is ``install ok installed``.  Multi-arch packages
+    may appear once per architecture; any installed instance counts.
+    """
+    installed: Dict[str, str] = {}
+    for line in output.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 3:
+            continue
+        name, status, version = parts
+        if status.strip() == "install ok installed" and name not in installed:
+            installed[name] = version.strip()
+    return installed
+
+
+def _split_showpkg_sections(showpkg_output: str) -> Dict[str, str]:
+    """Split multi-package ``apt-cache showpkg`` output into per-package text.
+
+    Each section starts at a ``Package: <name>`` line and runs until the
+    next one.  Unknown names produce no section at all.
+    """
+    sections: Dict[str, str] = {}
+    name: Optional[str] = None
+    lines: list = []
+    for line in showpkg_output.splitlines():
+        if line.startswith("Package:"):
+            if name is not None:
+                sections[name] = "\n".join(lines) + "\n"
+            name = line[len("Package:") :].strip()
+            lines = [line]
+            continue
+        if name is not None:
+            lines.append(line)
+    if name is not None:
+        sections[name] = "\n".join(lines) + "\n"
+    return sections
+
+
 def _parse_reverse_provides(showpkg_output: str) -> list:
     """Parse the ``Reverse Provides:`` section of ``apt-cache showpkg`` output.
 
@@ -6,11 +6,14 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
-from typing import Any, Iterable, Optional, Sequence
+from typing import AbstractSet, Any, FrozenSet, Iterable, List, Optional, Sequence
 
 from .command_runner import CommandRunner
+from .package_state import stat_fingerprint
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +33,12 @@ class InstallerBase(ABC):
     to get the default :attr:`available` and :meth:`can_install` behaviour
     for free.  Backends with non-trivial tool detection (e.g. pip) may
     instead override :attr:`available` directly.
+
+    Backends whose install check is "list everything, look for the name"
+    (brew, cargo, pip) override :meth:`_list_installed_cmd` and
+    :meth:`_parse_installed` and answer :meth:`is_pkg_installed` with
+    :meth:`_check_pkg_installed_by_listing`, so the listing runs once per
+    run rather than once per package.
     """
 
     #: Unique backend identifier used by :class:`Installer`.
@@ -39,6 +48,9 @@ class InstallerBase(ABC):
         self.runner: CommandRunner = runner
         self._tool_checked: bool = False
         self._tool_available: bool = False
+        # Populated by installed_snapshot(); cleared by install_pkgs().
+        self._snapshot: Optional[FrozenSet[str]] = None
+        self._snapshot_lock = threading.Lock()
 
     # -- override in subclasses (unless available / can_install are overridden) --
 
@@ -50,6 +62,38 @@ class InstallerBase(ABC):
         """Package-dict key for this backend (e.g. ``"apt"``)."""
         raise NotImplementedError(f"{type(self).__name__} must implement _pkg_key()")
 
+    def _db_paths(self) -> Sequence[Path]:
+        """Files or directories that change whenever a package is installed.
+
+        Default is ``[]`` (no fingerprint, so results are never cached).
+        """
+        return []
+
+    def _index_paths(self) -> Sequence[Path]:
+        """Files or directories that change whenever the repo index is refreshed.
+
+        Default is ``[]`` (availability results are never cached).
+        """
+        return []
+
+    def _list_installed_cmd(self) -> Optional[Sequence[str]]:
+        """Argv that lists every installed package, or None (the default).
+
+        Backends returning a command must also implement
+        :meth:`_parse_installed`.
+        """
+        return None
+
+    def _parse_installed(self, output: str) -> AbstractSet[str]:
+        """Parse :meth:`_list_installed_cmd` output into installed names."""
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement _parse_installed()"
+        )
+
+    def _installed_name(self, pkg: dict) -> str:
+        """Name of *pkg* as it appears in :meth:`_parse_installed` results."""
+        return pkg[self._pkg_key()]
+
     # -- provided by base class ------------------------------------------------
 
     @property
@@ -69,10 +113,14 @@ class InstallerBase(ABC):
             """Installer namespace for use by :class:`Installer`."""
 
             can_install = self.can_install
+            db_fingerprint = self.db_fingerprint
+            index_fingerprint = self.index_fingerprint
             install = self.install_pkgs
             install_unless_found = self.install_pkg_unless_found
             is_installed = self.is_pkg_installed
             is_pkg_available = self.is_pkg_available
+            prefetch = self.prefetch
+            prefetch_available = self.prefetch_available
             update = self.update_pkgs
             update_and_install_all = self.update_and_install_all
 
@@ -88,6 +136,72 @@ class InstallerBase(ABC):
         """
         return self.can_install(pkg)
 
+    def prefetch(self, pkgs: Sequence[dict]) -> None:
+        """Bulk-probe the state of *pkgs* ahead of per-package queries.
+
+        The default implementation is a no-op.  Backends whose probes are
+        one process per package (e.g. apt) override this to query every
+        package in a single invocation and answer subsequent
+        :meth:`is_pkg_installed` / :meth:`is_pkg_available` calls from
+        the result.  Packages this backend cannot handle are ignored.
+        """
+
+    def prefetch_available(self, pkgs: Sequence[dict]) -> None:
+        """Bulk-resolve repo availability of *pkgs* ahead of per-package queries.
+
+        The default implementation is a no-op.  Backends with a real
+        :meth:`is_pkg_available` probe (apt, dnf) override this to ask the
+        package manager about every name in one invocation and answer
+        later :meth:`is_pkg_available` calls from the result.
+        """
+
+    def installed_snapshot(self) -> Optional[FrozenSet[str]]:
+        """Return the names of all installed packages, listed once per run.
+
+        The first call runs :meth:`_list_installed_cmd` and parses it with
+        :meth:`_parse_installed`; later calls return the same set until
+        :meth:`clear_installed_snapshot` (called by :meth:`install_pkgs`).
+        A listing that fails is remembered as an empty set.  Returns None
+        if the backend has no listing command or is not available.
+        """
+        cmd = self._list_installed_cmd()
+        if cmd is None or not self.can_install():
+            return None
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                output = self._probe_output(cmd, what="installed packages")
+                names = self._parse_installed(output) if output is not None else ()
+                self._snapshot = frozenset(names)
+                log.debug(
+                    "%s: %d installed packages listed",
+                    self.INSTALLER_NAME,
+                    len(self._snapshot),
+                )
+            return self._snapshot
+
+    def clear_installed_snapshot(self) -> None:
+        """Forget the :meth:`installed_snapshot` so the next call re-lists."""
+        with self._snapshot_lock:
+            self._snapshot = None
+
+    def db_fingerprint(self) -> Optional[List[List[Any]]]:
+        """Return a fingerprint of the backend's package database, or None.
+
+        Built by :func:`~pyishlib.package_state.stat_fingerprint` from
+        :meth:`_db_paths`.  :class:`Installer` keys its persistent
+        :class:`~pyishlib.package_state.PackageStateCache` on this value,
+        so it must change whenever a package is installed or removed.
+        """
+        return stat_fingerprint(self._db_paths())
+
+    def index_fingerprint(self) -> Optional[List[List[Any]]]:
+        """Return a fingerprint of the backend's repo index, or None.
+
+        Built from :meth:`_index_paths`; :class:`Installer` keys cached
+        :meth:`is_pkg_available` results on it.
+        """
+        return stat_fingerprint(self._index_paths())
+
     def can_install(self, pkg: Optional[Any] = None) -> bool:
         """Return True if this backend can handle *pkg*.
 
@@ -154,6 +268,31 @@ class InstallerBase(ABC):
             return False
         return True
 
+    def _probe_output(
+        self, probe_cmd: Sequence[str], *, check: bool = True, what: str = ""
+    ) -> Optional[str]:
+        """Run *probe_cmd* and return its decoded stdout.
+
+        Returns None (and logs at debug level) if the command fails or
+        exits non-zero.  *what* names the probe in that log message.
+        """
+        try:
+            result = self.runner.run(
+                list(probe_cmd),
+                check=check,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except CalledProcessError as e:
+            log.debug("%s error checking %s: %s", self.INSTALLER_NAME, what, e)
+            return None
+        if result.returncode != 0:
+            return None
+        text = result.stdout
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="replace")
+        return text or ""
+
     def _check_pkg_installed_by_output(
         self,
         pkg: dict,
@@ -164,36 +303,26 @@ class InstallerBase(ABC):
     ) -> bool:
         """Run *probe_cmd* and return True iff *match* appears in stdout.
 
-        Covers the common "run tool, grep output" pattern used by brew,
-        cargo, pip, winget.  *match* defaults to ``pkg[self._pkg_key()]``.
-        Set ``check=False`` when the probe command may legitimately exit
+        Covers the "run tool, grep output" pattern for per-package probes
+        (winget).  *match* defaults to ``pkg[self._pkg_key()]``.  Set
+        ``check=False`` when the probe command may legitimately exit
         non-zero without raising.
         """
         if not self._guard_can_install(pkg):
             return False
-        try:
-            result = self.runner.run(
-                list(probe_cmd),
-                check=check,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-        except CalledProcessError as e:
-            log.debug(
-                "%s error checking %s: %s",
-                self.INSTALLER_NAME,
-                pkg.get("name"),
-                e,
-            )
-            return False
-        if result.returncode != 0:
+        text = self._probe_output(probe_cmd, check=check, what=pkg.get("name", ""))
+        if text is None:
             return False
-        text = result.stdout
-        if isinstance(text, bytes):
-            text = text.decode("utf-8", errors="replace")
         needle = match if match is not None else pkg[self._pkg_key()]
         return needle in text
 
+    def _check_pkg_installed_by_listing(self, pkg: dict) -> bool:
+        """Return True iff *pkg* is in the :meth:`installed_snapshot`."""
+        if not self._guard_can_install(pkg):
+            return False
+        snapshot = self.installed_snapshot()
+        return snapshot is not None and self._installed_name(pkg) in snapshot
+
     # -- install-command assembly hooks ----------------------------------------
 
     def _install_flags(self) -> Sequence[str]:
@@ -235,15 +364,19 @@ class InstallerBase(ABC):
         Default template: validate, build argv via :meth:`_build_install_cmd`,
         run with :meth:`_needs_sudo_for_install`.  Backends with a
         per-package invocation shape (winget) override this directly.
+        The :meth:`installed_snapshot` is cleared afterwards.
         """
         self._validate_pkgs(pkgs)
         pkg_names: Sequence[str] = [pkg[self._pkg_key()] for pkg in pkgs]
         log.info("Installing with %s: %s", self.INSTALLER_NAME, " ".join(pkg_names))
-        res = self._run_cmd(
-            self._build_install_cmd(pkg_names),
-            sudo=self._needs_sudo_for_install(),
-            action="installing",
-        )
+        try:
+            res = self._run_cmd(
+                self._build_install_cmd(pkg_names),
+                sudo=self._needs_sudo_for_install(),
+                action="installing",
+            )
+        finally:
+            self.clear_installed_snapshot()
         return res.returncode == 0
 
     def update_and_install_all(self, pkgs: Sequence[dict]) -> None:
@@ -3,12 +3,17 @@
 """Helper library for package installing tasks"""
 
 import logging
-from typing import Sequence
+import os
+from pathlib import Path
+from typing import AbstractSet, Sequence
 
 from .installer_base import InstallerBase
 
 log = logging.getLogger(__name__)
 
+# Default Homebrew prefixes (Apple silicon, Intel macOS, Linux).
+_BREW_PREFIXES = ("/opt/homebrew", "/usr/local", "/home/linuxbrew/.linuxbrew")
+
 
 class InstallerBrew(InstallerBase):
     """Helper class for managing packages via Homebrew"""
@@ -24,9 +29,24 @@ class InstallerBrew(InstallerBase):
     def _install_flags(self) -> Sequence[str]:
         return ["install"]
 
+    def _db_paths(self) -> Sequence[Path]:
+        prefix = os.environ.get("HOMEBREW_PREFIX")
+        prefixes = [prefix] if prefix else _BREW_PREFIXES
+        return [Path(p) / "Cellar" for p in prefixes]
+
+    def _list_installed_cmd(self) -> Sequence[str]:
+        return ["brew", "list", "--formula", "-1"]
+
+    def _parse_installed(self, output: str) -> AbstractSet[str]:
+        return set(output.split())
+
+    def _installed_name(self, pkg: dict) -> str:
+        # Tap-qualified formulae (``user/tap/tool``) are listed as ``tool``.
+        return pkg["brew"].rsplit("/", 1)[-1]
+
     def is_pkg_installed(self, pkg: dict) -> bool:
         """Check if a Homebrew package is installed"""
-        return self._check_pkg_installed_by_output(pkg, ["brew", "list", "--formula"])
+        return self._check_pkg_installed_by_listing(pkg)
 
     def update_pkgs(self) -> bool:
         """Update all installed Homebrew packages"""
@@ -5,9 +5,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+from pathlib import Path
 from subprocess import CalledProcessError, CompletedProcess
-from typing import Sequence
+from typing import AbstractSet, Sequence
 
 from .installer_base import InstallerBase
 
@@ -34,9 +36,28 @@ class InstallerCargo(InstallerBase):
     def _install_flags(self) -> Sequence[str]:
         return ["install", "--locked"]
 
+    def _db_paths(self) -> Sequence[Path]:
+        home = Path(os.environ.get("CARGO_HOME") or Path.home() / ".cargo")
+        return [home / ".crates.toml", home / ".crates2.json"]
+
+    def _list_installed_cmd(self) -> Sequence[str]:
+        return ["cargo", "install", "--list"]
+
+    def _parse_installed(self, output: str) -> AbstractSet[str]:
+        """Crate names from ``cargo install --list`` output.
+
+        Each crate is an unindented ``name vX.Y.Z[ (source)]:`` line,
+        followed by its indented binaries.
+        """
+        return {
+            line.split()[0]
+            for line in output.splitlines()
+            if line.strip() and not line[0].isspace()
+        }
+
     def is_pkg_installed(self, pkg: dict) -> bool:
         """Check if a cargo package is installed"""
-        return self._check_pkg_installed_by_output(pkg, ["cargo", "install", "--list"])
+        return self._check_pkg_installed_by_listing(pkg)
 
     def update_or_install_rust(self) -> bool:
         """Update rustup and install stable if needed"""
@@ -8,15 +8,11 @@ from pathlib import Path
 from typing import Any, Mapping, Iterable, Optional
 
 from .environment import should_skip_for_os
-from .schema_validation import validate_packages
+from .schema_validation import HAS_JSONSCHEMA, get_json_validator, validate_packages
 
-try:
+if HAS_JSONSCHEMA:
     import jsonschema
 
-    HAS_JSONSCHEMA = True
-except ImportError:
-    HAS_JSONSCHEMA = False
-
 from ._compat import HAS_TOML, load_toml_file_strict  # noqa: F401  # HAS_TOML re-exported for callers
 
 log = logging.getLogger(__name__)
@@ -95,11 +91,11 @@ class InstallerConfigJSON(InstallerConfig):
         # Validate the JSON file based on the schema
         if HAS_JSONSCHEMA:
             try:
-                with open(
-                    InstallerConfigJSON.SCHEMA, "r", encoding="utf-8"
-                ) as schema_fh:
-                    schema = json.load(schema_fh)
-                    jsonschema.validate(config, schema)
+                validator = get_json_validator(InstallerConfigJSON.SCHEMA)
+                # Same error selection as jsonschema.validate().
+                error = jsonschema.exceptions.best_match(validator.iter_errors(config))
+                if error is not None:
+                    raise error
             except json.decoder.JSONDecodeError as e:
                 raise ValueError(f"Failed to load JSON schema\n{e}") from e
             except jsonschema.exceptions.ValidationError as e:
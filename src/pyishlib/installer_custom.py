@@ -93,6 +93,7 @@ class InstallerCustom:
             install_unless_found = self.install_custom_pkg_unless_found
             is_installed = self.is_custom_pkg_installed
             is_pkg_available = self.can_use_custom
+            prefetch = self.prefetch_custom_pkgs
             update = self.update_custom_pkgs
             update_and_install_all = self.update_and_install_all
 
@@ -249,6 +250,9 @@ class InstallerCustom:
             return self.install_custom_pkg(pkg)
         return True
 
+    def prefetch_custom_pkgs(self, pkgs: Iterable[dict]) -> None:
+        """Bulk-probe custom packages (no-op for custom installer)."""
+
     def update_custom_pkgs(self) -> bool:
         """Update custom packages (no-op for custom installer)."""
         log.debug("Custom installer has no global update mechanism")
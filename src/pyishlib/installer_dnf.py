@@ -3,21 +3,45 @@
 """Helper library for dnf package installing tasks"""
 
 import logging
+import re
 import subprocess
+from pathlib import Path
 from subprocess import CalledProcessError
-from typing import Any, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Set
 
+from .command_runner import CommandRunner
 from .installer_base import InstallerBase
 from .version_check import meets_min_version
 
 log = logging.getLogger(__name__)
 
+# rpm database locations: sqlite backend (current and pre-sysimage), then
+# the legacy Berkeley DB file.
+_RPM_DBS = (
+    Path("/usr/lib/sysimage/rpm/rpmdb.sqlite"),
+    Path("/var/lib/rpm/rpmdb.sqlite"),
+    Path("/var/lib/rpm/Packages"),
+)
+
+# System-wide repo metadata caches of dnf4 and dnf5; each repo's
+# repomd.xml is replaced whenever its metadata is refreshed.
+_DNF_CACHES = (Path("/var/cache/dnf"), Path("/var/cache/libdnf5"))
+
+# Specs that name a package (optionally ``name.arch``) rather than a glob
+# or provide; only these are answered from a bulk repoquery.
+_PLAIN_SPEC_RE = re.compile(r"^[A-Za-z0-9_.+-]+$")
+
 
 class InstallerDnf(InstallerBase):
     """Helper class for managing dnf packages"""
 
     INSTALLER_NAME: str = "dnf"
 
+    def __init__(self, runner: CommandRunner) -> None:
+        super().__init__(runner)
+        # Populated by prefetch_available(): spec -> known to the repos.
+        self._available_cache: Dict[str, bool] = {}
+
     def _tool_cmd(self) -> str:
         return "dnf"
 
@@ -30,6 +54,71 @@ class InstallerDnf(InstallerBase):
     def _needs_sudo_for_install(self) -> bool:
         return True
 
+    def _db_paths(self) -> Sequence[Path]:
+        return _RPM_DBS
+
+    def _index_paths(self) -> Sequence[Path]:
+        paths = [Path("/etc/yum.repos.d")]
+        # dnf5 run as a regular user keeps its own cache.
+        for cache in (*_DNF_CACHES, Path.home() / ".cache" / "libdnf5"):
+            paths.extend(sorted(cache.glob("*/repodata/repomd.xml")))
+        return paths
+
+    def prefetch_available(self, pkgs: Sequence[dict]) -> None:
+        """Resolve availability for *pkgs* with one ``dnf repoquery``.
+
+        Every plain name (or ``name.arch``) spec absent from the output is
+        recorded as unavailable.  Globs and other specs are left to the
+        per-package ``dnf info`` in :meth:`is_pkg_available`, as is
+        everything if the query fails.  The query also runs in dry-run
+        mode, so the cache never holds a synthetic empty answer.
+        """
+        if not self.can_install():
+            return
+        specs = sorted(
+            {
+                p["dnf"]
+                for p in pkgs
+                if self.can_install(p) and _PLAIN_SPEC_RE.match(p["dnf"])
+            }
+            - set(self._available_cache)
+        )
+        if not specs:
+            return
+        try:
+            result = self.runner.run(
+                [
+                    "dnf",
+                    "repoquery",
+                    "--quiet",
+                    "--queryformat",
+                    "%{name} %{arch}\n",
+                    *specs,
+                ],
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                read_only=True,
+            )
+        except Exception:
+            return
+        if result.returncode != 0:
+            return
+        found: Set[str] = set()
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines():
+            parts = line.split()
+            if len(parts) == 2:
+                found.update((parts[0], f"{parts[0]}.{parts[1]}"))
+        for spec in specs:
+            self._available_cache[spec] = spec in found
+
+    def install_pkgs(self, pkgs: Sequence[dict]) -> bool:
+        """Install *pkgs* and forget the prefetched availability."""
+        try:
+            return super().install_pkgs(pkgs)
+        finally:
+            self._available_cache.clear()
+
     def is_pkg_installed(self, pkg: dict) -> bool:
         """Check if a dnf package is installed via ``rpm -q``.
 
@@ -72,6 +161,9 @@ class InstallerDnf(InstallerBase):
         if pkg is None or not self.can_install() or not self.can_install(pkg):
             return False
 
+        cached = self._available_cache.get(pkg["dnf"])
+        if cached is not None:
+            return cached
         try:
             result = self.runner.run(
                 ["dnf", "info", "--quiet", pkg["dnf"]],
@@ -88,5 +180,9 @@ class InstallerDnf(InstallerBase):
         self._require_available()
 
         log.info("Updating dnf packages")
-        self._run_cmd(["dnf", "upgrade", "-y"], sudo=True, action="updating")
+        try:
+            self._run_cmd(["dnf", "upgrade", "-y"], sudo=True, action="updating")
+        finally:
+            # upgrade refreshes repo metadata first.
+            self._available_cache.clear()
         return True
@@ -4,9 +4,14 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import re
+import site
 import sys
-from typing import Sequence
+import sysconfig
+from pathlib import Path
+from typing import AbstractSet, Sequence
 
 from .command_runner import CommandRunner
 from .environment import is_windows
@@ -14,6 +19,9 @@ from .installer_base import InstallerBase
 
 log = logging.getLogger(__name__)
 
+# Leading distribution name of a requirement (``black[jupyter]>=24`` -> ``black``).
+_PIP_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
 
 class InstallerPip(InstallerBase):
     """Helper class for managing python packages via pip"""
@@ -44,6 +52,20 @@ class InstallerPip(InstallerBase):
     def _pkg_key(self) -> str:
         return "pip"
 
+    def _db_paths(self) -> Sequence[Path]:
+        """User and interpreter site-packages directories.
+
+        ``pip3`` is not necessarily the running interpreter's pip, so the
+        per-user site-packages of every Python version are included.
+        """
+        paths = {
+            Path(site.getusersitepackages()),
+            Path(sysconfig.get_paths()["purelib"]),
+            Path(sysconfig.get_paths()["platlib"]),
+        }
+        paths.update(Path(site.getuserbase()).glob("lib/python*/site-packages"))
+        return sorted(paths)
+
     @property
     def pip_install_cmd(self) -> list[str]:
         """Get the pip install command for the current platform"""
@@ -80,9 +102,29 @@ class InstallerPip(InstallerBase):
         """Pip's install invocation is ``[*pip_cmd, "install", "--user", ...]``."""
         return [*self.pip_install_cmd, *pkg_names]
 
+    def _list_installed_cmd(self) -> Sequence[str]:
+        return [*self._pip_cmd, "list", "--format=json"]
+
+    def _parse_installed(self, output: str) -> AbstractSet[str]:
+        """Normalised names from ``pip list --format=json`` output."""
+        try:
+            entries = json.loads(output or "[]")
+        except ValueError:
+            log.debug("pip: could not parse pip list output")
+            return set()
+        return {
+            _normalise_pip_name(e["name"])
+            for e in entries
+            if isinstance(e, dict) and isinstance(e.get("name"), str)
+        }
+
+    def _installed_name(self, pkg: dict) -> str:
+        match = _PIP_NAME_RE.match(pkg["pip"].strip())
+        return _normalise_pip_name(match.group(0) if match else pkg["pip"])
+
     def is_pkg_installed(self, pkg: dict) -> bool:
         """Check if a pip package is installed"""
-        return self._check_pkg_installed_by_output(pkg, [*self._pip_cmd, "list"])
+        return self._check_pkg_installed_by_listing(pkg)
 
     def update_pkgs(self) -> bool:
         """Update all installed pip packages"""
@@ -94,3 +136,8 @@ class InstallerPip(InstallerBase):
         )
         log.warning("pip update not implemented (only updates pip itself)")
         return True
+
+
+def _normalise_pip_name(name: str) -> str:
+    """Normalise a distribution name per PEP 503 (``Foo_Bar`` -> ``foo-bar``)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
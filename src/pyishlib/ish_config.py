@@ -3,7 +3,6 @@
 # Copyright (C) 2024-2026 Hans Liljestrand <hans@liljestrand.dev>
 """Shared configuration for pyishlib components."""
 
-import json
 import logging
 import sys
 from dataclasses import dataclass, field
@@ -14,6 +13,7 @@ from typing import Any, Dict, Optional, Sequence, Tuple
 from .dotfile_context import DotfileContext
 
 from ._compat import atomic_write_text, load_toml_file, toml_escape_basic_string
+from .schema_validation import load_json_schema
 from .userio import prompt_string
 
 _log = logging.getLogger(__name__)
@@ -63,8 +63,7 @@ class IshConfig:
         nested object section, maps ``section.key`` → ``key``.  For
         top-level scalars, maps ``key`` → ``key``.
         """
-        with open(schema_path, encoding="utf-8") as fh:
-            schema = json.load(fh)
+        schema = load_json_schema(schema_path)
         flatten: Dict[str, str] = {}
         for section, sdef in schema.get("properties", {}).items():
             if sdef.get("type") == "object" and "properties" in sdef:
@@ -81,8 +80,7 @@ class IshConfig:
         Only checks for unknown top-level sections and unknown keys
         within known sections (mirrors ``additionalProperties: false``).
         """
-        with open(schema_path, encoding="utf-8") as fh:
-            schema = json.load(fh)
+        schema = load_json_schema(schema_path)
         allowed_sections = set(schema.get("properties", {}).keys())
         for key in data:
             if key not in allowed_sections:
@@ -325,14 +325,40 @@ def read_metadata(
         ValueError: If the embedded text is not valid TOML.
     """
     file_path = Path(file_path)
-
-    # Try embedded metadata
-    embedded = None
     try:
         text = file_path.read_text(encoding="utf-8")
     except UnicodeDecodeError:
         text = None
+    return parse_metadata(file_path, text, validate=validate)
+
+
+def parse_metadata(
+    file_path: Union[str, Path],
+    text: Optional[str],
+    validate: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Like :func:`read_metadata`, but use already-read file content.
+
+    Lets callers that need the file text anyway (e.g.
+    :class:`~pyishlib.file_preprocessor.ParsedSource`) avoid reading the
+    file a second time.  The ``.ish`` sidecar is still read from disk.
+
+    Args:
+        file_path: Path the content was read from (locates the sidecar).
+        text:      The file content, or None if it is not valid UTF-8.
+        validate:  Whether to validate the metadata against the schema.
 
+    Returns:
+        Parsed TOML metadata as a dictionary, or None if no metadata found.
+
+    Raises:
+        ImportError: If TOML support is not available.
+        ValueError: If the embedded text is not valid TOML.
+    """
+    file_path = Path(file_path)
+
+    # Try embedded metadata
+    embedded = None
     if text is not None:
         raw = _extract_embedded(text)
         if raw is not None:
@@ -13,7 +13,9 @@ from typing import Optional
 
 from ..dotfile_applier import DotfileApplier
 from ..dotfile_finder import DotfileFinder
+from ..dotfile_index import DotfileIndex
 from ..ish_config import IshConfig
+from ..staging_store import StagingStore
 from .ignore import build_ignore
 
 
@@ -34,7 +36,9 @@ def make_applier(
 
     Reads ``source``, ``target``, and ``patterns`` from *cfg* and
     constructs the appropriate :class:`DotfileIgnore` with ishfiles
-    defaults.
+    defaults, plus the persistent :class:`DotfileIndex` used for
+    change detection and the :class:`StagingStore` of preprocessed
+    output.
 
     Args:
         cfg: Resolved ishfiles configuration.
@@ -53,4 +57,6 @@ def make_applier(
         cfg=cfg,
         finder=finder,
         dotfile_ignore=di,
+        index=DotfileIndex.from_cfg(cfg),
+        store=StagingStore.from_cfg(cfg),
     )
@@ -2,9 +2,11 @@
 # Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
 """Command-line interface for ishfiles.
 
-Entry point for the ``ishfiles`` tool.  Subcommands are declared as
+Entry point for the ``ishfiles`` tool.  Subcommands are implemented as
 :class:`~pyishlib.cli_command.CliCommand` subclasses in
-:mod:`~pyishlib.ishfiles.commands` and listed on :class:`IshfilesCLI`.
+:mod:`~pyishlib.ishfiles.commands` and declared (name, help, arguments)
+in :mod:`~pyishlib.ishfiles.commands.registry`, so each implementation
+is imported only when its subcommand runs.
 """
 
 from __future__ import annotations
@@ -13,23 +15,7 @@ import argparse
 from typing import Any, List, Optional
 
 from ..cli_base import BaseCLI, _ExplicitStore
-from .commands.add import AddCommand
-from .commands.apply import ApplyCommand
-from .commands.cd import CdCommand
-from .commands.commit import CommitCommand
-from .commands.config import ConfigCommand
-from .commands.diff import DiffCommand
-from .commands.doctor import DoctorCommand
-from .commands.external import ExternalCommand
-from .commands.git import GitCommand
-from .commands.init import InitCommand
-from .commands.install import InstallCommand
-from .commands.log import LogCommand
-from .commands.pd import PdCommand
-from .commands.pull import PullCommand
-from .commands.push import PushCommand
-from .commands.runscripts import RunscriptsCommand
-from .commands.status import StatusCommand
+from .commands.registry import COMMANDS
 from .config import load_config
 from .data import process_data_template
 
@@ -39,25 +25,7 @@ class IshfilesCLI(BaseCLI):
 
     PROG = "ishfiles"
     DESCRIPTION = "Manage dotfiles from an ishfiles repository."
-    COMMANDS = (
-        AddCommand,
-        ApplyCommand,
-        CdCommand,
-        CommitCommand,
-        ConfigCommand,
-        DiffCommand,
-        DoctorCommand,
-        ExternalCommand,
-        GitCommand,
-        InitCommand,
-        InstallCommand,
-        LogCommand,
-        PdCommand,
-        PullCommand,
-        PushCommand,
-        RunscriptsCommand,
-        StatusCommand,
-    )
+    COMMANDS = COMMANDS
 
     def add_global_args(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
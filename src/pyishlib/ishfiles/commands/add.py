@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import filecmp
 import logging
 import os
@@ -14,7 +13,6 @@ from typing import List, Sequence, Tuple
 
 from ...cli_command import CliCommand
 from ...command_runner import CommandRunner
-from ...completions import FILE as _COMPLETE_FILE
 from ...dotfile_finder import DotfileFinder
 from ...file_preprocessor import (
     has_directives,
@@ -106,56 +104,6 @@ def _expand_directory_args(
 class AddCommand(CliCommand):
     """Add files to the dotfiles repository."""
 
-    NAME = "add"
-    HELP = "Add files to the dotfiles repository"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        files_arg = parser.add_argument(
-            "files",
-            nargs="*",
-            help="File(s) to add to the dotfiles repository",
-        )
-        files_arg.complete = _COMPLETE_FILE  # type: ignore[attr-defined]
-        parser.add_argument(
-            "-f",
-            "--force",
-            action="store_true",
-            default=False,
-            help="Overwrite dirty files in the dotfiles repository",
-        )
-        parser.add_argument(
-            "-u",
-            "--update",
-            action="store_true",
-            default=False,
-            help=(
-                "Re-add every file already tracked in the dotfiles "
-                "repository. Identical files are skipped (existing "
-                "duplicate detection), so only changed files are "
-                "actually copied. Combine with explicit FILES to "
-                "include extra paths."
-            ),
-        )
-        parser.add_argument(
-            "--overwrite-template",
-            action="store_true",
-            default=False,
-            help=(
-                "Allow overwriting an existing source file that contains "
-                "templating constructs (${__ish_*} references, @ish "
-                "directives, or __ISH__ metadata). Refused by default to "
-                "prevent silent loss of template syntax."
-            ),
-        )
-        parser.add_argument(
-            "--no-git-add",
-            dest="git_add",
-            action="store_false",
-            default=True,
-            help="Do not stage added files with 'git add' in the dotfiles repo",
-        )
-
     def run(self) -> int:
         """Execute the add command.
 
@@ -1,21 +1,32 @@
 # SPDX-License-Identifier: MIT
 # Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
-"""The ``apply`` subcommand -- install dotfiles into the target directory."""
+"""The ``apply`` subcommand -- install dotfiles into the target directory.
+
+With ``--timings`` every phase, and every package probe, external,
+script and subprocess inside it, is recorded by a
+:class:`~pyishlib.timings.Tracer`.  A per-phase table is printed when
+apply finishes and the full trace is written next to the script run
+logs as ``run-<timestamp>-<pid>.trace.json`` (Chrome trace format).
+"""
 
 from __future__ import annotations
 
-import argparse
 import logging
+import os
+from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
 from ...cli_command import CliCommand
+from ...file_preprocessor import ParsedSource
 from ...ish_config import IshConfig
 from ...launchers import install_all as _install_launchers_impl
+from ...timings import Tracer, phase, tracing
 from ...userio import prompt_yes_no_always
 from ..applier import make_applier, make_finder
 from ..default_shell import apply_default_shell_stage
 from ..installer_helper import run_install
-from ..script_logger import ScriptLogger
+from ..script_logger import ScriptLogger, default_log_dir
 from ..script_runner import run_scanned_scripts, scan_scripts
 from ..script_state import ScriptState
 from .external import apply_externals_stage
@@ -66,61 +77,34 @@ def _print_log_summary(slog: ScriptLogger, cfg: IshConfig) -> None:
         log.info("Scripts done: %s.", summary)
 
 
+def _report_timings(tracer: Tracer, cfg: IshConfig) -> None:
+    """Print the phase table and write the trace (unless in dry-run)."""
+    print(tracer.format_summary())
+    if cfg.dry_run:
+        return
+    ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = default_log_dir(cfg) / f"run-{ts}-{os.getpid()}.trace.json"
+    try:
+        tracer.write_chrome_trace(path)
+    except OSError as exc:
+        log.warning("Could not write trace %s: %s", path, exc)
+        return
+    log.info("Trace: %s", path)
+
+
 class ApplyCommand(CliCommand):
     """Apply dotfiles from the ishfiles folder to the target directory."""
 
-    NAME = "apply"
-    HELP = "Apply dotfiles from the ishfiles folder to the target directory"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "files",
-            nargs="*",
-            default=None,
-            help="Restrict to specific files (source or target paths)",
-        )
-        parser.add_argument(
-            "--dotfiles-only",
-            action="store_true",
-            default=False,
-            help="Skip package installation and scripts; apply dotfiles only",
-        )
-        parser.add_argument(
-            "--skip-launchers",
-            action="store_true",
-            default=False,
-            dest="skip_launchers",
-            help="Skip Phase 0 (tool launcher installation in ~/.local/bin).",
-        )
-        parser.add_argument(
-            "--force-scripts",
-            nargs="*",
-            metavar="SCRIPT",
-            default=None,
-            dest="force_scripts",
-            help=(
-                "Ignore run_when state for named scripts and re-run them. "
-                "With no arguments, force-runs all scripts."
-            ),
-        )
-        parser.add_argument(
-            "--yes",
-            "-y",
-            action="store_true",
-            default=False,
-            dest="yes",
-            help="Skip confirmation prompts and apply all changes automatically",
-        )
-        parser.add_argument(
-            "--isholate",
-            action="store_true",
-            default=False,
-            help=argparse.SUPPRESS,
-        )
-
     def run(self) -> int:
         """Execute the apply pipeline."""
+        tracer = Tracer() if self.cfg.get_opt("timings", default=False) else None
+        with tracing(tracer):
+            ret = self._run()
+        if tracer is not None:
+            _report_timings(tracer, self.cfg)
+        return ret
+
+    def _run(self) -> int:
         dotfiles_only = self.cfg.get_opt("dotfiles_only", default=False)
         force_scripts_arg = self.cfg.get_opt("force_scripts")
         force_scripts = force_scripts_arg
@@ -130,7 +114,8 @@ class ApplyCommand(CliCommand):
             log.debug("Skipping Phase 0: launcher installation (--skip-launchers)")
         else:
             log.info("Phase 0: Installing tool launchers in ~/.local/bin")
-            launcher_ret = _install_launchers(self.cfg)
+            with phase("launchers"):
+                launcher_ret = _install_launchers(self.cfg)
             if launcher_ret != 0:
                 log.warning("Some tool launchers could not be installed")
                 had_errors = True
@@ -143,25 +128,33 @@ class ApplyCommand(CliCommand):
 
         log.info("Phase 1: Scanning dotfiles and scripts for metadata")
 
-        dotfiles = applier.discover(files=rel_files)
-        dotfiles, dotfile_pkgs = applier.scan(dotfiles)
+        with phase("discover"):
+            dotfiles = applier.discover(files=rel_files)
+        with phase("scan"):
+            dotfiles, dotfile_pkgs = applier.scan(dotfiles)
 
-        if not dotfiles_only:
-            script_paths, script_pkgs = scan_scripts(self.cfg)
-        else:
-            script_paths, script_pkgs = [], []
+            script_sources: Dict[Path, ParsedSource] = {}
+            if not dotfiles_only:
+                script_paths, script_pkgs = scan_scripts(
+                    self.cfg, sources=script_sources
+                )
+            else:
+                script_paths, script_pkgs = [], []
 
         extra_packages = dotfile_pkgs + script_pkgs
         if extra_packages:
             log.info("Collected %d package(s) from file metadata", len(extra_packages))
 
         if not dotfiles_only:
-            ret = run_install(self.cfg, extra_packages=extra_packages)
+            with phase("install"):
+                ret = run_install(self.cfg, extra_packages=extra_packages)
             if ret != 0:
                 return ret
 
-        dotfiles = applier.prepare(dotfiles)
-        changes = applier.get_changes(dotfiles)
+        with phase("prepare"):
+            dotfiles = applier.prepare(dotfiles)
+        with phase("changes"):
+            changes = applier.get_changes(dotfiles)
         applier.print_changes(changes)
 
         if changes:
@@ -173,19 +166,21 @@ class ApplyCommand(CliCommand):
                         log.info("Aborted.")
                         return 0
 
-            applied = applier.apply_changes(changes)
+            with phase("write"):
+                applied = applier.apply_changes(changes)
             if applied:
                 log.info("Applied %d file(s).", applied)
 
         if not dotfiles_only:
             log.info("Phase 4b: Applying externals")
-            ext_ret = apply_externals_stage(self.cfg)
+            with phase("externals"):
+                ext_ret = apply_externals_stage(self.cfg)
             if ext_ret != 0:
                 log.warning("Some externals failed to fetch; continuing with scripts")
                 had_errors = True
 
         if not dotfiles_only and script_paths:
-            with ScriptLogger(self.cfg) as slog:
+            with phase("scripts"), ScriptLogger(self.cfg) as slog:
                 state = ScriptState.from_cfg(self.cfg)
                 ret = run_scanned_scripts(
                     self.cfg,
@@ -193,6 +188,7 @@ class ApplyCommand(CliCommand):
                     script_logger=slog,
                     script_state=state,
                     force_scripts=force_scripts,
+                    sources=script_sources,
                 )
                 _print_log_summary(slog, self.cfg)
             if ret != 0:
@@ -200,7 +196,8 @@ class ApplyCommand(CliCommand):
 
         if not dotfiles_only:
             log.info("Phase 6: Setting default login shell")
-            sh_ret = apply_default_shell_stage(self.cfg)
+            with phase("default_shell"):
+                sh_ret = apply_default_shell_stage(self.cfg)
             if sh_ret != 0:
                 had_errors = True
 
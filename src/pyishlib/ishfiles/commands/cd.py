@@ -15,12 +15,6 @@ from ..applier import make_finder
 class CdCommand(CliCommand):
     """Open a shell in the dotfiles source directory."""
 
-    NAME = "cd"
-    HELP = "Open a shell in the dotfiles source directory"
-    DESCRIPTION = (
-        "Change into the ishfiles source directory by spawning a new shell there."
-    )
-
     def run(self) -> int:
         """Exec a new interactive shell in the dotfiles source directory."""
         finder = make_finder(self.cfg)
@@ -11,7 +11,6 @@ persists a value to whichever user TOML was resolved at startup.
 
 from __future__ import annotations
 
-import argparse
 import logging
 from pathlib import Path
 from typing import Any, List, Optional, Tuple
@@ -42,37 +41,6 @@ _WRITABLE_SECTIONS = frozenset({"ishfiles", "ignore", "data"})
 class ConfigCommand(CliCommand):
     """View or modify ishfiles configuration."""
 
-    NAME = "config"
-    HELP = "View or modify the resolved ishfiles configuration"
-    DESCRIPTION = (
-        "View the resolved ishfiles configuration.  Use --show-origins to "
-        "see which layer (constant/cli/user-config/repo-config/default) "
-        "supplied each value, or --set <section.key> <value> to persist a "
-        "value to the user config TOML resolved at startup."
-    )
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        group = parser.add_mutually_exclusive_group()
-        group.add_argument(
-            "--show-origins",
-            action="store_true",
-            help=(
-                "Annotate each value with the layer that supplied it "
-                "(constant/cli/user-config/repo-config/default)."
-            ),
-        )
-        group.add_argument(
-            "--set",
-            dest="set_kv",
-            nargs=2,
-            metavar=("KEY", "VALUE"),
-            help=(
-                "Persist KEY=VALUE to the user config (KEY is dotted, "
-                "e.g. ishfiles.source)."
-            ),
-        )
-
     def run(self) -> int:
         set_kv = self.cfg.get_opt("set_kv", None)
         if set_kv is not None:
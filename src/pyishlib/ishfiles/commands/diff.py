@@ -4,13 +4,19 @@
 
 from __future__ import annotations
 
-import argparse
 import json
 import tempfile
 from pathlib import Path
+from typing import List
 
 from ...cli_command import CliCommand
-from ...diff import print_diff, print_new_file, print_binary_diff
+from ...diff import (
+    DiffEntry,
+    print_binary_diff,
+    print_diff,
+    print_diffs,
+    print_new_file,
+)
 from ...dotfile import DotFile, ChangeType
 from ...json_merge import canonical_json
 from ..applier import make_applier, make_finder
@@ -70,26 +76,31 @@ def _show_diff(dotfile: DotFile) -> None:
     )
 
 
-class DiffCommand(CliCommand):
-    """Show a unified diff of what would change."""
+def _diff_entry(dotfile: DotFile) -> DiffEntry:
+    """Build the :func:`~pyishlib.diff.print_diffs` entry for a dotfile."""
+    if dotfile.get_change_type() == ChangeType.NEW:
+        return DiffEntry(
+            old=None, new=dotfile.effective_source, new_label=str(dotfile.target)
+        )
+    old_text = None
+    if dotfile.mergejson:
+        try:
+            target_data = json.loads(dotfile.target.read_text(encoding="utf-8"))
+            old_text = canonical_json(target_data)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            old_text = None
+    return DiffEntry(
+        old=dotfile.target, new=dotfile.effective_source, old_text=old_text
+    )
 
-    NAME = "diff"
-    HELP = "Show a unified diff of what would change"
 
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "files",
-            nargs="*",
-            default=None,
-            help="Restrict to specific files (source or target paths)",
-        )
-        parser.add_argument(
-            "--name-only",
-            action="store_true",
-            default=False,
-            help="Show only the names of changed files, not the diff",
-        )
+def _show_diffs(changes: List[DotFile]) -> None:
+    """Print diffs for a whole change set without forking per file."""
+    print_diffs(_diff_entry(dotfile) for dotfile in changes)
+
+
+class DiffCommand(CliCommand):
+    """Show a unified diff of what would change."""
 
     def run(self) -> int:
         finder = make_finder(self.cfg)
@@ -112,11 +123,13 @@ class DiffCommand(CliCommand):
                 print("Everything is up to date.")
             return 0
 
-        name_only = self.cfg.get_opt("name_only", default=False)
-        for dotfile in changes:
-            if name_only:
+        if self.cfg.get_opt("name_only", default=False):
+            for dotfile in changes:
                 print(dotfile.target)
-            else:
+        elif self.cfg.get_opt("per_file", default=False):
+            for dotfile in changes:
                 _show_diff(dotfile)
+        else:
+            _show_diffs(changes)
 
         return 1
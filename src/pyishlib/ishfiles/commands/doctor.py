@@ -90,16 +90,6 @@ _STATUS_TAG = {
 class DoctorCommand(CliCommand):
     """Report availability of optional Python packages."""
 
-    NAME = "doctor"
-    HELP = "Report availability of optional Python packages"
-    DESCRIPTION = (
-        "Report which optional Python packages are installed.  None "
-        "of the packages listed here are required for ishlib's base "
-        "functionality -- each one simply enables an enhancement "
-        "(for example, `shtab` is needed to generate shell "
-        "tab-completion scripts from `ishfiles init --bash/--zsh`)."
-    )
-
     def run(self) -> int:
         problems = 0
         name_w = max(len(d.distribution) for d in OPTIONAL_DEPS)
@@ -16,7 +16,6 @@ The :func:`apply_externals_stage` helper is shared with the
 
 from __future__ import annotations
 
-import argparse
 import logging
 import re
 from pathlib import Path
@@ -25,10 +24,12 @@ from typing import Optional, Sequence
 from ...cli_command import CliCommand
 from ...command_runner import CommandRunner
 from ...ish_config import IshConfig
+from ...parallel import resolve_jobs
+from ...timings import span
 from ...userio import prompt_yes_no_always
 from ..externals_config import ExternalSpec, load_externals
 from ..externals_state import ExternalsState
-from ..externals import ExternalsEngine
+from ..externals import ExternalsEngine, check_updates, fetch_many
 
 log = logging.getLogger(__name__)
 
@@ -66,9 +67,16 @@ def run_update(cfg: IshConfig) -> int:
     config_file = cfg.get_opt("externals_config_file")
     config_path = source / config_dir / config_file
 
-    updated = 0
-    for spec in specs:
-        candidate = engine.check_update(spec, include_prereleases=include_pre)
+    jobs = resolve_jobs(cfg.get_opt("externals_jobs"))
+    accepted = []
+    for outcome in check_updates(
+        engine, specs, include_prereleases=include_pre, jobs=jobs
+    ):
+        spec = outcome.item
+        if outcome.error is not None:
+            log.warning("Update check failed for %s: %s", spec.path, outcome.error)
+            continue
+        candidate = outcome.result()
         if candidate is None:
             log.info("  %s: already at latest (%s)", spec.path, spec.revision)
             continue
@@ -91,15 +99,20 @@ def run_update(cfg: IshConfig) -> int:
         if do_update:
             engine.rewrite_revision(spec, candidate.latest_tag, config_path)
             spec.revision = candidate.latest_tag
-            try:
-                engine.fetch(spec, force=True)
-                log.info("  Updated %s to %s", spec.path, candidate.latest_tag)
-                updated += 1
-            except Exception as exc:  # noqa: BLE001
-                log.error("Failed to fetch %s after update: %s", spec.path, exc)
+            accepted.append(spec)
         else:
             log.info("  Skipped %s", spec.path)
 
+    updated = 0
+    for fetched in fetch_many(engine, accepted, force=True, jobs=jobs):
+        if fetched.error is not None:
+            log.error(
+                "Failed to fetch %s after update: %s", fetched.item.path, fetched.error
+            )
+            continue
+        log.info("  Updated %s to %s", fetched.item.path, fetched.item.revision)
+        updated += 1
+
     if updated:
         log.info(
             "%d external(s) updated. Run 'ishfiles external apply' to copy into target.",
@@ -135,64 +148,6 @@ def run_list(cfg: IshConfig) -> int:
 class ExternalCommand(CliCommand):
     """Manage external git-repo dotfiles (nested: apply/update/list)."""
 
-    NAME = "external"
-    HELP = "Manage external git-repo dotfiles"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        sub = parser.add_subparsers(dest="external_cmd", required=True)
-
-        pa = sub.add_parser(
-            "apply",
-            help="Fetch (if stale) and copy externals into the target home directory",
-        )
-        pa.add_argument(
-            "paths",
-            nargs="*",
-            metavar="PATH",
-            help="Restrict to specific externals (relative target paths, e.g. .fzf)",
-        )
-        pa.add_argument(
-            "--force",
-            action="store_true",
-            default=False,
-            help="Re-fetch from the remote even if the cached revision is still fresh",
-        )
-        pa.set_defaults(func=lambda cfg: run_apply(cfg))
-
-        pu = sub.add_parser(
-            "update",
-            help="Check remote repositories for newer tagged releases",
-        )
-        pu.add_argument(
-            "paths",
-            nargs="*",
-            metavar="PATH",
-            help="Restrict to specific externals",
-        )
-        pu.add_argument(
-            "-y",
-            "--yes",
-            action="store_true",
-            default=False,
-            dest="update_yes",
-            help="Accept all updates without prompting",
-        )
-        pu.add_argument(
-            "--include-prereleases",
-            action="store_true",
-            default=False,
-            dest="include_prereleases",
-            help="Consider pre-release tags (rc, alpha, beta …) when checking for updates",
-        )
-        pu.set_defaults(func=lambda cfg: run_update(cfg))
-
-        pl = sub.add_parser(
-            "list",
-            help="Show pinned revisions and cache status",
-        )
-        pl.set_defaults(func=lambda cfg: run_list(cfg))
-
     def run(self) -> int:
         """Fallback when no sub-subcommand is given (argparse enforces required=True)."""
         log.warning("Usage: ishfiles external <apply|update|list>")
@@ -232,21 +187,26 @@ def apply_externals_stage(
     engine = ExternalsEngine(cfg, runner, state)
 
     target_root = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+    jobs = resolve_jobs(cfg.get_opt("externals_jobs"))
     had_error = False
 
-    for spec in specs:
+    # The git/network phase fans out; copying into the target stays serial
+    # and in config order so the result is deterministic.
+    log.info("Fetching %d external(s) (jobs=%d)", len(specs), jobs)
+    for outcome in fetch_many(engine, specs, force=force, jobs=jobs):
+        spec = outcome.item
         log.info("Processing external: %s", spec.path)
 
-        try:
-            fetch_result = engine.fetch(spec, force=force)
-        except Exception as exc:  # noqa: BLE001
-            log.error("Failed to fetch external %s: %s", spec.path, exc)
+        if outcome.error is not None:
+            log.error("Failed to fetch external %s: %s", spec.path, outcome.error)
             had_error = True
             _seed_context(cfg, spec, "")
             continue
+        fetch_result = outcome.result()
 
         try:
-            apply_result = engine.apply(spec, target_root)
+            with span(spec.path, "external.apply"):
+                apply_result = engine.apply(spec, target_root)
             log.info(
                 "Applied %s: %d copied, %d skipped",
                 spec.path,
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import os
 import subprocess
 import sys
@@ -16,17 +15,6 @@ from ..applier import make_finder
 class GitCommand(CliCommand):
     """Run a git command inside the dotfiles repository."""
 
-    NAME = "git"
-    HELP = "Run a git command inside the dotfiles repository"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "git_args",
-            nargs=argparse.REMAINDER,
-            help="Arguments passed directly to git",
-        )
-
     def run(self) -> int:
         """Execute a git command in the dotfiles source directory."""
         finder = make_finder(self.cfg)
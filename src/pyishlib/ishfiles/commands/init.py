@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import logging
 
 from ... import completions, tools
@@ -26,43 +25,6 @@ ishfiles() {
 class InitCommand(CliCommand):
     """Print shell integration code (eval in your shell rc)."""
 
-    NAME = "init"
-    HELP = "Print shell integration code (eval in your shell rc)"
-    DESCRIPTION = (
-        "Print shell integration code for ishfiles.  "
-        'Add `eval "$(ishfiles init --zsh)"` (or --bash) to your '
-        "~/.zshrc / ~/.bashrc to make `ishfiles cd` perform a real "
-        "directory change and to enable tab-completion for both "
-        "ishfiles and isholate (completion requires the optional "
-        "`shtab` package -- see `ishfiles doctor`)."
-    )
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        shell_group = parser.add_mutually_exclusive_group()
-        shell_group.add_argument(
-            "--sh",
-            action="store_const",
-            dest="shell",
-            const="sh",
-            help="Emit POSIX sh wrapper only (default, safe for dash/ash)",
-        )
-        shell_group.add_argument(
-            "--bash",
-            action="store_const",
-            dest="shell",
-            const="bash",
-            help="Emit POSIX wrapper plus bash completions (needs `shtab`)",
-        )
-        shell_group.add_argument(
-            "--zsh",
-            action="store_const",
-            dest="shell",
-            const="zsh",
-            help="Emit POSIX wrapper plus zsh completions (needs `shtab`)",
-        )
-        parser.set_defaults(shell=None)
-
     def run(self) -> int:
         shell = self.cfg.get_opt("shell", None)
 
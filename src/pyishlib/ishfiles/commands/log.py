@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import sys
 from pathlib import Path
 
@@ -34,35 +33,6 @@ def _get_logs(cfg: IshConfig):
 class LogCommand(CliCommand):
     """View recent ishfiles run logs."""
 
-    NAME = "log"
-    HELP = "View recent ishfiles run logs"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "-i",
-            "--index",
-            metavar="N",
-            type=int,
-            default=1,
-            dest="log_n",
-            help="Show the Nth most recent log (default: 1 = most recent)",
-        )
-        parser.add_argument(
-            "--list",
-            action="store_true",
-            default=False,
-            dest="log_list",
-            help="List available log files",
-        )
-        parser.add_argument(
-            "--path",
-            action="store_true",
-            default=False,
-            dest="log_path",
-            help="Print the path to the most recent log",
-        )
-
     def run(self) -> int:
         logs = _get_logs(self.cfg)
 
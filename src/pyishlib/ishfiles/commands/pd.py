@@ -13,14 +13,6 @@ from ..applier import make_finder
 class PdCommand(CliCommand):
     """Print the dotfiles source directory."""
 
-    NAME = "pd"
-    HELP = "Print the dotfiles source directory"
-    DESCRIPTION = (
-        "Print the resolved ishfiles source directory to stdout.  "
-        "Used by the shell wrapper from `ishfiles init` to resolve "
-        "the path before cd-ing into it."
-    )
-
     def run(self) -> int:
         finder = make_finder(self.cfg)
         source_dir = finder.source_dir
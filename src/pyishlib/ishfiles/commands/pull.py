@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import sys
 
 from ...cli_command import CliCommand
@@ -15,17 +14,6 @@ from ..applier import make_finder
 class PullCommand(CliCommand):
     """Pull (rebase) the dotfiles repository from its remote."""
 
-    NAME = "pull"
-    HELP = "Pull (rebase) the dotfiles repository from its remote"
-    DESCRIPTION = (
-        "Runs ``git pull --rebase`` on the dotfiles source directory.  "
-        "Always rebases; for merge-based pulls use ``ishfiles git pull``."
-    )
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        pass
-
     def run(self) -> int:
         finder = make_finder(self.cfg)
 
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import sys
 
 from ...cli_command import CliCommand
@@ -15,17 +14,6 @@ from ..applier import make_finder
 class PushCommand(CliCommand):
     """Push the dotfiles repository to its remote."""
 
-    NAME = "push"
-    HELP = "Push the dotfiles repository to its remote"
-    DESCRIPTION = (
-        "Runs ``git push`` on the dotfiles source directory.  "
-        "For non-default remote or branch, use ``ishfiles git push …``."
-    )
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        pass
-
     def run(self) -> int:
         finder = make_finder(self.cfg)
 
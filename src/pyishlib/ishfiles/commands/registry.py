@@ -0,0 +1,537 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Declarations of the ishfiles subcommands.
+
+Each subcommand's name, help and argument builder live here as a
+:class:`~pyishlib.cli_command.LazyCommand`; the implementing module under
+:mod:`pyishlib.ishfiles.commands` is imported only when the subcommand
+is dispatched.  Shell hooks that call ``ishfiles pd`` or ``ishfiles
+status`` therefore do not pay for importing the installers, externals or
+script runner.  Keep this module free of imports beyond the standard
+library and :mod:`pyishlib.cli_command` / :mod:`pyishlib.completions`.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from ...cli_command import LazyCommand, lazy_callable
+from ...completions import FILE as _COMPLETE_FILE
+
+#: Default ``ishfiles commit`` message.
+DEFAULT_COMMIT_MESSAGE = "Update ishfiles"
+
+
+def _target(module: str, attr: str) -> str:
+    return f"{__package__}.{module}:{attr}"
+
+
+# ---------------------------------------------------------------------------
+# Argument builders
+# ---------------------------------------------------------------------------
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    files_arg = parser.add_argument(
+        "files",
+        nargs="*",
+        help="File(s) to add to the dotfiles repository",
+    )
+    files_arg.complete = _COMPLETE_FILE  # type: ignore[attr-defined]
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        default=False,
+        help="Overwrite dirty files in the dotfiles repository",
+    )
+    parser.add_argument(
+        "-u",
+        "--update",
+        action="store_true",
+        default=False,
+        help=(
+            "Re-add every file already tracked in the dotfiles "
+            "repository. Identical files are skipped (existing "
+            "duplicate detection), so only changed files are "
+            "actually copied. Combine with explicit FILES to "
+            "include extra paths."
+        ),
+    )
+    parser.add_argument(
+        "--overwrite-template",
+        action="store_true",
+        default=False,
+        help=(
+            "Allow overwriting an existing source file that contains "
+            "templating constructs (${__ish_*} references, @ish "
+            "directives, or __ISH__ metadata). Refused by default to "
+            "prevent silent loss of template syntax."
+        ),
+    )
+    parser.add_argument(
+        "--no-git-add",
+        dest="git_add",
+        action="store_false",
+        default=True,
+        help="Do not stage added files with 'git add' in the dotfiles repo",
+    )
+
+
+def _apply_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=None,
+        help="Restrict to specific files (source or target paths)",
+    )
+    parser.add_argument(
+        "--dotfiles-only",
+        action="store_true",
+        default=False,
+        help="Skip package installation and scripts; apply dotfiles only",
+    )
+    parser.add_argument(
+        "--skip-launchers",
+        action="store_true",
+        default=False,
+        dest="skip_launchers",
+        help="Skip Phase 0 (tool launcher installation in ~/.local/bin).",
+    )
+    parser.add_argument(
+        "--force-scripts",
+        nargs="*",
+        metavar="SCRIPT",
+        default=None,
+        dest="force_scripts",
+        help=(
+            "Ignore run_when state for named scripts and re-run them. "
+            "With no arguments, force-runs all scripts."
+        ),
+    )
+    parser.add_argument(
+        "--yes",
+        "-y",
+        action="store_true",
+        default=False,
+        dest="yes",
+        help="Skip confirmation prompts and apply all changes automatically",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        default=False,
+        help=(
+            "Print how long each apply phase took and write a Chrome trace "
+            "of all phases, items and subprocesses next to the run logs"
+        ),
+    )
+    parser.add_argument(
+        "--isholate",
+        action="store_true",
+        default=False,
+        help=argparse.SUPPRESS,
+    )
+
+
+def _commit_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-m",
+        "--message",
+        default=DEFAULT_COMMIT_MESSAGE,
+        metavar="MSG",
+        help=f"Commit message (default: {DEFAULT_COMMIT_MESSAGE!r})",
+    )
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="After committing, run `git push` on the dotfiles repository.",
+    )
+
+
+def _config_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--show-origins",
+        action="store_true",
+        help=(
+            "Annotate each value with the layer that supplied it "
+            "(constant/cli/user-config/repo-config/default)."
+        ),
+    )
+    group.add_argument(
+        "--set",
+        dest="set_kv",
+        nargs=2,
+        metavar=("KEY", "VALUE"),
+        help=(
+            "Persist KEY=VALUE to the user config (KEY is dotted, "
+            "e.g. ishfiles.source)."
+        ),
+    )
+
+
+def _diff_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=None,
+        help="Restrict to specific files (source or target paths)",
+    )
+    parser.add_argument(
+        "--name-only",
+        action="store_true",
+        default=False,
+        help="Show only the names of changed files, not the diff",
+    )
+    parser.add_argument(
+        "--per-file",
+        action="store_true",
+        default=False,
+        help="Run git diff once per file instead of the built-in renderer",
+    )
+
+
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        dest="externals_jobs",
+        help=(
+            "Maximum number of externals fetched/queried concurrently "
+            "(default: ishfiles.externals_jobs from config, else 4)"
+        ),
+    )
+
+
+def _external_arguments(parser: argparse.ArgumentParser) -> None:
+    sub = parser.add_subparsers(dest="external_cmd", required=True)
+
+    pa = sub.add_parser(
+        "apply",
+        help="Fetch (if stale) and copy externals into the target home directory",
+    )
+    pa.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="Restrict to specific externals (relative target paths, e.g. .fzf)",
+    )
+    pa.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Re-fetch from the remote even if the cached revision is still fresh",
+    )
+    _add_jobs_argument(pa)
+    pa.set_defaults(func=lazy_callable(_target("external", "run_apply")))
+
+    pu = sub.add_parser(
+        "update",
+        help="Check remote repositories for newer tagged releases",
+    )
+    pu.add_argument(
+        "paths",
+        nargs="*",
+        metavar="PATH",
+        help="Restrict to specific externals",
+    )
+    pu.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        default=False,
+        dest="update_yes",
+        help="Accept all updates without prompting",
+    )
+    pu.add_argument(
+        "--include-prereleases",
+        action="store_true",
+        default=False,
+        dest="include_prereleases",
+        help="Consider pre-release tags (rc, alpha, beta …) when checking for updates",
+    )
+    _add_jobs_argument(pu)
+    pu.set_defaults(func=lazy_callable(_target("external", "run_update")))
+
+    pl = sub.add_parser(
+        "list",
+        help="Show pinned revisions and cache status",
+    )
+    pl.set_defaults(func=lazy_callable(_target("external", "run_list")))
+
+
+def _git_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "git_args",
+        nargs=argparse.REMAINDER,
+        help="Arguments passed directly to git",
+    )
+
+
+def _init_arguments(parser: argparse.ArgumentParser) -> None:
+    shell_group = parser.add_mutually_exclusive_group()
+    shell_group.add_argument(
+        "--sh",
+        action="store_const",
+        dest="shell",
+        const="sh",
+        help="Emit POSIX sh wrapper only (default, safe for dash/ash)",
+    )
+    shell_group.add_argument(
+        "--bash",
+        action="store_const",
+        dest="shell",
+        const="bash",
+        help="Emit POSIX wrapper plus bash completions (needs `shtab`)",
+    )
+    shell_group.add_argument(
+        "--zsh",
+        action="store_const",
+        dest="shell",
+        const="zsh",
+        help="Emit POSIX wrapper plus zsh completions (needs `shtab`)",
+    )
+    parser.set_defaults(shell=None)
+
+
+def _install_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "packages",
+        nargs="*",
+        default=None,
+        help="Restrict to specific package names (default: all)",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        default=False,
+        dest="show_plan",
+        help=(
+            "Print what would be installed, and why, without installing "
+            "anything or prompting"
+        ),
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        dest="plan_json",
+        help="With --plan, print the plan as JSON",
+    )
+
+
+def _log_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-i",
+        "--index",
+        metavar="N",
+        type=int,
+        default=1,
+        dest="log_n",
+        help="Show the Nth most recent log (default: 1 = most recent)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        default=False,
+        dest="log_list",
+        help="List available log files",
+    )
+    parser.add_argument(
+        "--path",
+        action="store_true",
+        default=False,
+        dest="log_path",
+        help="Print the path to the most recent log",
+    )
+
+
+def _runscripts_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "scripts",
+        nargs="*",
+        default=None,
+        help="Restrict to specific script names (default: all)",
+    )
+    parser.add_argument(
+        "--force",
+        nargs="*",
+        metavar="SCRIPT",
+        default=None,
+        dest="force_scripts",
+        help=(
+            "Ignore run_when state for named scripts and re-run them. "
+            "With no arguments, force-runs all scripts."
+        ),
+    )
+
+
+def _status_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--include-ignored",
+        action="store_true",
+        default=False,
+        help=(
+            "Also list git-ignored paths under 'Other source changes'. "
+            "Used by `ishproject status` because the ishproject worktree "
+            "tracks files that match the main repo's .git/info/exclude."
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+COMMANDS = (
+    LazyCommand(
+        "add",
+        _target("add", "AddCommand"),
+        help="Add files to the dotfiles repository",
+        arguments=_add_arguments,
+    ),
+    LazyCommand(
+        "apply",
+        _target("apply", "ApplyCommand"),
+        help="Apply dotfiles from the ishfiles folder to the target directory",
+        arguments=_apply_arguments,
+    ),
+    LazyCommand(
+        "cd",
+        _target("cd", "CdCommand"),
+        help="Open a shell in the dotfiles source directory",
+        description=(
+            "Change into the ishfiles source directory by spawning a new shell there."
+        ),
+    ),
+    LazyCommand(
+        "commit",
+        _target("commit", "CommitCommand"),
+        help="Commit all changes in the dotfiles repository",
+        description=(
+            "Runs ``git commit -a`` on the dotfiles source directory.  "
+            "Stages and commits all tracked modifications.  Defaults to the "
+            f"message ``{DEFAULT_COMMIT_MESSAGE}``; override with ``-m``.  "
+            "Pass ``--push`` to also push after a successful commit."
+        ),
+        arguments=_commit_arguments,
+    ),
+    LazyCommand(
+        "config",
+        _target("config", "ConfigCommand"),
+        help="View or modify the resolved ishfiles configuration",
+        description=(
+            "View the resolved ishfiles configuration.  Use --show-origins to "
+            "see which layer (constant/cli/user-config/repo-config/default) "
+            "supplied each value, or --set <section.key> <value> to persist a "
+            "value to the user config TOML resolved at startup."
+        ),
+        arguments=_config_arguments,
+    ),
+    LazyCommand(
+        "diff",
+        _target("diff", "DiffCommand"),
+        help="Show a unified diff of what would change",
+        arguments=_diff_arguments,
+    ),
+    LazyCommand(
+        "doctor",
+        _target("doctor", "DoctorCommand"),
+        help="Report availability of optional Python packages",
+        description=(
+            "Report which optional Python packages are installed.  None "
+            "of the packages listed here are required for ishlib's base "
+            "functionality -- each one simply enables an enhancement "
+            "(for example, `shtab` is needed to generate shell "
+            "tab-completion scripts from `ishfiles init --bash/--zsh`)."
+        ),
+    ),
+    LazyCommand(
+        "external",
+        _target("external", "ExternalCommand"),
+        help="Manage external git-repo dotfiles",
+        arguments=_external_arguments,
+    ),
+    LazyCommand(
+        "git",
+        _target("git", "GitCommand"),
+        help="Run a git command inside the dotfiles repository",
+        arguments=_git_arguments,
+    ),
+    LazyCommand(
+        "init",
+        _target("init", "InitCommand"),
+        help="Print shell integration code (eval in your shell rc)",
+        description=(
+            "Print shell integration code for ishfiles.  "
+            'Add `eval "$(ishfiles init --zsh)"` (or --bash) to your '
+            "~/.zshrc / ~/.bashrc to make `ishfiles cd` perform a real "
+            "directory change and to enable tab-completion for both "
+            "ishfiles and isholate (completion requires the optional "
+            "`shtab` package -- see `ishfiles doctor`)."
+        ),
+        arguments=_init_arguments,
+    ),
+    LazyCommand(
+        "install",
+        _target("install", "InstallCommand"),
+        help="Install packages defined in the ishfiles package config",
+        arguments=_install_arguments,
+    ),
+    LazyCommand(
+        "log",
+        _target("log", "LogCommand"),
+        help="View recent ishfiles run logs",
+        arguments=_log_arguments,
+    ),
+    LazyCommand(
+        "pd",
+        _target("pd", "PdCommand"),
+        help="Print the dotfiles source directory",
+        description=(
+            "Print the resolved ishfiles source directory to stdout.  "
+            "Used by the shell wrapper from `ishfiles init` to resolve "
+            "the path before cd-ing into it."
+        ),
+    ),
+    LazyCommand(
+        "pull",
+        _target("pull", "PullCommand"),
+        help="Pull (rebase) the dotfiles repository from its remote",
+        description=(
+            "Runs ``git pull --rebase`` on the dotfiles source directory.  "
+            "Always rebases; for merge-based pulls use ``ishfiles git pull``."
+        ),
+    ),
+    LazyCommand(
+        "push",
+        _target("push", "PushCommand"),
+        help="Push the dotfiles repository to its remote",
+        description=(
+            "Runs ``git push`` on the dotfiles source directory.  "
+            "For non-default remote or branch, use ``ishfiles git push …``."
+        ),
+    ),
+    LazyCommand(
+        "runscripts",
+        _target("runscripts", "RunscriptsCommand"),
+        help="Run scripts from the ishscripts folder",
+        arguments=_runscripts_arguments,
+    ),
+    LazyCommand(
+        "status",
+        _target("status", "StatusCommand"),
+        help="Show dotfile target/source status and git working-tree state",
+        description=(
+            "For each dotfile, compares the deployed target file against the "
+            "preprocessed source and shows whether they differ.  Also shows "
+            "which source files are dirty in git.  Non-dotfile changes "
+            "(ishscripts, ishconfig, untracked files, …) are listed separately."
+        ),
+        arguments=_status_arguments,
+    ),
+)
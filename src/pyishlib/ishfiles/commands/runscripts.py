@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import logging
 
 from ...cli_command import CliCommand
@@ -18,29 +17,6 @@ log = logging.getLogger(__name__)
 class RunscriptsCommand(CliCommand):
     """Run scripts from the ishscripts folder."""
 
-    NAME = "runscripts"
-    HELP = "Run scripts from the ishscripts folder"
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "scripts",
-            nargs="*",
-            default=None,
-            help="Restrict to specific script names (default: all)",
-        )
-        parser.add_argument(
-            "--force",
-            nargs="*",
-            metavar="SCRIPT",
-            default=None,
-            dest="force_scripts",
-            help=(
-                "Ignore run_when state for named scripts and re-run them. "
-                "With no arguments, force-runs all scripts."
-            ),
-        )
-
     def run(self) -> int:
         scripts = self.cfg.get_opt("scripts") or None
         force_scripts = self.cfg.get_opt("force_scripts")
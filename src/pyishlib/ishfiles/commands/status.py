@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import argparse
 import logging
 import sys
 from pathlib import Path
@@ -38,28 +37,6 @@ def _display_target(dotfile_target: Path, home: Path) -> str:
 class StatusCommand(CliCommand):
     """Show dotfile and git status."""
 
-    NAME = "status"
-    HELP = "Show dotfile target/source status and git working-tree state"
-    DESCRIPTION = (
-        "For each dotfile, compares the deployed target file against the "
-        "preprocessed source and shows whether they differ.  Also shows "
-        "which source files are dirty in git.  Non-dotfile changes "
-        "(ishscripts, ishconfig, untracked files, …) are listed separately."
-    )
-
-    @classmethod
-    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            "--include-ignored",
-            action="store_true",
-            default=False,
-            help=(
-                "Also list git-ignored paths under 'Other source changes'. "
-                "Used by `ishproject status` because the ishproject worktree "
-                "tracks files that match the main repo's .git/info/exclude."
-            ),
-        )
-
     def run(self) -> int:
         finder = make_finder(self.cfg)
 
@@ -73,6 +50,7 @@ class StatusCommand(CliCommand):
         applier = make_applier(self.cfg, finder=finder)
         dotfiles = applier.discover()
         dotfiles = applier.prepare(dotfiles)
+        changed = set(applier.get_changes(dotfiles))
 
         try:
             repo = GitRepo.discover(finder.source_dir)
@@ -93,7 +71,7 @@ class StatusCommand(CliCommand):
         for dotfile in dotfiles:
             source_name = dotfile.rel_path.as_posix()
             source_dirty = source_name in dirty_paths
-            target_changed = dotfile.get_change_type() is not None
+            target_changed = dotfile in changed
             matched_paths.add(source_name)
 
             if not source_dirty and not target_changed:
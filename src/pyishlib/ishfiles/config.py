@@ -79,6 +79,14 @@ _CONSTANTS = {
     "externals_config_file": "externals.toml",
     # Externals state filename inside <target>/.config/ishfiles/
     "externals_state_filename": "externals-state.json",
+    # Dotfile change-detection index filename inside <target>/.config/ishfiles/
+    "dotfile_index_filename": "dotfile-index.json",
+    # Installed-package cache filename inside <target>/.config/ishfiles/
+    "package_state_filename": "package-state.json",
+    # Version-probe cache filename inside <target>/.config/ishfiles/
+    "version_cache_filename": "version-cache.json",
+    # Preprocessed-output store directory inside <target>/.config/ishfiles/
+    "staging_store_dirname": "staging",
 }
 
 
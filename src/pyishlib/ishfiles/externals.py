@@ -5,7 +5,12 @@
 Public API
 ----------
 - :class:`ExternalsEngine` -- fetch / apply / update one external at a time.
+- :func:`fetch_many` / :func:`check_updates` -- run the network-bound
+  fetch and update-check steps for many externals on a bounded worker
+  pool; copying into the target stays serial.
 - :func:`copy_tree_nondestructive` -- per-file, never-prune copy helper.
+- :func:`copy_tree_incremental` -- the same copy driven by the checkout's
+  git tree and the manifest recorded by the previous apply.
 - :class:`FetchResult` -- result of :meth:`ExternalsEngine.fetch`.
 - :class:`ApplyResult` -- result of :meth:`ExternalsEngine.apply`.
 - :class:`UpdateCandidate` -- result of :meth:`ExternalsEngine.check_update`.
@@ -15,15 +20,20 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import json
 import logging
 import os
 import re
 import subprocess
+import time
 from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Optional, Sequence
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ..command_runner import CommandRunner
+from ..package_state import is_racy
+from ..parallel import DEFAULT_JOBS, TaskOutcome, map_bounded
+from ..timings import span
 from .externals_config import ExternalSpec
 from .externals_state import ExternalsState
 
@@ -33,6 +43,10 @@ log = logging.getLogger(__name__)
 _DEFAULT_EXCLUDES = {".git", ".github", "__pycache__"}
 _DEFAULT_EXCLUDE_GLOBS: tuple = ("*.pyc",)
 
+# git tree entry modes.
+_MODE_SYMLINK = "120000"
+_MODE_GITLINK = "160000"
+
 _PRERELEASE_RE = re.compile(r"(?i)(rc|alpha|beta|dev|pre|preview|snapshot|nightly)")
 
 
@@ -221,6 +235,13 @@ class ExternalsEngine:
     def apply(self, spec: ExternalSpec, target_root: Path) -> ApplyResult:
         """Copy the cached checkout into the target directory (non-destructive).
 
+        Files are listed from the checkout's git tree and compared against
+        the manifest recorded by the previous apply, so only paths whose
+        blob changed, or whose destination no longer matches its recorded
+        stat, are verified and copied (:func:`copy_tree_incremental`).
+        Falls back to :func:`copy_tree_nondestructive` when the tree
+        cannot be listed (e.g. no clone yet under dry-run).
+
         Args:
             spec:        External specification.
             target_root: Root target directory (usually ``$HOME``).
@@ -234,6 +255,23 @@ class ExternalsEngine:
             src = cache_dir / spec.strip_prefix
 
         dst = (target_root / spec.path).expanduser().resolve()
+        tree = _list_tree(cache_dir, self._runner, spec.strip_prefix)
+        if tree is not None:
+            key = json.dumps([spec.strip_prefix, spec.include, spec.exclude, str(dst)])
+            result, manifest = copy_tree_incremental(
+                src=src,
+                dst=dst,
+                runner=self._runner,
+                tree=tree,
+                previous=self._state.get_manifest(spec.path, key),
+                include=spec.include,
+                exclude=spec.exclude,
+                label=spec.path,
+            )
+            if not self._runner.dry_run:
+                self._state.set_manifest(spec.path, key, manifest)
+                self._state.save()
+            return result
         return copy_tree_nondestructive(
             src=src,
             dst=dst,
@@ -375,6 +413,55 @@ class ExternalsEngine:
         return cache_dir / spec.path.lstrip("/")
 
 
+# ---------------------------------------------------------------------------
+# Concurrent fan-out
+# ---------------------------------------------------------------------------
+
+
+def fetch_many(
+    engine: ExternalsEngine,
+    specs: Sequence[ExternalSpec],
+    force: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> List[TaskOutcome[ExternalSpec, FetchResult]]:
+    """Run :meth:`ExternalsEngine.fetch` for every spec on at most *jobs* threads.
+
+    Each external has its own cache directory, so the git work is
+    independent; state updates are serialised by
+    :class:`~.externals_state.ExternalsState`.
+
+    Returns:
+        One :class:`~pyishlib.parallel.TaskOutcome` per spec, in the order
+        of *specs*.  Fetch failures are captured in ``outcome.error``
+        rather than raised.
+    """
+
+    def _fetch(spec: ExternalSpec) -> FetchResult:
+        with span(spec.path, "external.fetch"):
+            return engine.fetch(spec, force=force)
+
+    return map_bounded(_fetch, specs, jobs)
+
+
+def check_updates(
+    engine: ExternalsEngine,
+    specs: Sequence[ExternalSpec],
+    include_prereleases: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> List[TaskOutcome[ExternalSpec, Optional[UpdateCandidate]]]:
+    """Run :meth:`ExternalsEngine.check_update` for every spec on *jobs* threads.
+
+    Returns:
+        One :class:`~pyishlib.parallel.TaskOutcome` per spec, in the order
+        of *specs*.
+    """
+    return map_bounded(
+        lambda spec: engine.check_update(spec, include_prereleases=include_prereleases),
+        specs,
+        jobs,
+    )
+
+
 # ---------------------------------------------------------------------------
 # copy_tree_nondestructive
 # ---------------------------------------------------------------------------
@@ -439,38 +526,75 @@ def copy_tree_nondestructive(
             if include and not _matches_any(str(rel), list(include)):
                 continue
 
-            src_file = src / rel
-            dst_file = dst / rel
-
-            # Handle symlinks in source.
-            if src_file.is_symlink():
-                link_target = os.readlink(src_file)
-                if dst_file.is_symlink() and os.readlink(dst_file) == link_target:
-                    result.skipped += 1
-                    continue
-                if runner.dry_run:
-                    result.copied += 1
-                    continue
-                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                if dst_file.exists() or dst_file.is_symlink():
-                    dst_file.unlink()
-                os.symlink(link_target, dst_file)
-                result.copied += 1
-                continue
+            _copy_file(src / rel, dst / rel, runner, result)
 
-            # Regular file: compare size + hash before copying.
-            if dst_file.exists() and not dst_file.is_symlink():
-                if dst_file.stat().st_size == src_file.stat().st_size and _sha256(
-                    dst_file
-                ) == _sha256(src_file):
-                    result.skipped += 1
-                    continue
+    return result
 
-            dst_file.parent.mkdir(parents=True, exist_ok=True)
-            runner.copy(src_file, dst_file)
-            result.copied += 1
 
-    return result
+def copy_tree_incremental(
+    src: Path,
+    dst: Path,
+    runner: CommandRunner,
+    tree: Dict[str, Tuple[str, str]],
+    previous: Optional[Dict[str, List[Any]]] = None,
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None,
+    label: str = "",
+) -> Tuple[ApplyResult, Dict[str, List[Any]]]:
+    """Copy the files listed in *tree* from *src* into *dst*.
+
+    Same filters and per-file semantics as :func:`copy_tree_nondestructive`,
+    but the file list comes from the git tree instead of walking *src*,
+    and a file is skipped without reading it when *previous* records the
+    same blob and the destination still has the recorded size, mtime
+    and inode.  Everything else is verified (size + SHA-256) and copied
+    as needed.
+
+    Args:
+        src:      Source directory (checkout, below any strip prefix).
+        dst:      Target directory.
+        runner:   :class:`~pyishlib.command_runner.CommandRunner` (dry-run).
+        tree:     ``{relative_path: (mode, blob_id)}`` from :func:`_list_tree`.
+        previous: Manifest returned by the previous call, or None.
+        include:  See :func:`copy_tree_nondestructive`.
+        exclude:  See :func:`copy_tree_nondestructive`.
+        label:    Human-readable label for log messages.
+
+    Returns:
+        ``(result, manifest)`` where *manifest* maps each verified path to
+        ``[mode, blob_id, size, mtime_ns, inode]`` of its destination.
+    """
+    result = ApplyResult(path=label)
+    manifest: Dict[str, List[Any]] = {}
+    previous = previous or {}
+    if not src.exists():
+        log.warning("copy_tree_incremental: source %s does not exist", src)
+        return result, manifest
+
+    now = time.time_ns()
+    for rel, (mode, oid) in sorted(tree.items()):
+        if mode == _MODE_GITLINK or not _is_selected(rel, include, exclude):
+            continue
+        src_file = src / rel
+        dst_file = dst / rel
+        if mode == _MODE_SYMLINK and src_file.is_dir():
+            continue  # os.walk does not descend into directory symlinks
+
+        entry = previous.get(rel)
+        if entry is not None and entry[:2] == [mode, oid]:
+            if _stat_key(dst_file) == entry[2:]:
+                result.skipped += 1
+                manifest[rel] = entry
+                continue
+
+        _copy_file(src_file, dst_file, runner, result)
+        if runner.dry_run:
+            continue
+        key = _stat_key(dst_file)
+        if key is not None and not is_racy(key[1], now):
+            manifest[rel] = [mode, oid, *key]
+
+    return result, manifest
 
 
 # ---------------------------------------------------------------------------
@@ -478,6 +602,101 @@ def copy_tree_nondestructive(
 # ---------------------------------------------------------------------------
 
 
+def _copy_file(
+    src_file: Path, dst_file: Path, runner: CommandRunner, result: ApplyResult
+) -> None:
+    """Copy one file or symlink unless *dst_file* already matches it."""
+    # Handle symlinks in source.
+    if src_file.is_symlink():
+        link_target = os.readlink(src_file)
+        if dst_file.is_symlink() and os.readlink(dst_file) == link_target:
+            result.skipped += 1
+            return
+        if runner.dry_run:
+            result.copied += 1
+            return
+        dst_file.parent.mkdir(parents=True, exist_ok=True)
+        if dst_file.exists() or dst_file.is_symlink():
+            dst_file.unlink()
+        os.symlink(link_target, dst_file)
+        result.copied += 1
+        return
+
+    # Regular file: compare size + hash before copying.
+    if dst_file.exists() and not dst_file.is_symlink():
+        if dst_file.stat().st_size == src_file.stat().st_size and _sha256(
+            dst_file
+        ) == _sha256(src_file):
+            result.skipped += 1
+            return
+
+    dst_file.parent.mkdir(parents=True, exist_ok=True)
+    runner.copy(src_file, dst_file)
+    result.copied += 1
+
+
+def _is_selected(
+    rel: str,
+    include: Optional[Sequence[str]],
+    exclude: Optional[Sequence[str]],
+) -> bool:
+    """Apply the :func:`copy_tree_nondestructive` filters to a tree path."""
+    *dirs, name = rel.split("/")
+    for d in dirs:
+        if d in _DEFAULT_EXCLUDES or _matches_any(d, exclude or []):
+            return False
+    if _matches_any(name, _DEFAULT_EXCLUDE_GLOBS):
+        return False
+    if exclude and _matches_any(rel, list(exclude)):
+        return False
+    if include and not _matches_any(rel, list(include)):
+        return False
+    return True
+
+
+def _list_tree(
+    checkout: Path, runner: CommandRunner, strip_prefix: Optional[str] = None
+) -> Optional[Dict[str, Tuple[str, str]]]:
+    """Return ``{path: (mode, blob_id)}`` for every file in HEAD of *checkout*.
+
+    Paths are relative to *strip_prefix* (entries outside it are left
+    out).  ``git ls-tree`` runs as a *read_only* command so it also
+    works under dry-run.  Returns None when the tree cannot be listed.
+    """
+    prefix = ""
+    if strip_prefix:
+        prefix = PurePosixPath(strip_prefix).as_posix().strip("/") + "/"
+    try:
+        proc = runner.git(
+            ["ls-tree", "-r", "-z", "--full-tree", "HEAD"],
+            work_dir=checkout,
+            read_only=True,
+            capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    tree: Dict[str, Tuple[str, str]] = {}
+    for record in proc.stdout.split(b"\0"):
+        if not record:
+            continue
+        info, _, raw_path = record.partition(b"\t")
+        fields = info.decode("ascii").split()
+        path = os.fsdecode(raw_path)
+        if len(fields) != 3 or not path.startswith(prefix):
+            continue
+        tree[path[len(prefix) :]] = (fields[0], fields[2])
+    return tree
+
+
+def _stat_key(path: Path) -> Optional[List[int]]:
+    """Return ``[size, mtime_ns, inode]`` of *path* (not following symlinks)."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
 def _matches_any(name: str, patterns: Sequence[str]) -> bool:
     return any(fnmatch.fnmatch(name, p) for p in patterns)
 
@@ -9,6 +9,13 @@ Stores per-external records in
 - ``commit_sha`` -- the resolved git commit SHA.
 - ``url`` -- the clone URL (for sanity-checking).
 - ``last_fetched`` -- Unix timestamp of the last successful fetch.
+- ``manifest`` -- what the last apply wrote (see
+  :func:`~pyishlib.ishfiles.externals.copy_tree_incremental`), plus the
+  key of the path/filter settings it was recorded under.
+
+Mutations and saves are serialised with a lock so that the concurrent
+fetch phase (see :func:`pyishlib.ishfiles.externals.fetch_many`) can
+record results from worker threads.
 
 Public API
 ----------
@@ -19,6 +26,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -37,6 +45,7 @@ class ExternalsState:
     def __init__(self, state_path: Path) -> None:
         self._path = state_path
         self._data: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
         self._load()
 
     # -- factory ---------------------------------------------------------------
@@ -80,12 +89,37 @@ class ExternalsState:
             url:          Clone URL (for sanity-checking on reload).
             last_fetched: Unix timestamp; defaults to ``time.time()``.
         """
-        self._data[path] = {
+        record = {
             "revision": revision,
             "commit_sha": commit_sha,
             "url": url,
             "last_fetched": last_fetched if last_fetched is not None else time.time(),
         }
+        with self._lock:
+            manifest = (self._data.get(path) or {}).get("manifest")
+            if manifest is not None:
+                record["manifest"] = manifest
+            self._data[path] = record
+
+    def get_manifest(self, path: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the apply manifest for *path* if it was recorded under *key*.
+
+        Args:
+            path: Relative target path.
+            key:  Identifies the source prefix, filters and destination the
+                  manifest is valid for.
+        """
+        manifest = (self._data.get(path) or {}).get("manifest")
+        if not isinstance(manifest, dict) or manifest.get("key") != key:
+            return None
+        files = manifest.get("files")
+        return files if isinstance(files, dict) else None
+
+    def set_manifest(self, path: str, key: str, files: Dict[str, Any]) -> None:
+        """Record the apply manifest *files* for *path* under *key*."""
+        with self._lock:
+            record = self._data.setdefault(path, {})
+            record["manifest"] = {"key": key, "files": files}
 
     def is_stale(self, path: str, refresh_period_secs: Optional[int]) -> bool:
         """Return ``True`` if the cached entry needs a remote re-fetch.
@@ -110,16 +144,17 @@ class ExternalsState:
 
     def save(self) -> None:
         """Write the current state to :attr:`path` (atomic replace)."""
-        try:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            tmp = self._path.with_suffix(".json.tmp")
-            tmp.write_text(
-                json.dumps(self._data, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
-            tmp.replace(self._path)
-        except OSError as exc:
-            log.warning("Could not save externals state to %s: %s", self._path, exc)
+        with self._lock:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".json.tmp")
+                tmp.write_text(
+                    json.dumps(self._data, indent=2, sort_keys=True),
+                    encoding="utf-8",
+                )
+                tmp.replace(self._path)
+            except OSError as exc:
+                log.warning("Could not save externals state to %s: %s", self._path, exc)
 
     @property
     def path(self) -> Path:
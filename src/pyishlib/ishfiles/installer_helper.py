@@ -15,6 +15,7 @@ Package config files are discovered in ``<source>/ishconfig/``:
 
 from __future__ import annotations
 
+import json
 import logging
 import subprocess
 from pathlib import Path
@@ -22,10 +23,12 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..command_runner import CommandRunner, UserDeclinedError
 from ..environment import normalise_os
-from ..installer import Installer
+from ..installer import InstallPlan, Installer
 from ..installer_config import InstallerConfigJSON, InstallerConfigTOML
 from ..ish_config import IshConfig
+from ..package_state import PackageStateCache
 from ..userio import prompt_bool
+from ..version_check import VersionProbeCache
 
 log = logging.getLogger(__name__)
 
@@ -187,6 +190,11 @@ def run_install(
     The ``--yes`` config flag (set by ``ishfiles apply --yes``) skips
     both prompts and treats them as "continue".
 
+    Packages are probed once, into an :class:`~pyishlib.installer.InstallPlan`
+    that drives the rest of the run.  With ``show_plan`` set (``ishfiles
+    install --plan``) the plan is printed -- as JSON with ``plan_json`` --
+    and nothing is installed.
+
     Args:
         cfg:            Resolved ishfiles configuration.
         packages:       Optional list of package names to install (default: all).
@@ -229,40 +237,43 @@ def run_install(
         all_pkgs = filtered
 
     runner = CommandRunner(cfg=cfg)
-    installer = Installer(cfg=cfg, runner=runner)
-    missing: List[Dict[str, Any]] = [
-        dict(p) for p in installer.get_missing_pkgs(all_pkgs)
-    ]
+    installer = Installer(
+        cfg=cfg,
+        runner=runner,
+        state=PackageStateCache.from_cfg(cfg),
+        versions=VersionProbeCache.from_cfg(cfg),
+    )
+    plan = installer.plan(all_pkgs)
+
+    if cfg.get_opt("show_plan", default=False):
+        print_plan(plan, as_json=bool(cfg.get_opt("plan_json", default=False)))
+        return 0
+
+    missing = plan.missing
 
     if not missing:
         if cfg.verbose:
             print("All packages are already installed.")
         return 0
 
-    # Split into required and optional
-    required = [p for p in missing if not p.get("optional")]
-    optional = [p for p in missing if p.get("optional")]
-
-    # Pre-filter both required and optional by repo availability so we don't
-    # try to install packages the configured backends report as unknown
-    # (e.g. an apt package that's actually only on snap, or a package that
-    # needs a PPA that isn't configured).
-    available_required: List[Dict[str, Any]] = []
-    unavailable_required: List[Dict[str, Any]] = []
-    for pkg in required:
-        if installer.pkg_is_available(pkg):
-            available_required.append(pkg)
-        else:
-            unavailable_required.append(pkg)
+    # Split into required and optional.  The plan has already checked
+    # each missing package against the configured repos, so packages the
+    # backends report as unknown (e.g. an apt package that's actually only
+    # on snap, or one that needs a PPA that isn't configured) are skipped.
+    required = [e for e in missing if not e.optional]
+    optional = [e for e in missing if e.optional]
+
+    available_required = [e.pkg for e in required if e.available]
+    unavailable_required = [e.pkg for e in required if not e.available]
 
     available_optional: List[Dict[str, Any]] = []
-    for pkg in optional:
-        if installer.pkg_is_available(pkg):
-            available_optional.append(pkg)
+    for entry in optional:
+        if entry.available:
+            available_optional.append(entry.pkg)
         else:
             log.warning(
                 "Skipping optional package %s (not available in configured repos)",
-                pkg["name"],
+                entry.name,
             )
 
     yes_flag = bool(cfg.get_opt("yes", default=False))
@@ -297,7 +308,7 @@ def run_install(
 
     if available_required:
         try:
-            installer.install_pkgs(available_required)
+            installer.install_pkgs(available_required, plan=plan)
         except UserDeclinedError:
             log.warning("Skipping required packages (user declined sudo)")
         except (subprocess.CalledProcessError, OSError) as exc:
@@ -309,10 +320,32 @@ def run_install(
 
     if available_optional:
         try:
-            installer.install_pkgs(available_optional)
+            installer.install_pkgs(available_optional, plan=plan)
         except UserDeclinedError:
             log.warning("Skipping optional packages (user declined sudo)")
         except (subprocess.CalledProcessError, OSError) as exc:
             log.warning("Optional package installation failed: %s", exc)
 
     return 0
+
+
+def print_plan(plan: InstallPlan, as_json: bool = False) -> None:
+    """Print *plan* as a table, or as JSON when *as_json* is set."""
+    if as_json:
+        print(json.dumps(plan.as_dict(), indent=2))
+        return
+    rows = [
+        (
+            e.name,
+            "installed" if e.installed else "install",
+            e.reason,
+            e.backend or "-",
+            "-" if e.available is None else ("yes" if e.available else "no"),
+            e.version or "-",
+        )
+        for e in plan.entries
+    ]
+    head = ("package", "action", "reason", "backend", "available", "version")
+    widths = [max(len(r[i]) for r in [head, *rows]) for i in range(len(head))]
+    for row in [head, *rows]:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip())
@@ -14,9 +14,15 @@ stdout/stderr is also captured and appended to the same log file.
 ``ish_critical`` sets an abort flag that prevents subsequent scripts from
 running.
 
+Scripts that run concurrently each get their own sink via
+:meth:`ScriptLogger.open_channel`, so structured messages are attributed
+to the script that wrote them rather than to whichever script was
+started last.
+
 Public API
 ----------
 - :class:`ScriptLogger` -- context manager owning one run log.
+- :func:`default_log_dir` -- where run logs (and apply traces) are written.
 - :func:`inject_prelude`  -- add the bash helper snippet after the shebang.
 
 Prelude injected into every shell script
@@ -43,7 +49,6 @@ run.
 
 from __future__ import annotations
 
-import errno
 import logging
 import os
 import select
@@ -135,6 +140,32 @@ def inject_prelude(text: str, ext: str = "") -> str:
     return BASH_PRELUDE + text
 
 
+class _Sink:
+    """One structured-message input read by the :class:`ScriptLogger` thread.
+
+    The shared run sink has ``script=None`` (messages are attributed to the
+    current script); per-script channels carry their script name.
+    """
+
+    __slots__ = ("path", "script", "fd", "fh", "buf", "closing", "claimed", "done")
+
+    def __init__(self, path: Path, script: Optional[str]) -> None:
+        self.path = path
+        self.script = script
+        self.fd: Optional[int] = None  # POSIX FIFO
+        self.fh: Optional[IO[bytes]] = None  # polled plain file (Windows)
+        self.buf = b""
+        self.closing = False
+        self.claimed = False
+        self.done = threading.Event()
+
+
+def default_log_dir(cfg) -> Path:
+    """Return the directory run logs are written to for *cfg*'s target."""
+    target = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+    return target / _LOG_DIR_SUFFIX
+
+
 class ScriptLogger:
     """Context manager that owns a per-run log file and structured log sink.
 
@@ -159,7 +190,9 @@ class ScriptLogger:
 
         self._log_path: Optional[Path] = None
         self._sink_path: Optional[Path] = None  # FIFO on POSIX, plain file on Windows
-        self._fifo_fd: Optional[int] = None  # only used on POSIX
+        self._sinks: List[_Sink] = []  # shared sink + open per-script channels
+        self._channels: Dict[str, _Sink] = {}
+        self._channel_seq: int = 0
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event: threading.Event = threading.Event()
         self._counts: Dict[str, int] = {k: 0 for k in _LEVELS}
@@ -187,19 +220,12 @@ class ScriptLogger:
         # temporary directory so it is cleaned up by __exit__.
         self._tmp_dir = tempfile.TemporaryDirectory(prefix="ishfiles_log_")
 
-        if _USE_FIFO:
-            self._sink_path = Path(self._tmp_dir.name) / "log.fifo"
-            os.mkfifo(self._sink_path)
-            # Open with O_RDWR | O_NONBLOCK so:
-            # - No blocking on open (no need for a writer to be present first).
-            # - Python acts as both reader and writer, preventing premature EOF.
-            # - Reads return EAGAIN when no data is available.
-            self._fifo_fd = os.open(str(self._sink_path), os.O_RDWR | os.O_NONBLOCK)
-        else:
-            # Windows: plain append-mode file.  Scripts write with Add-Content;
-            # the reader thread polls for new bytes.
-            self._sink_path = Path(self._tmp_dir.name) / "log.sink"
-            self._sink_path.write_bytes(b"")
+        # Open with O_RDWR | O_NONBLOCK (see _create_sink) so the FIFO never
+        # blocks on open and never reports a premature EOF.  On Windows the
+        # sink is a plain append-mode file that the reader thread polls.
+        suffix = "fifo" if _USE_FIFO else "sink"
+        self._sink_path = Path(self._tmp_dir.name) / f"log.{suffix}"
+        self._sinks = [self._create_sink(self._sink_path, None)]
 
         # Start background reader thread.
         self._stop_event.clear()
@@ -220,13 +246,12 @@ class ScriptLogger:
         if self._reader_thread is not None:
             self._reader_thread.join(timeout=5)
 
-        # Close the FIFO FD (POSIX only).
-        if self._fifo_fd is not None:
-            try:
-                os.close(self._fifo_fd)
-            except OSError:
-                pass
-            self._fifo_fd = None
+        # Drain and close any sinks the reader thread did not finish.
+        with self._lock:
+            remaining = list(self._sinks)
+            self._channels.clear()
+        for sink in remaining:
+            self._finish_sink(sink)
 
         # Close the log file.
         if self._log_fh is not None:
@@ -257,6 +282,54 @@ class ScriptLogger:
             result["ISHLIB_SH"] = str(_ISHLIB_SH)
         return result
 
+    def open_channel(self, script_name: str) -> Dict[str, str]:
+        """Open a dedicated structured-message sink for one script.
+
+        Use instead of :meth:`env` when several scripts may run at the same
+        time: messages written to the returned ``ISHLIB_LOG_OUT`` are
+        attributed to *script_name* regardless of :meth:`set_current_script`.
+        Release it with :meth:`close_channel` once the script has exited.
+
+        Args:
+            script_name: Script filename (e.g. ``"50_setup_fzf.sh"``).
+
+        Returns:
+            Environment variables for the script subprocess (as :meth:`env`).
+        """
+        assert self._tmp_dir is not None, "ScriptLogger used outside its context"
+        with self._lock:
+            self._channel_seq += 1
+            seq = self._channel_seq
+            if script_name not in self._script_counts:
+                self._script_counts[script_name] = {k: 0 for k in _LEVELS}
+        suffix = "fifo" if _USE_FIFO else "sink"
+        sink = self._create_sink(
+            Path(self._tmp_dir.name) / f"script-{seq}.{suffix}", script_name
+        )
+        with self._lock:
+            self._sinks.append(sink)
+            self._channels[script_name] = sink
+        result = self.env()
+        result["ISHLIB_LOG_OUT"] = str(sink.path)
+        return result
+
+    def close_channel(self, script_name: str, timeout: float = 5.0) -> None:
+        """Read any remaining messages from *script_name*'s channel and close it.
+
+        Args:
+            script_name: Name previously passed to :meth:`open_channel`.
+            timeout:     Seconds to wait for the reader thread to drain it.
+        """
+        with self._lock:
+            sink = self._channels.pop(script_name, None)
+        if sink is None:
+            return
+        sink.closing = True
+        thread = self._reader_thread
+        if thread is not None and thread.is_alive():
+            sink.done.wait(timeout)
+        self._finish_sink(sink)
+
     @staticmethod
     def bash_prelude() -> str:
         """Return the bash snippet that defines ish_info/warning/error/critical."""
@@ -373,39 +446,92 @@ class ScriptLogger:
     # -- internal helpers ------------------------------------------------------
 
     def _default_log_dir(self) -> Path:
-        target = Path(self._cfg.get_opt("target") or Path.home()).expanduser().resolve()
-        return target / _LOG_DIR_SUFFIX
+        return default_log_dir(self._cfg)
+
+    def _create_sink(self, path: Path, script: Optional[str]) -> _Sink:
+        """Create the FIFO (POSIX) or plain file (Windows) backing a sink."""
+        sink = _Sink(path, script)
+        if _USE_FIFO:
+            os.mkfifo(path)
+            sink.fd = os.open(str(path), os.O_RDWR | os.O_NONBLOCK)
+        else:
+            path.write_bytes(b"")
+            sink.fh = open(path, "rb", buffering=0)  # noqa: WPS515
+        return sink
+
+    def _sink_snapshot(self) -> List[_Sink]:
+        with self._lock:
+            return list(self._sinks)
+
+    def _read_sink(self, sink: _Sink) -> bool:
+        """Read one chunk from *sink* and dispatch complete lines.
+
+        Returns True if any bytes were read.
+        """
+        try:
+            if sink.fd is not None:
+                chunk = os.read(sink.fd, 4096)
+            elif sink.fh is not None:
+                chunk = sink.fh.read(4096) or b""
+            else:
+                return False
+        except OSError:
+            # EAGAIN / EWOULDBLOCK on an empty FIFO, or a transient error.
+            return False
+        if not chunk:
+            return False
+        sink.buf += chunk
+        while b"\n" in sink.buf:
+            line, sink.buf = sink.buf.split(b"\n", 1)
+            self._dispatch(line.decode("utf-8", errors="replace"), sink.script)
+        return True
+
+    def _finish_sink(self, sink: _Sink) -> None:
+        """Drain *sink*, dispatch any unterminated line, and close it."""
+        with self._lock:
+            if sink.claimed:
+                return
+            sink.claimed = True
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+        while self._read_sink(sink):
+            pass
+        if sink.buf.strip():
+            self._dispatch(sink.buf.decode("utf-8", errors="replace"), sink.script)
+        sink.buf = b""
+        try:
+            if sink.fd is not None:
+                os.close(sink.fd)
+            if sink.fh is not None:
+                sink.fh.close()
+        except OSError:
+            pass
+        sink.fd = None
+        sink.fh = None
+        sink.done.set()
 
     def _reader_loop(self) -> None:
-        """Background thread: read from FIFO and dispatch structured lines."""
-        buf = b""
+        """Background thread: read from the FIFOs and dispatch structured lines."""
         while not self._stop_event.is_set():
-            fd = self._fifo_fd
-            if fd is None:
+            sinks = self._sink_snapshot()
+            fds = [sink.fd for sink in sinks if sink.fd is not None]
+            if not fds:
                 break
             try:
-                r, _, _ = select.select([fd], [], [], 0.05)
+                ready, _, _ = select.select(fds, [], [], 0.05)
             except (ValueError, OSError):
-                break
-            if not r:
+                # A channel was closed concurrently; retry with a fresh list.
                 continue
-            try:
-                chunk = os.read(fd, 4096)
-            except OSError as exc:
-                if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
-                    continue
-                break
-            if not chunk:
-                break
-            buf += chunk
-            while b"\n" in buf:
-                line, buf = buf.split(b"\n", 1)
-                self._dispatch(line.decode("utf-8", errors="replace"))
+            for sink in sinks:
+                if sink.closing:
+                    self._finish_sink(sink)
+                elif sink.fd in ready:
+                    self._read_sink(sink)
 
     def _reader_loop_polled(self) -> None:
-        """Background thread: poll a plain file and dispatch structured lines.
+        """Background thread: poll plain files and dispatch structured lines.
 
-        Used on Windows where POSIX FIFOs are not available.  The file is
+        Used on Windows where POSIX FIFOs are not available.  Each file is
         opened once and read from the current position on every poll cycle so
         only new (appended) bytes are processed — avoiding an O(log-size)
         re-read on every tick.
@@ -414,50 +540,25 @@ class ScriptLogger:
         before the signal, so no messages are lost in the race between the
         writer and the stop event.
         """
-        sink_path = self._sink_path
-        if sink_path is None:
-            return
-        buf = b""
-        try:
-            fh = open(sink_path, "rb", buffering=0)  # noqa: WPS515
-        except OSError:
-            return
-        try:
-            while not self._stop_event.is_set():
-                try:
-                    chunk = fh.read(4096)
-                except OSError:
-                    time.sleep(0.05)
-                    continue
-                if chunk:
-                    buf += chunk
-                    while b"\n" in buf:
-                        line, buf = buf.split(b"\n", 1)
-                        self._dispatch(line.decode("utf-8", errors="replace"))
-                else:
-                    time.sleep(0.05)
-            # Final drain: capture any bytes written just before stop was signalled.
-            try:
-                chunk = fh.read(4096)
-            except OSError:
-                chunk = b""
-            if chunk:
-                buf += chunk
-        finally:
-            try:
-                fh.close()
-            except OSError:
-                pass
-        # Dispatch any remaining complete lines.
-        while b"\n" in buf:
-            line, buf = buf.split(b"\n", 1)
-            self._dispatch(line.decode("utf-8", errors="replace"))
-        # Handle an unterminated final line (no trailing newline).
-        if buf.strip():
-            self._dispatch(buf.decode("utf-8", errors="replace"))
-
-    def _dispatch(self, line: str) -> None:
-        """Parse and handle one structured log line (``"level\\tmessage"``)."""
+        while not self._stop_event.is_set():
+            busy = False
+            for sink in self._sink_snapshot():
+                if sink.closing:
+                    self._finish_sink(sink)
+                elif self._read_sink(sink):
+                    busy = True
+            if not busy:
+                time.sleep(0.05)
+        # Final drain: capture any bytes written just before stop was signalled.
+        for sink in self._sink_snapshot():
+            self._finish_sink(sink)
+
+    def _dispatch(self, line: str, script: Optional[str] = None) -> None:
+        """Parse and handle one structured log line (``"level\\tmessage"``).
+
+        Messages are attributed to *script*, or to the current script
+        (:meth:`set_current_script`) when *script* is None.
+        """
         if "\t" not in line:
             return
         level, _, message = line.partition("\t")
@@ -469,11 +570,12 @@ class ScriptLogger:
 
         with self._lock:
             self._counts[level] = self._counts.get(level, 0) + 1
-            script_name = self._current_script
+            script_name = script if script is not None else self._current_script
             if script_name:
-                self._script_counts[script_name][level] = (
-                    self._script_counts[script_name].get(level, 0) + 1
+                counts = self._script_counts.setdefault(
+                    script_name, {k: 0 for k in _LEVELS}
                 )
+                counts[level] = counts.get(level, 0) + 1
             if level == "critical":
                 self._aborted = True
             script_label = f" [{script_name}]" if script_name else ""
@@ -32,21 +32,41 @@ The ``__ISH__`` metadata block (TOML, extracted by
 
 ``only_on`` / ``ignore_on``
     Existing OS-conditional keys (unchanged).
+
+``after`` / ``before``
+    Lists of script names (file name or stem) this script must run after
+    or before.  A script declaring either key depends *only* on those
+    edges, so independent scripts can run concurrently (up to
+    ``ishfiles.scripts_jobs``, default 4).  Scripts declaring neither key
+    keep the classic behaviour and wait for every lexically earlier
+    script.  Names that match no scheduled script are ignored.
 """
 
 from __future__ import annotations
 
 import logging
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from ..command_runner import CommandRunner
 from ..dotfile_script import DotfileScript
-from ..file_preprocessor import FilePreprocessor
+from ..file_preprocessor import FilePreprocessor, ParsedSource
 from ..ish_config import IshConfig
-from ..ish_metadata import collect_metadata_packages, read_metadata
+from ..ish_metadata import collect_metadata_packages
 from ..environment import should_skip_for_os_from_metadata
+from ..parallel import resolve_jobs
+from ..timings import span
 
 if TYPE_CHECKING:
     from .script_logger import ScriptLogger
@@ -89,6 +109,7 @@ def scan_scripts(
     scripts: Optional[Sequence[str]] = None,
     print_skipped: bool = False,
     all_scripts: Optional[List[Path]] = None,
+    sources: Optional[Dict[Path, ParsedSource]] = None,
 ) -> Tuple[List[Path], List[Dict[str, Any]]]:
     """Discover scripts, read metadata, and collect embedded packages.
 
@@ -102,6 +123,9 @@ def scan_scripts(
                        excluded script.
         all_scripts:   Optional pre-discovered list of script paths to
                        filter (skips :func:`find_scripts`).
+        sources:       Optional dict that is filled with the
+                       :class:`ParsedSource` of every kept script, for
+                       :func:`run_scanned_scripts` to reuse.
 
     Returns:
         A tuple of *(kept_scripts, packages)* where *kept_scripts* is the
@@ -120,10 +144,8 @@ def scan_scripts(
     packages: List[Dict[str, Any]] = []
 
     for script_path in all_scripts:
-        try:
-            meta = read_metadata(script_path)
-        except (ValueError, ImportError):
-            meta = None
+        parsed = ParsedSource.load(script_path)
+        meta = parsed.metadata
 
         # -- OS filter --------------------------------------------------------
         if should_skip_for_os_from_metadata(meta):
@@ -142,6 +164,8 @@ def scan_scripts(
 
         packages.extend(collect_metadata_packages(meta, source=script_path.name))
         kept.append(script_path)
+        if sources is not None:
+            sources[script_path] = parsed
 
     return kept, packages
 
@@ -152,6 +176,7 @@ def run_scanned_scripts(
     script_logger: Optional["ScriptLogger"] = None,
     script_state: Optional["ScriptState"] = None,
     force_scripts: Optional[List[str]] = None,
+    sources: Optional[Dict[Path, ParsedSource]] = None,
 ) -> int:
     """Execute pre-scanned scripts (OS and tag filtering already applied).
 
@@ -175,6 +200,9 @@ def run_scanned_scripts(
                         ``run_once`` / ``run_onchange`` gating.
         force_scripts:  Script names whose state records should be ignored
                         (force a re-run regardless of ``run_when``).
+        sources:        Optional :class:`ParsedSource` objects filled in by
+                        :func:`scan_scripts`; scripts missing from it are
+                        read here, once each.
 
     Returns:
         0 on success or when no scripts are found, 1 on error.
@@ -200,21 +228,26 @@ def run_scanned_scripts(
     runner = CommandRunner(cfg=cfg)
     preprocessor = FilePreprocessor(variables=cfg.context.as_dict())
 
-    for script_path in script_paths:
-        # -- Abort check ------------------------------------------------------
-        if script_logger is not None and script_logger.aborted:
-            log.error("Aborting after fatal error; skipping %s", script_path.name)
-            return 1
+    pending: List[DotfileScript] = []
+    metadata: Dict[Path, Optional[Dict[str, Any]]] = {}
 
+    for script_path in script_paths:
         # -- run_when gating --------------------------------------------------
+        parsed = (sources or {}).get(script_path)
+        if parsed is None:
+            try:
+                parsed = ParsedSource.load(script_path)
+            except OSError:
+                parsed = None  # reported by preprocess()/execute() below
         script = DotfileScript(
             path=script_path,
             preprocessor=preprocessor,
             runner=runner,
+            parsed=parsed,
         )
 
         if script_state is not None and script_path.name not in force_set:
-            run_when = _get_run_when(script_path)
+            run_when = _get_run_when(script_path, parsed)
             if run_when == "once":
                 if script_state.seen(script_path.name):
                     log.debug(
@@ -241,28 +274,21 @@ def run_scanned_scripts(
             log.info("Would run script: %s", script_path.name)
             continue
 
-        # -- Execute ----------------------------------------------------------
-        try:
-            log.info("  Running: %s", script_path.name)
-            if script_logger is not None:
-                script_logger.set_current_script(script_path.name)
-            script.execute(script_logger=script_logger)
-        except subprocess.CalledProcessError:
-            log.error("Script failed: %s", script_path.name)
-            return 1
-        except FileNotFoundError:
-            log.error("Script not found: %s", script_path)
-            return 1
+        pending.append(script)
+        metadata[script_path] = parsed.metadata if parsed is not None else None
 
-        # Record successful execution.
-        if script_state is not None:
-            try:
-                content = script._preprocessed_text or script.preprocess()
-                script_state.record(script_path.name, content)
-            except OSError as exc:
-                log.warning("Could not record state for %s: %s", script_path.name, exc)
+    if not pending:
+        return 0
 
-    return 0
+    discovered = find_scripts(cfg, source_dir)
+    deps = _script_dependencies([s.path for s in pending], metadata, discovered)
+    if deps is None:
+        return 1
+
+    jobs = resolve_jobs(cfg.get_opt("scripts_jobs"))
+    if jobs <= 1:
+        return _run_serial(pending, deps, script_logger, script_state)
+    return _run_parallel(pending, deps, jobs, script_logger, script_state)
 
 
 def run_scripts(
@@ -299,8 +325,13 @@ def run_scripts(
             log.error("Unknown scripts: %s", ", ".join(sorted(unknown)))
             return 1
 
+    sources: Dict[Path, ParsedSource] = {}
     kept, _ = scan_scripts(
-        cfg, scripts=scripts, print_skipped=not cfg.quiet, all_scripts=all_found
+        cfg,
+        scripts=scripts,
+        print_skipped=not cfg.quiet,
+        all_scripts=all_found,
+        sources=sources,
     )
     return run_scanned_scripts(
         cfg,
@@ -308,6 +339,7 @@ def run_scripts(
         script_logger=script_logger,
         script_state=script_state,
         force_scripts=force_scripts,
+        sources=sources,
     )
 
 
@@ -316,7 +348,235 @@ def run_scripts(
 # ---------------------------------------------------------------------------
 
 
-def _get_run_when(script_path: Path) -> str:
+def _execute_one(
+    script: DotfileScript,
+    script_logger: Optional["ScriptLogger"],
+    script_state: Optional["ScriptState"],
+) -> bool:
+    """Execute *script* and record it in *script_state* on success.
+
+    Safe to call from a worker thread once :meth:`DotfileScript.preprocess`
+    has run in the main thread.
+
+    Returns:
+        True if the script ran successfully.
+    """
+    name = script.path.name
+    try:
+        log.info("  Running: %s", name)
+        if script_logger is not None:
+            script_logger.set_current_script(name)
+        with span(name, "script"):
+            script.execute(script_logger=script_logger)
+    except subprocess.CalledProcessError:
+        log.error("Script failed: %s", name)
+        return False
+    except FileNotFoundError:
+        log.error("Script not found: %s", script.path)
+        return False
+
+    # Record successful execution.
+    if script_state is not None:
+        try:
+            content = script.preprocessed_text
+            if content is None:
+                content = script.preprocess()
+            script_state.record(name, content)
+        except OSError as exc:
+            log.warning("Could not record state for %s: %s", name, exc)
+    return True
+
+
+def _aborted(script_logger: Optional["ScriptLogger"]) -> bool:
+    return script_logger is not None and script_logger.aborted
+
+
+def _run_serial(
+    scripts: List[DotfileScript],
+    deps: Dict[Path, Set[Path]],
+    script_logger: Optional["ScriptLogger"],
+    script_state: Optional["ScriptState"],
+) -> int:
+    """Run *scripts* one at a time in dependency (then lexical) order."""
+    by_path = {s.path: s for s in scripts}
+    for path in _topological_order([s.path for s in scripts], deps):
+        if _aborted(script_logger):
+            log.error("Aborting after fatal error; skipping %s", path.name)
+            return 1
+        if not _execute_one(by_path[path], script_logger, script_state):
+            return 1
+    return 0
+
+
+def _run_parallel(
+    scripts: List[DotfileScript],
+    deps: Dict[Path, Set[Path]],
+    jobs: int,
+    script_logger: Optional["ScriptLogger"],
+    script_state: Optional["ScriptState"],
+) -> int:
+    """Run *scripts* on up to *jobs* threads, honouring *deps*.
+
+    Ready scripts are started in lexical order.  Preprocessing happens in
+    the calling thread because the shared preprocessor (and any prompts
+    it issues) is not thread-safe.  After a failure or a ``fatal``
+    message no further scripts are started; running ones are awaited.
+    """
+    order = {s.path: i for i, s in enumerate(scripts)}
+    by_path = {s.path: s for s in scripts}
+    waiting = {path: set(before) for path, before in deps.items()}
+    dependents: Dict[Path, List[Path]] = {path: [] for path in deps}
+    for path, before in deps.items():
+        for dep in before:
+            dependents[dep].append(path)
+
+    ready = sorted((p for p, w in waiting.items() if not w), key=order.__getitem__)
+    running: Dict[Future, Path] = {}
+    started: Set[Path] = set()
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while ready or running:
+            while ready and len(running) < jobs and not failed:
+                if _aborted(script_logger):
+                    break
+                path = ready.pop(0)
+                script = by_path[path]
+                try:
+                    script.preprocess()
+                except OSError as exc:
+                    log.error("Cannot preprocess %s: %s", path.name, exc)
+                    failed = True
+                    break
+                started.add(path)
+                future = pool.submit(_execute_one, script, script_logger, script_state)
+                running[future] = path
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = running.pop(future)
+                if not future.result():
+                    failed = True
+                    continue
+                for child in dependents[path]:
+                    waiting[child].discard(path)
+                    if not waiting[child]:
+                        ready.append(child)
+            ready.sort(key=order.__getitem__)
+
+    skipped = [s.path.name for s in scripts if s.path not in started]
+    if _aborted(script_logger):
+        log.error("Aborting after fatal error; skipping %s", ", ".join(skipped))
+        return 1
+    return 1 if failed or skipped else 0
+
+
+def _as_name_list(value: Any, owner: Path, key: str) -> Optional[List[str]]:
+    """Return an ``after``/``before`` value as a list of script names.
+
+    Returns None when the key is absent, or (after logging an error) when
+    it is neither a string nor a list of strings.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return value
+    log.error(
+        "Ignoring invalid %s=%r in %s: expected a script name or list of names",
+        key,
+        value,
+        owner.name,
+    )
+    return None
+
+
+def _script_dependencies(
+    paths: List[Path],
+    metadata: Dict[Path, Optional[Dict[str, Any]]],
+    discovered: Sequence[Path] = (),
+) -> Optional[Dict[Path, Set[Path]]]:
+    """Build the run-after graph for *paths* from ``after``/``before`` keys.
+
+    Scripts that declare neither key (or only invalid values) depend on
+    every lexically earlier script; scripts that declare one depend only
+    on their declared edges (plus ``before`` edges from other scripts).
+    Edges to a discovered script that is not scheduled this run (filtered
+    out, already run, or not requested) are dropped silently.
+
+    Args:
+        paths:      Scheduled scripts in lexical order.
+        metadata:   ``__ISH__`` metadata per script (``None`` if absent).
+        discovered: Every script in the scripts directory; references
+                    are resolved against these as well as *paths*.
+
+    Returns:
+        Mapping of each script to the set of scripts it must wait for, or
+        None (after logging an error) if the graph contains a cycle.
+    """
+    candidates = sorted(set(paths).union(discovered))
+    lookup: Dict[str, Path] = {}
+    for path in candidates:
+        lookup.setdefault(path.stem, path)
+    for path in candidates:
+        lookup[path.name] = path
+
+    deps: Dict[Path, Set[Path]] = {path: set() for path in paths}
+
+    def resolve(ref: str, owner: Path, key: str) -> Optional[Path]:
+        target = lookup.get(ref)
+        if target is None:
+            log.warning("Ignoring unknown %s=%r in %s", key, ref, owner.name)
+            return None
+        if target == owner or target not in deps:
+            return None
+        return target
+
+    for index, path in enumerate(paths):
+        meta = metadata.get(path) or {}
+        after = _as_name_list(meta.get("after"), path, "after")
+        before = _as_name_list(meta.get("before"), path, "before")
+        if after is None and before is None:
+            deps[path].update(paths[:index])
+            continue
+        for ref in after or []:
+            target = resolve(ref, path, "after")
+            if target is not None:
+                deps[path].add(target)
+        for ref in before or []:
+            target = resolve(ref, path, "before")
+            if target is not None:
+                deps[target].add(path)
+
+    ordered = _topological_order(paths, deps)
+    if len(ordered) < len(paths):
+        cyclic = sorted(p.name for p in set(paths) - set(ordered))
+        log.error("Script dependency cycle among: %s", ", ".join(cyclic))
+        return None
+    return deps
+
+
+def _topological_order(paths: List[Path], deps: Dict[Path, Set[Path]]) -> List[Path]:
+    """Order *paths* so every script follows its dependencies.
+
+    Ties are broken lexically, so a graph without declarations yields
+    *paths* unchanged.  Scripts on a cycle are left out of the result.
+    """
+    remaining = {path: set(deps.get(path, ())) for path in paths}
+    ordered: List[Path] = []
+    done: Set[Path] = set()
+    while True:
+        nxt = next((p for p in paths if p in remaining and remaining[p] <= done), None)
+        if nxt is None:
+            return ordered
+        del remaining[nxt]
+        done.add(nxt)
+        ordered.append(nxt)
+
+
+def _get_run_when(script_path: Path, parsed: Optional[ParsedSource] = None) -> str:
     """Return the ``run_when`` value from a script's ``__ISH__`` metadata.
 
     Falls back to ``"always"`` when the key is absent or the metadata
@@ -324,11 +584,14 @@ def _get_run_when(script_path: Path) -> str:
 
     Args:
         script_path: Path to the script file.
+        parsed:      Already-read source for *script_path*, if available.
     """
-    try:
-        meta = read_metadata(script_path)
-    except (ValueError, ImportError, OSError):
-        return "always"
+    if parsed is None:
+        try:
+            parsed = ParsedSource.load(script_path)
+        except OSError:
+            return "always"
+    meta = parsed.metadata
     if meta is None:
         return "always"
     value = meta.get("run_when", "always")
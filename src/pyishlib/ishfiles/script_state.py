@@ -8,6 +8,10 @@ preprocessed script content is used as the change-detection key so that
 edits to a script body (or to its ``@ish`` variables) trigger a re-run
 even if the file modification time has not changed.
 
+Mutations and saves are serialised with a lock so that scripts running
+concurrently (see :func:`pyishlib.ishfiles.script_runner.run_scanned_scripts`)
+can record their results from worker threads.
+
 Public API
 ----------
 - :class:`ScriptState` -- load / save / query per-script hashes.
@@ -19,6 +23,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -50,6 +55,7 @@ class ScriptState:
     def __init__(self, state_path: Path) -> None:
         self._path = state_path
         self._data: Dict[str, str] = {}
+        self._lock = threading.RLock()
         self._load()
 
     # -- factory ---------------------------------------------------------------
@@ -98,8 +104,10 @@ class ScriptState:
             script_name: The bare script filename.
             content:     Preprocessed script text that was executed.
         """
-        self._data[script_name] = hash_content(content)
-        self.save()
+        digest = hash_content(content)
+        with self._lock:
+            self._data[script_name] = digest
+            self.save()
 
     def clear(self, script_name: Optional[str] = None) -> None:
         """Remove stored state for one script or all scripts.
@@ -111,24 +119,26 @@ class ScriptState:
             script_name: If provided, clear only this script; otherwise
                          clear all entries.
         """
-        if script_name is None:
-            self._data.clear()
-        elif script_name in self._data:
-            del self._data[script_name]
-        self.save()
+        with self._lock:
+            if script_name is None:
+                self._data.clear()
+            elif script_name in self._data:
+                del self._data[script_name]
+            self.save()
 
     def save(self) -> None:
         """Write the current state to :attr:`path`."""
-        try:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            tmp = self._path.with_suffix(".json.tmp")
-            tmp.write_text(
-                json.dumps(self._data, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
-            tmp.replace(self._path)
-        except OSError as exc:
-            log.warning("Could not save script state to %s: %s", self._path, exc)
+        with self._lock:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".json.tmp")
+                tmp.write_text(
+                    json.dumps(self._data, indent=2, sort_keys=True),
+                    encoding="utf-8",
+                )
+                tmp.replace(self._path)
+            except OSError as exc:
+                log.warning("Could not save script state to %s: %s", self._path, exc)
 
     @property
     def path(self) -> Path:
@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 
 from ...cli_command import CliCommand
+from ...parallel import DEFAULT_JOBS
 from ..container import get_host_user_info, purge_containers
 
 
@@ -40,6 +41,17 @@ class PurgeCommand(CliCommand):
             dest="bases_alias",
             help="Alias of --bases (delete everything isholate created)",
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=None,
+            metavar="N",
+            help=(
+                "Maximum number of containers deleted concurrently "
+                f"(default: {DEFAULT_JOBS})"
+            ),
+        )
 
     def run(self) -> int:
         username, _home, _cwd = get_host_user_info()
@@ -48,4 +60,5 @@ class PurgeCommand(CliCommand):
             username,
             quiet=self.cfg.quiet,
             include_bases=include_bases,
+            jobs=self.cfg.jobs,
         )
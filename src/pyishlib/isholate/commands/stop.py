@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 
 from ...cli_command import CliCommand
+from ...parallel import DEFAULT_JOBS
 from ..container import get_host_user_info, stop_containers
 
 
@@ -42,6 +43,17 @@ class StopCommand(CliCommand):
                 "(otherwise only ephemerals are stopped)"
             ),
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=None,
+            metavar="N",
+            help=(
+                "Maximum number of containers stopped concurrently "
+                f"(default: {DEFAULT_JOBS})"
+            ),
+        )
 
     def run(self) -> int:
         username, _home, _cwd = get_host_user_info()
@@ -49,4 +61,5 @@ class StopCommand(CliCommand):
             username,
             names=list(self.cfg.names) if self.cfg.names else None,
             include_bases=self.cfg.include_bases,
+            jobs=self.cfg.jobs,
         )
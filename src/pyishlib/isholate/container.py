@@ -34,7 +34,7 @@ import string
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 
 # Parent of the pyishlib package directory — valid as a PYTHONPATH root
 # regardless of install layout (pipx venv, plain pip, source checkout).
@@ -42,6 +42,7 @@ import pyishlib as _pyishlib
 
 from ..container import Container, get_backend
 from ..ish_logging import log_level_from_args, log_level_to_cli_flags
+from ..parallel import map_bounded, resolve_jobs
 from .claude import (
     _add_claude_mounts,
     _apply_network_restrictions,
@@ -1659,13 +1660,64 @@ def _find_isholate_containers(
     return entries
 
 
+# ---------------------------------------------------------------------------
+# Teardown
+# ---------------------------------------------------------------------------
+
+
+def _teardown(
+    names: List[str],
+    action: Callable[[str], bool],
+    verb: str,
+    jobs: Optional[int] = None,
+) -> List[str]:
+    """Run *action* on every container in *names*, up to *jobs* at a time.
+
+    Each call is an independent ``incus`` round-trip, so stopping or
+    deleting many containers is dominated by waiting on the daemon.
+    Failures (a False return or an exception) are collected and reported
+    together once every container has been handled.
+
+    Args:
+        names:  Container names, from a single up-front listing.
+        action: Called with one name; returns True on success.
+        verb:   Infinitive for messages (``"delete"``, ``"stop"``).
+        jobs:   Concurrency limit (None: :data:`~pyishlib.parallel.DEFAULT_JOBS`).
+
+    Returns:
+        Names whose teardown failed, in input order.
+    """
+    failed = []
+    for outcome in map_bounded(action, names, resolve_jobs(jobs)):
+        if outcome.error is not None:
+            log.error("failed to %s %s: %s", verb, outcome.item, outcome.error)
+        elif not outcome.value:
+            log.error("failed to %s %s", verb, outcome.item)
+        else:
+            continue
+        failed.append(outcome.item)
+    if failed and len(names) > 1:
+        log.error(
+            "failed to %s %d of %d containers: %s",
+            verb,
+            len(failed),
+            len(names),
+            ", ".join(failed),
+        )
+    return failed
+
+
 # ---------------------------------------------------------------------------
 # Purge
 # ---------------------------------------------------------------------------
 
 
 def purge_containers(
-    username: str, *, quiet: bool = False, include_bases: bool = False
+    username: str,
+    *,
+    quiet: bool = False,
+    include_bases: bool = False,
+    jobs: Optional[int] = None,
 ) -> int:
     """Delete isholate containers belonging to the given username.
 
@@ -1678,6 +1730,7 @@ def purge_containers(
         quiet:         Suppress isholate's own progress messages.
         include_bases: When True, also delete host-base and project-base
                        containers (``isholate-base-*`` and ``isholate-pbase-*``).
+        jobs:          Maximum number of concurrent deletions.
 
     Returns:
         0 if all deletions succeeded, 1 if any failed.
@@ -1692,14 +1745,11 @@ def purge_containers(
         _say(f"no {kind} found for user '{username}'", quiet=quiet)
         return 0
 
-    failed = False
-    for name in containers:
+    def _delete(name: str) -> bool:
         _say(f"deleting {name}...", quiet=quiet)
-        if not _container(name).delete(force=True):
-            print(f"isholate: failed to delete {name}", file=sys.stderr)
-            failed = True
+        return _container(name).delete(force=True)
 
-    return 1 if failed else 0
+    return 1 if _teardown(containers, _delete, "delete", jobs) else 0
 
 
 # ---------------------------------------------------------------------------
@@ -1793,6 +1843,7 @@ def stop_containers(
     names: "Optional[List[str]]" = None,
     *,
     include_bases: bool = False,
+    jobs: Optional[int] = None,
 ) -> int:
     """Stop running isholate containers.
 
@@ -1809,6 +1860,7 @@ def stop_containers(
                        produce the "no containers" message).
         names:         Optional explicit container names to stop.
         include_bases: When *names* is empty, also stop running bases.
+        jobs:          Maximum number of concurrent stops.
 
     Returns:
         ``0`` if every targeted container stopped cleanly (or was already
@@ -1852,11 +1904,12 @@ def stop_containers(
             log.info("no running %s found for user '%s'", descr, username)
             return 0
 
-    for name in targets:
+    def _stop(name: str) -> bool:
         log.info("stopping %s...", name)
-        if not _container(name).stop(force=True):
-            log.error("failed to stop %s", name)
-            failed = True
+        return _container(name).stop(force=True)
+
+    if _teardown(targets, _stop, "stop", jobs):
+        failed = True
 
     return 1 if failed else 0
 
@@ -9,7 +9,7 @@ import logging
 import subprocess
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import IO, Iterable, List, Optional, Tuple
 
 from ...cli_command import CliCommand
 from ...command_runner import CommandRunner
@@ -23,6 +23,19 @@ from ..config import IshprojectConfig
 
 log = logging.getLogger(__name__)
 
+# Scratch ref that ``git fast-import`` writes the rewritten head to.
+_REWRITE_REF = "refs/ishproject/clean-rebase-tmp"
+
+_UNQUOTE = {
+    ord("a"): 7,
+    ord("b"): 8,
+    ord("f"): 12,
+    ord("n"): 10,
+    ord("r"): 13,
+    ord("t"): 9,
+    ord("v"): 11,
+}
+
 
 class CleanRebaseCommand(CliCommand):
     """Rewrite ``<base>..HEAD`` to strip ishproject-managed paths."""
@@ -166,24 +179,37 @@ class CleanRebaseCommand(CliCommand):
             return 1
 
         managed_set = set(managed)
-        new_head = base_sha
-        for sha in commits:
+        new_head: Optional[str] = None
+        if commits and not runner.dry_run:
             try:
-                new_head = _rewrite_commit(
+                new_head = _rewrite_range(
                     target=target,
-                    sha=sha,
-                    parent=new_head,
+                    base_sha=base_sha,
+                    head_sha=head_sha,
                     managed=managed_set,
-                    runner=runner,
                 )
-            except subprocess.CalledProcessError as exc:
-                log.error(
-                    "Failed to rewrite commit %s: %s; backup ref: %s",
-                    sha[:12],
-                    exc,
-                    backup_ref,
-                )
-                return 1
+            except (subprocess.CalledProcessError, OSError) as exc:
+                log.warning("Bulk rewrite failed (%s); rewriting commit by commit", exc)
+
+        if new_head is None:
+            new_head = base_sha
+            for sha in commits:
+                try:
+                    new_head = _rewrite_commit(
+                        target=target,
+                        sha=sha,
+                        parent=new_head,
+                        managed=managed_set,
+                        runner=runner,
+                    )
+                except subprocess.CalledProcessError as exc:
+                    log.error(
+                        "Failed to rewrite commit %s: %s; backup ref: %s",
+                        sha[:12],
+                        exc,
+                        backup_ref,
+                    )
+                    return 1
 
         if new_head != base_sha:
             try:
@@ -359,7 +385,7 @@ def _commit_metadata(target: Path, sha: str) -> Tuple[dict, str]:
     an, ae, ad, cn, ce, cd = parts
     msg = _git(
         target,
-        ["log", "-1", "--pretty=%B", sha],
+        ["log", "-1", "--pretty=format:%B", sha],
         check=True,
         capture_output=True,
         text=True,
@@ -389,7 +415,8 @@ def _rewrite_commit(
 
     Uses ``read-tree`` + ``update-index --force-remove`` + ``write-tree``
     + ``commit-tree`` so there are no cherry-pick conflicts. Returns the
-    new commit SHA.
+    new commit SHA.  Used for dry runs and as the fallback when
+    :func:`_rewrite_range` fails.
     """
     if runner.dry_run:
         log.info("dry-run: would rewrite %s on top of %s", sha[:12], parent[:12])
@@ -442,6 +469,138 @@ def _rewrite_commit(
     return result.stdout.strip()
 
 
+def _rewrite_range(
+    target: Path,
+    base_sha: str,
+    head_sha: str,
+    managed: set,
+) -> str:
+    """Rewrite ``<base_sha>..<head_sha>`` with managed files stripped.
+
+    Streams the range through one ``git fast-export --no-data`` |
+    ``git fast-import`` pipeline instead of spawning several git
+    processes per commit (see :func:`_rewrite_commit`).  Because the
+    export only carries per-commit changes, dropping the managed paths
+    from every change list (and deleting them once, in the first commit,
+    where they are inherited from *base_sha*) yields the same trees,
+    messages and authorship.  Neither the index nor the working tree is
+    touched.
+
+    Returns:
+        The SHA of the rewritten head.
+
+    Raises:
+        subprocess.CalledProcessError: if either git process fails.
+    """
+    env = _clean_git_env()
+    git = ["git", "-C", str(target)]
+    export_cmd = git + [
+        "fast-export",
+        "--no-data",
+        "--reference-excluded-parents",
+        "--reencode=no",
+        "--use-done-feature",
+        f"{base_sha}..{head_sha}",
+    ]
+    import_cmd = git + ["fast-import", "--quiet", "--force"]
+    with subprocess.Popen(export_cmd, stdout=subprocess.PIPE, env=env) as export:
+        with subprocess.Popen(import_cmd, stdin=subprocess.PIPE, env=env) as imp:
+            assert export.stdout is not None and imp.stdin is not None
+            try:
+                _filter_export(export.stdout, imp.stdin, managed)
+            finally:
+                imp.stdin.close()
+    if export.returncode != 0:
+        raise subprocess.CalledProcessError(export.returncode, export_cmd)
+    if imp.returncode != 0:
+        raise subprocess.CalledProcessError(imp.returncode, import_cmd)
+
+    try:
+        new_head = _git(
+            target,
+            ["rev-parse", "--verify", _REWRITE_REF],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    finally:
+        _git(target, ["update-ref", "-d", _REWRITE_REF], check=False)
+    return new_head
+
+
+def _filter_export(src: IO[bytes], dst: IO[bytes], managed: Iterable[str]) -> None:
+    """Copy a fast-export stream from *src* to *dst*, dropping *managed* paths.
+
+    Every ``commit``/``reset`` is redirected to :data:`_REWRITE_REF`, file
+    changes touching a managed path are dropped, and the first commit
+    deletes all managed paths it inherits from its (kept) parent.
+    """
+    managed = set(managed)
+    ref = _REWRITE_REF.encode()
+    first_commit: Optional[bool] = None
+    while True:
+        line = src.readline()
+        if not line:
+            return
+        if line.startswith(b"data "):
+            dst.write(line)
+            dst.write(src.read(int(line[5:])))
+            continue
+        if line.startswith(b"commit "):
+            line = b"commit " + ref + b"\n"
+            first_commit = first_commit is None
+        elif line.startswith(b"reset "):
+            line = b"reset " + ref + b"\n"
+        elif line.startswith(b"M "):
+            path = line[2:].rstrip(b"\n").split(b" ", 2)[2]
+            if _unquote_path(path) in managed:
+                continue
+        elif line.startswith(b"D "):
+            if _unquote_path(line[2:].rstrip(b"\n")) in managed:
+                continue
+        elif line == b"\n" and first_commit:
+            for rel in sorted(managed):
+                dst.write(b"D " + _quote_path(rel) + b"\n")
+            first_commit = False
+        dst.write(line)
+
+
+def _quote_path(rel: str) -> bytes:
+    """Return *rel* as a C-style quoted fast-import path."""
+    out = bytearray(b'"')
+    for byte in rel.encode("utf-8", "surrogateescape"):
+        if byte in (0x22, 0x5C):
+            out += b"\\" + bytes([byte])
+        elif byte < 0x20 or byte >= 0x7F:
+            out += b"\\%03o" % byte
+        else:
+            out.append(byte)
+    return bytes(out + b'"')
+
+
+def _unquote_path(raw: bytes) -> str:
+    """Decode a (possibly C-style quoted) path from a fast-export stream."""
+    if not raw.startswith(b'"'):
+        return raw.decode("utf-8", "surrogateescape")
+    body = raw[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        byte = body[i]
+        if byte != 0x5C:
+            out.append(byte)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if 0x30 <= nxt <= 0x37:
+            out.append(int(body[i + 1 : i + 4], 8))
+            i += 4
+        else:
+            out.append(_UNQUOTE.get(nxt, nxt))
+            i += 2
+    return out.decode("utf-8", "surrogateescape")
+
+
 def _sync_edits_to_ishproject(
     *,
     target: Path,
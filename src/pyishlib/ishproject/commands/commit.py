@@ -12,6 +12,7 @@ from ...cli_command import CliCommand
 from ...git_repo import GitRepo, NotAGitRepoError
 from ...ishfiles.cli import build_parser as ishfiles_build_parser
 from ...ishfiles.cli import main as ishfiles_main
+from ..fanout import add_jobs_argument, run_in_initialised_submodules
 from .._precommit import allow_missing_precommit_config
 
 log = logging.getLogger(__name__)
@@ -38,6 +39,8 @@ class CommitCommand(CliCommand):
     def TARGET_BUILD_PARSER():
         return ishfiles_build_parser()
 
+    TARGET_MODULE = "pyishlib.ishfiles"
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -51,6 +54,7 @@ class CommitCommand(CliCommand):
                 "an ishproject worktree are silently skipped."
             ),
         )
+        add_jobs_argument(parser)
         parser.add_argument(
             "rest",
             nargs=argparse.REMAINDER,
@@ -79,11 +83,19 @@ class CommitCommand(CliCommand):
             except NotAGitRepoError:
                 parent_repo = None
             if parent_repo is not None:
-                for sub_repo, sub_source, sub_target in cfg.iter_initialised_submodules(
-                    parent_repo
-                ):
-                    log.info("ishproject commit in submodule %s", sub_repo.work_tree)
-                    rcs.append(self._commit_one(sub_source, sub_target))
+                # Set once around the fan-out: concurrent submodule
+                # commits inherit it from this process's environment.
+                with allow_missing_precommit_config():
+                    rcs.extend(
+                        run_in_initialised_submodules(
+                            self,
+                            "commit",
+                            self.cfg.rest,
+                            cfg,
+                            parent_repo,
+                            jobs=self.cfg.jobs,
+                        )
+                    )
 
         return max(rcs)
 
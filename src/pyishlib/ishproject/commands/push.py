@@ -12,6 +12,7 @@ from ...cli_command import CliCommand
 from ...git_repo import GitRepo, NotAGitRepoError
 from ...ishfiles.cli import build_parser as ishfiles_build_parser
 from ...ishfiles.cli import main as ishfiles_main
+from ..fanout import add_jobs_argument, run_in_initialised_submodules
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +38,8 @@ class PushCommand(CliCommand):
     def TARGET_BUILD_PARSER():
         return ishfiles_build_parser()
 
+    TARGET_MODULE = "pyishlib.ishfiles"
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -50,6 +53,7 @@ class PushCommand(CliCommand):
                 "an ishproject worktree are silently skipped."
             ),
         )
+        add_jobs_argument(parser)
         parser.add_argument(
             "rest",
             nargs=argparse.REMAINDER,
@@ -78,11 +82,16 @@ class PushCommand(CliCommand):
             except NotAGitRepoError:
                 parent_repo = None
             if parent_repo is not None:
-                for sub_repo, sub_source, sub_target in cfg.iter_initialised_submodules(
-                    parent_repo
-                ):
-                    log.info("ishproject push in submodule %s", sub_repo.work_tree)
-                    rcs.append(self._push_one(sub_source, sub_target))
+                rcs.extend(
+                    run_in_initialised_submodules(
+                        self,
+                        "push",
+                        self.cfg.rest,
+                        cfg,
+                        parent_repo,
+                        jobs=self.cfg.jobs,
+                    )
+                )
 
         return max(rcs)
 
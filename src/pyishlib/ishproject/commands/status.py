@@ -7,13 +7,14 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from ...cli_command import CliCommand
-from ...git_repo import GitRepo, NotAGitRepoError
+from ...git_repo import GitRepo, NotAGitRepoError, git_session
 from ...ishfiles.cli import build_parser as ishfiles_build_parser
 from ...ishfiles.cli import main as ishfiles_main
 from ..config import IshprojectConfig
+from ..fanout import SubmoduleTarget, add_jobs_argument, run_in_submodules
 
 log = logging.getLogger(__name__)
 
@@ -39,8 +40,11 @@ class StatusCommand(CliCommand):
     def TARGET_BUILD_PARSER():
         return ishfiles_build_parser()
 
+    TARGET_MODULE = "pyishlib.ishfiles"
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
+        add_jobs_argument(parser)
         parser.add_argument(
             "rest",
             nargs=argparse.REMAINDER,
@@ -48,6 +52,12 @@ class StatusCommand(CliCommand):
         )
 
     def run(self) -> int:
+        # Every submodule is discovered and its refs queried several
+        # times below; one session answers those from shared snapshots.
+        with git_session():
+            return self._run()
+
+    def _run(self) -> int:
         cfg: IshprojectConfig = self.cfg.ishproject_cfg
         root = Path.cwd()
 
@@ -59,62 +69,41 @@ class StatusCommand(CliCommand):
         submodules: List[Path] = (
             repo.list_submodules(recursive=True) if repo is not None else []
         )
+        ready: List[SubmoduleTarget] = []
+        for sub in submodules:
+            paths = self._submodule_paths(cfg, sub)
+            if paths is not None:
+                ready.append((sub, *paths))
 
         # Headers go on every section when at least one submodule will
         # produce a status block; otherwise output stays byte-identical
         # to the pre-recursion behaviour.
-        emit_headers = any(self._will_report(cfg, sub) for sub in submodules)
+        emit_headers = bool(ready)
 
-        parent_rc = self._status_one(
-            cfg, root, is_parent=True, emit_header=emit_headers
+        forwarded = ["--include-ignored", *self.cfg.rest]
+        parent_rc = self._status_parent(cfg, root, forwarded, emit_headers)
+        sub_rcs = run_in_submodules(
+            self,
+            "status",
+            forwarded,
+            ready,
+            jobs=self.cfg.jobs,
+            header=lambda path: f"=== {self._display_path(path)} ===",
         )
-        sub_rcs = [
-            self._status_one(cfg, sub, is_parent=False, emit_header=emit_headers)
-            for sub in submodules
-        ]
 
         return max([parent_rc, *sub_rcs])
 
-    def _status_one(
+    def _status_parent(
         self,
         cfg: IshprojectConfig,
         root: Path,
-        *,
-        is_parent: bool,
+        forwarded: List[str],
         emit_header: bool,
     ) -> int:
-        """Run ishfiles status for a single repo (parent or submodule).
-
-        Submodules without an ishproject branch are silently skipped;
-        submodules whose branch exists locally / in cached remote refs
-        but whose worktree has not been created yet are surfaced via
-        ``log.info`` so the user knows where to run ``ishproject init``.
-        No fetches are performed.
-        """
+        """Run ishfiles status for the parent project."""
         branch = cfg.resolve_active_branch(root)
         source, target = cfg.resolve_project_paths(root, branch=branch)
-
-        # Submodules: gate every action (including running status against
-        # an existing worktree) on the ishproject branch being present in
-        # locally-known refs. A stale `.ishlib/ishproject` directory left
-        # over from a deleted branch is silently skipped rather than
-        # reported against. branch_exists() default does not fetch.
-        if not is_parent:
-            try:
-                sub_repo = GitRepo.discover(root, require_root=True)
-            except NotAGitRepoError:
-                return 0
-            if not sub_repo.branch_exists(branch):
-                return 0
-            if not source.is_dir():
-                log.info(
-                    "ishproject branch %s present in %s but worktree not "
-                    "initialized; run `ishproject init` to set it up",
-                    branch,
-                    root,
-                )
-                return 0
-        elif not source.is_dir():
+        if not source.is_dir():
             log.error(
                 "Project dotfiles directory does not exist: %s "
                 "(run `ishproject init` first)",
@@ -125,7 +114,6 @@ class StatusCommand(CliCommand):
         if emit_header:
             print(f"=== {self._display_path(root)} ===")
 
-        forwarded = ["--include-ignored", *self.cfg.rest]
         return self.passthrough(
             "status",
             forwarded,
@@ -133,24 +121,40 @@ class StatusCommand(CliCommand):
         )
 
     @staticmethod
-    def _will_report(cfg: IshprojectConfig, root: Path) -> bool:
-        """True if a submodule at *root* will produce a status section.
-
-        Mirrors the gate in :meth:`_status_one`: a section is produced only
-        when the ishproject branch is present in locally-known refs *and*
-        the worktree directory exists.  Headers are decided from this
-        predicate so they are not emitted for submodules that will be
-        silently skipped.
+    def _submodule_paths(
+        cfg: IshprojectConfig, root: Path
+    ) -> Optional[Tuple[Path, Path]]:
+        """Return ``(source, target)`` if the submodule at *root* reports.
+
+        Submodules without an ishproject branch are silently skipped;
+        submodules whose branch exists locally / in cached remote refs
+        but whose worktree has not been created yet are surfaced via
+        ``log.info`` so the user knows where to run ``ishproject init``.
+        No fetches are performed.
         """
         branch = cfg.resolve_active_branch(root)
-        source, _target = cfg.resolve_project_paths(root, branch=branch)
-        if not source.is_dir():
-            return False
+        source, target = cfg.resolve_project_paths(root, branch=branch)
+
+        # Gate every action (including running status against an
+        # existing worktree) on the ishproject branch being present in
+        # locally-known refs. A stale `.ishlib/ishproject` directory left
+        # over from a deleted branch is silently skipped rather than
+        # reported against. branch_exists() default does not fetch.
         try:
             sub_repo = GitRepo.discover(root, require_root=True)
         except NotAGitRepoError:
-            return False
-        return sub_repo.branch_exists(branch)
+            return None
+        if not sub_repo.branch_exists(branch):
+            return None
+        if not source.is_dir():
+            log.info(
+                "ishproject branch %s present in %s but worktree not "
+                "initialized; run `ishproject init` to set it up",
+                branch,
+                root,
+            )
+            return None
+        return source, target
 
     @staticmethod
     def _display_path(path: Path) -> str:
@@ -34,7 +34,7 @@ import re
 from pathlib import Path
 from typing import Callable, Iterator, Optional, Tuple, cast
 
-from ..git_repo import GitRepo, NotAGitRepoError
+from ..git_repo import GitRepo, NotAGitRepoError, git_session
 from ..ish_config import IshConfig
 from ..ishlib_folder import IshlibFolder
 
@@ -165,18 +165,25 @@ class IshprojectConfig(IshConfig):
         skipped so callers can iterate without per-submodule
         conditionals — same gate ``status`` uses to decide whether a
         submodule contributes a section to the report.
+
+        The gates are evaluated up front in one :func:`git_session`, so
+        they reflect the refs as they were before the caller acts on the
+        first submodule.
         """
-        for sub_repo in parent_repo.iter_submodule_repos():
-            sub_root = sub_repo.work_tree
-            sub_branch = self.resolve_active_branch(sub_root)
-            sub_source, sub_target = self.resolve_project_paths(
-                sub_root, branch=sub_branch
-            )
-            if not sub_repo.branch_exists(sub_branch):
-                continue
-            if not sub_source.is_dir():
-                continue
-            yield sub_repo, sub_source, sub_target
+        ready = []
+        with git_session():
+            for sub_repo in parent_repo.iter_submodule_repos():
+                sub_root = sub_repo.work_tree
+                sub_branch = self.resolve_active_branch(sub_root)
+                sub_source, sub_target = self.resolve_project_paths(
+                    sub_root, branch=sub_branch
+                )
+                if not sub_repo.branch_exists(sub_branch):
+                    continue
+                if not sub_source.is_dir():
+                    continue
+                ready.append((sub_repo, sub_source, sub_target))
+        yield from ready
 
     # -- helpers -----------------------------------------------------------
     def _middle_segment(self, branch: str) -> str:
@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Run one ishfiles passthrough in every ready submodule.
+
+``status`` and ``commit`` / ``pull`` / ``push --recurse-submodules``
+repeat the parent project's ishfiles call in each submodule returned by
+:meth:`~pyishlib.ishproject.config.IshprojectConfig.iter_initialised_submodules`.
+By default the calls run one after the other in-process.  With
+``-j N`` (N > 1) up to N of them run at once, each in its own ishfiles
+child process via
+:meth:`~pyishlib.cli_command.CliCommand.passthrough_captured`.  Their
+output is buffered and printed in submodule order once all of them
+have finished, so the report reads the same as a serial run.
+
+Public API
+----------
+- :func:`add_jobs_argument` -- the shared ``-j/--jobs`` flag.
+- :func:`run_in_submodules` -- run the passthrough for each submodule.
+- :func:`run_in_initialised_submodules` -- the same for every ready
+  submodule of a parent repository.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+from ..cli_command import CliCommand
+from ..parallel import map_bounded, resolve_jobs
+
+if TYPE_CHECKING:
+    from ..git_repo import GitRepo
+    from .config import IshprojectConfig
+
+log = logging.getLogger(__name__)
+
+#: ``(work_tree, source, target)`` of one submodule.
+SubmoduleTarget = Tuple[Path, Path, Path]
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    """Add ``-j/--jobs`` to a submodule-aware ishproject subcommand."""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Run up to N submodules concurrently, each in its own ishfiles "
+            "process; output is printed per submodule once all have "
+            "finished (default: 1, one after the other)"
+        ),
+    )
+
+
+def run_in_submodules(
+    command: CliCommand,
+    subcommand: str,
+    remainder: Sequence[str],
+    targets: Sequence[SubmoduleTarget],
+    *,
+    jobs: Optional[int] = None,
+    header: Optional[Callable[[Path], str]] = None,
+) -> List[int]:
+    """Run ``ishfiles <subcommand>`` for every submodule in *targets*.
+
+    Failures are summarised in one error once every submodule has run.
+
+    Args:
+        command:    The ishproject command doing the passthrough.
+        subcommand: ishfiles subcommand to run.
+        remainder:  Arguments forwarded after *subcommand*.
+        targets:    Submodules to run in, in reporting order.
+        jobs:       Concurrency limit (None or 1: serial, in-process).
+        header:     Returns a line printed before each submodule's
+                    output; when None the submodule is logged at INFO.
+
+    Returns:
+        One exit code per entry of *targets*, in the same order.
+    """
+    n_jobs = resolve_jobs(jobs, default=1)
+    if n_jobs <= 1 or len(targets) <= 1:
+        rcs = []
+        for work_tree, source, target in targets:
+            _announce(subcommand, work_tree, header)
+            rcs.append(
+                command.passthrough(
+                    subcommand, remainder, global_args=_paths(source, target)
+                )
+            )
+    else:
+        outcomes = map_bounded(
+            lambda t: command.passthrough_captured(
+                subcommand, remainder, global_args=_paths(t[1], t[2])
+            ),
+            targets,
+            n_jobs,
+        )
+        rcs = []
+        for outcome in outcomes:
+            _announce(subcommand, outcome.item[0], header)
+            if outcome.error is not None:
+                log.error(
+                    "could not run ishfiles %s in %s: %s",
+                    subcommand,
+                    outcome.item[0],
+                    outcome.error,
+                )
+                rcs.append(1)
+                continue
+            proc = outcome.result()
+            sys.stdout.write(proc.stdout)
+            sys.stdout.flush()
+            sys.stderr.write(proc.stderr)
+            sys.stderr.flush()
+            rcs.append(proc.returncode)
+
+    failed = [str(t[0]) for t, rc in zip(targets, rcs) if rc != 0]
+    if failed:
+        log.error(
+            "ishproject %s failed in %d of %d submodules: %s",
+            subcommand,
+            len(failed),
+            len(targets),
+            ", ".join(failed),
+        )
+    return rcs
+
+
+def run_in_initialised_submodules(
+    command: CliCommand,
+    subcommand: str,
+    remainder: Sequence[str],
+    cfg: "IshprojectConfig",
+    parent_repo: "GitRepo",
+    *,
+    jobs: Optional[int] = None,
+) -> List[int]:
+    """Run ``ishfiles <subcommand>`` in each ready submodule of *parent_repo*.
+
+    Submodules are those yielded by
+    :meth:`~pyishlib.ishproject.config.IshprojectConfig.iter_initialised_submodules`;
+    the remaining arguments are as for :func:`run_in_submodules`.
+
+    Returns:
+        One exit code per ready submodule, in iteration order.
+    """
+    targets = [
+        (sub_repo.work_tree, source, target)
+        for sub_repo, source, target in cfg.iter_initialised_submodules(parent_repo)
+    ]
+    return run_in_submodules(command, subcommand, remainder, targets, jobs=jobs)
+
+
+def _announce(
+    subcommand: str, work_tree: Path, header: Optional[Callable[[Path], str]]
+) -> None:
+    if header is not None:
+        print(header(work_tree), flush=True)
+    else:
+        log.info("ishproject %s in submodule %s", subcommand, work_tree)
+
+
+def _paths(source: Path, target: Path) -> List[str]:
+    return ["--source", str(source), "--target", str(target)]
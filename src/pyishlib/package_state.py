@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Persistent per-host cache of installed-package probe results.
+
+Records, for each installer backend, which packages it last reported as
+installed together with a *fingerprint* of the backend's package
+database (e.g. the stat of ``/var/lib/dpkg/status``).  As long as the
+fingerprint is unchanged, nothing can have been installed or removed
+through that backend, so :meth:`Installer.have_pkg` answers from the
+cache instead of running ``dpkg-query``, ``rpm -q``, ``pip list`` and
+friends.  Any change to the database (install, upgrade, removal, even
+outside ishfiles) changes the fingerprint and discards that backend's
+entries.  The cache lives in
+``<target>/.config/ishfiles/package-state.<hostname>.json``: fingerprints
+describe one machine's databases, so hosts sharing a home directory (NFS,
+synced dotfiles) must not read each other's records.
+
+Only positive results are cached: a package that is missing is probed
+again on the next run.  Fingerprints whose newest mtime is within
+:data:`RACY_WINDOW_NS` of the present are not trusted, so a database
+written in the same timestamp tick as the probe is never recorded.
+
+Repo availability (``apt-cache showpkg``, ``dnf repoquery``) is cached
+the same way under a separate ``_available`` section, keyed on a
+fingerprint of the backend's repo *index* (e.g. ``/var/lib/apt/lists``)
+instead of its installed-package database.  Both answers are cached
+there, since an unchanged index cannot have gained or lost a package;
+installing packages does not touch the index, so these entries survive
+install rounds.
+
+Public API
+----------
+- :class:`PackageStateCache` -- load / save / query per-backend records.
+- :func:`stat_fingerprint`  -- build a fingerprint from database paths.
+- :func:`host_filename`     -- qualify a state filename with the hostname.
+- :func:`is_racy`           -- whether an mtime is too recent to trust.
+- :data:`RACY_WINDOW_NS`    -- the window :func:`is_racy` applies.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_FILENAME = "package-state.json"
+
+# Top-level key of the availability section (never a backend name).
+_AVAILABLE = "_available"
+
+#: Files modified this recently are not trusted by stat-keyed caches: a
+#: rewrite within the same timestamp tick would leave the stat unchanged.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy(mtime_ns: int, now_ns: Optional[int] = None) -> bool:
+    """Return True if *mtime_ns* is within :data:`RACY_WINDOW_NS` of *now_ns*.
+
+    Stat-keyed caches (this module, the dotfile index, the version probe
+    cache, the externals manifest) skip recording such files, the same
+    "racy clean" guard git uses for its index.
+
+    Args:
+        mtime_ns: Modification time to check, in nanoseconds.
+        now_ns:   Reference time (default: :func:`time.time_ns`).
+    """
+    if now_ns is None:
+        now_ns = time.time_ns()
+    return now_ns - mtime_ns < RACY_WINDOW_NS
+
+
+def stat_fingerprint(paths: Iterable[Path]) -> Optional[List[List[Any]]]:
+    """Return ``[[path, mtime_ns, size, inode], ...]`` for existing *paths*.
+
+    Args:
+        paths: Package database files or directories to fingerprint.
+
+    Returns:
+        One entry per path that exists, or None when none exist (the
+        backend cannot be fingerprinted and is never cached).
+    """
+    result: List[List[Any]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        result.append([str(path), st.st_mtime_ns, st.st_size, st.st_ino])
+    return result or None
+
+
+def host_filename(filename: str) -> str:
+    """Return *filename* with this host's name inserted before the suffix.
+
+    ``package-state.json`` becomes ``package-state.<hostname>.json``.
+    Characters that are unsafe in a filename are replaced by ``_``.
+    """
+    host = re.sub(r"[^A-Za-z0-9._-]", "_", socket.gethostname()) or "localhost"
+    path = Path(filename)
+    return f"{path.stem}.{host}{path.suffix}"
+
+
+def _is_racy(fingerprint: List[List[Any]]) -> bool:
+    return is_racy(max(entry[1] for entry in fingerprint))
+
+
+class PackageStateCache:
+    """Persistent record of packages known to be installed, per backend.
+
+    Args:
+        state_path: Path to the JSON cache file.  Parent directories are
+                    created on first :meth:`save`.
+    """
+
+    def __init__(self, state_path: Path) -> None:
+        self._path = state_path
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._available: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # -- factory ---------------------------------------------------------------
+
+    @classmethod
+    def from_cfg(cls, cfg) -> "PackageStateCache":
+        """Create a :class:`PackageStateCache` rooted at *cfg*'s target home.
+
+        The configured filename is qualified with the hostname (see
+        :func:`host_filename`).
+
+        Args:
+            cfg: :class:`~pyishlib.ish_config.IshConfig` providing ``target``
+                 and (optionally) ``package_state_filename``.
+        """
+        target = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+        filename = cfg.get_opt("package_state_filename") or _DEFAULT_FILENAME
+        return cls(target / ".config" / "ishfiles" / host_filename(filename))
+
+    # -- public interface ------------------------------------------------------
+
+    @staticmethod
+    def key(backend_key: str, pkg: Mapping) -> str:
+        """Return the cache key for *pkg* as checked by one backend.
+
+        The key covers everything the backend's check depends on: the
+        backend-specific package name and the optional ``min_version``.
+
+        Args:
+            backend_key: The backend's package-dict key (e.g. ``"apt"``).
+            pkg:         Package dict.
+        """
+        return json.dumps([pkg.get(backend_key), pkg.get("min_version")])
+
+    def is_installed(
+        self, backend: str, fingerprint: Optional[List[List[Any]]], key: str
+    ) -> bool:
+        """True if *key* was recorded as installed under *fingerprint*.
+
+        Args:
+            backend:     Installer backend name.
+            fingerprint: Current database fingerprint (None never matches).
+            key:         Package key from :meth:`key`.
+        """
+        if fingerprint is None:
+            return False
+        record = self._data.get(backend)
+        if record is None or record.get("fingerprint") != fingerprint:
+            return False
+        return key in record.get("installed", ())
+
+    def record(
+        self, backend: str, fingerprint: Optional[List[List[Any]]], key: str
+    ) -> None:
+        """Remember that *backend* reported *key* installed under *fingerprint*.
+
+        Entries recorded under a different fingerprint are discarded.
+        Nothing is recorded for a missing or too-recent fingerprint.
+
+        Args:
+            backend:     Installer backend name.
+            fingerprint: Database fingerprint taken before the probe.
+            key:         Package key from :meth:`key`.
+        """
+        if fingerprint is None or _is_racy(fingerprint):
+            return
+        record = self._data.get(backend)
+        if record is None or record.get("fingerprint") != fingerprint:
+            record = {"fingerprint": fingerprint, "installed": []}
+            self._data[backend] = record
+            self._dirty = True
+        if key not in record["installed"]:
+            record["installed"].append(key)
+            self._dirty = True
+
+    def availability(
+        self, backend: str, fingerprint: Optional[List[List[Any]]], name: str
+    ) -> Optional[bool]:
+        """Return the recorded availability of *name*, or None if unknown.
+
+        Args:
+            backend:     Installer backend name.
+            fingerprint: Current repo index fingerprint (None never matches).
+            name:        Backend package name (e.g. ``pkg["apt"]``).
+        """
+        if fingerprint is None:
+            return None
+        record = self._available.get(backend)
+        if record is None or record.get("fingerprint") != fingerprint:
+            return None
+        return record["names"].get(name)
+
+    def record_availability(
+        self,
+        backend: str,
+        fingerprint: Optional[List[List[Any]]],
+        name: str,
+        available: bool,
+    ) -> None:
+        """Remember whether *backend*'s index under *fingerprint* offers *name*.
+
+        Entries recorded under a different fingerprint are discarded.
+        Nothing is recorded for a missing or too-recent fingerprint.
+        """
+        if fingerprint is None or _is_racy(fingerprint):
+            return
+        record = self._available.get(backend)
+        if record is None or record.get("fingerprint") != fingerprint:
+            record = {"fingerprint": fingerprint, "names": {}}
+            self._available[backend] = record
+            self._dirty = True
+        if record["names"].get(name) is not available:
+            record["names"][name] = available
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to :attr:`path` (atomic replace) if it changed."""
+        if not self._dirty:
+            return
+        data: Dict[str, Any] = dict(self._data)
+        if self._available:
+            data[_AVAILABLE] = self._available
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(".json.tmp")
+            tmp.write_text(
+                json.dumps(data, indent=2, sort_keys=True),
+                encoding="utf-8",
+            )
+            tmp.replace(self._path)
+            self._dirty = False
+        except OSError as exc:
+            log.warning("Could not save package state to %s: %s", self._path, exc)
+
+    @property
+    def path(self) -> Path:
+        """Path to the backing JSON file."""
+        return self._path
+
+    # -- internals -------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self._path.is_file():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            if not isinstance(raw, dict):
+                raise ValueError("Top-level JSON value is not an object")
+            self._data = {
+                k: v
+                for k, v in raw.items()
+                if isinstance(v, dict) and isinstance(v.get("installed"), list)
+            }
+            available = raw.get(_AVAILABLE)
+            if isinstance(available, dict):
+                self._available = {
+                    k: v
+                    for k, v in available.items()
+                    if isinstance(v, dict) and isinstance(v.get("names"), dict)
+                }
+        except (OSError, json.JSONDecodeError, ValueError) as exc:
+            log.warning(
+                "Could not load package state from %s: %s — starting empty",
+                self._path,
+                exc,
+            )
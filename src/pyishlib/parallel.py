@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Bounded thread-pool helpers for I/O-bound fan-out.
+
+Most of the slow work in the ishfiles/isholate/ishproject tools is waiting
+on subprocesses (git, package managers, incus).  :func:`map_bounded` runs
+one callable over a list of items on at most *jobs* worker threads and
+returns the outcomes **in input order**, so callers can keep their
+reporting and any follow-up work deterministic.
+
+Exceptions raised by the callable are captured per item rather than
+propagated, letting callers summarise failures after the fact.
+
+Public API
+----------
+- :func:`map_bounded` -- ordered, bounded, exception-capturing map.
+- :class:`TaskOutcome` -- per-item result of :func:`map_bounded`; use
+  :meth:`TaskOutcome.result` for the typed value.
+- :func:`resolve_jobs` -- normalise a configured job count.
+- :data:`DEFAULT_JOBS` -- default concurrency limit.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Default number of worker threads for I/O-bound fan-out.
+DEFAULT_JOBS = 4
+
+
+@dataclass
+class TaskOutcome(Generic[T, R]):
+    """Result of running one item through :func:`map_bounded`.
+
+    Attributes:
+        item:  The input item.
+        value: Return value of the callable (``None`` on error).
+        error: Exception raised by the callable, or ``None`` on success.
+    """
+
+    item: T
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the callable returned without raising."""
+        return self.error is None
+
+    def result(self) -> R:
+        """Return the callable's value, re-raising its exception if it failed.
+
+        Unlike :attr:`value` this is typed as the callable's return type, so
+        callers that have already handled :attr:`error` need no narrowing.
+        """
+        if self.error is not None:
+            raise self.error
+        return cast(R, self.value)
+
+
+def _call(func: Callable[[T], R], item: T) -> TaskOutcome[T, R]:
+    try:
+        return TaskOutcome(item=item, value=func(item))
+    except Exception as exc:  # noqa: BLE001
+        return TaskOutcome(item=item, error=exc)
+
+
+def resolve_jobs(value: Any, default: int = DEFAULT_JOBS) -> int:
+    """Coerce a configured job count to a positive integer.
+
+    ``None`` (unset) yields *default*; anything that does not parse as an
+    integer, or is below 1, is clamped to 1 (serial execution).
+    """
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def map_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    jobs: int = DEFAULT_JOBS,
+) -> List[TaskOutcome[T, R]]:
+    """Apply *func* to every item using at most *jobs* threads.
+
+    With ``jobs <= 1`` (or a single item) everything runs in the calling
+    thread, which keeps stack traces and debugging simple.
+
+    Args:
+        func:  Callable taking one item.  Must be safe to call from
+               multiple threads at once.
+        items: Items to process.
+        jobs:  Maximum number of concurrent calls.
+
+    Returns:
+        One :class:`TaskOutcome` per item, in the same order as *items*.
+    """
+    work = list(items)
+    if jobs <= 1 or len(work) <= 1:
+        return [_call(func, item) for item in work]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        return list(pool.map(lambda item: _call(func, item), work))
@@ -14,15 +14,27 @@ package declarations.
 
 When Cerberus is not available, all validation functions degrade gracefully
 by logging a debug message and returning without error.
+
+Validators are compiled once and reused: :func:`get_validator` keeps one
+Cerberus validator per schema (per thread, as Cerberus validators carry
+per-call state), :func:`get_json_validator` one jsonschema validator per
+schema file, and :func:`load_json_schema` reads each JSON Schema file
+once.  Package and metadata dicts that already passed validation are
+remembered by content hash, so re-validating the same block (e.g. a
+file's metadata read during both scanning and preprocessing) is a
+dictionary lookup.
 """
 
 from __future__ import annotations
 
 import functools
+import hashlib
 import json
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -33,6 +45,13 @@ try:
 except ImportError:
     HAS_CERBERUS = False
 
+try:
+    import jsonschema
+
+    HAS_JSONSCHEMA = True
+except ImportError:
+    HAS_JSONSCHEMA = False
+
 try:
     import yaml
 
@@ -93,6 +112,107 @@ def load_metadata_schema() -> Dict[str, Any]:
     return _load_schema("ish_metadata_cerberus.json")
 
 
+@functools.lru_cache(maxsize=None)
+def _load_json_schema(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def load_json_schema(path: Path) -> Dict[str, Any]:
+    """Load a JSON Schema file, reading each version of it only once.
+
+    The cache is keyed by the file's path, mtime and size, so an edited
+    schema is picked up.  The returned dict is shared; do not modify it.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    st = os.stat(path)
+    return _load_json_schema(str(path), st.st_mtime_ns, st.st_size)
+
+
+# ---------------------------------------------------------------------------
+# Validator registry
+# ---------------------------------------------------------------------------
+
+# Cerberus schema (wrapped under a single top-level key) per registry name.
+_CERBERUS_SCHEMAS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "packages": lambda: {"packages": load_packages_schema()},
+    "metadata": lambda: {"metadata": load_metadata_schema()["metadata"]},
+}
+
+_local = threading.local()
+
+# Content hashes of documents that passed validation, per registry name.
+_known_valid: Set[Tuple[str, str]] = set()
+
+
+def get_validator(name: str) -> "cerberus.Validator":
+    """Return the compiled Cerberus validator for schema *name*.
+
+    *name* is ``"packages"`` or ``"metadata"``.  Each thread gets its own
+    instance, built on first use and reused afterwards.
+
+    Raises:
+        KeyError: For an unknown *name*.
+    """
+    validators = getattr(_local, "validators", None)
+    if validators is None:
+        validators = _local.validators = {}
+    validator = validators.get(name)
+    if validator is None:
+        validator = validators[name] = cerberus.Validator(_CERBERUS_SCHEMAS[name]())
+    return validator
+
+
+@functools.lru_cache(maxsize=None)
+def _json_validator(path: str, mtime_ns: int, size: int) -> Any:
+    schema = _load_json_schema(path, mtime_ns, size)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def get_json_validator(path: Path) -> Any:
+    """Return a compiled jsonschema validator for the schema file *path*.
+
+    Built once per version of the file (see :func:`load_json_schema`).
+    jsonschema validators hold no per-call state and may be shared.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    st = os.stat(path)
+    return _json_validator(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _content_hash(document: Any) -> Optional[str]:
+    """Hash *document*, or None if it holds non-JSON values (dates etc.)."""
+    try:
+        text = json.dumps(document, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _validate_cached(name: str, document: Dict[str, Any]) -> Optional[Dict]:
+    """Validate *document* with :func:`get_validator`; return its errors.
+
+    Documents whose content hash already passed are not validated again.
+    """
+    key = _content_hash(document)
+    if key is not None and (name, key) in _known_valid:
+        return None
+    validator = get_validator(name)
+    if not validator.validate(document):
+        return validator.errors
+    if key is not None:
+        _known_valid.add((name, key))
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Validation functions
 # ---------------------------------------------------------------------------
@@ -116,10 +236,9 @@ def validate_packages(
         log.debug("cerberus not available, skipping package validation for %s", source)
         return None
 
-    schema = load_packages_schema()
-    validator = cerberus.Validator({"packages": schema})
-    if not validator.validate({"packages": packages}):
-        return f"Package validation failed ({source}): {validator.errors}"
+    errors = _validate_cached("packages", {"packages": packages})
+    if errors is not None:
+        return f"Package validation failed ({source}): {errors}"
     return None
 
 
@@ -145,10 +264,11 @@ def validate_metadata(
         log.debug("cerberus not available, skipping metadata validation for %s", source)
         return None
 
-    schema = load_metadata_schema()
-    validator = cerberus.Validator({"metadata": schema["metadata"]})
-    if not validator.validate({"metadata": metadata}):
-        return f"Metadata validation failed ({source}): {validator.errors}"
+    if metadata == {}:
+        return None
+    errors = _validate_cached("metadata", {"metadata": metadata})
+    if errors is not None:
+        return f"Metadata validation failed ({source}): {errors}"
 
     # Validate packages sub-section with the shared package schema
     if "packages" in metadata and isinstance(metadata["packages"], dict):
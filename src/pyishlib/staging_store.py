@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Persistent content-addressed store for preprocessed dotfile output.
+
+:meth:`DotfileApplier.prepare` runs every text file with ``@ish``
+directives or ``${__ish_*}`` references through the preprocessor and
+stages the result.  The output of such a file is fully determined by:
+
+- its source text and ``__ISH__`` metadata,
+- the preprocessing context as it was *before* the file was processed
+  (CLI/config variables plus anything earlier files ``set``),
+- the answers of the live ``ish.env`` checks, and
+- :data:`~pyishlib.file_preprocessor.PREPROCESSOR_VERSION`.
+
+:meth:`StagingStore.key` hashes exactly those inputs.  The store keeps
+the staged output under that key, together with the variables the file
+added to the context, so a later run can reuse the output and replay the
+context change instead of preprocessing and writing the file again.
+Files with ``@ish prompt*`` directives are never stored, because their
+output depends on the user's answers.
+
+Entries live under ``<target>/.config/ishfiles/staging/`` as
+``<key[:2]>/<key>`` (the staged output) plus ``<key>.json`` (its digest
+and context change).  Entries unused for :data:`_MAX_AGE_S` are removed
+by :meth:`StagingStore.prune`.
+
+Public API
+----------
+- :class:`StagingStore` -- look up / add / prune staged outputs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .environment import EnvironmentNamespace
+from .file_preprocessor import PREPROCESSOR_VERSION
+
+log = logging.getLogger(__name__)
+
+_DEFAULT_DIRNAME = "staging"
+
+# Entries not used for this long are removed by prune().
+_MAX_AGE_S = 30 * 24 * 3600
+
+# prune() scans the store at most this often.
+_PRUNE_INTERVAL_S = 24 * 3600
+
+_PRUNE_STAMP = ".last-prune"
+
+
+def environment_signature() -> Dict[str, Any]:
+    """Return the result of every ``ish.env`` check, keyed by name.
+
+    Directive expressions may call any public method of
+    :class:`~pyishlib.environment.EnvironmentNamespace`, so all of them
+    are part of a store key.
+    """
+    env = EnvironmentNamespace()
+    return {
+        name: getattr(env, name)()
+        for name in sorted(vars(EnvironmentNamespace))
+        if not name.startswith("_")
+    }
+
+
+class StagingStore:
+    """Content-addressed cache of preprocessed dotfile output.
+
+    Args:
+        root:     Directory holding the entries.  Created on first
+                  :meth:`put`.
+        writable: When False, :meth:`put` and :meth:`prune` do nothing
+                  and lookups do not refresh entry timestamps (dry-run).
+    """
+
+    def __init__(self, root: Path, writable: bool = True) -> None:
+        self._root = root
+        self.writable = writable
+
+    # -- factory ---------------------------------------------------------------
+
+    @classmethod
+    def from_cfg(cls, cfg) -> "StagingStore":
+        """Create a :class:`StagingStore` rooted at *cfg*'s target home.
+
+        Args:
+            cfg: :class:`~pyishlib.ish_config.IshConfig` providing ``target``
+                 and (optionally) ``staging_store_dirname``.
+        """
+        target = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+        dirname = cfg.get_opt("staging_store_dirname") or _DEFAULT_DIRNAME
+        return cls(target / ".config" / "ishfiles" / dirname)
+
+    # -- public interface ------------------------------------------------------
+
+    @staticmethod
+    def key(
+        text: str,
+        metadata: Optional[Dict[str, Any]],
+        context: Dict[str, str],
+        environment: Dict[str, Any],
+    ) -> str:
+        """Return the store key for one preprocessing run.
+
+        Args:
+            text:        Source text.
+            metadata:    The file's ``__ISH__`` metadata (or None).
+            context:     Preprocessing variables before the file is processed.
+            environment: Result of :func:`environment_signature`.
+        """
+        doc = json.dumps(
+            [PREPROCESSOR_VERSION, text, metadata, context, environment],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(doc.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Path, str, Dict[str, str]]]:
+        """Look up *key*.
+
+        Returns:
+            ``(staged_path, digest, context_delta)``, or None when the
+            entry is missing or unreadable.
+        """
+        path = self._path(key)
+        try:
+            info = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+            digest, delta = info["digest"], info["delta"]
+            if not path.is_file() or not isinstance(delta, dict):
+                return None
+            if self.writable:
+                os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return path, digest, delta
+
+    def put(
+        self, key: str, text: str, digest: str, delta: Dict[str, str]
+    ) -> Optional[Path]:
+        """Store *text* (with its *digest* and context *delta*) under *key*.
+
+        Returns:
+            The stored file, or None if the store is read-only or the
+            write failed (the caller then stages the text itself).
+        """
+        if not self.writable:
+            return None
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            tmp.replace(path)
+            info = path.with_suffix(".json")
+            tmp = info.with_name(f"{info.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"digest": digest, "delta": delta}), "utf-8")
+            tmp.replace(info)
+        except OSError as exc:
+            log.warning("Could not write staging store entry %s: %s", path, exc)
+            return None
+        return path
+
+    def prune(self) -> int:
+        """Remove entries unused for :data:`_MAX_AGE_S`.
+
+        Scans the store at most once per :data:`_PRUNE_INTERVAL_S`.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.writable or not self._root.is_dir():
+            return 0
+        stamp = self._root / _PRUNE_STAMP
+        now = time.time()
+        try:
+            if now - stamp.stat().st_mtime < _PRUNE_INTERVAL_S:
+                return 0
+        except OSError:
+            pass
+        removed = 0
+        for bucket in self._root.iterdir():
+            if not bucket.is_dir():
+                continue
+            for entry in bucket.iterdir():
+                if entry.suffix == ".json":
+                    continue
+                try:
+                    if now - entry.stat().st_mtime < _MAX_AGE_S:
+                        continue
+                    entry.unlink()
+                    entry.with_suffix(".json").unlink(missing_ok=True)
+                    removed += 1
+                except OSError:
+                    continue
+        try:
+            stamp.touch()
+        except OSError:
+            pass
+        return removed
+
+    @property
+    def root(self) -> Path:
+        """Directory holding the entries."""
+        return self._root
+
+    # -- internals -------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2026 Hans Liljestrand <hans@liljestrand.dev>
+"""Phase and span timings for long-running commands.
+
+A :class:`Tracer` records named, timed spans.  Commands mark their
+top-level phases with :func:`phase` and individual work items (a
+package probe, an external, a script) with :func:`span`;
+:meth:`~pyishlib.command_runner.CommandRunner.run` records every
+subprocess it starts, so each one is attributed to the phase that was
+current when it ran -- including subprocesses started from worker
+threads.
+
+Nothing is recorded unless a tracer has been activated with
+:func:`tracing`; without one, :func:`phase` and :func:`span` return a
+shared no-op context manager.
+
+Public API
+----------
+- :class:`Tracer` -- span store with a per-phase summary and a
+  Chrome trace (``chrome://tracing`` / Perfetto) export.
+- :class:`Span` -- one recorded span.
+- :func:`tracing` -- activate a tracer for the duration of a block.
+- :func:`phase` -- record a phase on the active tracer.
+- :func:`span` -- record a work item on the active tracer.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+#: Category of the spans recorded by :func:`phase`.
+PHASE = "phase"
+
+#: Category of the spans recorded by :class:`~pyishlib.command_runner.CommandRunner`.
+SUBPROCESS = "subprocess"
+
+_NULL: ContextManager[None] = nullcontext()
+
+
+@dataclass
+class Span:
+    """One timed span.
+
+    Attributes:
+        name:     Span name (phase name, item name or command).
+        cat:      Category (:data:`PHASE`, :data:`SUBPROCESS`, ``"script"``, ...).
+        start_ns: Start, in nanoseconds since the tracer was created.
+        dur_ns:   Duration in nanoseconds.
+        tid:      Thread the span ran on.
+        phase:    Phase that was current when the span started.
+        args:     Extra details (exported as Chrome trace ``args``).
+    """
+
+    name: str
+    cat: str
+    start_ns: int
+    dur_ns: int
+    tid: int
+    phase: Optional[str] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Thread-safe store of :class:`Span` records."""
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+        self._phase: Optional[str] = None
+
+    @contextmanager
+    def span(self, name: str, cat: str = "item", **args: Any) -> Iterator[None]:
+        """Record the enclosed block as a span named *name*."""
+        phase_name = self._phase
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            record = Span(
+                name=name,
+                cat=cat,
+                start_ns=start - self._t0,
+                dur_ns=end - start,
+                tid=threading.get_ident(),
+                phase=phase_name,
+                args=args,
+            )
+            with self._lock:
+                self._spans.append(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record a phase; spans started inside are attributed to it."""
+        previous = self._phase
+        self._phase = name
+        try:
+            with self.span(name, PHASE):
+                yield
+        finally:
+            self._phase = previous
+
+    @property
+    def spans(self) -> List[Span]:
+        """All spans recorded so far, in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self) -> List[Tuple[str, float, int, float]]:
+        """Return ``(phase, seconds, subprocesses, subprocess_seconds)`` rows.
+
+        One row per phase, in the order the phases ran.  Subprocess
+        seconds are summed over all threads, so they can exceed the
+        phase's wall time when work ran concurrently.
+        """
+        spans = self.spans
+        phases = sorted((s for s in spans if s.cat == PHASE), key=lambda s: s.start_ns)
+        rows = []
+        for p in phases:
+            subs = [s for s in spans if s.cat == SUBPROCESS and s.phase == p.name]
+            rows.append(
+                (
+                    p.name,
+                    p.dur_ns / 1e9,
+                    len(subs),
+                    sum(s.dur_ns for s in subs) / 1e9,
+                )
+            )
+        return rows
+
+    def format_summary(self) -> str:
+        """Return :meth:`summary` as a fixed-width table."""
+        rows = self.summary()
+        width = max([len("phase"), *(len(r[0]) for r in rows)])
+        head = f"{'phase':<{width}}  {'wall':>9}  {'subprocs':>8}  {'in subprocs':>11}"
+        lines = [head]
+        for name, secs, count, sub_secs in rows:
+            lines.append(
+                f"{name:<{width}}  {secs:>8.3f}s  {count:>8}  {sub_secs:>10.3f}s"
+            )
+        lines.append(
+            f"{'total':<{width}}  {sum(r[1] for r in rows):>8.3f}s  "
+            f"{sum(r[2] for r in rows):>8}  {sum(r[3] for r in rows):>10.3f}s"
+        )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans in Chrome trace event format (complete events)."""
+        pid = os.getpid()
+        events = []
+        for s in sorted(self.spans, key=lambda s: s.start_ns):
+            args = dict(s.args)
+            if s.phase is not None and s.cat != PHASE:
+                args["phase"] = s.phase
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.cat,
+                    "ph": "X",
+                    "ts": s.start_ns / 1000,
+                    "dur": s.dur_ns / 1000,
+                    "pid": pid,
+                    "tid": s.tid,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write :meth:`chrome_trace` to *path* (parent directories created)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+_active: Optional[Tracer] = None
+
+
+@contextmanager
+def tracing(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """Make *tracer* the active tracer for the enclosed block.
+
+    Passing None leaves tracing off, so callers can write
+    ``with tracing(Tracer() if enabled else None):``.
+    """
+    global _active
+    previous = _active
+    _active = tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Record a phase on the active tracer (no-op when tracing is off)."""
+    tracer = _active
+    return tracer.phase(name) if tracer is not None else _NULL
+
+
+def span(name: str, cat: str = "item", **args: Any) -> ContextManager[None]:
+    """Record a span on the active tracer (no-op when tracing is off)."""
+    tracer = _active
+    return tracer.span(name, cat, **args) if tracer is not None else _NULL
@@ -8,21 +8,40 @@ probe, parses the first dotted-int run from the combined stdout/stderr,
 and compares it to the minimum.  Failures (probe errors, unparsable
 output) deliberately return ``None``/``False`` so the caller treats the
 package as not installed and proceeds to install a working version.
+
+:class:`VersionProbeCache` remembers probe output across runs, keyed on
+the identity of the binary that produced it, so an unchanged tool is
+not started again just to print its version.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
 import shlex
+import stat
 import subprocess
+import threading
+from pathlib import Path
 from subprocess import CalledProcessError
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .package_state import is_racy
 
 log = logging.getLogger(__name__)
 
 _VERSION_RE = re.compile(r"(\d+(?:\.\d+)*)")
 
+_DEFAULT_CACHE_FILENAME = "version-cache.json"
+
+# Interpreter options whose value names the code that actually runs
+# (python -m/-c, node -e/-p/-r, perl -e, ruby -e/-r, ...).  The binary's
+# identity says nothing about that code, so such probes are not cached.
+_CODE_OPTIONS = ("-m", "-c", "-e", "-r", "-p")
+_CODE_LONG_OPTIONS = ("--eval", "--print", "--require", "--import", "--command")
+
 
 def parse_version(text: Optional[str]) -> Optional[Tuple[int, ...]]:
     """Return the first dotted-int version found in *text* as an int tuple.
@@ -104,3 +123,155 @@ def probe_version(runner, cmd_str: str) -> Optional[str]:
     if result.returncode != 0 and not stdout and not stderr:
         return None
     return f"{stdout}\n{stderr}"
+
+
+class VersionProbeCache:
+    """Persistent :func:`probe_version` results, keyed by binary identity.
+
+    An entry records, per ``command_version`` string, the resolved path of
+    the binary it runs plus that file's inode, size and mtime; it is
+    reused for as long as all of them match.  Only successful probes are
+    recorded.  Probes whose output may depend on more than the binary's
+    own contents are always run: scripts (``#!``), executables reached
+    under another name or with several hard links (version-manager shims
+    and multi-call proxies such as rustup's ``cargo``), and command lines
+    with anything but plain flags after the binary (``python3 -m black
+    --version`` reports the module, not the interpreter).
+
+    Safe to use from several threads.
+
+    Args:
+        path: Path to the JSON cache file.  Parent directories are
+              created on first :meth:`save`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_cfg(cls, cfg) -> "VersionProbeCache":
+        """Create a :class:`VersionProbeCache` in *cfg*'s ishfiles state directory.
+
+        Args:
+            cfg: :class:`~pyishlib.ish_config.IshConfig` providing ``target``
+                 and (optionally) ``version_cache_filename``.
+        """
+        target = Path(cfg.get_opt("target") or Path.home()).expanduser().resolve()
+        filename = cfg.get_opt("version_cache_filename") or _DEFAULT_CACHE_FILENAME
+        return cls(target / ".config" / "ishfiles" / filename)
+
+    @property
+    def path(self) -> Path:
+        """Path to the backing JSON file."""
+        return self._path
+
+    def probe(self, runner, cmd_str: str) -> Optional[str]:
+        """Return :func:`probe_version` output for *cmd_str*, cached if possible.
+
+        Nothing is recorded when *runner* is in dry-run mode.
+        """
+        identity = _binary_identity(runner, cmd_str)
+        if identity is not None:
+            with self._lock:
+                entry = self._data.get(cmd_str)
+            if entry is not None and entry.get("binary") == identity:
+                log.debug("Version probe %r answered from cache", cmd_str)
+                return entry["output"]
+        output = probe_version(runner, cmd_str)
+        if (
+            output is not None
+            and identity is not None
+            and not getattr(runner, "dry_run", False)
+            and not is_racy(identity[3])
+        ):
+            with self._lock:
+                self._data[cmd_str] = {"binary": identity, "output": output}
+                self._dirty = True
+        return output
+
+    def save(self) -> None:
+        """Write the cache to :attr:`path` (atomic replace) if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".json.tmp")
+                tmp.write_text(
+                    json.dumps(self._data, indent=2, sort_keys=True),
+                    encoding="utf-8",
+                )
+                tmp.replace(self._path)
+                self._dirty = False
+            except OSError as exc:
+                log.warning("Could not save version cache to %s: %s", self._path, exc)
+
+    def _load(self) -> None:
+        if not self._path.is_file():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            if not isinstance(raw, dict):
+                raise ValueError("Top-level JSON value is not an object")
+            self._data = {
+                k: v
+                for k, v in raw.items()
+                if isinstance(v, dict)
+                and isinstance(v.get("binary"), list)
+                and isinstance(v.get("output"), str)
+            }
+        except (OSError, json.JSONDecodeError, ValueError) as exc:
+            log.warning(
+                "Could not load version cache from %s: %s — starting empty",
+                self._path,
+                exc,
+            )
+
+
+def _plain_flags(args: List[str]) -> bool:
+    """True if *args* are all options that do not name code to run."""
+    for arg in args:
+        if not arg.startswith("-") or arg == "-":
+            return False
+        if arg.startswith("--"):
+            if arg.split("=", 1)[0] in _CODE_LONG_OPTIONS:
+                return False
+        elif arg[:2] in _CODE_OPTIONS:
+            return False
+    return True
+
+
+def _binary_identity(runner, cmd_str: str) -> Optional[List[Any]]:
+    """Return ``[realpath, inode, size, mtime_ns]`` of *cmd_str*'s binary.
+
+    Returns None when the binary cannot be resolved or should not be
+    cached (see :class:`VersionProbeCache`).
+    """
+    if not isinstance(cmd_str, str):
+        return None
+    try:
+        argv = shlex.split(cmd_str)
+    except ValueError:
+        return None
+    if not argv or not _plain_flags(argv[1:]):
+        return None
+    found = runner.which(argv[0])
+    if found is None:
+        return None
+    real = os.path.realpath(found)
+    try:
+        st = os.stat(real)
+        if not stat.S_ISREG(st.st_mode) or st.st_nlink > 1:
+            return None
+        if Path(real).stem != Path(found).stem:
+            return None
+        with open(real, "rb") as fh:
+            if fh.read(2) == b"#!":
+                return None
+    except OSError:
+        return None
+    return [real, st.st_ino, st.st_size, st.st_mtime_ns]